@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+'''Bundle `proxi` and the pure Python packages in `lib` into a zipimport-able archive of precompiled bytecode
+
+Cold starts from a network drive are dominated by stat/open calls on thousands of loose files. The bundle replaces them
+with two archives, each opened once. Both are stored uncompressed, decompressing costs more than reading the bytes:
+    bundle/code.zip: unchecked hash-based .pyc files, no sources, zipimport-able
+    bundle/data.zip: package data files (babel locale data, pytz zoneinfo). `bundle/data.json` indexes each file's offset
+    and size, so reading one is a seek and a read, without parsing the zip's central directory
+
+`bundle/bundle.json` lists the bundled packages and the bytecode magic number. `.install/init_unreal.py` serves the bundled
+packages from the archives if the magic number matches the running interpreter, and from the loose files otherwise.
+Packages with extension modules (PySide6, shiboken6, markupsafe) or that need real file paths (`KEEP_LOOSE`) stay loose
+
+Build with the interpreter Unreal ships, so the bytecode matches:
+    <Unreal>/Engine/Binaries/ThirdParty/Python3/Win64/python.exe .build/bundle.py
+'''
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import struct
+import marshal
+import zipfile
+import argparse
+import importlib.util
+
+
+PACKAGES = ['proxi'] # Packages in the python base folder, on top of everything in `lib`
+LIB_STUB = 'lib'
+BUNDLE_STUB = 'bundle'
+CODE_ARCHIVE = 'code.zip'
+DATA_ARCHIVE = 'data.zip'
+BUNDLE_INDEX = 'bundle.json'
+DATA_INDEX = 'data.json'
+BUNDLE_VERSION = 1
+KEEP_LOOSE = ['qt_material'] # Reads its themes and resources through `__file__`
+EXTENSION_SUFFIXES = ('.pyd', '.so', '.dll', '.dylib') # Not `importlib.machinery.EXTENSION_SUFFIXES`: we may bundle for another platform
+SKIP_SUFFIXES = ('.pyc', '.pyo', '.pyi', '.c', '.h', '.ui', '.typed') # Neither code nor runtime data
+ZIP_DATE = (1980, 1, 1, 0, 0, 0) # Fixed entry dates: identical inputs give identical archives
+
+
+def getPaths() -> tuple[str, str]:
+    '''Get the python base folder and the bundle folder
+
+    Returns:
+        tuple[str, str]: Python base folder, bundle folder
+    '''
+
+    pythonBaseDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return pythonBaseDir, os.path.join(pythonBaseDir, BUNDLE_STUB)
+
+
+def iterFiles(path: str):
+    '''Files below `path` (or `path` itself if it is a file), skipping `__pycache__`'''
+
+    if os.path.isfile(path):
+        yield path
+        return
+
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(x for x in dirs if x != '__pycache__')
+        for file in sorted(files):
+            yield os.path.join(root, file)
+
+
+def findPackages(pythonBaseDir: str) -> tuple[dict[str, str], list[str]]:
+    '''Split the top level packages and modules into bundled and loose ones
+
+    Returns:
+        tuple[dict[str, str], list[str]]: Bundled name -> package folder (or module file), loose names
+    '''
+
+    candidates = {name: os.path.join(pythonBaseDir, name) for name in PACKAGES}
+    libDir = os.path.join(pythonBaseDir, LIB_STUB)
+    for entry in sorted(os.listdir(libDir)):
+        path = os.path.join(libDir, entry)
+        if os.path.isdir(path) and entry.isidentifier() and os.path.isfile(os.path.join(path, '__init__.py')):
+            candidates[entry] = path
+        elif entry.endswith('.py') and entry[:-3].isidentifier() and entry != '__init__.py':
+            candidates[entry[:-3]] = path
+
+    bundled: dict[str, str] = {}
+    loose: list[str] = []
+    for name, path in candidates.items():
+        if name in KEEP_LOOSE or any(x.endswith(EXTENSION_SUFFIXES) for x in iterFiles(path)):
+            loose.append(name)
+        else:
+            bundled[name] = path
+
+    return bundled, loose
+
+
+def compileSource(source: bytes, archiveName: str, optimize: int=0) -> bytes:
+    '''Compile a module to the contents of an unchecked hash-based .pyc file (PEP 552), which zipimport never validates against a source'''
+
+    code = compile(source, archiveName, 'exec', dont_inherit=True, optimize=optimize)
+    flags = 0b01 # Hash-based, don't check source
+    return importlib.util.MAGIC_NUMBER + flags.to_bytes(4, 'little') + importlib.util.source_hash(source) + marshal.dumps(code)
+
+
+def writeEntry(archive: zipfile.ZipFile, name: str, data: bytes) -> None:
+    info = zipfile.ZipInfo(name, date_time=ZIP_DATE)
+    info.compress_type = archive.compression
+    info.external_attr = 0o644 << 16
+    archive.writestr(info, data)
+
+
+def indexArchive(path: str) -> dict[str, list[int]]:
+    '''Offset and size of the data of every entry in an uncompressed zip archive
+
+    Returns:
+        dict[str, list[int]]: Entry -> [offset, size]
+    '''
+
+    index: dict[str, list[int]] = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f'{path}: {info.filename} is compressed')
+
+            f.seek(info.header_offset + 26) # Local file header: name and extra field lengths, then the name, the extra field and the data
+            nameLength, extraLength = struct.unpack('<HH', f.read(4))
+            index[info.filename] = [info.header_offset + 30 + nameLength + extraLength, info.file_size]
+
+    return index
+
+
+def buildBundle(pythonBaseDir: str, bundleDir: str, optimize: int=0, verbose: bool=False) -> dict:
+    '''Write the code archive, the data archive with its index, and the bundle index
+
+    Args:
+        pythonBaseDir (str): Folder containing `proxi` and `lib`
+        bundleDir (str): Output folder
+        optimize (int, optional): Bytecode optimization level, as `python -O`. Docstrings are used at runtime, so don't go beyond 1. Defaults to 0.
+        verbose (bool, optional): List every bundled package. Defaults to False.
+
+    Returns:
+        dict: The bundle index
+    '''
+
+    start = time.perf_counter()
+    bundled, loose = findPackages(pythonBaseDir)
+    os.makedirs(bundleDir, exist_ok=True)
+
+    codeFile = os.path.join(bundleDir, CODE_ARCHIVE)
+    dataFile = os.path.join(bundleDir, DATA_ARCHIVE)
+    modules = 0
+    dataFiles = 0
+    sourceBytes = 0
+
+    # Write next to the targets and swap them in at the end, a running editor may have the old archives open
+    with zipfile.ZipFile(f'{codeFile}.tmp', 'w', zipfile.ZIP_STORED) as code, zipfile.ZipFile(f'{dataFile}.tmp', 'w', zipfile.ZIP_STORED) as data:
+        for name, path in bundled.items():
+            baseDir = os.path.dirname(path)
+            packageModules = 0
+            for file in iterFiles(path):
+                archiveName = os.path.relpath(file, baseDir).replace('\\', '/')
+                if file.endswith('.py'):
+                    with open(file, 'rb') as f:
+                        source = f.read()
+
+                    try:
+                        pyc = compileSource(source, archiveName, optimize=optimize)
+                    except SyntaxError as e:
+                        raise RuntimeError(f'Could not compile {file}: {e}') from e
+
+                    writeEntry(code, f'{archiveName}c', pyc)
+                    packageModules += 1
+                    sourceBytes += len(source)
+                elif not file.endswith(SKIP_SUFFIXES):
+                    with open(file, 'rb') as f:
+                        writeEntry(data, archiveName, f.read())
+                    dataFiles += 1
+
+            modules += packageModules
+            if verbose:
+                print(f'    {name}: {packageModules} module(s)')
+
+    dataIndex = indexArchive(f'{dataFile}.tmp')
+    os.replace(f'{codeFile}.tmp', codeFile)
+    os.replace(f'{dataFile}.tmp', dataFile)
+    with open(os.path.join(bundleDir, DATA_INDEX), 'w') as f:
+        json.dump(dataIndex, f, separators=(',', ':'))
+
+    index = {
+        'version': BUNDLE_VERSION,
+        'magic': importlib.util.MAGIC_NUMBER.hex(),
+        'python': '{}.{}'.format(*sys.version_info[:2]),
+        'packages': sorted(bundled),
+        'loose': sorted(loose),
+        'modules': modules,
+        'dataFiles': dataFiles
+    }
+    with open(os.path.join(bundleDir, BUNDLE_INDEX), 'w') as f:
+        json.dump(index, f, indent=4)
+
+    print(
+        f'Bundled {modules} module(s) ({sourceBytes / 1024 / 1024:.1f} MB of source) into {codeFile} '
+        f'({os.path.getsize(codeFile) / 1024 / 1024:.1f} MB) and {dataFiles} data file(s) into {dataFile} '
+        f'({os.path.getsize(dataFile) / 1024 / 1024:.1f} MB) in {time.perf_counter() - start:.1f} s, for Python {index["python"]}'
+    )
+    print(f'Bundled: {", ".join(index["packages"])}. Loose: {", ".join(index["loose"])}')
+
+    return index
+
+
+def main(bundleDir: str|None=None, optimize: int=0, verbose: bool=False):
+    pythonBaseDir, defaultBundleDir = getPaths()
+    buildBundle(pythonBaseDir, bundleDir or defaultBundleDir, optimize=optimize, verbose=verbose)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', help=f'Bundle folder. Defaults to `{BUNDLE_STUB}` in the python base folder')
+    parser.add_argument('--optimize', type=int, default=0, choices=[0, 1], help='Bytecode optimization level')
+    parser.add_argument('--verbose', action='store_true', help='List bundled packages')
+    args = parser.parse_args()
+    main(bundleDir=args.output, optimize=args.optimize, verbose=args.verbose)
\ No newline at end of file
@@ -5,8 +5,10 @@ from __future__ import annotations
 
 import os
 import io
+import ast
 import subprocess
 from enum import Enum, auto
+from typing import cast
 
 
 
@@ -17,6 +19,9 @@ SELF_IDENTIFIER = 'self.'
 SETUPUI_IDENTIFIER = 'def setupUi('
 DIALOG_IDENTIFIER = 'Dialog'
 MAINWINDOW_IDENTIFIER = 'MainWindow'
+LAZY_PAGES_IDENTIFIER = 'LAZY_PAGES'
+PAGE_CONTAINERS = ('QTabWidget', 'QStackedWidget') # Not `QToolBox`: it puts pages in a `QScrollArea`, which needs their layout before `setWidget`
+PAGE_ADD_METHODS = ('addTab', 'addWidget')
 
 
 class WindowType(Enum):
@@ -76,50 +81,361 @@ def typeHintTextClassGenerator(widgets: list[str], windowType: WindowType, force
 
 
 
-def main():
+def _isSelfAttribute(node: ast.AST) -> bool:
+    return isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'self'
+
+
+def _selfAttributes(node: ast.AST, context: type) -> set[str]:
+    '''Names of the `self.<name>` attributes read (`ast.Load`) or assigned (`ast.Store`) in a statement'''
+
+    return {x.attr for x in ast.walk(node) if _isSelfAttribute(x) and isinstance(x.ctx, context)} # type: ignore
+
+
+def _localNames(node: ast.AST, context: type) -> set[str]:
+    return {x.id for x in ast.walk(node) if isinstance(x, ast.Name) and isinstance(x.ctx, context)} - {'self'}
+
+
+def _statementLines(lines: list[str], body: list[ast.stmt]) -> list[tuple[int, int]]:
+    '''Line range (start, end) of each statement in a method body, with the blank lines and comments before it, and the
+    `#endif` closing a uic `#if QT_CONFIG(...)` guard after it
+    '''
+
+    ranges: list[tuple[int, int]] = []
+    start = body[0].lineno - 1
+    for stmt in body:
+        end = cast(int, stmt.end_lineno)
+        while end < len(lines) and lines[end].lstrip().startswith('#endif'):
+            end += 1
+        ranges.append((start, end))
+        start = end
+
+    return ranges
+
+
+def _isPageCall(stmt: ast.stmt, page: str) -> bool:
+    '''Is `stmt` a call on `self.<page>` that uses no other widgets'''
+
+    return (
+        isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, ast.Attribute)
+        and _isSelfAttribute(stmt.value.func.value) and cast(ast.Attribute, stmt.value.func.value).attr == page
+        and _selfAttributes(stmt, ast.Load) == {page}
+    )
+
+
+def findPages(body: list[ast.stmt]) -> dict[str, tuple[str, int, int]]:
+    '''Pages of the tab widgets and stacked widgets in a `setupUi` body, at any depth
+
+    Returns:
+        dict[str, tuple[str, int, int]]: Page -> (container, index of the last statement creating it, index of the statement adding it to the container). Statements in between build the page
+    '''
+
+    containers: set[str] = set()
+    created: dict[str, int] = {}
+    pages: dict[str, tuple[str, int, int]] = {}
+    for i, stmt in enumerate(body):
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and _isSelfAttribute(stmt.targets[0]) and isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, ast.Name):
+            name = cast(ast.Attribute, stmt.targets[0]).attr
+            if stmt.value.func.id in PAGE_CONTAINERS:
+                containers.add(name)
+            elif stmt.value.func.id == 'QWidget' and not stmt.value.args and not stmt.value.keywords:
+                created[name] = i # Parentless widget: a page, if a container adds it later on
+
+        elif isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, ast.Attribute):
+            call = stmt.value
+            func = cast(ast.Attribute, call.func)
+            if func.attr in PAGE_ADD_METHODS and _isSelfAttribute(func.value) and cast(ast.Attribute, func.value).attr in containers and call.args and _isSelfAttribute(call.args[0]):
+                page = cast(ast.Attribute, call.args[0]).attr
+                if page not in created:
+                    continue
+
+                # Calls on the page itself right after creating it (`setObjectName`, etc) stay with the creation
+                first = created.pop(page)
+                while first + 1 < i and _isPageCall(body[first + 1], page):
+                    first += 1
+
+                if first + 1 < i: # Nothing to build otherwise
+                    pages[page] = (cast(ast.Attribute, func.value).attr, first, i)
+
+    return pages
+
+
+def _planPages(setupBody: list[ast.stmt], translateBody: list[ast.stmt], pages: dict[str, tuple[str, int, int]], lazy: set[str]) -> tuple[list[str|None], list[str|None], dict[str, str], set[str]]:
+    '''Assign the statements of `setupUi` and `retranslateUi` to the lazy pages they build or use
+
+    A page gets the statements between its creation and the container adding it (minus those of lazy pages nested in
+    it), plus every later statement that uses the widgets (or local variables) those created. A statement using the
+    widgets of a page and of its parent pages goes to the innermost one, which is built last. Pages that share a
+    statement with an unrelated page, or with a local variable set elsewhere, can't be built on their own and are
+    returned as eager
+
+    Returns:
+        tuple[list[str|None], list[str|None], dict[str, str], set[str]]: Page of each `setupUi` statement and each `retranslateUi` statement (None: not part of a lazy page), nested page -> parent page, pages that must be built eagerly
+    '''
+
+    parents: dict[str, str] = {}
+    for page in lazy:
+        _, first, last = pages[page]
+        enclosing = [x for x in lazy if pages[x][1] < first and last < pages[x][2]]
+        if enclosing:
+            parents[page] = min(enclosing, key=lambda x: pages[x][2] - pages[x][1])
+
+    def lineage(page: str) -> set[str]:
+        chain = {page}
+        while page in parents:
+            page = parents[page]
+            chain.add(page)
+        return chain
+
+    # Outer pages first, so inner pages claim their own statements
+    setupOwners: list[str|None] = [None] * len(setupBody)
+    for page in sorted(lazy, key=lambda x: pages[x][1] - pages[x][2]):
+        _, first, last = pages[page]
+        setupOwners[first + 1:last] = [page] * (last - first - 1)
+
+    owned: dict[str, set[str]] = {x: set() for x in lazy}
+    eager: set[str] = set()
+
+    def assign(owners: list[str|None], body: list[ast.stmt]) -> None:
+        definedBy: dict[str, str|None] = {} # Local variable -> page of the statement that last assigned it
+        for i, stmt in enumerate(body):
+            used = _selfAttributes(stmt, ast.Load)
+            locals = [definedBy[x] for x in _localNames(stmt, ast.Load) if x in definedBy]
+            users = {x for x in lazy if used & owned[x]} | {x for x in locals if x is not None}
+            if owners[i] is not None:
+                users.add(cast(str, owners[i]))
+
+            page = max(users, key=lambda x: len(lineage(x)), default=None)
+            if page is not None and not users <= lineage(page) or any(x != page for x in locals):
+                eager.update(users)
+            else:
+                owners[i] = page
+
+            if owners[i] is not None:
+                owned[cast(str, owners[i])].update(_selfAttributes(stmt, ast.Store))
+
+            for name in _localNames(stmt, ast.Store):
+                definedBy[name] = owners[i]
+
+    assign(setupOwners, setupBody)
+    translateOwners: list[str|None] = [None] * len(translateBody)
+    assign(translateOwners, translateBody)
+    return setupOwners, translateOwners, parents, eager
+
+
+def splitLazyPages(source: str) -> str:
+    '''Split a uic generated `setupUi` by tab/stack page, so windows can build the pages they don't show yet later on
+
+    Each page's widgets move to a `setupPage_<page>` method and its texts to `retranslatePage_<page>`. Pages nested in
+    another page are split too, and built after it. `LAZY_PAGES` lists the pages per container, `setupUi(..., lazy=True)`
+    builds none of them and `setupPage` builds one (and its parents) on demand. A plain `setupUi(...)` still builds
+    everything. See `QtWindowBase.lazyPages`
+
+    Note: `QMetaObject.connectSlotsByName` doesn't see widgets of pages built after `setupUi`
+
+    Returns:
+        str: Split source, or `source` as it is if it has no pages that can be split (or was split already)
+    '''
+
+    tree = ast.parse(source)
+    uiClass = next((x for x in tree.body if isinstance(x, ast.ClassDef) and x.name.startswith('Ui_')), None)
+    if uiClass is None or any(isinstance(x, ast.Assign) and any(isinstance(y, ast.Name) and y.id == LAZY_PAGES_IDENTIFIER for y in x.targets) for x in uiClass.body):
+        return source
+
+    methods = {x.name: x for x in uiClass.body if isinstance(x, ast.FunctionDef)}
+    setupUi = methods.get('setupUi')
+    retranslateUi = methods.get('retranslateUi')
+    if setupUi is None or retranslateUi is None or len(setupUi.args.args) != 2:
+        return source
+
+    root = setupUi.args.args[1].arg
+    retranslateCall = next((i for i, x in enumerate(setupUi.body) if isinstance(x, ast.Expr) and isinstance(x.value, ast.Call) and _isSelfAttribute(x.value.func) and cast(ast.Attribute, x.value.func).attr == 'retranslateUi'), None)
+    if retranslateCall is None:
+        return source
+
+    pages = findPages(setupUi.body)
+    lazy = set(pages)
+    while True:
+        setupOwners, translateOwners, parents, eager = _planPages(setupUi.body, retranslateUi.body, pages, lazy)
+        if not eager:
+            break
+        lazy -= eager
+
+    if not lazy:
+        return source
+
+    lines = source.splitlines(keepends=True)
+    setupRanges = _statementLines(lines, setupUi.body)
+    translateRanges = _statementLines(lines, retranslateUi.body)
+
+    def chunks(ranges: list[tuple[int, int]], owners: list[str|None], page: str|None) -> str:
+        return ''.join(''.join(lines[start:end]) for (start, end), owner in zip(ranges, owners) if owner == page)
+
+    # In creation order: parents before the pages nested in them
+    containers: dict[str, list[str]] = {}
+    for page, (container, _, _) in pages.items():
+        if page in lazy:
+            containers.setdefault(container, []).append(page)
+
+    ordered = sorted(containers.items(), key=lambda x: pages[x[1][0]][1])
+    classLine = uiClass.lineno - 1
+    out = lines[:classLine + 1]
+    out.append(f'    {LAZY_PAGES_IDENTIFIER} = {{ # Container -> pages, built by `setupPage`\n')
+    out.extend(f'        {container!r}: {tuple(containerPages)!r},\n' for container, containerPages in ordered)
+    out.append('    }\n')
+    out.append('    LAZY_PAGE_PARENTS = { # Nested page -> page containing it, built first\n')
+    out.extend(f'        {page!r}: {parents[page]!r},\n' for _, containerPages in ordered for page in containerPages if page in parents)
+    out.append('    }\n\n')
+    out.extend(lines[classLine + 1:setupUi.lineno - 1])
+    out.append(lines[setupUi.lineno - 1].replace(f'def setupUi(self, {root}):', f'def setupUi(self, {root}, lazy=False):'))
+    out.extend(lines[setupUi.lineno:setupRanges[0][0]])
+    for i, ((start, end), owner) in enumerate(zip(setupRanges, setupOwners)):
+        if i == retranslateCall:
+            out.append(
+                '        self.builtPages = set()\n'
+                '        if not lazy:\n'
+                f'            for pages in self.{LAZY_PAGES_IDENTIFIER}.values():\n'
+                '                for page in pages:\n'
+                f'                    self.setupPage({root}, page, retranslate=False)\n'
+            )
+        if owner is None:
+            out.extend(lines[start:end])
+
+    out.extend(lines[setupRanges[-1][1]:translateRanges[0][0]])
+    out.append(chunks(translateRanges, translateOwners, None))
+    out.append(
+        '        for page in self.builtPages:\n'
+        f"            getattr(self, f'retranslatePage_{{page}}')({root})\n"
+    )
+
+    # After the trailing `# retranslateUi` comment
+    end = translateRanges[-1][1]
+    while end < len(lines) and lines[end].startswith('    #'):
+        end += 1
+    out.extend(lines[translateRanges[-1][1]:end])
+
+    out.append(
+        '\n'
+        f'    def setupPage(self, {root}, page, retranslate=True):\n'
+        '        if page in self.builtPages:\n'
+        '            return False\n\n'
+        '        parent = self.LAZY_PAGE_PARENTS.get(page)\n'
+        '        if parent is not None:\n'
+        f'            self.setupPage({root}, parent, retranslate)\n\n'
+        '        self.builtPages.add(page)\n'
+        f"        getattr(self, f'setupPage_{{page}}')({root})\n"
+        '        widget = getattr(self, page).parentWidget()\n'
+        '        while widget is not None: # Hidden pages don\'t pass size hint changes on, their containers cached the empty page\'s\n'
+        '            widget.updateGeometry()\n'
+        '            widget = widget.parentWidget()\n'
+        '        if retranslate:\n'
+        f"            getattr(self, f'retranslatePage_{{page}}')({root})\n"
+        '        return True\n'
+        '    # setupPage\n'
+    )
+    for _, containerPages in ordered:
+        for page in containerPages:
+            setupText = chunks(setupRanges, setupOwners, page).lstrip('\n')
+            translateText = chunks(translateRanges, translateOwners, page).lstrip('\n') or '        pass\n'
+            out.append(
+                '\n'
+                f'    def setupPage_{page}(self, {root}):\n'
+                f'{setupText}'
+                f'    # setupPage_{page}\n\n'
+                f'    def retranslatePage_{page}(self, {root}):\n'
+                f'{translateText}'
+                f'    # retranslatePage_{page}\n'
+            )
+
+    out.extend(lines[end:])
+    return ''.join(out)
+
+
+
+def getPaths() -> tuple[str, str]:
+    '''Get the UIC executable and the UI source directory
+
+    Returns:
+        tuple[str, str]: uic path, ui directory
+    '''
 
     thisDir = os.path.dirname(__file__)
     pythonBaseDir = os.path.dirname(thisDir)
 
     uicExe = os.path.join(pythonBaseDir, 'lib/PySide6/uic.exe').replace('\\', '/')
     uiDir = os.path.join(pythonBaseDir, 'proxi/ui').replace('\\', '/')
+    return uicExe, uiDir
+
 
-    compiledFiles: list[str] = []
+def findUiFiles(uiDir: str) -> list[str]:
+    '''All .ui files below `uiDir`'''
 
-    # Compile UI files with UIC
+    uiFiles: list[str] = []
     for root, dirs, files in os.walk(uiDir):
         for file in files:
-            if not file.endswith('.ui'):
-                continue
-
-            fullPath = os.path.join(root, file).replace('\\', '/')
-            outPath = fullPath.replace('.ui', '_ui.py')
-            compiledFiles.append(outPath)
-
-            print(f'Compiling {fullPath}')
-            command = f'"{uicExe}" "{fullPath}" -g python -o "{outPath}"'
-            result = subprocess.call(command, shell=True)
-            if result == 0:
-                print('Success')
-            else:
-                print('ERROR!')
+            if file.endswith('.ui'):
+                uiFiles.append(os.path.join(root, file).replace('\\', '/'))
+
+    return uiFiles
+
+
+def compileUiFile(uicExe: str, fullPath: str) -> str|None:
+    '''Compile one .ui file with UIC, split `setupUi` into lazy pages, and inject type hinting
+
+    Returns:
+        str|None: Compiled `_ui.py` file, None if compilation failed
+    '''
+
+    fullPath = fullPath.replace('\\', '/')
+    outPath = fullPath.replace('.ui', '_ui.py')
+
+    print(f'Compiling {fullPath}')
+    command = f'"{uicExe}" "{fullPath}" -g python -o "{outPath}"'
+    result = subprocess.call(command, shell=True)
+    if result == 0:
+        print('Success')
+    else:
+        print('ERROR!')
+        return None
+
+    # Split `setupUi` by top level tab/stack page, for windows with `lazyPages`
+    with open(outPath, 'r') as f:
+        source = f.read()
+
+    split = splitLazyPages(source)
+    if split != source:
+        print(f'Splitting setupUi into lazy pages for {outPath}')
+        with open(outPath, 'w') as f:
+            f.write(split)
 
     # Inject type hinting
-    for file in compiledFiles:
-        print(f'Generating type-hinting for {file}')
-        widgets: list[str] = []
-        windowType: WindowType = WindowType.invalid
-
-        with open(file, 'r+') as f:
-            for line in f.readlines():
-                # print(line)
-                if isSetupUiDefinition(line):
-                    windowType = getWindowType(line)
-                elif isWidgetDefinition(line):
-                    widgets.append(line)
-
-            f.seek(0, io.SEEK_END)
-            f.writelines(typeHintTextClassGenerator(widgets, windowType))
+    print(f'Generating type-hinting for {outPath}')
+    widgets: list[str] = []
+    windowType: WindowType = WindowType.invalid
+
+    with open(outPath, 'r+') as f:
+        for line in f.readlines():
+            # print(line)
+            if isSetupUiDefinition(line):
+                windowType = getWindowType(line)
+            elif isWidgetDefinition(line):
+                widgets.append(line)
+
+        f.seek(0, io.SEEK_END)
+        f.writelines(typeHintTextClassGenerator(widgets, windowType))
+
+    return outPath
+
+
+def main(files: list[str]|None=None):
+    '''Compile .ui files
+
+    Args:
+        files (list[str], optional): .ui files to compile. Defaults to None, which means all of them.
+    '''
+
+    uicExe, uiDir = getPaths()
+    for fullPath in (files if files is not None else findUiFiles(uiDir)):
+        compileUiFile(uicExe, fullPath)
 
     print('Done')
 
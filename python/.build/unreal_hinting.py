@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
-'''Modify the unreal.py stubs to include type hinting
+'''Modify the unreal.py stubs to include type hinting, and split them into a `.pyi` stubs package
+
+The package (`.autocomplete/stubs/unreal`) has one module per class category and an index `__init__.pyi`, so type
+checkers bind many small files instead of one giant one. It is only rebuilt when the source stubs (or this script) change
 
 To export a Python stub file from the Unreal Python plugin, follow these directions:
     https://sondreutheim.com/post/getting_started_with_python_in_ue4#4-autocomplete-in-vs-code
@@ -9,6 +12,11 @@ from __future__ import annotations
 
 import os
 import re
+import json
+import shutil
+import hashlib
+import argparse
+from collections import deque
 
 
 TARGET_STUBS_FILENAME = 'unreal_orig_5.py'
@@ -50,65 +58,151 @@ class Patterns:
     returnActual = re.compile(r'\s+?(pass|return None)\s*?')
 
 
-def main(verbose: bool = False):
+class Prefixes:
+    '''Cheap substring checks, necessary for the `Patterns` to match. Lines failing them skip the regex'''
+
+    className = 'class '
+    returnTypeHint = ') -> '
+    returnActual = ('pass', 'return None')
+
+
+LOOKBACK = 3 # Lines held back while streaming: a method's signature docstring line is 2 lines below its `def`
+
+STUBS_PACKAGE = 'unreal'
+CORE_MODULE = '_core' # Module level functions, constants, and classes outside the class hierarchy
+MANIFEST_FILENAME = '_manifest.json'
+SPLIT_ROOTS = ['Object', 'StructBase'] # Too big for one module, split by their direct sub classes instead
+MIN_MODULE_CLASSES = 20 # Smaller categories are merged into their root's module
+IDENTIFIER = re.compile(r'[A-Za-z_]\w*')
+TOP_LEVEL_NAME = re.compile(r'(?:def (\w+)|(\w+)\s*[:=])')
+
+
+def getPaths() -> tuple[str, str]:
+    '''Get the input stubs file and processed output file
+
+    Returns:
+        tuple[str, str]: Unreal stubs file, processed file
+    '''
 
     thisDir = os.path.dirname(__file__)
     pythonBaseDir = os.path.dirname(thisDir)
     autocompleteDir = os.path.join(pythonBaseDir, '.autocomplete')
-    unrealStubsFile = os.path.join(autocompleteDir, TARGET_STUBS_FILENAME)
-    processedFile = os.path.join(autocompleteDir, 'unreal.py')
+    return os.path.join(autocompleteDir, TARGET_STUBS_FILENAME), os.path.join(autocompleteDir, 'unreal.py')
 
-    unrealTypes: list[str] = []
-    hintedTypes: list[str] = []
-    buffer: list[str] = []
-    # lastTypeHint: str = ''
 
-    print(f'Parsing file {unrealStubsFile}...')
-    with open(unrealStubsFile, 'r') as f:
-        for line in f.readlines():
-            if 'import ' in line:
-                line = line.encode("ascii", "ignore").decode()
+def getStubsPackageDir() -> str:
+    '''Get the `.pyi` stubs package directory. Point your type checker's stub path to its parent (see pyrightconfig.json)'''
 
-            buffer.append(line)
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), '.autocomplete', 'stubs', STUBS_PACKAGE)
 
-            # This is a class declaration
-            classMatch = Patterns.className.match(line)
-            if classMatch:
-                # lastTypeHint = ''
-                className = classMatch.group(2)
-                if not className.startswith('_'):
-                    unrealTypes.append(className)
 
-                # Class inheritance needs some nudging
-                if className in ITERABLES:
-                    indent = classMatch.group(1)
-                    whitespace = classMatch.group(4) or ''
-                    inheritance = classMatch.group(3)
-                    correction = [ITERABLES[className]]
-                    if inheritance:
-                        correction.insert(0, inheritance)
+def matchClassName(line: str) -> re.Match|None:
+    if not line.lstrip().startswith(Prefixes.className):
+        return None
 
-                    buffer[-1] = f'{indent}class {className}({", ".join(correction)}):{whitespace}'
-                continue
+    return Patterns.className.match(line)
 
-            # This is a type-signature for a method
-            typeMatch = Patterns.returnTypeHint.match(line)
-            if typeMatch:
-                typeName = typeMatch.group(2)
-                typeName = CORRECTIONS.get(typeName, typeName)
-                # lastTypeHint = typeName if not typeName.startswith('_') else ''
-                hintedTypes.append(typeName)
-                continue
 
-            # This is a return statement
-            # if lastTypeHint and lastTypeHint != 'None':
-            #     returnMatch = Patterns.returnActual.match(line)
-            #     if returnMatch:
-            #         oldStatement = returnMatch.group(1)
-            #         newStatement = f'return {lastTypeHint}()'
-            #         buffer[-1] = line.replace(oldStatement, newStatement)
+def matchReturnTypeHint(line: str) -> re.Match|None:
+    if Prefixes.returnTypeHint not in line:
+        return None
 
-    print('Done!')
+    return Patterns.returnTypeHint.match(line)
+
+
+def fixImport(line: str) -> str:
+    if 'import ' in line:
+        line = line.encode("ascii", "ignore").decode()
+
+    return line
+
+
+def fixInheritance(line: str, classMatch: re.Match|None) -> str:
+    '''Iterable classes inherit from their Python counterpart, eg. `Array` from `list`'''
+
+    if classMatch:
+        # Class inheritance needs some nudging
+        className = classMatch.group(2)
+        if className in ITERABLES:
+            indent = classMatch.group(1)
+            whitespace = classMatch.group(4) or ''
+            inheritance = classMatch.group(3)
+            correction = [ITERABLES[className]]
+            if inheritance:
+                correction.insert(0, inheritance)
+
+            line = f'{indent}class {className}({", ".join(correction)}):{whitespace}'
+
+    return line
+
+
+def resolveReturnType(typeMatch: re.Match, unrealTypesSet: set[str]) -> tuple[str, str]:
+    '''Get the type hint for a method's return type signature
+
+    Returns:
+        tuple[str, str]: Return type hint, type to instantiate in the return statement
+    '''
+
+    returnTypeRaw = typeMatch.group(2)
+    returnTypeRaw = CORRECTIONS.get(returnTypeRaw, returnTypeRaw)
+    returnTypeSub = typeMatch.group(3)
+
+    if returnTypeRaw == DEFAULT or not (returnTypeRaw in BUILTINS or returnTypeRaw in unrealTypesSet):
+        return DEFAULT, DEFAULT
+
+    returnTypeActual = returnTypeRaw
+    if returnTypeSub:
+
+        ## It's actually better to keep this 'incorrect', which produces an incomplete type hint, which in turn is less annoying for
+        ## Unreal methods that return sub-types specific to the input Array[MovieSceneScriptingChannel] vs. Array[MovieSceneScriptingFloatChannel], etc
+        # returnTypeActual = ITERABLES.get(returnTypeActual, returnTypeActual) # Translates Array->list, etc
+
+        returnTypesSub: list[str] = []
+        for typ in returnTypeSub.split(','):
+            typ = typ.strip()
+            typ = CORRECTIONS.get(typ, typ)
+            if typ in BUILTINS or typ in unrealTypesSet:
+                returnTypesSub.append(typ)
+            else:
+                returnTypesSub.append(DEFAULT)
+
+        returnTypeActual = f'{returnTypeActual}[{", ".join(returnTypesSub)}]'
+
+    return returnTypeActual, returnTypeRaw
+
+
+def hintTarget(targetLine: str, i: int, typeMatch: re.Match, returnTypeActual: str) -> str|None:
+    '''Add the return type hint to a method definition line, None if the line isn't the expected definition'''
+
+    targetLineNum = i - 2
+    methodName = typeMatch.group(1)
+    if not methodName in targetLine:
+        print(f'ERROR: Line {i} -> Target line {targetLineNum} does not contain expected method name {methodName}')
+        return None
+    elif not targetLine.strip().endswith(':'):
+        print(f'ERROR: Line {i} -> Target line {targetLineNum} does not end with a colon, perhaps it\'s already type hinted?')
+        return None
+
+    return targetLine.replace(':', f' -> {returnTypeActual}:')
+
+
+def hintReturn(line: str, returnMatch: re.Match, returnTypeObjectBuffer: str) -> str|None:
+    '''Replace a stub return statement with an instance of the return type, None if there's nothing to instantiate'''
+
+    if returnTypeObjectBuffer and returnTypeObjectBuffer not in ['None', 'type']:
+        oldStatement = returnMatch.group(1)
+        newStatement = f'return {returnTypeObjectBuffer}()'
+        return line.replace(oldStatement, newStatement)
+
+    return None
+
+
+def printTypeStats(unrealTypes: list[str], hintedTypes: list[str], verbose: bool=False) -> set[str]:
+    '''Print what was found in the stubs
+
+    Returns:
+        set[str]: Unreal types
+    '''
 
     unrealTypesSet = set(unrealTypes)
     hintedTypesSet = set(hintedTypes)
@@ -135,6 +229,158 @@ def main(verbose: bool = False):
         for typ in sorted(unaccountedForSet, key=lambda x: x.lower()):
             print(f'    {typ}')
 
+    return unrealTypesSet
+
+
+def indexTypes(unrealStubsFile: str) -> tuple[list[str], list[str]]:
+    '''First pass: collect class names and hinted return types, without keeping any lines in memory
+
+    Returns:
+        tuple[list[str], list[str]]: Unreal types, hinted types
+    '''
+
+    unrealTypes: list[str] = []
+    hintedTypes: list[str] = []
+    with open(unrealStubsFile, 'r') as f:
+        for line in f:
+            if 'import ' in line:
+                line = fixImport(line)
+
+            if Prefixes.className in line:
+                classMatch = matchClassName(line)
+                if classMatch:
+                    className = classMatch.group(2)
+                    if not className.startswith('_'):
+                        unrealTypes.append(className)
+                    continue
+
+            typeMatch = matchReturnTypeHint(line)
+            if typeMatch:
+                typeName = typeMatch.group(2)
+                hintedTypes.append(CORRECTIONS.get(typeName, typeName))
+
+    return unrealTypes, hintedTypes
+
+
+def processStreaming(unrealStubsFile: str, processedFile: str, verbose: bool=False) -> int:
+    '''Hint the stubs in two streaming passes: index the types, then rewrite while writing out with a `LOOKBACK` line window
+
+    Returns:
+        int: Number of replacements. The processed file is only written if there were any
+    '''
+
+    print(f'Indexing file {unrealStubsFile}...')
+    unrealTypes, hintedTypes = indexTypes(unrealStubsFile)
+    print('Done!')
+
+    unrealTypesSet = printTypeStats(unrealTypes, hintedTypes, verbose=verbose)
+
+    print('\nProcessing method signatures...')
+    replacements = 0
+    returnTypeObjectBuffer = ''
+    window: deque[str] = deque()
+    tempFile = f'{processedFile}.tmp'
+    with open(unrealStubsFile, 'r') as src, open(tempFile, 'w') as dst:
+        for imp in EXTRA_IMPORTS:
+            dst.write(f'{imp}\n')
+
+        # Prefix checks are inlined below, this loop runs for every line of a very large file
+        classPrefix = Prefixes.className
+        typeHintPrefix = Prefixes.returnTypeHint
+        returnPrefixes = Prefixes.returnActual
+        write = dst.write
+        for i, line in enumerate(src):
+            if len(window) == LOOKBACK:
+                write(window.popleft())
+
+            if 'import ' in line:
+                line = fixImport(line)
+
+            # This is a class declaration
+            if classPrefix in line:
+                classMatch = matchClassName(line)
+                if classMatch:
+                    window.append(fixInheritance(line, classMatch))
+                    returnTypeObjectBuffer = ''
+                    continue
+
+            window.append(line)
+
+            # This is a type-signature for a method
+            typeMatch = Patterns.returnTypeHint.match(line) if typeHintPrefix in line else None
+            if typeMatch:
+                returnTypeActual, returnTypeObjectBuffer = resolveReturnType(typeMatch, unrealTypesSet)
+                if i < 2:
+                    print(f'ERROR: Line {i} -> Target line {i - 2} is invalid')
+                    continue
+
+                hinted = hintTarget(window[-3], i, typeMatch, returnTypeActual)
+                if hinted is not None:
+                    window[-3] = hinted
+                    replacements += 1
+                continue
+
+            # Return statement
+            returnMatch = Patterns.returnActual.match(line) if returnPrefixes[0] in line or returnPrefixes[1] in line else None
+            if returnMatch:
+                hinted = hintReturn(line, returnMatch, returnTypeObjectBuffer)
+                if hinted is not None:
+                    window[-1] = hinted
+                    replacements += 1
+
+                returnTypeObjectBuffer = ''
+
+        dst.writelines(window)
+
+    print('Done!')
+
+    if not replacements:
+        os.remove(tempFile)
+        print('No replacements were made! This is bad news...')
+        return 0
+
+    print(f'Inserted {replacements} type hints')
+    print(f'Writing content to {processedFile}...')
+    os.replace(tempFile, processedFile)
+    print('Done!')
+    return replacements
+
+
+def processBuffered(unrealStubsFile: str, processedFile: str, verbose: bool=False) -> int:
+    '''Hint the stubs with the whole file in memory. Reference for `processStreaming`, which produces identical output
+
+    Returns:
+        int: Number of replacements. The processed file is only written if there were any
+    '''
+
+    unrealTypes: list[str] = []
+    hintedTypes: list[str] = []
+    buffer: list[str] = []
+
+    print(f'Parsing file {unrealStubsFile}...')
+    with open(unrealStubsFile, 'r') as f:
+        for line in f.readlines():
+            line = fixImport(line)
+            classMatch = Patterns.className.match(line)
+            buffer.append(fixInheritance(line, classMatch))
+
+            # This is a class declaration
+            if classMatch:
+                className = classMatch.group(2)
+                if not className.startswith('_'):
+                    unrealTypes.append(className)
+                continue
+
+            # This is a type-signature for a method
+            typeMatch = Patterns.returnTypeHint.match(line)
+            if typeMatch:
+                typeName = typeMatch.group(2)
+                hintedTypes.append(CORRECTIONS.get(typeName, typeName))
+
+    print('Done!')
+
+    unrealTypesSet = printTypeStats(unrealTypes, hintedTypes, verbose=verbose)
+
     print('\nProcessing method signatures...')
     replacements = 0
     returnTypeObjectBuffer = ''
@@ -150,58 +396,23 @@ def main(verbose: bool = False):
         typeMatch = Patterns.returnTypeHint.match(line)
         if typeMatch:
             targetLineNum = i-2
-            methodName = typeMatch.group(1)
-            returnTypeRaw = typeMatch.group(2)
-            returnTypeRaw = CORRECTIONS.get(returnTypeRaw, returnTypeRaw)
-            returnTypeSub = typeMatch.group(3)
-
-            if returnTypeRaw != DEFAULT and (returnTypeRaw in BUILTINS or returnTypeRaw in unrealTypesSet):
-                returnTypeActual = returnTypeRaw
-                returnTypeObjectBuffer = returnTypeRaw
-                if returnTypeSub:
-
-                    ## It's actually better to keep this 'incorrect', which produces an incomplete type hint, which in turn is less annoying for
-                    ## Unreal methods that return sub-types specific to the input Array[MovieSceneScriptingChannel] vs. Array[MovieSceneScriptingFloatChannel], etc
-                    # returnTypeActual = ITERABLES.get(returnTypeActual, returnTypeActual) # Translates Array->list, etc
-
-                    returnTypesSub: list[str] = []
-                    for typ in returnTypeSub.split(','):
-                        typ = typ.strip()
-                        typ = CORRECTIONS.get(typ, typ)
-                        if typ in BUILTINS or typ in unrealTypesSet:
-                            returnTypesSub.append(typ)
-                        else:
-                            returnTypesSub.append(DEFAULT)
-
-                    returnTypeActual = f'{returnTypeActual}[{", ".join(returnTypesSub)}]'
-            else:
-                returnTypeActual = DEFAULT
-                returnTypeObjectBuffer = DEFAULT
-
+            returnTypeActual, returnTypeObjectBuffer = resolveReturnType(typeMatch, unrealTypesSet)
             if targetLineNum < 0:
                 print(f'ERROR: Line {i} -> Target line {targetLineNum} is invalid')
                 continue
 
-            targetLine = buffer[targetLineNum]
-            if not methodName in targetLine:
-                print(f'ERROR: Line {i} -> Target line {targetLineNum} does not contain expected method name {methodName}')
-                continue
-            elif not targetLine.strip().endswith(':'):
-                print(f'ERROR: Line {i} -> Target line {targetLineNum} does not end with a colon, perhaps it\'s already type hinted?')
-                continue
-
-            buffer[targetLineNum] = targetLine.replace(':', f' -> {returnTypeActual}:')
-            replacements += 1
-
+            hinted = hintTarget(buffer[targetLineNum], i, typeMatch, returnTypeActual)
+            if hinted is not None:
+                buffer[targetLineNum] = hinted
+                replacements += 1
             continue
 
         # Return statement
         returnMatch = Patterns.returnActual.match(line)
         if returnMatch:
-            if returnTypeObjectBuffer and returnTypeObjectBuffer not in ['None', 'type']:
-                oldStatement = returnMatch.group(1)
-                newStatement = f'return {returnTypeObjectBuffer}()'
-                buffer[i] = line.replace(oldStatement, newStatement)
+            hinted = hintReturn(line, returnMatch, returnTypeObjectBuffer)
+            if hinted is not None:
+                buffer[i] = hinted
                 replacements += 1
 
             returnTypeObjectBuffer = ''
@@ -210,7 +421,7 @@ def main(verbose: bool = False):
 
     if not replacements:
         print('No replacements were made! This is bad news...')
-        return
+        return 0
 
     print(f'Inserted {replacements} type hints')
     print(f'Writing content to {processedFile}...')
@@ -222,9 +433,245 @@ def main(verbose: bool = False):
             f.write(line)
 
     print('Done!')
+    return replacements
+
+
+def hashStubs(unrealStubsFile: str) -> str:
+    '''Cache key for the stubs package: the source stubs, and this script (so changes to the processing rebuild)'''
+
+    digest = hashlib.sha256()
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+
+    with open(unrealStubsFile, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def readManifest(packageDir: str) -> dict|None:
+    try:
+        with open(os.path.join(packageDir, MANIFEST_FILENAME), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def isStubsPackageCurrent(packageDir: str, sourceHash: str) -> bool:
+    '''Was the stubs package built from these exact source stubs, and are all its modules still there?'''
+
+    manifest = readManifest(packageDir)
+    if not manifest or manifest.get('sourceHash') != sourceHash:
+        return False
+
+    return all(os.path.isfile(os.path.join(packageDir, f'{x}.pyi')) for x in ['__init__', *manifest.get('modules', {})])
+
+
+def snakeCase(name: str) -> str:
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', name).lower()
+
+
+def readClassBases(processedFile: str) -> dict[str, list[str]]:
+    '''Index pass for splitting: top level class name -> base class names, in declaration order'''
+
+    bases: dict[str, list[str]] = {}
+    with open(processedFile, 'r') as f:
+        for line in f:
+            if not line.startswith(Prefixes.className):
+                continue
+
+            classMatch = Patterns.className.match(line)
+            if classMatch:
+                bases[classMatch.group(2)] = [x.strip() for x in (classMatch.group(3) or '').split(',') if x.strip()]
+
+    return bases
+
+
+def categorize(bases: dict[str, list[str]]) -> dict[str, str]:
+    '''Assign every class to a stubs module, by inheritance root (`StructBase` -> `_struct_base`)
+
+    Classes under a `SPLIT_ROOTS` class are grouped by their ancestor right below it instead (`Actor` and all its sub
+    classes -> `_actor`). Categories with less than `MIN_MODULE_CLASSES` classes are merged into their root's module
+
+    Returns:
+        dict[str, str]: Class name -> module name
+    '''
+
+    def ancestry(className: str) -> list[str]:
+        chain = [className]
+        while True:
+            parent = next((x for x in bases.get(chain[-1], []) if x in bases and x not in chain), None)
+            if parent is None:
+                return [x for x in reversed(chain) if not x.startswith('_')]
+
+            chain.append(parent)
+
+    categories: dict[str, str] = {}
+    roots: dict[str, str] = {}
+    for className in bases:
+        chain = ancestry(className)
+        if not chain:
+            categories[className] = CORE_MODULE
+            continue
+
+        root = f'_{snakeCase(chain[0])}'
+        roots[className] = root
+        if chain[0] in SPLIT_ROOTS and len(chain) > 1:
+            categories[className] = f'{root}_{snakeCase(chain[1])}'
+        else:
+            categories[className] = root
+
+    sizes: dict[str, int] = {}
+    for module in categories.values():
+        sizes[module] = sizes.get(module, 0) + 1
+
+    for className, module in categories.items():
+        if sizes[module] < MIN_MODULE_CLASSES and className in roots:
+            categories[className] = roots[className]
+
+    return categories
+
+
+def splitStubs(processedFile: str, packageDir: str, sourceHash: str) -> dict[str, list[str]]:
+    '''Split the processed stubs into a `.pyi` package, streaming each top level statement into its category's module
+
+    Every module imports the names it uses from its siblings, `__init__.pyi` re-exports all public names, and
+    `MANIFEST_FILENAME` records the source hash and module contents. The package is swapped in only once complete
+
+    Returns:
+        dict[str, list[str]]: Module name -> names defined in it
+    '''
+
+    categories = categorize(readClassBases(processedFile))
+    buildDir = f'{packageDir}.tmp'
+    shutil.rmtree(buildDir, ignore_errors=True)
+    os.makedirs(buildDir)
+
+    bodies = {}
+    names: dict[str, list[str]] = {}
+    references: dict[str, set[str]] = {}
+    def body(module: str):
+        if module not in bodies:
+            bodies[module] = open(os.path.join(buildDir, f'{module}.body'), 'w')
+            references[module] = set()
+
+        return bodies[module]
+
+    module = CORE_MODULE
+    pending: list[str] = [] # Top level decorators and comments, they belong to the next statement
+    quote: str|None = None # Open triple quote, if inside a multi line string
+    try:
+        with open(processedFile, 'r') as src:
+            for line in src:
+                if quote is None and line[:1] not in ('', ' ', '\t', '\n', '\r'):
+                    if line.strip() in EXTRA_IMPORTS:
+                        continue
+
+                    if line.startswith(('@', '#')):
+                        pending.append(line)
+                        continue
+
+                    classMatch = Patterns.className.match(line) if line.startswith(Prefixes.className) else None
+                    if classMatch:
+                        module = categories[classMatch.group(2)]
+                        names.setdefault(module, []).append(classMatch.group(2))
+                    else:
+                        module = CORE_MODULE
+                        nameMatch = TOP_LEVEL_NAME.match(line)
+                        if nameMatch:
+                            names.setdefault(module, []).append(nameMatch.group(1) or nameMatch.group(2))
+
+                    body(module).writelines(pending)
+                    pending.clear()
+
+                body(module).write(line)
+
+                if quote is None:
+                    references[module].update(IDENTIFIER.findall(line))
+                    opening = next((x for x in ('"""', "'''") if x in line), None)
+                    if opening and line.count(opening) % 2:
+                        quote = opening
+                elif line.count(quote) % 2:
+                    quote = None
+    finally:
+        for f in bodies.values():
+            f.close()
+
+    # Modules: header, imports from siblings, body
+    definedIn = {name: module for module, moduleNames in names.items() for name in moduleNames}
+    for module in bodies:
+        imports: dict[str, list[str]] = {}
+        for name in sorted(references[module]):
+            other = definedIn.get(name)
+            if other and other != module:
+                imports.setdefault(other, []).append(name)
+
+        bodyFile = os.path.join(buildDir, f'{module}.body')
+        with open(os.path.join(buildDir, f'{module}.pyi'), 'w') as dst:
+            dst.write(f'# Generated by {os.path.basename(__file__)}, do not edit\n')
+            for other in sorted(imports):
+                dst.write(f'from .{other} import {", ".join(imports[other])}\n')
+
+            dst.write('\n')
+            with open(bodyFile, 'r') as src:
+                shutil.copyfileobj(src, dst)
+
+        os.remove(bodyFile)
+
+    # Index
+    with open(os.path.join(buildDir, '__init__.pyi'), 'w') as dst:
+        dst.write(f'# Generated by {os.path.basename(__file__)}, do not edit\n')
+        for module in sorted(names):
+            exported = [x for x in names[module] if not x.startswith('_')]
+            if exported:
+                dst.write(f'from .{module} import (\n')
+                dst.writelines(f'    {x} as {x},\n' for x in dict.fromkeys(exported))
+                dst.write(')\n')
+
+    with open(os.path.join(buildDir, MANIFEST_FILENAME), 'w') as dst:
+        json.dump({'source': os.path.basename(processedFile), 'sourceHash': sourceHash, 'modules': names}, dst, indent=1)
+
+    shutil.rmtree(packageDir, ignore_errors=True)
+    os.replace(buildDir, packageDir)
+    return names
+
+
+def buildStubsPackage(unrealStubsFile: str, processedFile: str, packageDir: str, verbose: bool=False, buffered: bool=False, force: bool=False) -> bool:
+    '''Hint the stubs and split them into a `.pyi` package, unless the package was already built from the same source
+
+    Returns:
+        bool: True if (re)built
+    '''
+
+    sourceHash = hashStubs(unrealStubsFile)
+    if not force and os.path.isfile(processedFile) and isStubsPackageCurrent(packageDir, sourceHash):
+        print(f'Stubs package {packageDir} is up to date')
+        return False
+
+    process = processBuffered if buffered else processStreaming
+    if not process(unrealStubsFile, processedFile, verbose=verbose):
+        return False
+
+    print(f'\nSplitting stubs into {packageDir}...')
+    modules = splitStubs(processedFile, packageDir, sourceHash)
+    print(f'Done! {len(modules)} modules')
+    if verbose:
+        for module in sorted(modules):
+            print(f'    {module}: {len(modules[module])}')
+
+    return True
 
 
+def main(verbose: bool = False, buffered: bool = False, force: bool = False):
+    unrealStubsFile, processedFile = getPaths()
+    buildStubsPackage(unrealStubsFile, processedFile, getStubsPackageDir(), verbose=verbose, buffered=buffered, force=force)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--verbose', action='store_true', help='List all types found')
+    parser.add_argument('--buffered', action='store_true', help='Read the whole stubs file into memory (slower, reference implementation)')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if the stubs package is up to date')
+    args = parser.parse_args()
+    main(verbose=args.verbose, buffered=args.buffered, force=args.force)
\ No newline at end of file
@@ -12,36 +12,545 @@ a different repository than end-users.
 
 If you want to auto-populate various UI elements with a default project
 see the `os.environ` calls below.
+
+The resolved install root and a module -> file manifest of the `proxi` and `lib` packages are cached in
+`%LOCALAPPDATA%/Proxi/Unreal`, per location of this file (each project, or a moved install, gets its own). A meta path finder serves those modules straight from the manifest, so our folders are
+only appended to `sys.path` instead of being scanned first by every import in the editor. Set `PROXI_BOOTSTRAP_VERBOSE`
+to print each step, or `PROXI_BOOTSTRAP_NOCACHE` to bypass the cache. Bootstrap timings end up in `PROXI_BOOTSTRAP_TIMES`
+
+If the install root has a bundle built by `.build/bundle.py` for this interpreter, the bundled packages are imported
+from its bytecode archive instead, and babel/pytz read their data from its data archive. Set `PROXI_BOOTSTRAP_NOBUNDLE`
+to use the loose files regardless. Developer paths, and developer or debug mode (see `proxi.dev`), always use the loose
+files, so a stale bundle never shadows the sources being edited
 '''
 
+import io
 import os
 import sys
+import json
+import hashlib
+import time
+import zipimport
+import tempfile
+import threading
 import traceback
+import importlib.abc
+import importlib.util
+import importlib.machinery
 
 # Developer vs. production paths
 DEVELOPERPATHS = [r'C:\GIT\ue5-error-example\python', r'D:\GIT\ue5-error-example\python']
 LIB_STUB = 'lib'
+PACKAGE_STUBS = ['proxi'] # Packages in the install root, on top of everything in `lib`
+BUNDLE_STUB = 'bundle' # See `.build/bundle.py`
 
 # Don't touch this
 BOOTLOCATION_MYDOCS = r'{}\Documents\UnrealEngine\Python'.format(os.getenv('USERPROFILE'))
+DEV_FLAG_FILES = [os.path.expanduser(r'~\Documents\unreal-dev'), os.path.expanduser(r'~\Documents\unreal-debug')] # `proxi.dev.DEV_MODE` and `DEBUG_MODE`
 CURRENT_SCRIPT_LOCATION = os.path.realpath(__file__)
+BOOTSTRAP_CACHE = os.path.join(os.getenv('LOCALAPPDATA') or tempfile.gettempdir(), 'Proxi', 'Unreal', 'bootstrap-{}.json'.format(
+    hashlib.sha1(os.path.normcase(CURRENT_SCRIPT_LOCATION).encode('utf-8')).hexdigest()[:12]
+))
+BOOTSTRAP_CACHE_VERSION = 2
+VERBOSE = bool(os.environ.get('PROXI_BOOTSTRAP_VERBOSE'))
+USE_CACHE = not os.environ.get('PROXI_BOOTSTRAP_NOCACHE')
+USE_BUNDLE = not os.environ.get('PROXI_BOOTSTRAP_NOBUNDLE')
+MODULE_SUFFIXES = importlib.machinery.EXTENSION_SUFFIXES + importlib.machinery.SOURCE_SUFFIXES + importlib.machinery.BYTECODE_SUFFIXES # Path finder priority
+
+
+def log(message):
+    '''Print a bootstrap step, only in verbose mode'''
+
+    if VERBOSE:
+        print(message)
+
+
+def isDevSession():
+    '''Is developer or debug mode on? Same flag files as `proxi.dev`, which can't be imported before the imports are set up'''
+
+    return any(os.path.isfile(x) for x in DEV_FLAG_FILES)
+
+
+def loadCache():
+    '''Read the bootstrap cache, None if missing, unreadable, from another cache version or written by a bootstrapper elsewhere'''
+
+    if not USE_CACHE:
+        return None
+
+    try:
+        with open(BOOTSTRAP_CACHE, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cache.get('version') != BOOTSTRAP_CACHE_VERSION or cache.get('script') != CURRENT_SCRIPT_LOCATION:
+        return None
+
+    return cache
+
+
+def saveCache(cache):
+    '''Write the bootstrap cache. Failure only costs the next startup some time'''
+
+    if not USE_CACHE:
+        return
+
+    cache['version'] = BOOTSTRAP_CACHE_VERSION
+    cache['script'] = CURRENT_SCRIPT_LOCATION # The production root is derived from it
+    try:
+        os.makedirs(os.path.dirname(BOOTSTRAP_CACHE), exist_ok=True)
+        tempFile = '{}.tmp'.format(BOOTSTRAP_CACHE)
+        with open(tempFile, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tempFile, BOOTSTRAP_CACHE)
+    except OSError as e:
+        print('Could not write bootstrap cache {}: {}'.format(BOOTSTRAP_CACHE, e))
+
+
+def resolveRoot(targetPaths, cache):
+    '''Find the developer install root: the cached one (see `loadCache`) if it was resolved from the same candidates and still exists, else the first existing candidate'''
+
+    if cache and cache.get('candidates') == targetPaths and cache.get('root') and os.path.isdir(cache['root']):
+        log('Using cached install root {}'.format(cache['root']))
+        return cache['root']
+
+    for path in targetPaths:
+        log('Testing {}...'.format(path))
+        if os.path.exists(path):
+            log('Found!')
+            return path
+
+        log('Not found')
+
+    return None
+
+
+def scanPackage(name, directory, modules, directories):
+    '''Add a package and all its sub modules/packages to the manifest. Only directories with an `__init__` are packages'''
+
+    try:
+        entries = os.listdir(directory)
+    except OSError:
+        return
+
+    initFile = pickModuleFiles(directory, [x for x in entries if x.startswith('__init__.')]).get('__init__')
+    if initFile is None:
+        return
+
+    modules[name] = [initFile, directory]
+    directories[directory] = os.stat(directory).st_mtime_ns
+    addModules('{}.'.format(name), directory, entries, modules, directories)
+
+
+def addModules(prefix, directory, entries, modules, directories):
+    '''Add the packages and modules in `directory`, preferring packages over modules, like the regular path finder'''
+
+    files = []
+    for entry in entries:
+        if entry == '__pycache__' or entry.startswith('__init__.'):
+            continue
+
+        path = os.path.join(directory, entry)
+        if os.path.isdir(path):
+            if entry.isidentifier():
+                scanPackage('{}{}'.format(prefix, entry), path, modules, directories)
+        else:
+            files.append(entry)
+
+    for moduleName, path in pickModuleFiles(directory, files).items():
+        fullName = '{}{}'.format(prefix, moduleName)
+        if fullName not in modules:
+            modules[fullName] = [path, None]
+
+
+def pickModuleFiles(directory, filenames):
+    '''Module name -> file, for the importable files among `filenames`. Extensions win over source, source over bytecode'''
+
+    picked = {}
+    for filename in filenames:
+        for priority, suffix in enumerate(MODULE_SUFFIXES):
+            if filename.endswith(suffix):
+                name = filename[:-len(suffix)]
+                if name.isidentifier() and (name not in picked or priority < picked[name][0]):
+                    picked[name] = (priority, os.path.join(directory, filename))
+                break
+
+    return {name: path for name, (priority, path) in picked.items()}
+
+
+def buildManifest(root, excluded=()):
+    '''Map every module of the `PACKAGE_STUBS` packages and the `lib` folder to its file
+
+    Args:
+        root (str): Install root
+        excluded (list, optional): Top level packages/modules to leave out, e.g. the bundled ones. Defaults to ().
+
+    Returns:
+        dict: {'modules': {name: [file, packageDir|None]}, 'directories': {dir: mtime_ns}, 'excluded': [name]}
+    '''
+
+    modules = {}
+    directories = {}
+    libPath = os.path.join(root, LIB_STUB)
+    for name in PACKAGE_STUBS:
+        if name not in excluded:
+            scanPackage(name, os.path.join(root, name), modules, directories)
+
+    if os.path.isdir(libPath):
+        directories[libPath] = os.stat(libPath).st_mtime_ns
+        addModules('', libPath, os.listdir(libPath), modules, directories)
+
+    for name in [x for x in modules if x.partition('.')[0] in excluded]:
+        del modules[name]
+
+    return {'modules': modules, 'directories': directories, 'excluded': list(excluded)}
+
+
+def isManifestCurrent(manifest):
+    '''Were no files added, removed or renamed in any manifest directory since it was built?'''
+
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in manifest['directories'].items())
+    except (OSError, KeyError, AttributeError):
+        return False
+
+
+class ManifestFinder(importlib.abc.MetaPathFinder):
+    '''Meta path finder resolving manifest modules straight to their file, without scanning `sys.path`'''
+
+    def __init__(self, modules):
+        self.modules = modules
+        self.hits = 0
+
+    def find_spec(self, fullname, path=None, target=None):
+        entry = self.modules.get(fullname)
+        if entry is None:
+            return None
+
+        location, packageDir = entry
+        if not os.path.exists(location):
+            return None # Removed since the manifest was built, let the regular finders deal with it
+
+        self.hits += 1
+        if packageDir is not None:
+            return importlib.util.spec_from_file_location(fullname, location, submodule_search_locations=[packageDir])
+
+        return importlib.util.spec_from_file_location(fullname, location)
+
+    def invalidate_caches(self):
+        pass
+
+
+def installFinder(modules):
+    '''Put a `ManifestFinder` first on `sys.meta_path`, replacing one from a previous run'''
+
+    sys.meta_path[:] = [x for x in sys.meta_path if type(x).__name__ != 'ManifestFinder']
+    finder = ManifestFinder(modules)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def loadBundle(root):
+    '''Read the bundle index in `root`, None if there is no bundle or it was built for another Python version'''
+
+    if not USE_BUNDLE:
+        return None
+
+    bundleDir = os.path.join(root, BUNDLE_STUB)
+    try:
+        with open(os.path.join(bundleDir, 'bundle.json'), 'r') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if index.get('magic') != importlib.util.MAGIC_NUMBER.hex():
+        print('Ignoring bundle {}: built for Python {}, running {}.{}'.format(bundleDir, index.get('python'), *sys.version_info[:2]))
+        return None
+
+    index['code'] = os.path.join(bundleDir, 'code.zip')
+    index['data'] = os.path.join(bundleDir, 'data.zip')
+    index['dataIndex'] = os.path.join(bundleDir, 'data.json')
+    return index
+
+
+class DataArchive:
+    '''Package data files in the bundle's data archive, addressed by their path as if the code archive were a folder
+
+    The archive and its index (entry -> [offset, size]) are opened on first use. Entries are stored uncompressed, so
+    reading one is a seek and a read
+    '''
+
+    def __init__(self, path, indexPath, codeArchive):
+        self.path = path
+        self.indexPath = indexPath
+        self.prefix = '{}/'.format(codeArchive.replace('\\', '/').rstrip('/'))
+        self.reads = 0
+        self._file = None
+        self._index = None
+        self._directories = None
+        self._lock = threading.Lock()
+
+    def index(self):
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    with open(self.indexPath, 'r') as f:
+                        self._index = json.load(f)
+
+        return self._index
+
+    def entry(self, path):
+        '''Archive entry for a path below the code archive, None for any other path'''
+
+        path = path.replace('\\', '/')
+        return path[len(self.prefix):] if path.startswith(self.prefix) else None
+
+    def exists(self, entry):
+        return entry in self.index()
+
+    def listdir(self, directory):
+        if self._directories is None:
+            directories = {}
+            for entry in self.index():
+                parent, _, filename = entry.rpartition('/')
+                directories.setdefault(parent, []).append(filename)
+            self._directories = directories
+
+        return list(self._directories.get(directory.rstrip('/'), ()))
+
+    def read(self, entry):
+        '''Contents of an entry, raises `FileNotFoundError` if missing'''
+
+        location = self.index().get(entry)
+        if location is None:
+            raise FileNotFoundError('No such file in {}: {}'.format(self.path, entry))
+
+        offset, size = location
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'rb')
+            self._file.seek(offset)
+            data = self._file.read(size)
+
+        self.reads += 1
+        return data
+
+    def open(self, entry):
+        '''Binary file object for an entry, raises `FileNotFoundError` if missing'''
+
+        return io.BufferedReader(io.BytesIO(self.read(entry))) # Buffered: without `peek`, unpickling a `BytesIO` is ~2.5x slower
+
+
+def patchBabelLocaledata(module, data):
+    '''Locale data listing, lookup and loading from the data archive'''
+
+    directory = 'babel/locale-data'
+    builtinOpen = open
+
+    def openData(file, mode='r', *args, **kwargs):
+        entry = data.entry(file) if isinstance(file, str) and mode == 'rb' else None
+        if entry is None:
+            return builtinOpen(file, mode, *args, **kwargs)
+
+        return data.open(entry)
+
+    def exists(name):
+        if not name or not isinstance(name, str):
+            return False
+        if name in module._cache:
+            return True
+        return data.exists('{}/{}.dat'.format(directory, os.path.basename(name))) or bool(module.normalize_locale(name))
+
+    def locale_identifiers():
+        identifiers = getattr(locale_identifiers, 'cache', None)
+        if identifiers is None:
+            locale_identifiers.cache = identifiers = [
+                stem for stem, extension in (os.path.splitext(x) for x in data.listdir(directory)) if extension == '.dat' and stem != 'root'
+            ]
+        return identifiers
+
+    exists.__doc__ = module.exists.__doc__
+    locale_identifiers.__doc__ = module.locale_identifiers.__doc__
+    module.open = openData # `load` opens `resolve_locale_filename`, below the code archive
+    module.exists = exists
+    module.locale_identifiers = locale_identifiers
+
+
+def patchBabelCore(module, data):
+    '''Global data from the data archive'''
+
+    def get_global(key):
+        if module._global_data is None:
+            import pickle
+            module._global_data = pickle.loads(data.read('babel/global.dat'))
+        return module._global_data.get(key, {})
+
+    get_global.__doc__ = module.get_global.__doc__
+    module.get_global = get_global
+
+
+def patchPytz(module, data):
+    '''Zoneinfo from the data archive, unless redirected by `PYTZ_TZDATADIR`'''
+
+    openResource = module.open_resource
+    resourceExists = module.resource_exists
+
+    def open_resource(name):
+        if os.environ.get('PYTZ_TZDATADIR'):
+            return openResource(name)
+
+        parts = name.lstrip('/').split('/')
+        for part in parts:
+            if part == os.path.pardir or os.sep in part:
+                raise ValueError('Bad path segment: %r' % part)
+        return data.open('pytz/zoneinfo/{}'.format('/'.join(parts)))
+
+    def resource_exists(name):
+        if os.environ.get('PYTZ_TZDATADIR'):
+            return resourceExists(name)
+
+        return data.exists('pytz/zoneinfo/{}'.format(name.lstrip('/'))) # Index lookup instead of opening every zone for `all_timezones`
+
+    open_resource.__doc__ = openResource.__doc__
+    resource_exists.__doc__ = resourceExists.__doc__
+    module.open_resource = open_resource # `timezone` looks it up at call time
+    module.resource_exists = resource_exists
+
+
+DATA_PATCHES = {
+    'babel.localedata': patchBabelLocaledata,
+    'babel.core': patchBabelCore,
+    'pytz': patchPytz
+}
+
+
+class PatchingLoader(importlib.abc.Loader):
+    '''Executes a module through the wrapped bundle loader, then applies its `DATA_PATCHES` entry'''
+
+    def __init__(self, loader, patch, data):
+        self.loader = loader
+        self.patch = patch
+        self.data = data
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        exec(self.loader.get_code(module.__name__), module.__dict__)
+        self.patch(module, self.data)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name) # get_data, get_source, is_package, get_resource_reader...
+
+
+class BundleFinder(importlib.abc.MetaPathFinder):
+    '''Meta path finder importing the bundled packages from the code archive, ahead of their loose files'''
+
+    def __init__(self, index):
+        self.archive = index['code']
+        self.packages = set(index['packages'])
+        self.data = DataArchive(index['data'], index['dataIndex'], index['code'])
+        self.hits = 0
+        self._importers = {}
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.partition('.')[0] not in self.packages:
+            return None
+
+        location = path[0] if path else self.archive # Submodules: the parent package's folder in the archive
+        importer = self._importers.get(location)
+        if importer is None:
+            importer = self._importers[location] = zipimport.zipimporter(location)
+
+        try:
+            isPackage = importer.is_package(fullname)
+        except zipimport.ZipImportError:
+            return None
+
+        # Not `importer.find_spec`: it unmarshals the module's code just to get its filename, then again to execute it
+        tail = fullname.rpartition('.')[2]
+        modulePath = '{}{}{}'.format(location, os.sep, tail)
+        spec = importlib.machinery.ModuleSpec(fullname, importer, origin=modulePath + ('{}__init__.pyc'.format(os.sep) if isPackage else '.pyc'), is_package=isPackage)
+        spec.has_location = True
+        if isPackage:
+            spec.submodule_search_locations = [modulePath]
+
+        self.hits += 1
+        patch = DATA_PATCHES.get(fullname)
+        if patch is not None:
+            spec.loader = PatchingLoader(spec.loader, patch, self.data)
+
+        return spec
+
+    def invalidate_caches(self):
+        pass
+
+
+def installBundleFinder(index):
+    '''Put a `BundleFinder` first on `sys.meta_path`, replacing one from a previous run. Only removes it if `index` is None'''
+
+    sys.meta_path[:] = [x for x in sys.meta_path if type(x).__name__ != 'BundleFinder']
+    if index is None:
+        return None
+
+    finder = BundleFinder(index)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def setupImports(target, targetPaths, cache, useBundle=True):
+    '''Install the import machinery for the install root `target`: the bundle finder (if there is a usable bundle) and the manifest finder
+
+    Args:
+        target (str): Install root
+        targetPaths (list): Candidates `target` was resolved from, cached along with it
+        cache (dict): Bootstrap cache, see `loadCache`
+        useBundle (bool, optional): Use the bundle, if any. Off for developers, whose loose sources it would shadow. Defaults to True.
+
+    Returns:
+        tuple: Bundle finder (or None), manifest finder, manifest, whether the manifest came from the cache
+    '''
+
+    bundle = loadBundle(target)
+    if bundle and not useBundle:
+        print('Ignoring bundle in {}: developer setup, importing {} from the loose sources'.format(target, ', '.join(bundle['packages'])))
+        bundle = None
+
+    excluded = bundle['packages'] if bundle else []
+
+    manifest = cache.get('manifest') if cache.get('root') == target else None
+    cacheHit = bool(manifest) and manifest.get('excluded', []) == excluded and isManifestCurrent(manifest)
+    if not cacheHit:
+        log('Building module manifest for {}'.format(target))
+        manifest = buildManifest(target, excluded)
+        saveCache({'root': target, 'candidates': targetPaths, 'manifest': manifest})
+
+    finder = installFinder(manifest['modules'])
+    bundleFinder = installBundleFinder(bundle)
+    if bundleFinder is not None:
+        print('Importing {} from bundle {}, not from the loose sources. Set PROXI_BOOTSTRAP_NOBUNDLE to use those'.format(', '.join(bundle['packages']), bundleFinder.archive))
+
+    addPaths(target)
+    return bundleFinder, finder, manifest, cacheHit
 
 
 def addPaths(modPath):
-    '''Adds paths to sys.path if required'''
+    '''Adds paths to sys.path if required. Appended, our modules are resolved by the `ManifestFinder` regardless'''
 
     libPath = r'{}\{}'.format(modPath, LIB_STUB)
     for path in [modPath, libPath]:
         if not path in sys.path:
-            print('Adding path {} to sys.path'.format(path))
-            sys.path.insert(0, path)
+            log('Adding path {} to sys.path'.format(path))
+            sys.path.append(path)
         else:
-            print('Path {} is already in sys.path, taking no action'.format(path))
+            log('Path {} is already in sys.path, taking no action'.format(path))
 
 
 def execute():
     '''Main entry point'''
 
+    start = time.perf_counter()
+    times = {}
     print('Unreal bootstrapper is loading from {}'.format(CURRENT_SCRIPT_LOCATION))
     targetPaths = []
 
@@ -50,26 +559,29 @@ def execute():
         return
 
     if BOOTLOCATION_MYDOCS.lower() in CURRENT_SCRIPT_LOCATION.lower():
-        print('Using developer paths')
+        log('Using developer paths')
         targetPaths = DEVELOPERPATHS
 
-    target = None
-    for path in targetPaths:
-        print('Testing {}...'.format(path))
-        if os.path.exists(path):
-            print('Found!')
-            target = path
-            break
+    useBundle = not targetPaths and not isDevSession()
 
-        print('Not found')
+    cache = loadCache() or {}
+    if targetPaths:
+        target = resolveRoot(targetPaths, cache)
+        if not target:
+            print('None of the desired paths were found -- this will not go well. Adding the first one nonetheless')
+            target = targetPaths[0]
+    else:
+        # Production: shipped next to this file. Nothing to look up, so the cache only serves the manifest
+        target = os.path.dirname(CURRENT_SCRIPT_LOCATION)
+        log('Using install root {}'.format(target))
 
-    if not target:
-        print('None of the desired paths were found -- this will not go well. Adding the first one nonetheless')
-        target = targetPaths[0]
+    times['resolve'] = time.perf_counter() - start
 
-    addPaths(target)
-    
-    print('Executing startup script')
+    bundleFinder, finder, manifest, cacheHit = setupImports(target, targetPaths, cache, useBundle)
+    times['manifest'] = time.perf_counter() - start - times['resolve']
+
+    log('Executing startup script')
+    startupStart = time.perf_counter()
     try:
         import proxi.startup
         os.environ['PROXI_UNREAL_HASLOADED'] = 'True'
@@ -80,12 +592,18 @@ def execute():
         unreal.log_error('## Stacktrace ##\n{}'.format(stack))
         unreal.EditorDialog.show_message(
             title='PROXi Pipeline Error',
-            message='Unable to initialize PROXi Pipeline integration.\n\nInstall path(s) not found:\n{}\n\nUnreal says:\n{}'.format('\n'.join(targetPaths), e),
+            message='Unable to initialize PROXi Pipeline integration.\n\nInstall path(s) not found:\n{}\n\nUnreal says:\n{}'.format('\n'.join(targetPaths or [target]), e),
             message_type=unreal.AppMsgType.OK,
             default_value=unreal.AppReturnType.NO
         )
 
-    print('Unreal bootstrapper has finished')
+    times['startup'] = time.perf_counter() - startupStart
+    times['total'] = time.perf_counter() - start
+    os.environ['PROXI_BOOTSTRAP_TIMES'] = json.dumps({key: round(value * 1000, 2) for key, value in times.items()})
+    print('Unreal bootstrapper has finished in {:.1f} ms (root {}, manifest {}: {} modules, {} served; {}startup {:.1f} ms)'.format(
+        times['total'] * 1000, target, 'cached' if cacheHit else 'rebuilt', len(manifest['modules']), finder.hits,
+        'bundle: {} modules served; '.format(bundleFinder.hits) if bundleFinder else '', times['startup'] * 1000
+    ))
 
 
 # Simply call the `execute` entry point.
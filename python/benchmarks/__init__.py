@@ -0,0 +1,59 @@
+'''Performance benchmarks for PROXi hot paths
+
+Each module exposes `run() -> dict[str, float]` (metric name -> seconds) and can also be run as a script.
+`python -m benchmarks` runs them all and tracks regressions, see `benchmarks.runner`
+
+Importing this package makes the pure Python packages in `lib` importable (babel, jinja2, qt_material...), as the
+Unreal bootstrapper does. Installed packages take precedence
+'''
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import importlib.abc
+import importlib.machinery
+from typing import Callable
+
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib')
+LIB_EXCLUDE = {'PySide6', 'shiboken6'} # Windows builds for the editor's interpreter, install PySide6 to run the UI benchmarks elsewhere
+
+
+class LibFinder(importlib.abc.MetaPathFinder):
+    '''Resolves top level packages and modules from `LIB_DIR`, except `LIB_EXCLUDE`. Sub modules are found through their package'''
+
+    def find_spec(self, fullname, path=None, target=None):
+        if path is not None or fullname in LIB_EXCLUDE:
+            return None
+
+        return importlib.machinery.PathFinder.find_spec(fullname, [LIB_DIR])
+
+    def invalidate_caches(self):
+        pass
+
+
+def installLibFinder() -> None:
+    '''Append a `LibFinder` to `sys.meta_path`, after the regular finders, unless there is one already'''
+
+    if not any(type(x).__name__ == 'LibFinder' for x in sys.meta_path):
+        sys.meta_path.append(LibFinder())
+
+
+installLibFinder()
+
+
+def timed(results: dict[str, float], name: str, method: Callable, *args, **kwargs):
+    '''Call `method` and store its duration (seconds) in `results[name]`. Returns whatever `method` returns'''
+
+    start = time.perf_counter()
+    ret = method(*args, **kwargs)
+    results[name] = time.perf_counter() - start
+    return ret
+
+
+def printResults(title: str, results: dict[str, float]) -> None:
+    print(title)
+    for name, seconds in results.items():
+        print(f'    {name:<40} {seconds * 1000:10.2f} ms')
\ No newline at end of file
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+'''`python -m benchmarks`, see `benchmarks.runner`'''
+
+import sys
+from benchmarks import runner
+
+
+sys.exit(runner.main())
\ No newline at end of file
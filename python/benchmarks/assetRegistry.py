@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `proxi.io.assetRegistry` batched lookups and cached queries, on the headless `unreal` stand-in
+
+Stand-in calls are plain Python, so this tracks the query layer's own overhead. In the editor every call also crosses into C++,
+which is what batching saves: a per-asset lookup on the stand-in is a bare dict lookup, so there is nothing to compare against.
+Also checks caching, invalidation (by registry events and, without them, by expiry) and paging
+'''
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+ASSETS = 5000
+REPEAT = 50
+
+
+def getAssetsCalls(unreal) -> int:
+    return len(unreal.calls('AssetRegistry.get_assets'))
+
+
+def checkEvents(unreal, assetRegistry) -> None:
+    '''Cached queries are reused, and registry events drop exactly the ones they may affect'''
+
+    unreal.reset()
+    unreal.ASSET_EVENTS = True
+    try:
+        unreal.addAsset('/Game/Check/Props/SM_Chair.SM_Chair', 'StaticMesh')
+        unreal.addAsset('/Game/Check/Textures/T_Wood.T_Wood', 'Texture2D')
+        cache = assetRegistry.AssetRegistryCache()
+        if not cache.bindEvents():
+            raise RuntimeError('Stand-in registry events were not bound')
+    finally:
+        unreal.ASSET_EVENTS = False
+
+    def names(paths: list[str]) -> list[str]:
+        return sorted(str(x.asset_name) for x in cache.assets(['StaticMesh'], paths, recursive=False))
+
+    def expect(paths: list[str], assets: list[str], queried: bool, step: str) -> None:
+        calls = getAssetsCalls(unreal)
+        found = names(paths)
+        if found != assets or (getAssetsCalls(unreal) > calls) != queried:
+            raise RuntimeError(f'{step}: expected {assets} ({"queried" if queried else "cached"}), got {found} ({getAssetsCalls(unreal) - calls} registry call(s))')
+
+    props = ['/Game/Check/Props']
+    expect(props, ['SM_Chair'], True, 'First query')
+    expect(props, ['SM_Chair'], False, 'Repeated query')
+
+    unreal.addAsset('/Game/Check/Textures/T_Stone.T_Stone', 'Texture2D')
+    expect(props, ['SM_Chair'], False, 'Unrelated asset added')
+
+    unreal.addAsset('/Game/Check/Props/SM_Table.SM_Table', 'StaticMesh')
+    expect(props, ['SM_Chair', 'SM_Table'], True, 'Matching asset added')
+
+    unreal.removeAsset('/Game/Check/Props/SM_Chair.SM_Chair')
+    expect(props, ['SM_Table'], True, 'Matching asset removed')
+
+    expect(['/Game/Check/Archive'], [], True, 'Other folder')
+    unreal.renameAsset('/Game/Check/Props/SM_Table.SM_Table', '/Game/Check/Archive/SM_Table.SM_Table')
+    expect(props, [], True, 'Renamed out of the folder')
+    expect(['/Game/Check/Archive'], ['SM_Table'], True, 'Renamed into the folder')
+
+    cache.unbindEvents()
+    unreal.reset()
+
+
+def checkExpiry(unreal, assetRegistry, config) -> None:
+    '''Without registry events (as in the editor) cached queries go stale only until `assetCacheSeconds`'''
+
+    unreal.reset()
+    unreal.addAsset('/Game/Check/Props/SM_Chair.SM_Chair', 'StaticMesh')
+    cache = assetRegistry.AssetRegistryCache()
+    if cache.bindEvents():
+        raise RuntimeError('Stand-in registry has events without `ASSET_EVENTS`, unlike the editor')
+
+    cache.assets(['StaticMesh'])
+    unreal.addAsset('/Game/Check/Props/SM_Table.SM_Table', 'StaticMesh')
+    calls = getAssetsCalls(unreal)
+    if len(cache.assets(['StaticMesh'])) != 1 or getAssetsCalls(unreal) != calls:
+        raise RuntimeError('Query was not cached within `assetCacheSeconds`')
+
+    cacheSeconds = config.AssetQueries.assetCacheSeconds
+    config.AssetQueries.assetCacheSeconds = 0.0
+    try:
+        if len(cache.assets(['StaticMesh'])) != 2:
+            raise RuntimeError('Cached query did not expire')
+    finally:
+        config.AssetQueries.assetCacheSeconds = cacheSeconds
+        unreal.reset()
+
+
+def checkPages(cache, pageSize: int) -> None:
+    '''`iterPages` yields every result exactly once, in order, in full pages but the last'''
+
+    results = cache.assets(['StaticMesh'], ['/Game/Bench'])
+    pages = list(cache.iterPages(['StaticMesh'], ['/Game/Bench'], pageSize=pageSize))
+    paged = [x for page in pages for x in page]
+    if len(paged) != len(results) or any(a is not b for a, b in zip(paged, results)):
+        raise RuntimeError(f'Pages of {pageSize} do not cover the {len(results)} results exactly once')
+
+    if any(len(x) != pageSize for x in pages[:-1]) or not 0 < len(pages[-1]) <= pageSize:
+        raise RuntimeError(f'Unexpected page sizes: {[len(x) for x in pages]}')
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    import unreal
+    import proxi.config as config
+    import proxi.io.assetRegistry as assetRegistry
+
+    if not getattr(unreal, 'HEADLESS', False):
+        return {}
+
+    checkEvents(unreal, assetRegistry)
+    checkExpiry(unreal, assetRegistry, config)
+    unreal.reset()
+    unreal.RECORD = False
+    paths = []
+    for i in range(ASSETS):
+        path = f'/Game/Bench/Folder{i % 10}/Asset{i}.Asset{i}'
+        unreal.addAsset(path, 'StaticMesh' if i % 2 else 'Texture2D', broadcast=False)
+        paths.append(path)
+
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    cache = assetRegistry.AssetRegistryCache(registry)
+    lookup = paths[::10]
+    for pageSize in [1, 7, 500, ASSETS]:
+        checkPages(cache, pageSize)
+
+    def batched():
+        for _ in range(REPEAT):
+            cache.assetsByPath(lookup)
+
+    def uncachedQuery():
+        for _ in range(REPEAT):
+            cache.invalidate()
+            cache.assets(['StaticMesh'], ['/Game/Bench'])
+
+    def cachedQuery():
+        for _ in range(REPEAT):
+            cache.assets(['StaticMesh'], ['/Game/Bench'])
+
+    results: dict[str, float] = {}
+    try:
+        timed(results, f'batched lookup x{REPEAT}', batched)
+        timed(results, f'query uncached x{REPEAT}', uncachedQuery)
+        timed(results, f'query cached x{REPEAT}', cachedQuery)
+    finally:
+        unreal.RECORD = True
+        unreal.reset()
+
+    return results
+
+
+def main():
+    printResults('Asset registry benchmark', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
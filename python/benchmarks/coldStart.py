@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: cold start of `proxi` and the `lib` packages from loose files against the bundle built by `.build/bundle.py`
+
+Each sample is a fresh interpreter bootstrapped by `.install/init_unreal.py` (without running `proxi.startup`), which then
+imports the bundled packages and reads babel locale data and pytz zoneinfo. Both layouts get a warm OS file cache here,
+so on a local disk this mostly shows the per-file overhead; a network drive adds its latency to every one of those files
+'''
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import json
+import shutil
+import tempfile
+import contextlib
+import subprocess
+import importlib.util
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import timed, printResults
+
+
+RUNS = 10 # Per layout, the fastest one counts
+LIB_PACKAGES = ['babel', 'pytz', 'jinja2', 'markupsafe', 'decorator.py', '__init__.py']
+CHILD = '''
+import os, sys, io, json, time, contextlib, importlib.util
+start = time.perf_counter()
+root = sys.argv[1]
+opened = []
+sys.addaudithook(lambda event, args: opened.append(1) if event == 'open' else None)
+os.environ['PROXI_UNREAL_HASLOADED'] = '1' # Only define the bootstrapper, `setupImports` below does the work
+spec = importlib.util.spec_from_file_location('init_unreal', os.path.join(root, '.install', 'init_unreal.py'))
+bootstrap = importlib.util.module_from_spec(spec)
+with contextlib.redirect_stdout(io.StringIO()):
+    spec.loader.exec_module(bootstrap)
+bootstrap.setupImports(root, [], {})
+import datetime, babel.dates, babel.numbers, pytz, jinja2
+import proxi.headless as headless
+headless.install()
+import proxi.config
+tz = pytz.timezone('Europe/Berlin')
+now = tz.localize(datetime.datetime(2024, 1, 1, 12))
+for locale in ['en_US', 'de_DE', 'fr_FR', 'ja_JP']:
+    babel.dates.format_datetime(now, locale=locale, tzinfo=tz)
+    babel.numbers.format_currency(1234.5, 'EUR', locale=locale)
+jinja2.Template('{{ x }}').render(x=1)
+print(json.dumps({'seconds': time.perf_counter() - start, 'opened': len(opened)}))
+'''
+
+
+def makeTree(pythonBaseDir: str, root: str) -> None:
+    '''Copy what the child imports into a fresh install root'''
+
+    for name in ['proxi', '.install']:
+        shutil.copytree(os.path.join(pythonBaseDir, name), os.path.join(root, name), ignore=shutil.ignore_patterns('__pycache__'))
+
+    for name in LIB_PACKAGES:
+        source = os.path.join(pythonBaseDir, 'lib', name)
+        target = os.path.join(root, 'lib', name)
+        if os.path.isdir(source):
+            shutil.copytree(source, target, ignore=shutil.ignore_patterns('__pycache__'))
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(source, target)
+
+
+def coldStart(root: str, bundle: bool) -> tuple[float, int]:
+    '''Start a fresh interpreter from the loose files or the bundle
+
+    Returns:
+        tuple[float, int]: Seconds, files opened
+    '''
+
+    env = dict(os.environ, PROXI_BOOTSTRAP_NOCACHE='1', PYTHONDONTWRITEBYTECODE='1')
+    env.pop('PYTHONPATH', None)
+    if not bundle:
+        env['PROXI_BOOTSTRAP_NOBUNDLE'] = '1'
+
+    output = subprocess.run([sys.executable, '-c', CHILD, root], env=env, capture_output=True, text=True, check=True).stdout
+    sample = json.loads(output.strip().splitlines()[-1])
+    return sample['seconds'], sample['opened']
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    pythonBaseDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location('bundle', os.path.join(pythonBaseDir, '.build', 'bundle.py'))
+    bundle = importlib.util.module_from_spec(spec) # type: ignore
+    spec.loader.exec_module(bundle) # type: ignore
+
+    results: dict[str, float] = {}
+    samples: dict[bool, list[tuple[float, int]]] = {False: [], True: []}
+    with tempfile.TemporaryDirectory() as root:
+        makeTree(pythonBaseDir, root)
+
+        # Byte compile the loose files first, like a deployed install that has been started before
+        subprocess.run([sys.executable, '-m', 'compileall', '-q', root], check=True, capture_output=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            timed(results, 'build bundle', bundle.buildBundle, root, os.path.join(root, bundle.BUNDLE_STUB))
+
+        for _ in range(RUNS): # Interleaved, so load on the machine hits both layouts alike
+            for useBundle in samples:
+                samples[useBundle].append(coldStart(root, useBundle))
+
+    loose = min(samples[False])
+    bundled = min(samples[True])
+    results['cold start, loose files'] = loose[0]
+    results['cold start, bundle'] = bundled[0]
+    print(f'Files opened: {loose[1]} loose, {bundled[1]} bundled')
+    return results
+
+
+def main():
+    printResults(f'Cold start benchmark, fastest of {RUNS} runs', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
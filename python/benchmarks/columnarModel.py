@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `QtColumnarTableModel` vs. `QTableWidget` + `QtTableWidgetItemCustom` at 100k rows'''
+
+from __future__ import annotations
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+from PySide6 import QtCore, QtWidgets
+
+
+ROWS = 100_000
+COMPARE_ROWS = 10_000 # `QTableWidget` is too slow for the full set, extrapolated from this
+HEADERS = ['Asset', 'Path', 'Size', 'Modified']
+
+
+def _generateColumns(rows: int) -> list[list]:
+    rng = random.Random(1234)
+    return [
+        [f'SM_Asset_{i:06d}' for i in range(rows)],
+        [f'/Game/Props/Set{i % 97:02d}/SM_Asset_{i:06d}' for i in range(rows)],
+        [rng.randint(1, 1 << 24) for _ in range(rows)],
+        [rng.random() * 1e9 for _ in range(rows)]
+    ]
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    from proxi.ui.widgets.columnarModel import QtColumnarTableModel
+    from proxi.ui.widgets.tableWidgetItemCustom import QtTableWidgetItemCustom
+
+    _ = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    results: dict[str, float] = {}
+    columns = _generateColumns(ROWS)
+
+    # Columnar model
+    model = QtColumnarTableModel(HEADERS, batchSize=1000)
+    timed(results, 'model.setColumns', model.setColumns, columns)
+
+    def fetchAll():
+        while model.canFetchMore():
+            model.fetchMore()
+    timed(results, 'model.fetchAll', fetchAll)
+
+    def readViewport():
+        for row in range(50):
+            for column in range(len(HEADERS)):
+                model.data(model.index(row, column), QtCore.Qt.DisplayRole)
+    timed(results, 'model.data (50 visible rows)', readViewport)
+
+    timed(results, 'model.sort (int column)', model.sort, 2, QtCore.Qt.DescendingOrder)
+    timed(results, 'model.sort (str column)', model.sort, 1, QtCore.Qt.AscendingOrder)
+    timed(results, 'model.setFilterText', model.setFilterText, 'set42', 1)
+    timed(results, 'model.clearFilter', model.setFilterText, None)
+    timed(results, 'model.appendRows (10k)', model.appendRows, _generateColumns(10_000))
+    timed(results, 'model.removeSourceRows (10k)', model.removeSourceRows, random.Random(1).sample(range(model.sourceRowCount()), 10_000))
+
+    # Item based widget, for comparison
+    table = QtWidgets.QTableWidget(0, len(HEADERS))
+    compareColumns = [x[:COMPARE_ROWS] for x in columns]
+
+    def populateWidget():
+        table.setRowCount(COMPARE_ROWS)
+        for c, values in enumerate(compareColumns):
+            for r, value in enumerate(values):
+                table.setItem(r, c, QtTableWidgetItemCustom(value))
+    timed(results, f'tableWidget.populate ({COMPARE_ROWS // 1000}k)', populateWidget)
+    timed(results, f'tableWidget.sort ({COMPARE_ROWS // 1000}k)', table.sortItems, 2, QtCore.Qt.DescendingOrder)
+
+    return results
+
+
+def main():
+    printResults(f'Columnar model benchmark, {ROWS} rows', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `proxi.common` array union/dedup/partition helpers vs. the list/set round trips they replace'''
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+ENTRIES = 100_000
+ARRAYS = 4
+
+
+class _Asset:
+    '''Stand-in for an asset/actor object, identified by path'''
+
+    __slots__ = ('path',)
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def get_path_name(self) -> str:
+        return self.path
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    import unreal
+    import proxi.common as common
+
+    results: dict[str, float] = {}
+
+    # 100k entries over 4 arrays, roughly 25% duplicates across arrays
+    perArray = ENTRIES // ARRAYS
+    paths = [[f'/Game/Props/SM_Asset_{(i * perArray + x) % (ENTRIES * 3 // 4):06d}' for x in range(perArray)] for i in range(ARRAYS)]
+    stringArrays = [unreal.Array.cast(str, x) for x in paths]
+    assetArrays = [unreal.Array.cast(_Asset, [_Asset(p) for p in x]) for x in paths]
+
+    # Previous approach: copy into a list, then a set, then back into a list
+    timed(results, 'UniqueList(arraysToList) [before]', lambda: list(set(common.arraysToList(*stringArrays))))
+    timed(results, 'union', common.union, *stringArrays)
+    timed(results, 'union (lazy, consumed)', lambda: sum(1 for _ in common.union(*stringArrays, lazy=True)))
+    timed(results, 'arraysToSet', common.arraysToSet, *stringArrays)
+
+    # Keyed: objects are unique per instance, identity is their path
+    def keyedBefore():
+        seen = {}
+        for asset in common.arraysToList(*assetArrays):
+            seen.setdefault(asset.get_path_name(), asset)
+        return list(seen.values())
+    timed(results, 'dedup by path (dict round trip) [before]', keyedBefore)
+    timed(results, 'union (key=path)', common.union, *assetArrays, key=_Asset.get_path_name)
+
+    def partitionBefore():
+        elements = common.arraysToList(*stringArrays)
+        return [x for x in elements if x.endswith('5')], [x for x in elements if not x.endswith('5')]
+    timed(results, 'partition (two comprehensions) [before]', partitionBefore)
+    timed(results, 'partition', common.partition, lambda x: x.endswith('5'), *stringArrays)
+
+    view = timed(results, 'arraysView', common.arraysView, *stringArrays)
+    timed(results, 'arraysView 10k random reads', lambda: [view[(i * 7919) % ENTRIES] for i in range(10_000)])
+
+    return results
+
+
+def main():
+    printResults(f'Array helpers benchmark, {ENTRIES} entries in {ARRAYS} arrays', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `proxi.console` logging overhead (stack inspection and formatting), against the headless `unreal` stand-in'''
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+COUNT = 10_000
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    import unreal
+    import proxi.dev as dev
+    import proxi.console as console
+
+    results: dict[str, float] = {}
+    record = getattr(unreal, 'RECORD', None)
+    if record is not None:
+        unreal.RECORD = False # Measure `console`, not the stand-in's call log
+
+    try:
+        def nested(depth: int, method):
+            # Logging from deeper call stacks, as from within UI callbacks
+            if depth:
+                return nested(depth - 1, method)
+
+            for i in range(COUNT):
+                method(f'Message {i}')
+
+        timed(results, 'log', nested, 0, console.log)
+        timed(results, 'log (stack depth 30)', nested, 30, console.log)
+        timed(results, 'log (timestamp)', lambda: [console.log(f'Message {i}', timestamp=True) for i in range(COUNT)])
+        timed(results, 'warning', lambda: [console.warning(f'Message {i}') for i in range(COUNT)])
+
+        debugMode = dev.DEBUG_MODE
+        dev.DEBUG_MODE = False
+        timed(results, 'debug (disabled)', lambda: [console.debug(f'Message {i}') for i in range(COUNT)])
+        dev.DEBUG_MODE = debugMode
+    finally:
+        if record is not None:
+            unreal.RECORD = record
+
+    return results
+
+
+def main():
+    printResults(f'Console benchmark, {COUNT} messages', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `proxi.io.fileScanner` full and incremental scans against `os.walk`, on a generated tree, with and without verifying the files of unchanged directories'''
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+DIRECTORIES = 2000
+FILES = 50 # Per directory
+EXTENSIONS = ['mb', 'ma', 'fbx', 'png', 'tif', 'uasset', 'txt', 'json']
+
+
+def makeTree(root: str) -> list[str]:
+    '''Write `DIRECTORIES` x `FILES` empty files, three levels deep
+
+    Returns:
+        list[str]: Leaf directories
+    '''
+
+    leaves = []
+    for i in range(DIRECTORIES):
+        directory = os.path.join(root, f'Set{i % 10:02d}', f'Group{i % 100:03d}', f'Asset{i:05d}')
+        os.makedirs(directory)
+        for x in range(FILES):
+            open(os.path.join(directory, f'file_{x:03d}.{EXTENSIONS[x % len(EXTENSIONS)]}'), 'w').close()
+        leaves.append(directory)
+
+    return leaves
+
+
+def walk(root: str) -> list[tuple[str, int, float]]:
+    '''What tools did before: `os.walk` and a stat per file'''
+
+    result = []
+    for path, dirs, files in os.walk(root):
+        for file in files:
+            filePath = os.path.join(path, file)
+            stat = os.stat(filePath)
+            result.append((filePath, stat.st_size, stat.st_mtime))
+
+    return result
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    import proxi.config as config
+    import proxi.io.fileScanner as fileScanner
+
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as root:
+        leaves = makeTree(root)
+        time.sleep(config.FileScan.racyWindow) # Let the tree age out of the racy window, as real project folders have
+
+        scanner = fileScanner.FileScanner(persist=False)
+        walked = timed(results, 'os.walk + stat', walk, root)
+        full = timed(results, 'scan, full', scanner.scan, root)
+        repeat = timed(results, 'scan, repeat', scanner.scan, root)
+        timed(results, 'scan, repeat, maya only', scanner.scan, root, types=[config.FileTypes.maya])
+
+        for leaf in leaves[::100]:
+            open(os.path.join(leaf, 'new.fbx'), 'w').close()
+        changed = timed(results, 'scan, 20 directories changed', scanner.scan, root)
+
+        # In place: directory mtimes stay the same
+        for leaf in leaves[50::100]:
+            with open(os.path.join(leaf, 'file_000.mb'), 'w') as f:
+                f.write('modified')
+        modified = timed(results, 'scan, 20 files modified in place', scanner.scan, root)
+        scanner.shutdown()
+
+        unverified = fileScanner.FileScanner(persist=False, verifyFiles=False)
+        unverified.scan(root)
+        timed(results, 'scan, repeat, files not verified', unverified.scan, root)
+        unverified.shutdown()
+
+    if len(walked) != len(full.entries) or len(full.entries) != len(repeat.entries) or len(changed.entries) != len(full.entries) + 20:
+        raise RuntimeError('Scans disagree on the number of files')
+
+    # The directories changed just before the in place modifications are still in the racy window, so listed again
+    if repeat.listed != 0 or changed.listed != 20 or modified.listed != 40:
+        raise RuntimeError(f'Unexpected incremental listing: {repeat.listed}, {changed.listed}, {modified.listed} directories listed')
+
+    if sum(x.size for x in modified.entries) != 20 * len('modified'):
+        raise RuntimeError('Files modified in place were not picked up')
+
+    return results
+
+
+def main():
+    printResults(f'File scanner benchmark, {DIRECTORIES * FILES} files', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `proxi.config.FILE_TYPE_CLASSIFIER` bulk classification against per-path suffix checks on `FileExtensions`'''
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+COUNT = 100_000
+EXTENSIONS = ['mb', 'MA', 'fbx', 'png', 'Tiff', 'exr', 'mov', 'uasset', 'txt', 'json']
+
+
+def classifyNaive(paths: list[str], extensions) -> list[str|None]:
+    '''What tools did before: split and lower every path, then scan the extensions'''
+
+    result: list[str|None] = []
+    for path in paths:
+        extension = os.path.splitext(path)[1].lower()
+        result.append(next((key for key, value in extensions.items() if value == extension), None))
+
+    return result
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    import proxi.config as config
+
+    classifier = config.FILE_TYPE_CLASSIFIER
+    paths = [f'D:/Projects/Game/Assets/Set{x % 97:02d}/asset_{x:06d}.{EXTENSIONS[x % len(EXTENSIONS)]}' for x in range(COUNT)]
+    results: dict[str, float] = {}
+
+    naive = timed(results, 'splitext + FileExtensions scan', classifyNaive, paths, config.FileExtensions())
+    timed(results, 'typeOf per path', lambda: [classifier.typeOf(x) for x in paths])
+    bulk = timed(results, 'classify', classifier.classify, paths)
+    timed(results, 'classify, aliases', classifier.classify, paths, aliases=True)
+    timed(results, 'filter maya family', classifier.filter, paths, config.FileTypes.maya, aliases=True)
+
+    # The naive scan picks the first key declaring an extension, as the classifier does
+    if naive != bulk:
+        raise RuntimeError('Bulk classification differs from the naive one')
+
+    return results
+
+
+def main():
+    printResults(f'File type classification benchmark, {COUNT} paths', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
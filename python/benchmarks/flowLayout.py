@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `QtFlowLayout` resize and `heightForWidth` at 1k/10k items, cold (after `invalidate`) vs. cached, item removal and teardown'''
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+from PySide6 import QtCore, QtWidgets
+
+
+ITEM_COUNTS = [1_000, 10_000]
+WIDTHS = [640, 800, 1024, 1280] # Resize sweep, repeated to hit cached widths
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    from proxi.ui.widgets.flowLayout import QtFlowLayout
+
+    _ = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    results: dict[str, float] = {}
+
+    for count in ITEM_COUNTS:
+        label = f'{count // 1000}k'
+        widget = QtWidgets.QWidget()
+        layout = QtFlowLayout(widget)
+
+        def populate():
+            for i in range(count):
+                item = QtWidgets.QWidget()
+                item.setFixedSize(64 + (i % 7) * 8, 64)
+                layout.addWidget(item)
+        timed(results, f'addWidget ({label})', populate)
+
+        def heightForWidthCold():
+            for width in WIDTHS:
+                layout.invalidate()
+                layout._geometryCache.clear()
+                layout.heightForWidth(width)
+        timed(results, f'heightForWidth cold ({label})', heightForWidthCold)
+
+        for width in WIDTHS:
+            layout.heightForWidth(width)
+
+        def heightForWidthWarm():
+            for width in WIDTHS:
+                layout.heightForWidth(width)
+        timed(results, f'heightForWidth cached ({label})', heightForWidthWarm)
+
+        def resizeSweep():
+            for width in WIDTHS * 2:
+                layout.setGeometry(QtCore.QRect(0, 0, width, 0))
+        timed(results, f'setGeometry sweep ({label})', resizeSweep)
+
+        # One item changes size, relayout starts from the row before it
+        middle = layout.itemAt(count // 2).widget() # type: ignore
+        def resizeItem():
+            middle.setFixedSize(200, 64)
+            layout.invalidate()
+            layout.heightForWidth(WIDTHS[0])
+        timed(results, f'single item resize ({label})', resizeItem)
+
+        # Remove every 10th item, then lay out once
+        def removeItems():
+            for i in range(count - 1, -1, -10):
+                layout.takeAt(i)
+            layout.heightForWidth(WIDTHS[0])
+        timed(results, f'remove 10% of items ({label})', removeItems)
+
+        # Empty the layout item by item, with every width cached
+        for width in WIDTHS:
+            layout.heightForWidth(width)
+
+        def clear():
+            while layout.takeAt(0):
+                pass
+        timed(results, f'takeAt(0) until empty ({label})', clear)
+
+        widget.deleteLater()
+
+    return results
+
+
+def main():
+    printResults(f'Flow layout benchmark, {ITEM_COUNTS} items', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
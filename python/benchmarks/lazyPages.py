@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: building and first painting the demo main window with all pages against lazy pages (see `QtWindowBase.lazyPages`)
+
+Plain `QMainWindow`s with the compiled demo UI, under the qt_material stylesheet the tools run with, so widget polishing
+costs what it does in the editor. Time to first paint runs from construction to the end of the first painted frame
+'''
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+THEME = 'dark_bluegrey.xml'
+ICONS_PARENT = 'proxi_benchmark' # qt_material icon output folder (under its resources path), kept apart from the real style cache
+RUNS = 10 # Per variant, the fastest one counts
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    from PySide6 import QtCore, QtWidgets
+    import qt_material
+    from proxi.ui.demoMainWindow import demoMainWindow_ui
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    app.setStyleSheet(qt_material.build_stylesheet(THEME, False, {'density_scale': '0'}, parent=ICONS_PARENT))
+    uiClass = demoMainWindow_ui.Ui_MainWindow
+
+    class PaintProbe(QtCore.QObject):
+        '''Flags the first paint event of a window'''
+
+        painted = False
+
+        def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+            if event.type() == QtCore.QEvent.Type.Paint:
+                self.painted = True
+            return False
+
+    def build(lazy: bool) -> tuple[QtWidgets.QMainWindow, object]:
+        window = QtWidgets.QMainWindow()
+        ui = uiClass()
+        ui.setupUi(window, lazy=lazy)
+        if lazy:
+            # Current page of each container, as `QtWindowBase._watchLazyContainers` does. Nested containers come after
+            # the page containing them, and only exist if it was built
+            for containerName, pages in ui.LAZY_PAGES.items():
+                container = getattr(ui, containerName, None)
+                if container is None:
+                    continue
+
+                current = container.currentWidget()
+                for page in pages:
+                    if getattr(ui, page) is current:
+                        ui.setupPage(window, page)
+        return window, ui
+
+    def firstPaint(lazy: bool) -> tuple[float, QtWidgets.QMainWindow, object]:
+        start = time.perf_counter()
+        window, ui = build(lazy)
+        probe = PaintProbe()
+        window.installEventFilter(probe)
+        window.show()
+        while not probe.painted:
+            app.processEvents()
+        app.processEvents() # Children paint in the same pass
+        seconds = time.perf_counter() - start
+        window.removeEventFilter(probe)
+        return seconds, window, ui
+
+    def discard(window: QtWidgets.QMainWindow) -> None:
+        window.hide()
+        window.deleteLater()
+        app.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+
+    # Warm up: the first window built under a stylesheet pays for parsing it
+    discard(firstPaint(False)[1])
+
+    samples: dict[str, list[float]] = {}
+    for _ in range(RUNS): # Interleaved, so load on the machine hits all variants alike
+        for lazy in (False, True):
+            label = 'lazy pages' if lazy else 'all pages'
+            results: dict[str, float] = {}
+            window, ui = timed(results, f'setupUi, {label}', build, lazy)
+            discard(window)
+
+            results[f'time to first paint, {label}'], window, ui = firstPaint(lazy)
+            if lazy:
+                def buildRemaining():
+                    for pages in ui.LAZY_PAGES.values(): # type: ignore
+                        for page in pages:
+                            ui.setupPage(window, page) # type: ignore
+                timed(results, 'remaining pages, after first paint', buildRemaining)
+            discard(window)
+
+            for name, seconds in results.items():
+                samples.setdefault(name, []).append(seconds)
+
+    app.setStyleSheet('')
+    return {name: min(values) for name, values in samples.items()}
+
+
+def main():
+    printResults(f'Lazy pages benchmark, fastest of {RUNS} runs', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
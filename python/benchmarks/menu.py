@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `proxi.ui.menu.createMenu` against the headless `unreal` stand-in. Also checks the `ToolMenus` calls it records'''
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+REPEAT = 200
+
+
+def countItems(items) -> tuple[int, int, int]:
+    '''Sub menus, sections and menu entries `createMenu` should create for a `TopLevelMenu.items` tree (all dev items included)'''
+
+    from proxi.models.menuBase import MenuSection, SubMenu
+
+    subMenus = sections = entries = 0
+    for item in items:
+        if isinstance(item, (tuple, list)):
+            counts = countItems(item)
+        elif isinstance(item, SubMenu):
+            counts = countItems(item.items)
+            subMenus += 1
+        elif isinstance(item, MenuSection):
+            counts = countItems(item.items)
+            sections += 1
+        else:
+            counts = (0, 0, 1)
+
+        subMenus += counts[0]
+        sections += counts[1]
+        entries += counts[2]
+
+    return subMenus, sections, entries
+
+
+def checkCalls(unreal, menu) -> None:
+    '''One `createMenu` must remove the old menus, then add exactly what `TOPLEVELMENUS` describes and refresh once'''
+
+    unreal.reset()
+    menu.createMenu()
+
+    subMenus, sections, entries = 0, 0, 0
+    for topLevelMenu in menu.TOPLEVELMENUS:
+        counts = countItems(topLevelMenu.items)
+        subMenus += counts[0] + 1
+        sections += counts[1]
+        entries += counts[2]
+
+    expected = {
+        'ToolMenus.remove_menu': [(f'{menu.MAINMENU_ID}.{x.id}',) for x in menu.TOPLEVELMENUS],
+        'ToolMenus.unregister_owner_by_name': [(f'{menu.MAINMENU_ID}.{x.id}',) for x in menu.TOPLEVELMENUS]
+    }
+    for name, args in expected.items():
+        recorded = [x.args for x in unreal.calls(name)]
+        if recorded != args:
+            raise RuntimeError(f'Expected {name} calls {args}, recorded {recorded}')
+
+    counts = {
+        'ToolMenu.add_sub_menu': subMenus,
+        'ToolMenu.add_section': sections,
+        'ToolMenu.add_menu_entry': entries,
+        'ToolMenus.refresh_all_widgets': 1
+    }
+    for name, count in counts.items():
+        recorded = len(unreal.calls(name))
+        if recorded != count:
+            raise RuntimeError(f'Expected {count} {name} call(s), recorded {recorded}')
+
+    names = [x.name for x in unreal.calls() if x.name.startswith('ToolMenu')]
+    if names.index('ToolMenus.remove_menu') > names.index('ToolMenu.add_sub_menu') or names[-1] != 'ToolMenus.refresh_all_widgets':
+        raise RuntimeError(f'Unexpected menu call order: {names}')
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    import unreal
+    import proxi.dev as dev
+    import proxi.ui.menu as menu
+
+    results: dict[str, float] = {}
+    devMode = dev.DEV_MODE
+    dev.DEV_MODE = True # Dev menus are the only ones at the moment
+
+    try:
+        if getattr(unreal, 'HEADLESS', False):
+            checkCalls(unreal, menu)
+
+        timed(results, f'createMenu x{REPEAT}', lambda: [menu.createMenu() for _ in range(REPEAT)])
+        timed(results, f'deleteMenu x{REPEAT}', lambda: [menu.deleteMenu() for _ in range(REPEAT)])
+    finally:
+        dev.DEV_MODE = devMode
+        if getattr(unreal, 'HEADLESS', False):
+            unreal.reset()
+
+    return results
+
+
+def main():
+    printResults('Menu benchmark', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+'''Benchmark runner: runs every benchmark module, stores results per commit, fails on regressions
+
+Usage (from the `python` folder):
+    python -m benchmarks                      Run all, save results, compare with the most recent other commit
+    python -m benchmarks --only timecode      Run a subset
+    python -m benchmarks --threshold 0.1      Fail on metrics more than 10% slower than baseline
+    python -m benchmarks --baseline abc123    Compare with the results of a specific commit (or .json file)
+'''
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import importlib
+import pkgutil
+import traceback
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, 'results')
+DEFAULT_THRESHOLD = 0.25 # Max allowed slowdown vs. baseline, as a fraction
+DEFAULT_NOISE_FLOOR = 0.001 # Seconds. Metrics faster than this (in both runs) are too noisy to fail on
+DEFAULT_REPEAT = 3 # Each module is run this many times, keeping the fastest result per metric
+EXCLUDE = {'runner', '__main__'}
+
+
+def discover() -> list[str]:
+    '''Names of all benchmark modules'''
+
+    return sorted(x.name for x in pkgutil.iter_modules([BENCHMARKS_DIR]) if x.name not in EXCLUDE)
+
+
+def runModule(name: str, repeat: int=DEFAULT_REPEAT) -> dict[str, float]:
+    '''Run one benchmark module `repeat` times
+
+    Returns:
+        dict[str, float]: Metric name -> fastest time (seconds)
+    '''
+
+    module = importlib.import_module(f'benchmarks.{name}')
+    best: dict[str, float] = {}
+    for _ in range(repeat):
+        for metric, seconds in module.run().items():
+            best[metric] = min(seconds, best.get(metric, seconds))
+
+    return best
+
+
+def currentCommit() -> tuple[str, bool]:
+    '''Current git commit, and whether the working tree has changes. ('unknown', True) outside of git'''
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARKS_DIR, capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=BENCHMARKS_DIR, capture_output=True, text=True, check=True).stdout.strip()
+        return commit, bool(status)
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', True
+
+
+def save(report: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4, sort_keys=True)
+
+
+def load(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def findBaseline(baseline: str|None, commit: str) -> str|None:
+    '''Resolve a baseline results file
+
+    Args:
+        baseline (str|None): Commit or .json path. None means the most recent results of any other commit
+        commit (str): Current commit, excluded from automatic selection
+
+    Returns:
+        str|None: Path to results file, None if there is none
+    '''
+
+    if baseline:
+        if os.path.isfile(baseline):
+            return baseline
+
+        path = os.path.join(RESULTS_DIR, f'{baseline}.json')
+        return path if os.path.isfile(path) else None
+
+    if not os.path.isdir(RESULTS_DIR):
+        return None
+
+    candidates = [
+        os.path.join(RESULTS_DIR, x) for x in os.listdir(RESULTS_DIR)
+        if x.endswith('.json') and os.path.splitext(x)[0].split('-')[0] != commit
+    ]
+    return max(candidates, key=os.path.getmtime) if candidates else None
+
+
+def compare(baseline: dict[str, float], current: dict[str, float], threshold: float=DEFAULT_THRESHOLD, noiseFloor: float=DEFAULT_NOISE_FLOOR) -> list[tuple[str, float, float, float]]:
+    '''Find regressed metrics. Metrics missing from either side are ignored
+
+    Returns:
+        list[tuple[str, float, float, float]]: (metric, baseline seconds, current seconds, ratio) per regression
+    '''
+
+    regressions = []
+    for metric, seconds in current.items():
+        old = baseline.get(metric)
+        if old is None or max(old, seconds) < noiseFloor:
+            continue
+
+        ratio = seconds / old if old > 0 else float('inf')
+        if ratio > 1 + threshold:
+            regressions.append((metric, old, seconds, ratio))
+
+    return regressions
+
+
+def main(argv: list[str]|None=None) -> int:
+    '''Run benchmarks. Returns the process exit code: 1 on regressions or failed modules, 0 otherwise'''
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Run PROXi benchmarks and check for regressions')
+    parser.add_argument('--only', nargs='+', choices=discover(), help='Benchmark modules to run. Defaults to all')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Runs per module, fastest result is kept')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Max allowed slowdown vs. baseline, as a fraction')
+    parser.add_argument('--noise-floor', type=float, default=DEFAULT_NOISE_FLOOR, help='Ignore metrics faster than this many seconds')
+    parser.add_argument('--baseline', help='Commit or results file to compare with. Defaults to the most recent results of another commit')
+    parser.add_argument('--no-save', action='store_true', help='Do not store results')
+    args = parser.parse_args(argv)
+
+    commit, dirty = currentCommit()
+    metrics: dict[str, float] = {}
+    failed: list[str] = []
+
+    for name in args.only or discover():
+        start = time.perf_counter()
+        try:
+            results = runModule(name, repeat=max(1, args.repeat))
+        except Exception: # A broken module (missing dependency, failed check) must not cost the results of the others
+            print(f'{name} FAILED ({time.perf_counter() - start:.1f}s)')
+            traceback.print_exc()
+            failed.append(name)
+            continue
+
+        print(f'{name} ({time.perf_counter() - start:.1f}s)')
+        for metric, seconds in results.items():
+            print(f'    {metric:<40} {seconds * 1000:10.2f} ms')
+            metrics[f'{name}.{metric}'] = seconds
+
+    report = {
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'metrics': metrics,
+        'failed': failed
+    }
+
+    baselinePath = findBaseline(args.baseline, commit)
+
+    if not args.no_save:
+        path = os.path.join(RESULTS_DIR, f'{commit}{"-dirty" if dirty else ""}.json')
+        save(report, path)
+        print(f'Results saved to {path}')
+
+    if failed:
+        print(f'Failed modules: {", ".join(failed)}')
+
+    if baselinePath is None:
+        print('No baseline results to compare with')
+        return 1 if failed else 0
+
+    baseline = load(baselinePath)
+    regressions = compare(baseline.get('metrics', {}), metrics, threshold=args.threshold, noiseFloor=args.noise_floor)
+    print(f'Compared with {baseline.get("commit", baselinePath)} (threshold {args.threshold:.0%})')
+
+    for metric, old, new, ratio in regressions:
+        print(f'    REGRESSION {metric:<40} {old * 1000:10.2f} ms -> {new * 1000:10.2f} ms ({ratio:.2f}x)')
+
+    if regressions:
+        return 1
+
+    print('    No regressions')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
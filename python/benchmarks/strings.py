@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `proxi.common.strings` helpers'''
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+COUNT = 100_000
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    import proxi.common.strings as strings
+
+    results: dict[str, float] = {}
+    numbers = [str(x) if x % 10 else f'x{x}' for x in range(COUNT)] # 10% invalid
+    paths = [f'D:\\\\Projects//Game\\Content\\Props/Set{x % 97:02d}\\SM_Asset_{x:06d}.uasset' for x in range(COUNT)]
+    names = [f'some asset name {x}' for x in range(COUNT)]
+    seconds = [x * 7.3 for x in range(COUNT)]
+
+    timed(results, 'toInt', lambda: [strings.toInt(x) for x in numbers])
+    timed(results, 'toFloat', lambda: [strings.toFloat(x) for x in numbers])
+    timed(results, 'toInts', strings.toInts, numbers)
+    timed(results, 'toFloats', strings.toFloats, numbers)
+    timed(results, 'sanitizeSlashes', lambda: [strings.sanitizeSlashes(x) for x in paths])
+    timed(results, 'sanitizeSlashesMany', strings.sanitizeSlashesMany, paths)
+    timed(results, 'camelCase', lambda: [strings.camelCase(x) for x in names])
+    timed(results, 'compare', lambda: [strings.compare(x, x.upper()) for x in names])
+    timed(results, 'isEmpty', lambda: [strings.isEmpty(x) for x in names])
+    timed(results, 'secondsToDuration', lambda: [strings.secondsToDuration(x) for x in seconds])
+    timed(results, 'secondsToTimestamp', lambda: [strings.secondsToTimestamp(x) for x in seconds])
+
+    return results
+
+
+def main():
+    printResults(f'Strings benchmark, {COUNT} values', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
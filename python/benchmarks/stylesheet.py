@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `qt_material.build_stylesheet`, plus the jinja2 and babel operations underneath our UI stack'''
+
+from __future__ import annotations
+
+import os
+import sys
+import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+THEME = 'dark_bluegrey.xml'
+ICONS_PARENT = 'proxi_benchmark' # qt_material icon output folder (under its resources path), kept apart from the real style cache
+RENDERS = 20
+FORMATS = 10_000
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    from PySide6 import QtWidgets
+    import jinja2
+    import qt_material
+    from babel import dates, numbers
+
+    _ = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    results: dict[str, float] = {}
+
+    # Full build: theme .xml parse, icon generation, template render
+    timed(results, 'build_stylesheet', qt_material.build_stylesheet, THEME, False, {'density_scale': '0'}, parent=ICONS_PARENT)
+    theme = timed(results, 'get_theme', qt_material.get_theme, THEME)
+
+    # Template only, as `build_stylesheet` does it
+    parent, template = os.path.split(qt_material.TEMPLATE_FILE)
+
+    def compileTemplate():
+        env = jinja2.Environment(autoescape=False, loader=jinja2.FileSystemLoader(parent))
+        env.filters['opacity'] = qt_material.opacity
+        env.filters['density'] = qt_material.density
+        return env.get_template(template)
+    stylesheet = timed(results, 'jinja2 compile template', compileTemplate)
+
+    environ: dict[str, object] = {'linux': True, 'windows': False, 'darwin': False, 'pyqt5': False, 'pyqt6': False, 'pyside2': False, 'pyside6': True}
+    environ.update(theme)
+    environ.update({'icon': None, 'font_family': 'Roboto', 'danger': '#dc3545', 'warning': '#ffc107', 'success': '#17a2b8', 'density_scale': '0', 'button_shape': 'default'})
+    timed(results, f'jinja2 render x{RENDERS}', lambda: [stylesheet.render(environ) for _ in range(RENDERS)])
+
+    # Babel formatting
+    now = datetime.datetime(2022, 6, 1, 12, 30)
+    timed(results, f'babel format_decimal x{FORMATS}', lambda: [numbers.format_decimal(x * 1.5, locale='en_US') for x in range(FORMATS)])
+    timed(results, f'babel format_datetime x{FORMATS}', lambda: [dates.format_datetime(now, locale='en_US') for _ in range(FORMATS)])
+
+    return results
+
+
+def main():
+    printResults(f'Stylesheet benchmark, theme {THEME}', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `proxi.common.threads.MultiThreadWrapper` fan-out latency'''
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+FAN_OUT = [1, 8, 32]
+WORK = 0.005 # Seconds each target "works" for, eg. a short http call
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    import proxi.common.threads as threads
+
+    results: dict[str, float] = {}
+
+    for count in FAN_OUT:
+        def noop():
+            return None
+
+        def work():
+            time.sleep(WORK)
+            return None
+
+        timed(results, f'fan-out {count} (no-op)', threads.MultiThreadWrapper([noop] * count, callbacks=lambda x: None).start)
+        timed(results, f'fan-out {count} ({WORK * 1000:.0f} ms work)', threads.MultiThreadWrapper([work] * count, callbacks=lambda x: None).start)
+
+    return results
+
+
+def main():
+    printResults(f'MultiThreadWrapper benchmark, fan-out {FAN_OUT}', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `proxi.common.timecode` conversions'''
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proxi.headless as headless
+headless.install()
+
+from benchmarks import timed, printResults
+
+
+FRAMES = 100_000
+FPS = 24.0
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    import proxi.common.timecode as timecode
+
+    results: dict[str, float] = {}
+    frames = range(FRAMES)
+
+    strings = timed(results, 'generateTimecodeString', lambda: [timecode.generateTimecodeString(x, FPS) for x in frames])
+    components = timed(results, 'parseTimecodeString', lambda: [timecode.parseTimecodeString(x) for x in strings])
+    timed(results, 'getFrameFromTimecodeComponents', lambda: [timecode.getFrameFromTimecodeComponents(x, FPS) for x in components]) # type: ignore
+    timed(results, 'getFrameFromTimecodeString', lambda: [timecode.getFrameFromTimecodeString(x, FPS) for x in strings])
+
+    return results
+
+
+def main():
+    printResults(f'Timecode benchmark, {FRAMES} frames', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+'''Benchmark: `.build/unreal_hinting.py` streaming processor against the buffered one, and splitting into a stubs package, on a generated Unreal stubs file'''
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import tempfile
+import contextlib
+import importlib.util
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import timed, printResults
+
+
+CLASSES = 3000
+METHODS = 12 # Per class
+RETURN_TYPES = ['None', 'bool', 'int32', 'str', 'Vector', 'Array(Actor)', 'Map(Name, int32)', 'UnknownStruct', 'type', 'Object']
+
+
+def loadHinting():
+    '''Import `.build/unreal_hinting.py`, which isn't part of a package'''
+
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.build', 'unreal_hinting.py')
+    spec = importlib.util.spec_from_file_location('unreal_hinting', path)
+    module = importlib.util.module_from_spec(spec) # type: ignore
+    spec.loader.exec_module(module) # type: ignore
+    return module
+
+
+def writeStubs(path: str, classes: int=CLASSES) -> None:
+    '''Write a stubs file laid out like the one exported by the Unreal Python plugin'''
+
+    builtins = ['Object', 'Actor', 'Vector', 'Name', 'Array', 'Map']
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('# -*- coding: utf-8 -*-\nimport _unreal_core  # Generated — do not edit\n\n')
+        for i, name in enumerate(builtins + [f'Class{x}' for x in range(classes)]):
+            f.write(f'class {name}(Object):\n    r"""\n    {name} docs\n    """\n')
+            for m in range(METHODS):
+                returnType = RETURN_TYPES[(i + m) % len(RETURN_TYPES)]
+                f.write(
+                    f'    def method_{m}(self, value):\n'
+                    f'        r"""\n'
+                    f'        x.method_{m}(value) -> {returnType}\n'
+                    f'        Does thing {m}\n'
+                    f'        """\n'
+                    f'        {"pass" if m % 2 else "return None"}\n\n'
+                )
+
+
+def run() -> dict[str, float]:
+    '''Run benchmark
+
+    Returns:
+        dict[str, float]: Metric name -> seconds
+    '''
+
+    hinting = loadHinting()
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tempDir:
+        stubs = os.path.join(tempDir, 'unreal_orig_5.py')
+        buffered = os.path.join(tempDir, 'buffered.py')
+        streamed = os.path.join(tempDir, 'streamed.py')
+        writeStubs(stubs)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            timed(results, 'buffered', hinting.processBuffered, stubs, buffered)
+            timed(results, 'streaming', hinting.processStreaming, stubs, streamed)
+            timed(results, 'split into package', hinting.splitStubs, streamed, os.path.join(tempDir, 'unreal'), '')
+
+        with open(buffered) as a, open(streamed) as b:
+            if a.read() != b.read():
+                raise RuntimeError('Streaming output differs from buffered output')
+
+    return results
+
+
+def main():
+    printResults(f'Unreal stubs hinting benchmark, {CLASSES} classes', run())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
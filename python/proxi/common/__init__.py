@@ -2,7 +2,10 @@
 '''Common utilities'''
 
 from __future__ import annotations
-from collections.abc import Iterable
+import bisect
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Callable
 import unreal
 
 
@@ -56,20 +59,144 @@ def arraysToSet(*arrays: unreal.Array) -> set:
         set: returns a set
     '''
 
-    return set(arraysToList(*arrays))
+    return set(iterArrays(*arrays))
 
 def UniqueList(element) -> list:
-    '''Makes a list unique
+    '''Makes a list unique, keeping the order of first occurrence
 
     Returns:
         list: returns a list of unique elements
     '''
 
-    uniqueElementList = []
+    return list(dict.fromkeys(element))
 
-    uniqueElement = set(element)
 
-    for item in uniqueElement:
-        uniqueElementList.append(item)
+def iterArrays(*arrays: unreal.Array) -> Iterator:
+    '''Iterate over the elements of one or more arrays without copying them. Empty or non-`unreal.Array` arguments are skipped, like `arraysToList`'''
 
-    return uniqueElementList
+    return itertools.chain.from_iterable(x for x in arrays if x and isinstance(x, unreal.Array)) # type: ignore
+
+
+def iterUnique(iterable: Iterable, key: Callable[[Any], Any]|None=None) -> Iterator:
+    '''Yield elements not seen before, in order of first occurrence
+
+    Args:
+        iterable (Iterable): Elements
+        key (Callable, optional): Identity of an element, eg. `lambda x: x.get_path_name()`. Must return something hashable. Defaults to None, which means the element itself.
+    '''
+
+    seen = set()
+    add = seen.add
+
+    if key is None:
+        for element in iterable:
+            if element not in seen:
+                add(element)
+                yield element
+    else:
+        for element in iterable:
+            identity = key(element)
+            if identity not in seen:
+                add(identity)
+                yield element
+
+
+def dedup(iterable: Iterable, key: Callable[[Any], Any]|None=None, lazy: bool=False) -> list|Iterator:
+    '''Remove duplicates, keeping the order of first occurrence
+
+    Args:
+        iterable (Iterable): Elements
+        key (Callable, optional): Identity of an element. Defaults to None, which means the element itself.
+        lazy (bool, optional): Return a generator instead of a list. Defaults to False.
+
+    Returns:
+        list|Iterator: Unique elements
+    '''
+
+    if lazy:
+        return iterUnique(iterable, key)
+
+    if key is None:
+        return list(dict.fromkeys(iterable))
+
+    # Identity -> first element. Dicts keep insertion order
+    unique = {}
+    setdefault = unique.setdefault
+    for element in iterable:
+        setdefault(key(element), element)
+
+    return list(unique.values())
+
+
+def union(*arrays: unreal.Array, key: Callable[[Any], Any]|None=None, lazy: bool=False) -> list|Iterator:
+    '''Order-preserving union of one or more arrays, in a single pass. Shorthand for `dedup(iterArrays(*arrays))`
+
+    Args:
+        key (Callable, optional): Identity of an element, eg. an asset path getter. Defaults to None, which means the element itself.
+        lazy (bool, optional): Return a generator instead of a list. Defaults to False.
+
+    Returns:
+        list|Iterator: Unique elements of all arrays
+    '''
+
+    return dedup(iterArrays(*arrays), key=key, lazy=lazy)
+
+
+def partition(predicate: Callable[[Any], bool], *arrays: unreal.Array, key: Callable[[Any], Any]|None=None, unique: bool=False) -> tuple[list, list]:
+    '''Split the elements of one or more arrays by `predicate`, in a single pass
+
+    Args:
+        predicate (Callable[[Any], bool]): Test per element
+        key (Callable, optional): Identity of an element, used with `unique`. Defaults to None, which means the element itself.
+        unique (bool, optional): Drop duplicates (first occurrence wins). Defaults to False.
+
+    Returns:
+        tuple[list, list]: (matching, not matching), both in original order
+    '''
+
+    matching = []
+    other = []
+    elements = iterArrays(*arrays)
+    if unique:
+        elements = iterUnique(elements, key)
+
+    for element in elements:
+        (matching if predicate(element) else other).append(element)
+
+    return matching, other
+
+
+class ArraysView(Sequence):
+    '''Read-only sequence over one or more arrays, without copying their elements'''
+
+    def __init__(self, *arrays: unreal.Array) -> None:
+        '''Read-only sequence over one or more arrays, without copying their elements. Skips arguments like `arraysToList`'''
+
+        self.arrays = [x for x in arrays if x and isinstance(x, unreal.Array)] # type: ignore
+        self._offsets = list(itertools.accumulate(len(x) for x in self.arrays))
+
+    def __len__(self) -> int:
+        return self._offsets[-1] if self._offsets else 0
+
+    def __iter__(self) -> Iterator:
+        return itertools.chain.from_iterable(self.arrays)
+
+    def __getitem__(self, index): # type: ignore
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError('ArraysView index out of range')
+
+        arrayIndex = bisect.bisect_right(self._offsets, index)
+        start = self._offsets[arrayIndex - 1] if arrayIndex else 0
+        return self.arrays[arrayIndex][index - start]
+
+
+def arraysView(*arrays: unreal.Array) -> ArraysView:
+    '''Lightweight view over one or more arrays (len, indexing, iteration), see `ArraysView`'''
+
+    return ArraysView(*arrays)
\ No newline at end of file
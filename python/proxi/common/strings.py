@@ -6,6 +6,15 @@ from __future__ import annotations
 import unreal
 import datetime
 import proxi.console as console
+from typing import Iterable, NamedTuple
+
+
+class BulkResult(NamedTuple):
+    '''Result of a bulk conversion, eg. `toInts`'''
+
+    values: list # One per input value, in order. Failed and blank values are replaced by the default
+    errors: int # Values that failed to convert
+    blanks: int # None or empty (whitespace only) values. Not errors
 
 
 def __ensureString__(obj: object) -> str:
@@ -185,6 +194,64 @@ def toFloat(string: str) -> float|None:
     return None
 
 
+def _isBlank(value: object) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def toInts(values: Iterable, defaultValue: int=-1) -> BulkResult:
+    '''Convert a sequence of strings (eg. a CSV column) to integers in one pass. Unlike `toInt`, failures are counted instead of logged
+    
+    Args:
+        values (Iterable): Strings or desired string-like objects
+        defaultValue (int, optional): Value for blank values and values that don't parse to a known number. Defaults to -1.
+    
+    Returns:
+        BulkResult: Integers, number of failed and blank values. Unlike `toInt`, `0` converts to 0 rather than `defaultValue`
+    '''
+
+    result = []
+    append = result.append
+    errors = blanks = 0
+    for value in values:
+        try:
+            append(int(value))
+        except (TypeError, ValueError, OverflowError):
+            append(defaultValue)
+            if _isBlank(value):
+                blanks += 1
+            else:
+                errors += 1
+
+    return BulkResult(result, errors, blanks)
+
+
+def toFloats(values: Iterable, defaultValue: float|None=None) -> BulkResult:
+    '''Convert a sequence of strings (eg. a CSV column) to floats in one pass. Unlike `toFloat`, failures are counted instead of logged
+    
+    Args:
+        values (Iterable): Strings or desired string-like objects
+        defaultValue (float, optional): Value for blank values and values that don't parse to a known number. Defaults to None.
+    
+    Returns:
+        BulkResult: Floats, number of failed and blank values
+    '''
+
+    result = []
+    append = result.append
+    errors = blanks = 0
+    for value in values:
+        try:
+            append(float(value))
+        except (TypeError, ValueError):
+            append(defaultValue)
+            if _isBlank(value):
+                blanks += 1
+            else:
+                errors += 1
+
+    return BulkResult(result, errors, blanks)
+
+
 def toStr(obj: str) -> str:
     '''Convert a given object to a string
     
@@ -331,6 +398,31 @@ def sanitizeSlashes(string: str, removeDoubleSlashes: bool=True) -> str:
     return string
 
 
+def sanitizeSlashesMany(strings: Iterable, removeDoubleSlashes: bool=True) -> BulkResult:
+    '''Sanitize slashes in a sequence of strings in one pass, as `sanitizeSlashes`
+    
+    Args:
+        strings (Iterable): Strings to process. Non-string values become empty strings and count as errors
+        removeDoubleSlashes (bool, optional): Remove double slashes? Defaults to True
+
+    Returns:
+        BulkResult: Processed strings, number of non-string values. `blanks` is always 0
+    '''
+
+    result = []
+    append = result.append
+    errors = 0
+    for value in strings:
+        if isinstance(value, str):
+            value = value.replace('\\', '/')
+            append(value.replace('//', '/') if removeDoubleSlashes else value)
+        else:
+            append('')
+            errors += 1
+
+    return BulkResult(result, errors, 0)
+
+
 def stripEnd(text: str, suffix: str) -> str:
     '''Strip the supplied character(s) from the end of the string. Order matters, this will match sub-string, not iterate over suffixes'''
 
@@ -421,4 +513,4 @@ class Unicode:
     chevronsLeft = '\u00ab' # «
     hairSpace = '\u200a'
     bullet = '\u2022' # •
-    plus = '\u002b' # +
+    plus = '\u002b' # +
\ No newline at end of file
@@ -7,10 +7,17 @@ import os
 import proxi.dev as dev
 import proxi.common.strings as strings
 
-from .fileTypes import FileTypes, FileExtensions
+from .assetQueries import AssetQueries
+from .dialogs import Dialogs
+from .fileScan import FileScan
+from .fileTypes import FileTypes, FileExtensions, FileTypeClassifier, FILE_TYPE_ALIASES, FILE_TYPE_CLASSIFIER
+from .liveReload import LiveReload
 from .paths import Paths
+from .style import Style
 from .timecode import Timecode
 from .timeFormats import TimeFormats
+from .userPrefs import UserPrefs
+from .windows import Windows
 
 
 def getUiPrefsPath(uiFilename: str=None, toolName: str=None) -> str:
@@ -36,7 +43,7 @@ def getUiPrefsPath(uiFilename: str=None, toolName: str=None) -> str:
     else:
         bare = toolName.replace(' ', '_')
 
-    return '{}/Proxi_{}.{}'.format(Paths.userPrefsDir, bare, FileTypes.json)
+    return '{}/{}{}.{}'.format(Paths.userPrefsDir, UserPrefs.filePrefix, bare, FileTypes.json)
 
 
 def getUiFilePath(pyFile: str) -> str:
@@ -46,4 +53,4 @@ def getUiFilePath(pyFile: str) -> str:
         str: Full path to .ui file
     '''
 
-    return '{}.{}'.format(os.path.splitext(pyFile)[0], FileTypes.qt)
+    return '{}.{}'.format(os.path.splitext(pyFile)[0], FileTypes.qt)
\ No newline at end of file
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+'''Asset registry query config'''
+
+
+class AssetQueries:
+    '''Asset registry & level actor query settings, see `proxi.io.assetRegistry`'''
+
+    cacheAssets = True # Cache asset registry results per filter until a matching asset is added/removed/renamed
+    assetCacheSeconds = 10.0 # Where registry events can't be bound (the editor's Python API has none), cached asset results expire after this
+    actorCacheSeconds = 2.0 # Level actors change without events, so their cache expires after this
+    pageSize = 500 # Assets per page for `iterPages`
\ No newline at end of file
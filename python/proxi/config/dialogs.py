@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+'''Dialog and notification config'''
+
+import os
+
+
+class Dialogs:
+    '''Dialog and toast notification settings, see `proxi.ui.dialogs` and `proxi.ui.notifications`'''
+
+    headless = os.environ.get('PROXI_HEADLESS', '') not in ('', '0') # Never block on dialogs: resolve to defaults instantly and log. Eg. batch/automation runs
+    toastDuration = 4000 # Milliseconds a toast notification stays on screen
+    maxVisibleToasts = 4 # Further toasts are queued until one is dismissed
+    toastInterval = 250 # Min milliseconds between two toasts appearing (rate limit)
\ No newline at end of file
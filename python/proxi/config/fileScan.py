@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+'''Directory scanning config'''
+
+
+class FileScan:
+    '''Parallel, cached directory scanning settings, see `proxi.io.fileScanner`'''
+
+    maxWorkers = 8 # Threads listing the directories of one tree level in parallel
+    excludeDirs = ('__pycache__', '.git', '.svn', '.vs', 'Intermediate', 'Saved', 'DerivedDataCache') # Directory names never descended into
+    racyWindow = 2.0 # Seconds: directories modified this close to a scan are listed again by the next one (coarse mtime resolution)
+    verifyFiles = True # Stat the files of unchanged directories too, so files modified in place report their new size/mtime. Off: only listing changes are picked up (see `FileScanner.rescan`)
+    persist = True # Keep snapshots on disk in `Paths.scanCacheDir`, so repeat scans are incremental across sessions
\ No newline at end of file
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Iterable
+
 
 class FileTypes:
     '''File types: mb, fbx, mov, mp4, etc. For formatted extensions, use the `extensions` object'''
@@ -33,12 +36,8 @@ class FileExtensions(object):
     '''
 
     def __init__(self):
-        self.allExtensions: dict[str, str] = {}
-
-        # Straight up dot-extensions
-        for key, value in vars(FileTypes).items():
-            if not '__' in key:
-                self.allExtensions[key] = '.{}'.format(value)
+        # Straight up dot-extensions, precomputed by `FILE_TYPE_CLASSIFIER`
+        self.allExtensions: dict[str, str] = dict(FILE_TYPE_CLASSIFIER.keyExtensions)
 
         # Future: add any special file extensions here (not directly derived from `fileTypes`)
 
@@ -67,4 +66,124 @@ class FileExtensions(object):
         return self.allExtensions.items()
 
     # Alias
-    iteritems = items
\ No newline at end of file
+    iteritems = items
+
+
+# Related file types, classified as their family with `aliases=True`. Key aliases (`mayaBinary`, `mobu`) resolve on their own
+FILE_TYPE_ALIASES: dict[str, tuple[str, ...]] = {
+    'maya': ('mayaAscii',), # mb/ma
+    'fbx': ('mobu',),
+    'tif': ('tiff',)
+}
+
+
+class FileTypeClassifier:
+    '''Immutable reverse index of `FileTypes`: extension -> file type key. Use the shared `FILE_TYPE_CLASSIFIER`
+
+    Keys of the same extension collapse onto the first one declared (`mayaBinary` -> `maya`, `mobu` -> `fbx`), and
+    `FILE_TYPE_ALIASES` groups related types into families (`mayaAscii` -> `maya`, `tiff` -> `tif`). Lookups are case-insensitive
+    '''
+
+    __slots__ = ('keyExtensions', 'types', 'families', 'keys', '_types', '_families', '_familyExtensions')
+
+    def __init__(self, fileTypes: type=FileTypes, aliases: dict[str, tuple[str, ...]]=FILE_TYPE_ALIASES):
+        keyExtensions: dict[str, str] = {} # Key -> '.ext', every key including aliases
+        types: dict[str, str] = {} # '.ext' -> key
+        keys: dict[str, str] = {} # Key, alias key or bare extension -> key
+        for key, value in vars(fileTypes).items():
+            if '__' in key or not isinstance(value, str):
+                continue
+
+            extension = '.{}'.format(value.lower())
+            keyExtensions[key] = extension
+            types.setdefault(extension, key)
+            keys[key] = types[extension]
+
+        for extension, key in types.items():
+            keys.setdefault(extension[1:], key)
+
+        familyOf = {keys[member]: keys[family] for family, members in aliases.items() for member in members}
+        families = {extension: familyOf.get(key, key) for extension, key in types.items()} # '.ext' -> family key
+        familyExtensions: dict[str, tuple[str, ...]] = {}
+        for extension, family in families.items():
+            familyExtensions[family] = familyExtensions.get(family, ()) + (extension,)
+
+        object.__setattr__(self, 'keyExtensions', MappingProxyType(keyExtensions))
+        object.__setattr__(self, 'types', MappingProxyType(types))
+        object.__setattr__(self, 'families', MappingProxyType(families))
+        object.__setattr__(self, 'keys', MappingProxyType(keys))
+        object.__setattr__(self, '_familyExtensions', MappingProxyType(familyExtensions))
+        object.__setattr__(self, '_types', types) # Lookups go to the plain dicts, `mappingproxy.get` is slower
+        object.__setattr__(self, '_families', families)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def key(self, typeOrKey: str) -> str|None:
+        '''Key for a file type, key or key alias: `mb`, `maya` and `mayaBinary` all give `maya`. None if unknown'''
+
+        keys = self.keys
+        return keys.get(typeOrKey) or keys.get(typeOrKey.lstrip('.').lower())
+
+    def family(self, typeOrKey: str) -> str|None:
+        '''Family key for a file type or key: `ma` and `mayaAscii` give `maya`. None if unknown'''
+
+        key = self.key(typeOrKey)
+        return self.families[self.keyExtensions[key]] if key else None
+
+    def extensions(self, typeOrKey: str, aliases: bool=False) -> tuple[str, ...]:
+        '''Dot-extensions of a file type or key, and with `aliases` those of its whole family'''
+
+        key = self.key(typeOrKey)
+        if key is None:
+            return ()
+
+        extension = self.keyExtensions[key]
+        return self._familyExtensions[self.families[extension]] if aliases else (extension,)
+
+    def typeOf(self, path: str, aliases: bool=False) -> str|None:
+        '''File type key of a path (or filename, or extension), None if not a known file type'''
+
+        index = self._families if aliases else self._types
+        extension = path[path.rfind('.'):]
+        return index.get(extension) or index.get(extension.lower())
+
+    def classify(self, paths: Iterable[str], aliases: bool=False) -> list[str|None]:
+        '''File type key of each path, None for unknown types. Built for large listings: the only per-path work is
+        slicing off the extension and one dict lookup (two for mixed-case or unknown extensions)
+
+        Args:
+            paths (Iterable[str]): Paths, filenames or extensions. Separators don't matter, `a.mb/file` has no type
+            aliases (bool, optional): Classify as the family instead (`.ma` -> `maya`). Defaults to False.
+
+        Returns:
+            list[str|None]: Type keys, in the order of `paths`
+        '''
+
+        get = (self._families if aliases else self._types).get
+        return [get(extension) or get(extension.lower()) for path in paths for extension in [path[path.rfind('.'):]]]
+
+    def group(self, paths: Iterable[str], aliases: bool=False) -> dict[str, list[str]]:
+        '''Paths grouped by file type key, unknown types left out'''
+
+        if not isinstance(paths, (list, tuple)):
+            paths = list(paths)
+
+        groups: dict[str, list[str]] = {}
+        for path, key in zip(paths, self.classify(paths, aliases=aliases)):
+            if key is not None:
+                groups.setdefault(key, []).append(path)
+
+        return groups
+
+    def filter(self, paths: Iterable[str], *typesOrKeys: str, aliases: bool=False) -> list[str]:
+        '''Paths of the given file types or keys, e.g. `filter(paths, FileTypes.maya, 'fbx')`. With `aliases`, of their families'''
+
+        if not isinstance(paths, (list, tuple)):
+            paths = list(paths)
+
+        wanted = {(self.family(x) if aliases else self.key(x)) for x in typesOrKeys} - {None}
+        return [path for path, key in zip(paths, self.classify(paths, aliases=aliases)) if key in wanted]
+
+
+FILE_TYPE_CLASSIFIER = FileTypeClassifier()
\ No newline at end of file
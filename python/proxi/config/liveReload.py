@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+'''Live reload config'''
+
+
+class LiveReload:
+    '''File watcher driven reload settings (`DEV_MODE` only), see `proxi.ui.liveReload`'''
+
+    enabled = True # Watch `proxi` for changes at startup, and reload changed modules/re-show their windows
+    extensions = ('.py', '.ui') # Files to watch
+    debounce = 300 # Milliseconds without further changes before reloading, so a burst of saves reloads once
+    polling = False # Poll for changes instead of using native file system notifications, eg. for network drives
+    pollInterval = 1000 # Milliseconds between polls, when polling
\ No newline at end of file
@@ -4,8 +4,21 @@
 import os
 
 
+def _installRoot() -> str:
+    '''Folder containing the `proxi` package, or the bundle folder's parent when imported from the bundle (`.build/bundle.py`)'''
+
+    root = os.path.dirname(__file__).replace('\\', '/').replace('/proxi/config', '')
+    if root.endswith('.zip'):
+        root = os.path.dirname(os.path.dirname(root)) # <root>/bundle/code.zip
+
+    return root
+
+
 class Paths:
     '''Key folder and server paths'''
 
     userPrefsDir = '{}/Proxi/Unreal'.format(os.getenv('APPDATA').replace('\\', '/').strip('/'))
-    pipelineBaseDynamic = '{}'.format(os.path.dirname(__file__)).replace('\\', '/').replace('/proxi/config', '')
\ No newline at end of file
+    pipelineBaseDynamic = _installRoot()
+    userPrefsDatabase = '{}/Proxi_Prefs.sqlite'.format(userPrefsDir)
+    styleCacheDir = '{}/StyleCache'.format(userPrefsDir)
+    scanCacheDir = '{}/ScanCache'.format(userPrefsDir)
\ No newline at end of file
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+'''Qt styling config'''
+
+
+class Style:
+    '''Qt Material theme settings, see `proxi.ui.styleCache`'''
+
+    applyTheme = False # Apply the material theme (plus PROXi overrides) app-wide at `proxi.ui` import
+    theme = 'dark_bluegrey.xml' # qt_material theme file
+    density = 0 # qt_material density scale. Negative values are more compact
+    invertSecondary = False # Swap light and dark secondary colors (light themes)
\ No newline at end of file
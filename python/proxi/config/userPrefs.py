@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+'''User prefs config'''
+
+
+class UserPrefs:
+    '''User prefs storage settings'''
+
+    useDatabase = False # Store all tool prefs in a single SQLite database instead of one .json file per tool
+    migrateJsonFiles = True # Import existing `Proxi_<tool>.json` files into the database the first time it is opened
+    filePrefix = 'Proxi_' # Prefix for per-tool prefs files, see `config.getUiPrefsPath`
\ No newline at end of file
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+'''Window lifecycle config'''
+
+
+class Windows:
+    '''Window pooling and warm-start settings, see `proxi.ui.windowManager`'''
+
+    keepWarm = True # Hide closed windows instead of deleting them, so reopening skips `setupUi`, `loadPrefs`, etc
+    maxWarmInstances = 4 # Max number of hidden (warm) windows to keep around. Least recently used are deleted first
+    prebuild: list[str] = [] # Window classes to build in idle time after startup. Eg. `proxi.ui.debugSystemTime.DebugSystemTime`
+    prebuildDelay = 5000 # Milliseconds to wait after startup before prebuilding windows
+    lazyPageIdleBuild = True # Build the hidden pages of lazy windows in idle time after their first paint, instead of on first activation only. See `QtWindowBase.lazyPages`
+    lazyPageIdleDelay = 50 # Milliseconds after the first paint before building the first hidden page. Then one page per event loop turn
\ No newline at end of file
@@ -3,9 +3,14 @@
 
 from __future__ import annotations
 
+import os
+import sys
+import ast
 import types
+import hashlib
 import importlib
-import os
+import importlib.util
+from typing import Callable, NamedTuple
 
 
 _DEBUG_FILE = os.path.expanduser(r'~\Documents\unreal-debug')
@@ -16,25 +21,287 @@ print(f'Debug mode? {DEBUG_MODE}')
 print(f'Developer mode? {DEV_MODE}')
 
 
-def reloadModules(modules: list[types.ModuleType|str], onlyInDevMode: bool=True):
-    '''Reload the specified modules or module paths if we're in DEV mode (optionally forced)'''
+RELOAD_PACKAGE = 'proxi' # Modules tracked by `reloadChanged`
+RELOAD_EXCLUDE = ['proxi.dev'] # Never reloaded, they hold session state
+
+
+class _SourceState(NamedTuple):
+    mtime: int # Nanoseconds
+    size: int
+    digest: str
+    imports: frozenset[str] # Tracked modules imported by this one
+
+
+# Keep tracked source state while allowing for module reload without resetting
+try:
+    _SOURCE_STATE # type: ignore
+except NameError:
+    _SOURCE_STATE: dict[str, _SourceState] = {}
+    _RELOAD_HOOKS: dict[str, Callable[[], None]] = {}
+    _RELOADING = False
+
+
+def setReloadHook(name: str, hook: Callable[[], None]|None) -> None:
+    '''Run `hook` before `reloadChanged` looks for changes, eg. to regenerate sources. Replaces (or with None, removes) the hook named `name`'''
+
+    if hook is None:
+        _RELOAD_HOOKS.pop(name, None)
+    else:
+        _RELOAD_HOOKS[name] = hook
+
+
+def _sourceFile(module: types.ModuleType) -> str|None:
+    path = getattr(module, '__file__', None)
+    if not path or not path.endswith('.py'):
+        return None
+
+    return path
+
+
+def _isTracked(name: str) -> bool:
+    return (name == RELOAD_PACKAGE or name.startswith(f'{RELOAD_PACKAGE}.')) and name not in RELOAD_EXCLUDE
+
+
+def _loadedStamp(module: types.ModuleType) -> tuple[int, int]|None:
+    '''Source mtime (seconds) and size the module was loaded from, according to the header of its cached bytecode'''
+
+    cached = getattr(module, '__cached__', None)
+    if not cached:
+        return None
+
+    try:
+        with open(cached, 'rb') as f:
+            header = f.read(16)
+    except OSError:
+        return None
+
+    if len(header) < 16 or header[:4] != importlib.util.MAGIC_NUMBER or int.from_bytes(header[4:8], 'little') != 0:
+        return None # Hash based or foreign bytecode
+
+    return int.from_bytes(header[8:12], 'little'), int.from_bytes(header[12:16], 'little')
+
+
+def _isTypeChecking(node: ast.expr) -> bool:
+    return (isinstance(node, ast.Name) and node.id == 'TYPE_CHECKING') or (isinstance(node, ast.Attribute) and node.attr == 'TYPE_CHECKING')
+
+
+def _moduleLevelImports(nodes: list[ast.stmt]):
+    '''Import statements executed when the module runs. Function level imports resolve at call time, and `TYPE_CHECKING` ones never run'''
+
+    for node in nodes:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+        elif isinstance(node, ast.If):
+            if not _isTypeChecking(node.test):
+                yield from _moduleLevelImports(node.body)
+            yield from _moduleLevelImports(node.orelse)
+        elif isinstance(node, ast.Try):
+            for block in (node.body, *(x.body for x in node.handlers), node.orelse, node.finalbody):
+                yield from _moduleLevelImports(block)
+        elif isinstance(node, (ast.With, ast.ClassDef, ast.For, ast.While)):
+            yield from _moduleLevelImports(node.body)
+
+
+def _parseImports(name: str, module: types.ModuleType, source: bytes) -> frozenset[str]:
+    '''Tracked modules imported (at module level) by a module'''
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return frozenset()
+
+    package = name if hasattr(module, '__path__') else name.rpartition('.')[0]
+    imports: set[str] = set()
+    for node in _moduleLevelImports(tree.body):
+        if isinstance(node, ast.Import):
+            imports.update(x.name for x in node.names)
+        else:
+            if node.level:
+                base = package.rsplit('.', node.level - 1)[0] if node.level > 1 else package
+                base = f'{base}.{node.module}' if node.module else base
+            else:
+                base = node.module or ''
+
+            imports.add(base)
+            imports.update(f'{base}.{x.name}' for x in node.names) # Submodules, filtered below
+
+    return frozenset(x for x in imports if x != name and x in sys.modules and _isTracked(x))
+
+
+def _readState(name: str, module: types.ModuleType, path: str, stat: os.stat_result) -> _SourceState:
+    with open(path, 'rb') as f:
+        source = f.read()
+
+    return _SourceState(stat.st_mtime_ns, stat.st_size, hashlib.sha1(source).hexdigest(), _parseImports(name, module, source))
+
+
+def changedModules() -> tuple[set[str], dict[str, frozenset[str]]]:
+    '''Find loaded, tracked modules whose source changed on disk since they were (re)loaded
+
+    Modules seen for the first time are compared against their cached bytecode header, otherwise against the recorded
+    mtime and size. Only when those differ is the source read and hashed, so touching a file doesn't count as a change
+
+    Returns:
+        tuple[set[str], dict[str, frozenset[str]]]: Changed module names, and the import graph of all tracked modules
+    '''
+
+    changed: set[str] = set()
+    graph: dict[str, frozenset[str]] = {}
+    for name in list(sys.modules):
+        module = sys.modules.get(name) # None for placeholders that block an import
+        if module is None or not _isTracked(name):
+            continue
+
+        path = _sourceFile(module)
+        if path is None:
+            continue
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue # Deleted, nothing to reload from
+
+        state = _SOURCE_STATE.get(name)
+        if state is not None and (state.mtime, state.size) == (stat.st_mtime_ns, stat.st_size):
+            graph[name] = state.imports
+            continue
+
+        newState = _readState(name, module, path, stat)
+        if state is None:
+            stamp = _loadedStamp(module)
+            if stamp is not None and stamp != (int(stat.st_mtime) & 0xFFFFFFFF, stat.st_size & 0xFFFFFFFF):
+                changed.add(name)
+            else:
+                _SOURCE_STATE[name] = newState # Baseline, assume the loaded module matches its source
+        elif newState.digest != state.digest:
+            changed.add(name)
+        else:
+            _SOURCE_STATE[name] = newState # Touched, not changed
+
+        graph[name] = newState.imports
+
+    return changed, graph
+
+
+def reloadOrder(changed: set[str], graph: dict[str, frozenset[str]], dependents: bool=True) -> list[str]:
+    '''Order modules for reloading: dependencies before the modules importing them
+
+    Args:
+        changed (set[str]): Modules to reload
+        graph (dict[str, frozenset[str]]): Module -> modules it imports
+        dependents (bool, optional): Also reload (transitive) importers of `changed`. Defaults to True.
+
+    Returns:
+        list[str]: Module names. Import cycles are broken in a stable (alphabetical) order
+    '''
+
+    selected = set(changed)
+    if dependents:
+        importers: dict[str, set[str]] = {}
+        for name, imports in graph.items():
+            for imported in imports:
+                importers.setdefault(imported, set()).add(name)
+
+        stack = list(changed)
+        while stack:
+            for importer in importers.get(stack.pop(), ()):
+                if importer not in selected:
+                    selected.add(importer)
+                    stack.append(importer)
+
+    order: list[str] = []
+    visited: set[str] = set()
+
+    def visit(name: str):
+        visited.add(name)
+        for imported in sorted(graph.get(name, ())):
+            if imported in selected and imported not in visited:
+                visit(imported)
+        order.append(name)
+
+    for name in sorted(selected):
+        if name not in visited:
+            visit(name)
+
+    return order
+
+
+def _reload(names: list[str]) -> list[str]:
+    global _RELOADING
+
+    _RELOADING = True
+    try:
+        for name in names:
+            module = sys.modules.get(name)
+            if module is None:
+                continue
+
+            print(f'Reloading module {name}')
+            importlib.reload(module)
+
+            path = _sourceFile(module)
+            if path is not None:
+                _SOURCE_STATE[name] = _readState(name, module, path, os.stat(path))
+    finally:
+        _RELOADING = False
+
+    return names
+
+
+def reloadChanged(onlyInDevMode: bool=True) -> list[str]:
+    '''Reload `RELOAD_PACKAGE` modules whose source changed on disk, and all modules importing them, in dependency order
+
+    A no-op (a `stat` per loaded module) when nothing changed. Calls made while reloading, eg. from the module level of
+    a module being reloaded, are ignored
+
+    Returns:
+        list[str]: Reloaded module names
+    '''
+
+    if (onlyInDevMode and not DEV_MODE) or _RELOADING:
+        return []
+
+    for hook in list(_RELOAD_HOOKS.values()):
+        hook()
+
+    changed, graph = changedModules()
+    if not changed:
+        return []
+
+    return _reload(reloadOrder(changed, graph))
+
+
+def reloadModules(modules: list[types.ModuleType|str], onlyInDevMode: bool=True, onlyChanged: bool=False):
+    '''Reload the specified modules or module paths if we're in DEV mode (optionally forced)
+
+    Modules are reloaded in dependency order, regardless of the order given. With `onlyChanged`, only those whose source
+    changed on disk. To also pick up changes in their dependencies, use `reloadChanged`
+    '''
 
     if onlyInDevMode and not DEV_MODE:
         return
 
+    names: list[str] = []
     for mod in modules:
         if isinstance(mod, str):
-            print(f'Importing module {mod}')
+            if mod not in sys.modules:
+                print(f'Importing module {mod}')
             mod = importlib.import_module(mod)
-        print(f'Reloading module {mod.__name__}')
-        mod = importlib.reload(mod)
+        names.append(mod.__name__)
+
+    changed, graph = changedModules()
+    if onlyChanged:
+        names = [x for x in names if x in changed or not _isTracked(x)]
+
+    if names:
+        _reload(reloadOrder(set(names), graph, dependents=False))
 
 
-def insertReloadForDev(moduleName) -> str:
-    '''Insert reload call in import string if we're in dev mode'''
+def insertReloadForDev() -> str:
+    '''Insert reload call in import string if we're in dev mode. Reloads whatever changed, the imported module included (see `reloadChanged`)'''
 
     if DEV_MODE:
-        return f'import importlib; importlib.reload({moduleName}); '
+        return 'import proxi.dev; proxi.dev.reloadChanged(); '
     else:
         return ''
 
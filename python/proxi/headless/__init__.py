@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+'''Headless runtime: run proxi outside the editor (benchmarks, CI), with a recording `unreal` stand-in'''
+
+from __future__ import annotations
+
+import os
+import sys
+import types
+
+
+def isEditor() -> bool:
+    '''Are we running inside Unreal, with the real `unreal` module?'''
+
+    module = sys.modules.get('unreal')
+    return module is not None and not getattr(module, 'HEADLESS', False)
+
+
+def install(force: bool=False) -> types.ModuleType:
+    '''Make `import unreal` resolve to `proxi.headless.unreal` and put dialogs in headless mode. Call before importing other proxi modules
+
+    Args:
+        force (bool, optional): Replace the real `unreal` module, even if available. Defaults to False.
+
+    Returns:
+        types.ModuleType: The active `unreal` module (real or stand-in)
+    '''
+
+    if not force:
+        if 'unreal' in sys.modules:
+            return sys.modules['unreal']
+
+        try:
+            import unreal
+            return unreal
+        except ImportError:
+            pass
+
+    from . import unreal as standIn
+    sys.modules['unreal'] = standIn
+
+    # Scripted runs must never block on a dialog
+    os.environ.setdefault('PROXI_HEADLESS', '1')
+    if 'proxi.config' in sys.modules:
+        sys.modules['proxi.config'].Dialogs.headless = True
+
+    return standIn
+
+
+def uninstall() -> None:
+    '''Remove the stand-in from `sys.modules`. Modules that already imported it keep their reference'''
+
+    module = sys.modules.get('unreal')
+    if module is not None and getattr(module, 'HEADLESS', False):
+        del sys.modules['unreal']
\ No newline at end of file
@@ -0,0 +1,500 @@
+# -*- coding: utf-8 -*-
+'''Stand-in for the editor's `unreal` module, for running proxi outside Unreal (benchmarks, CI)
+
+Covers what proxi uses: logging, `ToolMenus` & co, `Array`, Slate tick and Python shutdown callbacks, and a minimal
+asset registry / level actor setup (populate with `addAsset` and `addActor`). Calls are
+recorded in `CALLS` (the last `MAX_CALLS` of them), so tests can assert on (and benchmarks can count) editor interaction. Installed as `unreal` by
+`proxi.headless.install`
+'''
+
+from __future__ import annotations
+
+import sys
+import time
+import enum
+import itertools
+from collections import deque
+from typing import Any, Callable, NamedTuple
+
+
+class Call(NamedTuple):
+    '''Recorded call into this module'''
+
+    name: str
+    args: tuple
+    kwargs: dict
+    time: float
+
+
+MAX_CALLS = 100_000 # Recorded calls to keep. Tick callbacks and registry queries would otherwise grow `CALLS` for the whole session
+
+try:
+    CALLS # type: ignore
+except NameError:
+    CALLS: deque[Call] = deque(maxlen=MAX_CALLS) # Oldest first
+
+HEADLESS = True # Marks this module as the stand-in, see `proxi.headless.isEditor`
+RECORD = True # Record calls in `CALLS`
+ECHO_LOGS = False # Print `log*` output to stdout (stderr for warnings/errors)
+ASSET_EVENTS = False # Give new `AssetRegistry` instances `on_asset_added/removed/renamed` delegates. The editor's Python API has none, opt in only to test code for hooks that do
+
+_handles = itertools.count(1)
+_tickCallbacks: dict[int, Callable[[float], None]] = {}
+_shutdownCallbacks: dict[int, Callable[[], None]] = {}
+
+
+def _record(_name: str, *args, **kwargs) -> None:
+    if RECORD:
+        CALLS.append(Call(_name, args, kwargs, time.perf_counter()))
+
+
+def calls(name: str|None=None) -> list[Call]:
+    '''Recorded calls, optionally only those to `name` (eg. `log`, `ToolMenu.add_menu_entry`)'''
+
+    if name is None:
+        return list(CALLS)
+
+    return [x for x in CALLS if x.name == name]
+
+
+def reset() -> None:
+    '''Clear recorded calls, callbacks and menus'''
+
+    CALLS.clear()
+    _tickCallbacks.clear()
+    _shutdownCallbacks.clear()
+    ToolMenus._instance = None
+    AssetRegistryHelpers._registry = None
+    _editorSubsystems.clear()
+
+
+# Logging
+
+def log(arg: object) -> None:
+    _record('log', arg)
+    if ECHO_LOGS:
+        print(arg)
+
+
+def log_warning(arg: object) -> None:
+    _record('log_warning', arg)
+    if ECHO_LOGS:
+        print(arg, file=sys.stderr)
+
+
+def log_error(arg: object) -> None:
+    _record('log_error', arg)
+    if ECHO_LOGS:
+        print(arg, file=sys.stderr)
+
+
+# Containers
+
+class Array(list):
+    '''`unreal.Array` stand-in: a typed list. The element type is kept but not enforced'''
+
+    def __init__(self, type: type|None=None, iterable=()):
+        super().__init__(iterable)
+        self.type = type
+
+    @classmethod
+    def cast(cls, type: type, obj) -> Array:
+        return cls(type, obj)
+
+
+# Callbacks
+
+def register_slate_post_tick_callback(callback: Callable[[float], None]) -> int:
+    _record('register_slate_post_tick_callback', callback)
+    handle = next(_handles)
+    _tickCallbacks[handle] = callback
+    return handle
+
+
+def unregister_slate_post_tick_callback(handle: int) -> None:
+    _record('unregister_slate_post_tick_callback', handle)
+    _tickCallbacks.pop(handle, None)
+
+
+def register_python_shutdown_callback(callback: Callable[[], None]) -> int:
+    _record('register_python_shutdown_callback', callback)
+    handle = next(_handles)
+    _shutdownCallbacks[handle] = callback
+    return handle
+
+
+def unregister_python_shutdown_callback(handle: int) -> None:
+    _record('unregister_python_shutdown_callback', handle)
+    _shutdownCallbacks.pop(handle, None)
+
+
+def parent_external_window_to_slate(handle: int) -> None:
+    _record('parent_external_window_to_slate', handle)
+
+
+def tick(deltaSeconds: float=1 / 60, frames: int=1) -> None:
+    '''Drive registered Slate post-tick callbacks, as the editor would once per frame'''
+
+    for _ in range(frames):
+        for callback in list(_tickCallbacks.values()):
+            callback(deltaSeconds)
+
+
+def shutdown() -> None:
+    '''Run registered Python shutdown callbacks, as the editor would on exit'''
+
+    for callback in list(_shutdownCallbacks.values()):
+        callback()
+
+    _shutdownCallbacks.clear()
+
+
+# Tool menus
+
+class MultiBlockType(enum.Enum):
+    NONE = 0
+    BUTTON_ROW = 1
+    EDITABLE_TEXT = 2
+    HEADING = 3
+    MENU_ENTRY = 4
+    SEPARATOR = 5
+    TOOL_BAR_BUTTON = 6
+    TOOL_BAR_COMBO_BUTTON = 7
+    WIDGET = 8
+
+
+class ToolMenuStringCommandType(enum.Enum):
+    COMMAND = 0
+    PYTHON = 1
+    CUSTOM = 2
+
+
+class ToolMenuEntry:
+
+    def __init__(self, name: str='', type: MultiBlockType=MultiBlockType.MENU_ENTRY, **kwargs):
+        _record('ToolMenuEntry', name=name, type=type, **kwargs)
+        self.name = name
+        self.type = type
+        self.label = ''
+        self.tool_tip = ''
+        self.string_command: tuple[ToolMenuStringCommandType, str, str]|None = None
+
+    def set_label(self, label: str) -> None:
+        _record('ToolMenuEntry.set_label', label)
+        self.label = label
+
+    def set_tool_tip(self, tool_tip: str) -> None:
+        _record('ToolMenuEntry.set_tool_tip', tool_tip)
+        self.tool_tip = tool_tip
+
+    def set_string_command(self, type: ToolMenuStringCommandType, custom_type: str, string: str) -> None:
+        _record('ToolMenuEntry.set_string_command', type=type, custom_type=custom_type, string=string)
+        self.string_command = (type, custom_type, string)
+
+
+class ToolMenu:
+
+    def __init__(self, name: str, label: str='', tool_tip: str=''):
+        self.name = name
+        self.label = label
+        self.tool_tip = tool_tip
+        self.sections: dict[str, str] = {} # Section name -> label
+        self.entries: list[tuple[str, ToolMenuEntry]] = [] # (section name, entry)
+        self.sub_menus: list[ToolMenu] = []
+
+    def get_name(self) -> str:
+        return self.name
+
+    def add_sub_menu(self, owner: Any, section_name: str, name: str, label: str, tool_tip: str='') -> ToolMenu:
+        _record('ToolMenu.add_sub_menu', owner, section_name, name, label, tool_tip)
+        menu = ToolMenus.get().register_menu(f'{self.name}.{name}', label=label, tool_tip=tool_tip)
+        self.sub_menus.append(menu)
+        return menu
+
+    def add_section(self, section_name: str, label: str='', **kwargs) -> None:
+        _record('ToolMenu.add_section', section_name, label=label, **kwargs)
+        self.sections[section_name] = label
+
+    def add_menu_entry(self, section_name: str, args: ToolMenuEntry) -> None:
+        _record('ToolMenu.add_menu_entry', section_name, args)
+        self.entries.append((section_name, args))
+
+
+class ToolMenus:
+
+    _instance: ToolMenus|None = None
+
+    def __init__(self):
+        self.menus: dict[str, ToolMenu] = {}
+        self.register_menu('LevelEditor.MainMenu')
+
+    @classmethod
+    def get(cls) -> ToolMenus:
+        if cls._instance is None:
+            cls._instance = ToolMenus()
+
+        return cls._instance
+
+    def register_menu(self, name: str, label: str='', tool_tip: str='', **kwargs) -> ToolMenu:
+        menu = self.menus.get(name)
+        if menu is None:
+            menu = self.menus[name] = ToolMenu(name, label, tool_tip)
+
+        return menu
+
+    def find_menu(self, name: str) -> ToolMenu|None:
+        _record('ToolMenus.find_menu', name)
+        return self.menus.get(name)
+
+    def remove_menu(self, name: str) -> None:
+        _record('ToolMenus.remove_menu', name)
+        for key in [x for x in self.menus if x == name or x.startswith(f'{name}.')]:
+            del self.menus[key]
+
+        for menu in self.menus.values():
+            menu.sub_menus = [x for x in menu.sub_menus if x.name in self.menus]
+
+    def unregister_owner_by_name(self, name: str) -> None:
+        _record('ToolMenus.unregister_owner_by_name', name)
+
+    def refresh_all_widgets(self) -> None:
+        _record('ToolMenus.refresh_all_widgets')
+
+
+# Delegates
+
+class _Delegate:
+    '''Multicast delegate stand-in'''
+
+    def __init__(self):
+        self.callables: list[Callable] = []
+
+    def add_callable(self, callable: Callable) -> None:
+        if callable not in self.callables:
+            self.callables.append(callable)
+
+    def remove_callable(self, callable: Callable) -> None:
+        if callable in self.callables:
+            self.callables.remove(callable)
+
+    def broadcast(self, *args) -> None:
+        for callable in list(self.callables):
+            callable(*args)
+
+
+# Asset registry
+
+class TopLevelAssetPath:
+
+    def __init__(self, package_name: str='', asset_name: str=''):
+        self.package_name = package_name
+        self.asset_name = asset_name
+
+    def __str__(self) -> str:
+        return f'{self.package_name}.{self.asset_name}'
+
+    def __eq__(self, other) -> bool:
+        return str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+class AssetData:
+
+    def __init__(self, object_path: str, asset_class: str, tags: dict[str, str]|None=None):
+        '''Asset registry entry. `object_path` as in `/Game/Props/SM_Chair.SM_Chair`'''
+
+        self.object_path = object_path
+        self.package_name = object_path.split('.')[0]
+        self.package_path = self.package_name.rsplit('/', 1)[0]
+        self.asset_name = object_path.rsplit('.', 1)[-1]
+        self.asset_class = asset_class
+        self.asset_class_path = TopLevelAssetPath('/Script/Engine', asset_class)
+        self.tags = dict(tags or {})
+
+    def get_tag_value(self, tag_name: str) -> str|None:
+        _record('AssetData.get_tag_value', self.object_path, tag_name)
+        return self.tags.get(tag_name)
+
+    def get_full_name(self) -> str:
+        return f'{self.asset_class} {self.object_path}'
+
+    def __repr__(self) -> str:
+        return f'<AssetData {self.object_path}>'
+
+
+class ARFilter:
+
+    def __init__(self, class_names=(), class_paths=(), package_paths=(), object_paths=(), soft_object_paths=(), recursive_paths: bool=False, recursive_classes: bool=False, tags_and_values=None, **kwargs):
+        self.class_names = list(class_names)
+        self.class_paths = list(class_paths)
+        self.package_paths = list(package_paths)
+        self.object_paths = list(object_paths) + [str(x) for x in soft_object_paths]
+        self.recursive_paths = recursive_paths
+        self.recursive_classes = recursive_classes
+        self.tags_and_values = dict(tags_and_values or {})
+        self._classes = set(self.class_names) | {x.asset_name if isinstance(x, TopLevelAssetPath) else str(x).rsplit('.', 1)[-1] for x in self.class_paths}
+        self._objectPaths = set(self.object_paths)
+
+    def matches(self, asset: AssetData) -> bool:
+        if self._classes and asset.asset_class not in self._classes:
+            return False
+
+        if self.package_paths:
+            if self.recursive_paths:
+                if not any(asset.package_path == x or asset.package_path.startswith(f'{x.rstrip("/")}/') for x in self.package_paths):
+                    return False
+            elif asset.package_path not in self.package_paths:
+                return False
+
+        if self._objectPaths and asset.object_path not in self._objectPaths:
+            return False
+
+        for tag, value in self.tags_and_values.items():
+            if asset.tags.get(tag) != value:
+                return False
+
+        return True
+
+
+class AssetRegistry:
+
+    def __init__(self):
+        self.assets: dict[str, AssetData] = {} # Object path -> asset
+        if ASSET_EVENTS:
+            self.on_asset_added = _Delegate()
+            self.on_asset_removed = _Delegate()
+            self.on_asset_renamed = _Delegate()
+
+    def get_assets(self, filter: ARFilter) -> Array:
+        _record('AssetRegistry.get_assets', filter)
+        if filter.object_paths:
+            # Object paths are indexed, like in the real registry
+            candidates = [self.assets[x] for x in dict.fromkeys(filter.object_paths) if x in self.assets]
+            if not (filter._classes or filter.package_paths or filter.tags_and_values):
+                return Array(AssetData, candidates) # Nothing else to match
+        else:
+            candidates = self.assets.values()
+
+        return Array(AssetData, [x for x in candidates if filter.matches(x)])
+
+    def get_assets_by_path(self, package_path: str, recursive: bool=False, include_only_on_disk_assets: bool=False) -> Array:
+        _record('AssetRegistry.get_assets_by_path', package_path, recursive)
+        return Array(AssetData, [x for x in self.assets.values() if ARFilter(package_paths=[package_path], recursive_paths=recursive).matches(x)])
+
+    def get_asset_by_object_path(self, object_path: str, include_only_on_disk_assets: bool=False) -> AssetData|None:
+        _record('AssetRegistry.get_asset_by_object_path', object_path)
+        return self.assets.get(object_path)
+
+
+class AssetRegistryHelpers:
+
+    _registry: AssetRegistry|None = None
+
+    @classmethod
+    def get_asset_registry(cls) -> AssetRegistry:
+        if cls._registry is None:
+            cls._registry = AssetRegistry()
+
+        return cls._registry
+
+
+def _broadcast(registry: AssetRegistry, name: str, *args) -> None:
+    '''Fire a registry delegate, if it has them (see `ASSET_EVENTS`)'''
+
+    delegate = getattr(registry, name, None)
+    if delegate is not None:
+        delegate.broadcast(*args)
+
+
+def addAsset(object_path: str, asset_class: str, tags: dict[str, str]|None=None, broadcast: bool=True) -> AssetData:
+    '''Stand-in only: add an asset to the registry, optionally broadcasting `on_asset_added` (see `ASSET_EVENTS`)'''
+
+    registry = AssetRegistryHelpers.get_asset_registry()
+    asset = registry.assets[object_path] = AssetData(object_path, asset_class, tags)
+    if broadcast:
+        _broadcast(registry, 'on_asset_added', asset)
+
+    return asset
+
+
+def removeAsset(object_path: str) -> None:
+    '''Stand-in only: remove an asset from the registry and broadcast `on_asset_removed` (see `ASSET_EVENTS`)'''
+
+    registry = AssetRegistryHelpers.get_asset_registry()
+    asset = registry.assets.pop(object_path, None)
+    if asset is not None:
+        _broadcast(registry, 'on_asset_removed', asset)
+
+
+def renameAsset(old_object_path: str, new_object_path: str) -> None:
+    '''Stand-in only: rename an asset and broadcast `on_asset_renamed` (see `ASSET_EVENTS`)'''
+
+    registry = AssetRegistryHelpers.get_asset_registry()
+    old = registry.assets.pop(old_object_path)
+    asset = registry.assets[new_object_path] = AssetData(new_object_path, old.asset_class, old.tags)
+    _broadcast(registry, 'on_asset_renamed', asset, old_object_path)
+
+
+# Level actors
+
+class Actor:
+
+    def __init__(self, name: str, tags: list[str]|None=None):
+        self.name = name
+        self.tags = list(tags or [])
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_path_name(self) -> str:
+        return f'/Game/Maps/Level.Level:PersistentLevel.{self.name}'
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.name}>'
+
+
+class StaticMeshActor(Actor):
+    pass
+
+
+class EditorActorSubsystem:
+
+    def __init__(self):
+        self.actors: list[Actor] = []
+
+    def get_all_level_actors(self) -> Array:
+        _record('EditorActorSubsystem.get_all_level_actors')
+        return Array(Actor, self.actors)
+
+
+_editorSubsystems: dict[type, object] = {}
+
+
+def get_editor_subsystem(subsystem: type):
+    _record('get_editor_subsystem', subsystem)
+    if subsystem not in _editorSubsystems:
+        _editorSubsystems[subsystem] = subsystem()
+
+    return _editorSubsystems[subsystem]
+
+
+def addActor(actor: Actor) -> Actor:
+    '''Stand-in only: add an actor to the level'''
+
+    get_editor_subsystem(EditorActorSubsystem).actors.append(actor) # type: ignore
+    return actor
+
+
+class EditorFilterLibrary:
+
+    @staticmethod
+    def by_class(target_array: Array, object_class: type, filter_type=None) -> Array:
+        _record('EditorFilterLibrary.by_class', object_class)
+        return Array(object_class, [x for x in target_array if isinstance(x, object_class)])
+
+    @staticmethod
+    def by_actor_tag(target_array: Array, tag: str, filter_type=None) -> Array:
+        _record('EditorFilterLibrary.by_actor_tag', tag)
+        return Array(Actor, [x for x in target_array if tag in x.tags])
\ No newline at end of file
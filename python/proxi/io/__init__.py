@@ -0,0 +1 @@
+'''File and storage IO'''
\ No newline at end of file
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+'''Batched, cached asset registry and level actor queries. One Unreal call per query, instead of one per asset/actor'''
+
+from __future__ import annotations
+
+import time
+import unreal
+import proxi.config as config
+import proxi.console as console
+from typing import Iterator
+
+
+class AssetQuery:
+    '''Asset registry filter, hashable so results can be cached per query'''
+
+    def __init__(self, classNames: list[str]|tuple[str, ...]=(), paths: list[str]|tuple[str, ...]=(), tags: dict[str, str]|None=None, recursive: bool=True) -> None:
+        '''Asset registry filter, hashable so results can be cached per query
+
+        Args:
+            classNames (list[str], optional): Asset classes, short (`StaticMesh`) or full (`/Script/Engine.StaticMesh`). Defaults to (), which means any class.
+            paths (list[str], optional): Package paths, eg. `/Game/Props`. Defaults to (), which means anywhere.
+            tags (dict[str, str], optional): Asset registry tag -> value, all must match. Defaults to None.
+            recursive (bool, optional): Include sub folders and sub classes. Defaults to True.
+        '''
+
+        self.classNames = tuple(sorted(classNames))
+        self.paths = tuple(sorted(x.rstrip('/') for x in paths))
+        self.tags = tuple(sorted((tags or {}).items()))
+        self.recursive = recursive
+        self._shortClassNames = {x.rsplit('.', 1)[-1] for x in self.classNames}
+
+    def key(self) -> tuple:
+        return (self.classNames, self.paths, self.tags, self.recursive)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AssetQuery) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __repr__(self) -> str:
+        return f'AssetQuery(classNames={self.classNames}, paths={self.paths}, tags={dict(self.tags)}, recursive={self.recursive})'
+
+    def mayContain(self, className: str, packagePath: str) -> bool:
+        '''Could an asset with this class and package path be part of the results? Used for cache invalidation, errs on the side of True'''
+
+        # With recursive classes, a sub class could match and those can't be resolved cheaply, so only paths rule it out
+        if className and self._shortClassNames and className not in self._shortClassNames and not self.recursive:
+            return False
+
+        if self.paths and packagePath:
+            if self.recursive:
+                return any(packagePath == x or packagePath.startswith(f'{x}/') for x in self.paths)
+
+            return packagePath in self.paths
+
+        return True
+
+    def toFilter(self) -> unreal.ARFilter:
+        '''Build the `unreal.ARFilter` for this query'''
+
+        kwargs = {
+            'package_paths': list(self.paths),
+            'recursive_paths': self.recursive,
+            'recursive_classes': self.recursive
+        }
+
+        if self.classNames:
+            if hasattr(unreal, 'TopLevelAssetPath'):
+                # UE 5.1+: class paths instead of names
+                kwargs['class_paths'] = [unreal.TopLevelAssetPath(*_splitClassPath(x)) for x in self.classNames] # type: ignore
+            else:
+                kwargs['class_names'] = [x.rsplit('.', 1)[-1] for x in self.classNames]
+
+        if self.tags:
+            kwargs['tags_and_values'] = dict(self.tags)
+
+        return unreal.ARFilter(**kwargs) # type: ignore
+
+
+def _splitClassPath(className: str) -> tuple[str, str]:
+    '''`/Script/Engine.StaticMesh` -> (`/Script/Engine`, `StaticMesh`). Short names are assumed to be engine classes'''
+
+    if '.' in className:
+        package, name = className.rsplit('.', 1)
+        return package, name
+
+    return '/Script/Engine', className
+
+
+def assetClassName(asset: unreal.AssetData) -> str:
+    '''Short class name of an asset registry entry, for any UE5 version'''
+
+    classPath = getattr(asset, 'asset_class_path', None)
+    if classPath is not None:
+        return str(classPath.asset_name)
+
+    return str(asset.asset_class) # type: ignore
+
+
+class AssetRegistryCache:
+    '''Cached asset registry and level actor queries'''
+
+    def __init__(self, registry: unreal.AssetRegistry|None=None) -> None:
+        '''Cached asset registry and level actor queries
+
+        Asset results are cached per `AssetQuery` until an asset matching it is added, removed or renamed (see
+        `bindEvents`, or call `onAssetAdded` & co from your own hooks). Without bound registry events, which the
+        editor's Python API doesn't expose, they also expire after `config.AssetQueries.assetCacheSeconds`. Level
+        actors are cached for `config.AssetQueries.actorCacheSeconds`, or until `invalidateActors`
+
+        Args:
+            registry (unreal.AssetRegistry, optional): Registry to query. Defaults to None, which means the editor's.
+        '''
+
+        self.registry = registry or unreal.AssetRegistryHelpers.get_asset_registry()
+        self._assets: dict[AssetQuery, tuple[float, list[unreal.AssetData]]] = {} # Query -> (time, results)
+        self._actors: list[unreal.Actor]|None = None
+        self._actorsTime = 0.0
+        self._actorQueries: dict[tuple, list[unreal.Actor]] = {}
+        self._boundEvents: list[tuple[object, object]] = []
+        self.eventsBound = False # All registry events bound, so cached asset results don't need to expire
+
+        # Stats
+        self.unrealCalls = 0
+        self.hits = 0
+        self.misses = 0
+
+    # Assets
+
+    def assets(self, classNames: list[str]|tuple[str, ...]=(), paths: list[str]|tuple[str, ...]=(), tags: dict[str, str]|None=None, recursive: bool=True) -> list[unreal.AssetData]:
+        '''Assets matching a filter, in one registry call (or none, if cached). See `AssetQuery` for arguments
+
+        Returns:
+            list[unreal.AssetData]: Matching assets. Shared with the cache, do not modify
+        '''
+
+        return self.query(AssetQuery(classNames, paths, tags, recursive))
+
+    def query(self, query: AssetQuery) -> list[unreal.AssetData]:
+        '''Assets matching an `AssetQuery`'''
+
+        if config.AssetQueries.cacheAssets:
+            cached = self._assets.get(query)
+            if cached is not None and (self.eventsBound or time.monotonic() - cached[0] <= config.AssetQueries.assetCacheSeconds):
+                self.hits += 1
+                return cached[1]
+
+        self.misses += 1
+        self.unrealCalls += 1
+        results = list(self.registry.get_assets(query.toFilter()))
+
+        if config.AssetQueries.cacheAssets:
+            self._assets[query] = (time.monotonic(), results)
+
+        return results
+
+    def iterPages(self, classNames: list[str]|tuple[str, ...]=(), paths: list[str]|tuple[str, ...]=(), tags: dict[str, str]|None=None, recursive: bool=True, pageSize: int|None=None) -> Iterator[list[unreal.AssetData]]:
+        '''Matching assets in pages, eg. to process them across several ticks or fill a view incrementally
+
+        Args:
+            pageSize (int, optional): Assets per page. Defaults to None, which means `config.AssetQueries.pageSize`.
+        '''
+
+        results = self.assets(classNames, paths, tags, recursive)
+        pageSize = pageSize or config.AssetQueries.pageSize
+        for start in range(0, len(results), pageSize):
+            yield results[start:start + pageSize]
+
+    def assetsByPath(self, objectPaths: list[str]) -> dict[str, unreal.AssetData]:
+        '''Look up many assets by object path (eg. `/Game/Props/SM_Chair.SM_Chair`) in one registry call
+
+        Returns:
+            dict[str, unreal.AssetData]: Object path -> asset, for the ones that exist
+        '''
+
+        if not objectPaths:
+            return {}
+
+        if hasattr(unreal, 'TopLevelAssetPath'):
+            arFilter = unreal.ARFilter(soft_object_paths=list(objectPaths)) # type: ignore
+        else:
+            arFilter = unreal.ARFilter(object_paths=list(objectPaths)) # type: ignore
+
+        self.unrealCalls += 1
+        found = {}
+        for asset in self.registry.get_assets(arFilter):
+            found[f'{asset.package_name}.{asset.asset_name}'] = asset
+
+        return found
+
+    def invalidate(self, className: str|None=None, packagePath: str|None=None) -> None:
+        '''Drop cached asset results. Only those that may contain an asset of `className` in `packagePath`, if given'''
+
+        if className is None and packagePath is None:
+            self._assets.clear()
+            return
+
+        for query in [x for x in self._assets if x.mayContain(className or '', packagePath or '')]:
+            del self._assets[query]
+
+    def onAssetAdded(self, asset: unreal.AssetData) -> None:
+        self.invalidate(assetClassName(asset), str(asset.package_path))
+
+    def onAssetRemoved(self, asset: unreal.AssetData) -> None:
+        self.invalidate(assetClassName(asset), str(asset.package_path))
+
+    def onAssetRenamed(self, asset: unreal.AssetData, oldObjectPath: str) -> None:
+        className = assetClassName(asset)
+        self.invalidate(className, str(asset.package_path))
+        self.invalidate(className, oldObjectPath.split('.')[0].rsplit('/', 1)[0])
+
+    def bindEvents(self) -> bool:
+        '''Invalidate on registry events, where the registry exposes them to Python
+
+        Returns:
+            bool: True if all events were bound. If not, cached asset results expire after `config.AssetQueries.assetCacheSeconds`, call `invalidate` (or `onAssetAdded` & co) from your own hooks for anything sooner
+        '''
+
+        self.unbindEvents()
+
+        bound = 0
+        for name, callback in [('on_asset_added', self.onAssetAdded), ('on_asset_removed', self.onAssetRemoved), ('on_asset_renamed', self.onAssetRenamed)]:
+            delegate = getattr(self.registry, name, None)
+            if delegate is None:
+                continue
+
+            delegate.add_callable(callback)
+            self._boundEvents.append((delegate, callback))
+            bound += 1
+
+        self.eventsBound = bound == 3
+        if not self.eventsBound:
+            console.log(f'Asset registry events not (fully) available, cached asset queries expire after {config.AssetQueries.assetCacheSeconds} s')
+
+        return self.eventsBound
+
+    def unbindEvents(self) -> None:
+        for delegate, callback in self._boundEvents:
+            delegate.remove_callable(callback) # type: ignore
+
+        self._boundEvents.clear()
+        self.eventsBound = False
+
+    # Level actors
+
+    def allActors(self) -> list[unreal.Actor]:
+        '''All level actors, in one call. Cached for `config.AssetQueries.actorCacheSeconds`'''
+
+        now = time.monotonic()
+        if self._actors is None or now - self._actorsTime > config.AssetQueries.actorCacheSeconds:
+            self.misses += 1
+            self.unrealCalls += 2
+            subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem) # type: ignore
+            self._actors = list(subsystem.get_all_level_actors())
+            self._actorsTime = now
+            self._actorQueries.clear()
+        else:
+            self.hits += 1
+
+        return self._actors
+
+    def actors(self, actorClass: type|None=None, tag: str|None=None) -> list[unreal.Actor]:
+        '''Level actors by class and/or tag. Filtering happens in `unreal.EditorFilterLibrary`, one call per criterion instead of one per actor
+
+        Args:
+            actorClass (type, optional): Eg. `unreal.StaticMeshActor`. Defaults to None, which means any class.
+            tag (str, optional): Actor tag. Defaults to None, which means any (or no) tag.
+        '''
+
+        actors = self.allActors()
+        key = (actorClass, tag)
+        cached = self._actorQueries.get(key)
+        if cached is not None:
+            return cached
+
+        results = unreal.Array.cast(unreal.Actor, actors) if actors else [] # type: ignore
+        if results and actorClass is not None:
+            self.unrealCalls += 1
+            results = unreal.EditorFilterLibrary.by_class(results, actorClass) # type: ignore
+
+        if results and tag is not None:
+            self.unrealCalls += 1
+            results = unreal.EditorFilterLibrary.by_actor_tag(results, tag) # type: ignore
+
+        results = list(results)
+        self._actorQueries[key] = results
+        return results
+
+    def invalidateActors(self) -> None:
+        '''Drop cached level actors, eg. after spawning/deleting actors or loading a level'''
+
+        self._actors = None
+        self._actorQueries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {'unrealCalls': self.unrealCalls, 'hits': self.hits, 'misses': self.misses, 'cachedQueries': len(self._assets)}
+
+
+# Keep the shared cache while allowing for module reload without resetting
+try:
+    CACHE # type: ignore
+except NameError:
+    CACHE: AssetRegistryCache|None = None
+
+
+def getCache() -> AssetRegistryCache:
+    '''Get the shared cache, creating it (and binding registry events) on first access'''
+
+    global CACHE
+
+    if CACHE is None:
+        CACHE = AssetRegistryCache()
+        CACHE.bindEvents()
+
+    return CACHE
+
+
+def assets(classNames: list[str]|tuple[str, ...]=(), paths: list[str]|tuple[str, ...]=(), tags: dict[str, str]|None=None, recursive: bool=True) -> list[unreal.AssetData]:
+    '''Assets matching a filter, from the shared cache. See `AssetQuery` for arguments'''
+
+    return getCache().assets(classNames, paths, tags, recursive)
+
+
+def iterPages(classNames: list[str]|tuple[str, ...]=(), paths: list[str]|tuple[str, ...]=(), tags: dict[str, str]|None=None, recursive: bool=True, pageSize: int|None=None) -> Iterator[list[unreal.AssetData]]:
+    '''Matching assets in pages, from the shared cache'''
+
+    return getCache().iterPages(classNames, paths, tags, recursive, pageSize)
+
+
+def actors(actorClass: type|None=None, tag: str|None=None) -> list[unreal.Actor]:
+    '''Level actors by class and/or tag, from the shared cache'''
+
+    return getCache().actors(actorClass, tag)
+
+
+def invalidate() -> None:
+    '''Drop all cached asset and actor results'''
+
+    cache = getCache()
+    cache.invalidate()
+    cache.invalidateActors()
\ No newline at end of file
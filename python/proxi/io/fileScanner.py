@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+'''Parallel, cached directory scanning: `os.scandir` on a thread pool, one tree level at a time, with incremental rescans'''
+
+from __future__ import annotations
+
+import os
+import time
+import pickle
+import hashlib
+import threading
+import proxi.config as config
+import proxi.console as console
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, NamedTuple
+
+
+SNAPSHOT_VERSION = 1
+
+
+class DirectoryState(NamedTuple):
+    '''One directory of a snapshot'''
+
+    mtime: int # Directory st_mtime_ns when listed. Adding, removing or renaming entries changes it
+    files: tuple[tuple[str, int, float], ...] # (name, size, mtime)
+    dirs: tuple[str, ...] # Sub directory names, excluding `config.FileScan.excludeDirs`
+
+
+class ScanEntry(NamedTuple):
+    path: str
+    size: int
+    mtime: float # As `os.path.getmtime`
+    fileType: str|None # `config.FileTypes` key (or family, with `aliases`), None if not a known type
+
+
+class ScanResult(NamedTuple):
+    root: str
+    entries: list[ScanEntry]
+    directories: int # Directories in the tree
+    listed: int # Directories listed with `os.scandir` or with files modified in place, the rest were unchanged since the previous scan
+    seconds: float
+
+
+def _snapshotFile(root: str) -> str:
+    '''Snapshot location for a root directory, in `config.Paths.scanCacheDir`'''
+
+    key = hashlib.sha1(os.path.normcase(root).encode('utf-8')).hexdigest()[:16]
+    return '{}/{}.pickle'.format(config.Paths.scanCacheDir, key)
+
+
+def _statFiles(path: str, files: tuple[tuple[str, int, float], ...]) -> tuple[tuple[str, int, float], ...]|None:
+    '''Current size/mtime of the files of an unchanged directory
+
+    Returns:
+        tuple|None: `files` itself if none changed, None if one is gone (the directory needs listing again)
+    '''
+
+    prefix = os.path.join(path, '')
+    stat = os.stat
+    updated: list[tuple[str, int, float]] = []
+    changed = False
+    for file in files:
+        try:
+            result = stat(prefix + file[0])
+        except OSError:
+            return None
+
+        if result.st_size != file[1] or result.st_mtime != file[2]:
+            file = (file[0], result.st_size, result.st_mtime)
+            changed = True
+
+        updated.append(file)
+
+    return tuple(updated) if changed else files
+
+
+def _listDirectory(path: str, previous: DirectoryState|None, racyCutoff: int, excludeDirs: frozenset[str], verifyFiles: bool) -> DirectoryState|None:
+    '''List a directory, or reuse its previous state if it is unchanged
+
+    Args:
+        verifyFiles (bool): Stat the files of an unchanged directory, to pick up files modified in place
+
+    Returns:
+        DirectoryState|None: State (the previous object itself if reused and no file changed), None if the directory is gone or unreadable
+    '''
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    # Changes within the same mtime tick as the previous listing would go unnoticed, so recently modified directories are listed again
+    if previous is not None and previous.mtime == mtime and mtime < racyCutoff:
+        if not verifyFiles:
+            return previous
+
+        verified = _statFiles(path, previous.files)
+        if verified is previous.files:
+            return previous
+        if verified is not None:
+            return previous._replace(files=verified)
+
+    files: list[tuple[str, int, float]] = []
+    dirs: list[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excludeDirs:
+                            dirs.append(entry.name)
+                    elif entry.is_file():
+                        stat = entry.stat() # Free on Windows, it comes with the listing
+                        files.append((entry.name, stat.st_size, stat.st_mtime))
+                except OSError:
+                    continue # Removed while listing, broken link, no permission
+    except OSError as e:
+        console.warning(f'Could not list {path}: {e}')
+        return None
+
+    return DirectoryState(mtime, tuple(files), tuple(dirs))
+
+
+class FileScanner:
+
+    def __init__(self, maxWorkers: int|None=None, persist: bool|None=None, verifyFiles: bool|None=None) -> None:
+        '''Scans directory trees with `os.scandir`, listing the directories of each tree level in parallel
+
+        Every scan leaves a snapshot (path, size, mtime of each file, and each directory's mtime). The next scan of the
+        same root only lists directories whose mtime changed, all others are taken from the snapshot. Files modified in
+        place don't change their directory's mtime, so the files of unchanged directories are stat'ed in the same worker
+        batches, which is still much cheaper than listing. Without `verifyFiles`, their size/mtime are only refreshed when
+        the directory is listed again: pass `force` for a full rescan, or `rescan` the directories you know have changed
+
+        Args:
+            maxWorkers (int, optional): Listing threads. Defaults to None, which means `config.FileScan.maxWorkers`.
+            persist (bool, optional): Keep snapshots on disk. Defaults to None, which means `config.FileScan.persist`.
+            verifyFiles (bool, optional): Stat the files of unchanged directories. Defaults to None, which means `config.FileScan.verifyFiles`.
+        '''
+
+        self.maxWorkers = maxWorkers or config.FileScan.maxWorkers
+        self.persist = config.FileScan.persist if persist is None else persist
+        self.verifyFiles = config.FileScan.verifyFiles if verifyFiles is None else verifyFiles
+        self._snapshots: dict[str, dict] = {} # Root -> {'version', 'time', 'directories': {path: DirectoryState}}
+        self._entryCache: dict[tuple[str, bool], dict[str, tuple[DirectoryState, list[ScanEntry]]]] = {} # (root, aliases) -> directory -> (state, entries)
+        self._pool: ThreadPoolExecutor|None = None
+        self._lock = threading.RLock()
+
+    def scan(self, root: str, types: Iterable[str]|None=None, aliases: bool=True, force: bool=False) -> ScanResult:
+        '''Files below `root`, optionally filtered by file type
+
+        Args:
+            root (str): Directory to scan, recursively
+            types (Iterable[str], optional): `config.FileTypes` keys or extensions to keep, eg. `[FileTypes.maya, 'fbx']`. Defaults to None, which means all files.
+            aliases (bool, optional): Match and report file type families (`.ma` is `maya`), see `config.FILE_TYPE_ALIASES`. Defaults to True.
+            force (bool, optional): List every directory, ignoring the snapshot. Defaults to False.
+
+        Returns:
+            ScanResult: Matching files and scan stats
+        '''
+
+        start = time.perf_counter()
+        root = os.path.abspath(root)
+        with self._lock:
+            directories, listed = self._update(root, force)
+            entries = self._entries(root, directories, types, aliases)
+
+        seconds = time.perf_counter() - start
+        console.debug(f'Scanned {root}: {len(directories)} directories ({listed} listed), {len(entries)} file(s) in {seconds * 1000:.1f} ms')
+        return ScanResult(root, entries, len(directories), listed, seconds)
+
+    def rescan(self, directories: Iterable[str]) -> None:
+        '''Make the next scan list these directories again, eg. after files in them were modified in place'''
+
+        with self._lock:
+            for directory in directories:
+                directory = os.path.abspath(directory)
+                for root, snapshot in self._snapshots.items():
+                    state = snapshot['directories'].get(directory)
+                    if state is not None:
+                        snapshot['directories'][directory] = state._replace(mtime=-1)
+
+    def invalidate(self, root: str|None=None) -> None:
+        '''Drop the snapshot of a root (memory and disk), or of all roots'''
+
+        with self._lock:
+            roots = [os.path.abspath(root)] if root else list(self._snapshots)
+            for path in roots:
+                self._snapshots.pop(path, None)
+                self._entryCache.pop((path, True), None)
+                self._entryCache.pop((path, False), None)
+                if self.persist:
+                    try:
+                        os.remove(_snapshotFile(path))
+                    except OSError:
+                        pass
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _update(self, root: str, force: bool) -> tuple[dict[str, DirectoryState], int]:
+        '''Bring the snapshot of `root` up to date, one tree level at a time
+
+        Returns:
+            tuple[dict[str, DirectoryState], int]: Directory path -> state, number of directories listed
+        '''
+
+        snapshot = None if force else self._loadSnapshot(root)
+        previous: dict[str, DirectoryState] = snapshot['directories'] if snapshot else {}
+        racyCutoff = int((snapshot['time'] - config.FileScan.racyWindow) * 1e9) if snapshot else 0
+        excludeDirs = frozenset(config.FileScan.excludeDirs)
+        verifyFiles = self.verifyFiles
+        scanTime = time.time()
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.maxWorkers, thread_name_prefix='FileScanner')
+
+        def listBatch(paths: list[str]) -> list[DirectoryState|None]:
+            return [_listDirectory(x, previous.get(x), racyCutoff, excludeDirs, verifyFiles) for x in paths]
+
+        directories: dict[str, DirectoryState] = {}
+        listed = 0
+        level = [root]
+        while level:
+            # A few batches per thread: one task per directory costs more than checking an unchanged directory
+            size = max(1, len(level) // (self.maxWorkers * 4))
+            batches = [level[i:i + size] for i in range(0, len(level), size)]
+            nextLevel: list[str] = []
+            for batch, states in zip(batches, self._pool.map(listBatch, batches)):
+                for path, state in zip(batch, states):
+                    if state is None:
+                        continue
+
+                    if state is not previous.get(path):
+                        listed += 1
+
+                    directories[path] = state
+                    prefix = os.path.join(path, '')
+                    nextLevel.extend(prefix + x for x in state.dirs)
+
+            level = nextLevel
+
+        if listed or len(directories) != len(previous):
+            snapshot = {'version': SNAPSHOT_VERSION, 'time': scanTime, 'directories': directories}
+            self._snapshots[root] = snapshot
+            self._saveSnapshot(root, snapshot)
+
+        return directories, listed
+
+    def _entries(self, root: str, directories: dict[str, DirectoryState], types: Iterable[str]|None, aliases: bool) -> list[ScanEntry]:
+        '''Entries of the files in `directories`. Those of directories unchanged since the previous scan are reused'''
+
+        classifier = config.FILE_TYPE_CLASSIFIER
+        wanted: set[str|None]|None = None
+        if types is not None:
+            wanted = {(classifier.family(x) if aliases else classifier.key(x)) for x in types} - {None}
+
+        previous = self._entryCache.get((root, aliases), {})
+        cache: dict[str, tuple[DirectoryState, list[ScanEntry]]] = {}
+        new = tuple.__new__
+        entries: list[ScanEntry] = []
+        for path, state in directories.items():
+            if not state.files:
+                continue
+
+            cached = previous.get(path)
+            if cached is not None and cached[0] is state:
+                directoryEntries = cached[1]
+            else:
+                prefix = os.path.join(path, '')
+                fileTypes = classifier.classify([x[0] for x in state.files], aliases=aliases)
+                directoryEntries = [new(ScanEntry, (prefix + name, size, mtime, fileType)) for (name, size, mtime), fileType in zip(state.files, fileTypes)]
+
+            cache[path] = (state, directoryEntries)
+            if wanted is None:
+                entries.extend(directoryEntries)
+            else:
+                entries.extend([x for x in directoryEntries if x[3] in wanted])
+
+        self._entryCache[(root, aliases)] = cache
+        return entries
+
+    def _loadSnapshot(self, root: str) -> dict|None:
+        snapshot = self._snapshots.get(root)
+        if snapshot is not None or not self.persist:
+            return snapshot
+
+        try:
+            with open(_snapshotFile(root), 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            return None
+
+        self._snapshots[root] = snapshot
+        return snapshot
+
+    def _saveSnapshot(self, root: str, snapshot: dict) -> None:
+        if not self.persist:
+            return
+
+        path = _snapshotFile(root)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f'{path}.tmp', 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f'{path}.tmp', path)
+        except OSError as e:
+            console.warning(f'Could not save scan snapshot {path}: {e}')
+
+
+# Keep snapshots and the thread pool while allowing for module reload without resetting
+try:
+    SCANNER # type: ignore
+except NameError:
+    SCANNER: FileScanner|None = None
+
+
+def getScanner() -> FileScanner:
+    '''Get the shared scanner, creating it on first access'''
+
+    global SCANNER
+
+    if SCANNER is None:
+        SCANNER = FileScanner()
+
+    return SCANNER
+
+
+def scan(root: str, types: Iterable[str]|None=None, aliases: bool=True, force: bool=False) -> ScanResult:
+    '''Files below `root`, optionally filtered by file type, with the shared scanner. See `FileScanner.scan`'''
+
+    return getScanner().scan(root, types=types, aliases=aliases, force=force)
\ No newline at end of file
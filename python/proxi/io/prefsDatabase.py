@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+'''SQLite backed user prefs, one namespace per tool'''
+
+from __future__ import annotations
+
+import os
+import json
+import sqlite3
+import threading
+import proxi.console as console
+
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS prefs (
+        namespace TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        PRIMARY KEY (namespace, key)
+    ) WITHOUT ROWID
+'''
+
+
+class PrefsDatabase:
+    '''Single-file prefs store for all tools. Reads are served from an in-memory cache filled by one batched query'''
+
+    def __init__(self, path: str) -> None:
+        '''Single-file prefs store for all tools. Reads are served from an in-memory cache filled by one batched query
+
+        Args:
+            path (str): Full path to database file. Parent folder is created if required. Use `:memory:` for a throwaway database
+        '''
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.cache: dict[str, dict] = {}
+        self._loadedAll = False
+
+        # Single handle, shared between threads (access is serialized through `self.lock`)
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(SCHEMA)
+
+    def close(self) -> None:
+        '''Close database handle'''
+
+        with self.lock:
+            self.connection.close()
+
+    def loadAll(self) -> dict[str, dict]:
+        '''Read every namespace in one query and fill the cache
+
+        Returns:
+            dict[str, dict]: All prefs, keyed on namespace
+        '''
+
+        with self.lock:
+            cache: dict[str, dict] = {}
+            for namespace, key, value in self.connection.execute('SELECT namespace, key, value FROM prefs'):
+                cache.setdefault(namespace, {})[key] = json.loads(value)
+
+            self.cache = cache
+            self._loadedAll = True
+
+        console.debug(f'Loaded prefs for {len(self.cache)} namespace(s) from {self.path}')
+        return self.cache
+
+    def namespaces(self) -> list[str]:
+        '''Get all stored namespaces'''
+
+        if not self._loadedAll:
+            self.loadAll()
+
+        return list(self.cache.keys())
+
+    def load(self, namespace: str) -> dict|None:
+        '''Load prefs for a given namespace
+
+        Args:
+            namespace (str): Namespace (tool name)
+
+        Returns:
+            dict|None: Copy of stored prefs, None if namespace has no prefs
+        '''
+
+        if not self._loadedAll:
+            self.loadAll()
+
+        prefs = self.cache.get(namespace)
+        return dict(prefs) if prefs is not None else None
+
+    def save(self, namespace: str, prefs: dict) -> None:
+        '''Replace all prefs for a given namespace in a single transaction
+
+        Args:
+            namespace (str): Namespace (tool name)
+            prefs (dict): Prefs to save. Values must be JSON serializable
+        '''
+
+        self.saveMany({namespace: prefs})
+
+    def saveMany(self, prefsByNamespace: dict[str, dict]) -> None:
+        '''Replace prefs for several namespaces in a single transaction
+
+        Args:
+            prefsByNamespace (dict[str, dict]): Prefs keyed on namespace. Values must be JSON serializable
+        '''
+
+        # Serialize before touching the database, so a bad value doesn't leave a half-written transaction
+        rows = [
+            (namespace, key, json.dumps(value))
+            for namespace, prefs in prefsByNamespace.items()
+            for key, value in prefs.items()
+        ]
+
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                self.connection.executemany('DELETE FROM prefs WHERE namespace = ?', [(x,) for x in prefsByNamespace])
+                self.connection.executemany('INSERT INTO prefs (namespace, key, value) VALUES (?, ?, ?)', rows)
+                self.connection.execute('COMMIT')
+            except Exception:
+                self.connection.execute('ROLLBACK')
+                raise
+
+            for namespace, prefs in prefsByNamespace.items():
+                self.cache[namespace] = dict(prefs)
+
+    def delete(self, namespace: str) -> None:
+        '''Delete all prefs for a given namespace'''
+
+        with self.lock:
+            self.connection.execute('DELETE FROM prefs WHERE namespace = ?', (namespace,))
+            self.cache.pop(namespace, None)
+
+    def migrateJsonFiles(self, directory: str, prefix: str) -> int:
+        '''Import `<prefix><namespace>.json` files into the database. Namespaces already in the database are left untouched
+
+        Args:
+            directory (str): Folder containing the .json prefs files
+            prefix (str): Filename prefix, stripped to get the namespace. Eg. `Proxi_`
+
+        Returns:
+            int: Number of imported files
+        '''
+
+        if not os.path.isdir(directory):
+            return 0
+
+        existing = set(self.namespaces())
+        imported: dict[str, dict] = {}
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                bare, ext = os.path.splitext(entry.name)
+                if ext.lower() != '.json' or not bare.startswith(prefix) or not entry.is_file():
+                    continue
+
+                namespace = bare[len(prefix):]
+                if namespace in existing:
+                    continue
+
+                try:
+                    with open(entry.path, 'r') as f:
+                        prefs = json.load(f)
+                except Exception as e:
+                    console.warning(f'Skipping prefs file `{entry.path}` during migration: {e}')
+                    continue
+
+                if isinstance(prefs, dict):
+                    imported[namespace] = prefs
+
+        if imported:
+            self.saveMany(imported)
+            console.log(f'Migrated {len(imported)} prefs file(s) into {self.path}')
+
+        return len(imported)
\ No newline at end of file
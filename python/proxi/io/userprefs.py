@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+'''User prefs storage. Either one .json file per tool, or a shared SQLite database (see `config.UserPrefs`)'''
+
+from __future__ import annotations
+
+import os
+import json
+import proxi.config as config
+import proxi.console as console
+from proxi.io.prefsDatabase import PrefsDatabase
+
+
+# Keep database handle while allowing for module reload without resetting
+try:
+    _DATABASE # type: ignore
+except NameError:
+    _DATABASE: PrefsDatabase|None = None
+
+
+def getNamespace(prefsPath: str) -> str:
+    '''Get the database namespace (tool name) for a given prefs path. Eg. `.../Proxi_debugSystemTime.json` -> `debugSystemTime`
+
+    Args:
+        prefsPath (str): Full path to prefs file, as returned by `config.getUiPrefsPath`
+
+    Returns:
+        str: Namespace
+    '''
+
+    bare = os.path.splitext(os.path.basename(prefsPath))[0]
+    if bare.startswith(config.UserPrefs.filePrefix):
+        bare = bare[len(config.UserPrefs.filePrefix):]
+
+    return bare
+
+
+def getDatabase() -> PrefsDatabase:
+    '''Get the shared prefs database, opening (and migrating) it on first access'''
+
+    global _DATABASE
+
+    if _DATABASE is None:
+        _DATABASE = PrefsDatabase(config.Paths.userPrefsDatabase)
+        if config.UserPrefs.migrateJsonFiles:
+            _DATABASE.migrateJsonFiles(config.Paths.userPrefsDir, config.UserPrefs.filePrefix)
+
+    return _DATABASE
+
+
+def preload() -> None:
+    '''Read all tool prefs in one batch. Call once at startup; no-op unless `config.UserPrefs.useDatabase` is set'''
+
+    if not config.UserPrefs.useDatabase:
+        return
+
+    try:
+        getDatabase().loadAll()
+    except Exception as e:
+        console.error(f'Error preloading user prefs database: {e}')
+
+
+def load(prefsPath: str) -> dict|None:
+    '''Load userprefs for a given prefs path
+
+    Args:
+        prefsPath (str): Full path to prefs file, as returned by `config.getUiPrefsPath`
+
+    Returns:
+        dict|None: Loaded prefs, None if missing or on error
+    '''
+
+    if config.UserPrefs.useDatabase:
+        try:
+            return getDatabase().load(getNamespace(prefsPath))
+        except Exception as e:
+            console.error(f'Error loading prefs `{getNamespace(prefsPath)}` from database: {e}')
+            return None
+
+    if not os.path.isfile(prefsPath):
+        return None
+
+    try:
+        with open(prefsPath, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        console.error(f'Error loading prefs file `{prefsPath}`: {e}')
+
+    return None
+
+
+def save(prefs: dict, prefsPath: str) -> bool:
+    '''Save userprefs for a given prefs path
+
+    Args:
+        prefs (dict): Prefs to save. Must be JSON serializable
+        prefsPath (str): Full path to prefs file, as returned by `config.getUiPrefsPath`
+
+    Returns:
+        bool: True on success, False on error
+    '''
+
+    if config.UserPrefs.useDatabase:
+        try:
+            getDatabase().save(getNamespace(prefsPath), prefs)
+            return True
+        except Exception as e:
+            console.error(f'Error saving prefs `{getNamespace(prefsPath)}` to database: {e}')
+            return False
+
+    try:
+        os.makedirs(os.path.dirname(prefsPath), exist_ok=True)
+        with open(prefsPath, 'w') as f:
+            json.dump(prefs, f, indent=4)
+        return True
+    except Exception as e:
+        console.error(f'Error saving prefs file `{prefsPath}`: {e}')
+
+    return False
\ No newline at end of file
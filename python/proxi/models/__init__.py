@@ -2,8 +2,6 @@
 
 import proxi.dev as dev
 
-dev.reloadModules([
-    'proxi.models.timecodeComponents',
-])
+dev.reloadChanged()
 
 from .timecodeComponents import TimecodeComponents, FrameDelimeter
\ No newline at end of file
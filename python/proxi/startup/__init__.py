@@ -1,9 +1,24 @@
 # -*- coding: utf-8 -*-
 '''Unreal Bootstrapper: Editor startup/auto-init methods'''
 
+import proxi.dev as dev
+import proxi.config as config
+import proxi.io.userprefs as userprefs
 import proxi.ui.menu as menu
 
 
+# Batch-read user prefs (database backend only)
+userprefs.preload()
+
 # Create menu
 menu.createMenu()
 
+# Prebuild configured windows in idle time. Importing `proxi.ui` spins up Qt, so only do so when asked to
+if config.Windows.prebuild:
+    import proxi.ui.windowManager as windowManager
+    windowManager.schedulePrebuild()
+
+# Reload changed modules and .ui files as they are saved. Dev mode only, this also spins up Qt
+if dev.DEV_MODE and config.LiveReload.enabled:
+    import proxi.ui.liveReload as liveReload
+    liveReload.start()
\ No newline at end of file
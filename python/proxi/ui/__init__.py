@@ -7,10 +7,12 @@ import os
 import sys
 import importlib.util as importUtil
 import proxi.dev as dev
+import proxi.config as config
 import proxi.console as console
 # import proxi.ui.resources.proxiQtResources as proxiQtResources
 import qt_material
-# from . import proxiStyle_css as css
+from . import proxiStyle_css as css
+from . import styleCache
 from PySide6 import QtGui, QtWidgets
 from typing import Callable, cast, TYPE_CHECKING
 # from importlib.machinery import SourceFileLoader
@@ -25,24 +27,54 @@ else:
     QtWindowBase = type
 
 
-def rebuildUiFiles():
-    '''Rebuild all .ui files'''
+def rebuildUiFiles(files: list[str]|None=None):
+    '''Rebuild .ui files
 
-    console.warning('Rebuilding all .ui files', timestamp=True)
+    Args:
+        files (list[str], optional): .ui files to rebuild. Defaults to None, which means all of them.
+    '''
+
+    console.warning(f'Rebuilding {len(files) if files is not None else "all"} .ui file(s)', timestamp=True)
     buildFile = CURRENT_SCRIPT_LOCATION.replace('\\', '/').split('/proxi/ui/')[0] + '/.build/ui.py'
     try:
         spec = importUtil.spec_from_file_location('buildUi', buildFile)
         mod = importUtil.module_from_spec(spec) # type: ignore
         spec.loader.exec_module(mod)
-        mod.main()
+        mod.main(files)
         console.log('Rebuilds complete', timestamp=True)
     except Exception as e:
         console.error(f'Failed to run build script: {e}', timestamp=True)
 
 
-# Auto-rebuild UI in debug mode
+def staleUiFiles() -> list[str]:
+    '''.ui files newer than their compiled `_ui.py` module (or not compiled at all)'''
+
+    stale: list[str] = []
+    for root, dirs, files in os.walk(os.path.dirname(CURRENT_SCRIPT_LOCATION)):
+        for file in files:
+            if not file.endswith('.ui'):
+                continue
+
+            uiFile = os.path.join(root, file)
+            compiledFile = f'{os.path.splitext(uiFile)[0]}_ui.py'
+            if not os.path.isfile(compiledFile) or os.path.getmtime(uiFile) > os.path.getmtime(compiledFile):
+                stale.append(uiFile)
+
+    return stale
+
+
+def rebuildChangedUiFiles():
+    '''Rebuild .ui files newer than their compiled `_ui.py` module'''
+
+    stale = staleUiFiles()
+    if stale:
+        rebuildUiFiles(stale)
+
+
+# Auto-rebuild changed UI in debug mode, and when reloading changed modules (see `dev.reloadChanged`)
 if dev.DEV_MODE:
-    rebuildUiFiles()
+    rebuildChangedUiFiles()
+    dev.setReloadHook('proxi.ui', rebuildChangedUiFiles)
 
 console.debug('Rebuild stage complete', timestamp=True)
 
@@ -71,10 +103,9 @@ UNREAL_APP.setWindowIcon(logo)
 # defaultFont.setStyleStrategy(QtGui.QFont.PreferAntialias)
 # UNREAL_APP.setFont(defaultFont)
 
-# Apply material theme and any global custom style overrides we have
-console.debug('Applying base theme', timestamp=True)
-# qt_material.apply_stylesheet(UNREAL_APP, theme='dark_bluegrey.xml')
-console.debug('Applying custom theme', timestamp=True)
-# UNREAL_APP.setStyleSheet(UNREAL_APP.styleSheet() + css.STYLESHEET.format(**os.environ))
+# Apply material theme and any global custom style overrides we have (rendered once, then cached on disk)
+if config.Style.applyTheme:
+    console.debug('Applying base and custom theme', timestamp=True)
+    styleCache.applyStylesheet(UNREAL_APP, overrides=[css.STYLESHEET])
 
 console.debug('Module init complete', timestamp=True)
\ No newline at end of file
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+'''Busy-state manager: reference counted in-flight tasks, with coalesced spinner/status bar updates'''
+
+from __future__ import annotations
+
+import time
+import itertools
+import threading
+import proxi.console as console
+from PySide6 import QtCore
+from typing import Callable
+
+
+MANUAL = 0 # Token for `QtWindowBase.setBusy(True)`, held until `setBusy(False)`
+
+
+class BusyState(QtCore.QObject):
+
+    busyChanged = QtCore.Signal(bool)
+    _changed = QtCore.Signal()
+
+    def __init__(self, onUpdate: Callable[[bool, str|None], None], parent: QtCore.QObject|None=None) -> None:
+        '''Busy-state manager. Tasks `acquire` a token and `release` it when done, the owner is busy while any token is held
+
+        Safe to call from any thread. UI updates are coalesced and applied once on the next event loop turn of the
+        owner's thread (never via `processEvents`), so many concurrent tasks only restart the spinner once
+
+        Args:
+            onUpdate (Callable[[bool, str|None], None]): Applies the state to the UI. Receives busy, and the most recent busy text (if any)
+            parent (QObject, optional): Parent object, usually the owning window. Defaults to None.
+        '''
+
+        super().__init__(parent)
+
+        self.onUpdate = onUpdate
+        self.busy = False # As last applied to the UI
+        self._lock = threading.Lock()
+        self._tokens: dict[int, str|None] = {} # Token -> busy text, in acquisition order
+        self._counter = itertools.count(1)
+        self._updatePending = False
+        self._scheduledAt = 0.0
+        self._appliedText: str|None = None
+        self._busySince = 0.0
+
+        # Instrumentation
+        self.busyPeriods = 0
+        self.totalBusyTime = 0.0
+        self.maxBusyTime = 0.0
+        self.updates = 0
+        self.totalUpdateLatency = 0.0
+        self.maxUpdateLatency = 0.0
+
+        self._changed.connect(self._apply, QtCore.Qt.QueuedConnection) # type: ignore
+
+    def acquire(self, text: str|None=None) -> int:
+        '''Mark a task as in flight
+
+        Args:
+            text (str, optional): Busy text to display while this is the most recent task with text. Defaults to None.
+
+        Returns:
+            int: Token for `release`
+        '''
+
+        with self._lock:
+            token = next(self._counter)
+            self._tokens[token] = text
+
+        self._schedule()
+        return token
+
+    def release(self, token: int) -> None:
+        '''Mark a task as done. Unknown (or already released) tokens are ignored'''
+
+        with self._lock:
+            if self._tokens.pop(token, False) is False:
+                return
+
+        self._schedule()
+
+    def setManual(self, busy: bool, text: str|None=None) -> None:
+        '''Hold (or update the text of) the `MANUAL` token, making it the most recent one, or drop all tokens'''
+
+        if busy:
+            with self._lock:
+                previous = self._tokens.pop(MANUAL, None) # Re-inserted at the end, the dict order is the acquisition order
+                self._tokens[MANUAL] = text if text else previous
+            self._schedule()
+        else:
+            self.reset()
+
+    def reset(self) -> None:
+        '''Drop all tokens, e.g. after threads were killed and will never release theirs'''
+
+        with self._lock:
+            self._tokens.clear()
+
+        self._schedule()
+
+    def count(self) -> int:
+        '''Number of tasks in flight (including `MANUAL`)'''
+
+        with self._lock:
+            return len(self._tokens)
+
+    def text(self) -> str|None:
+        '''Most recent busy text'''
+
+        with self._lock:
+            return next((x for x in reversed(self._tokens.values()) if x), None)
+
+    def flush(self) -> None:
+        '''Apply pending changes right away. GUI thread only'''
+
+        if self._updatePending:
+            self._apply()
+
+    def _schedule(self) -> None:
+        with self._lock:
+            if self._updatePending:
+                return
+
+            self._updatePending = True
+            self._scheduledAt = time.perf_counter()
+
+        self._changed.emit() # type: ignore
+
+    def _apply(self) -> None:
+        with self._lock:
+            if not self._updatePending:
+                return # Already flushed
+
+            self._updatePending = False
+            busy = bool(self._tokens)
+            text = next((x for x in reversed(self._tokens.values()) if x), None)
+            latency = time.perf_counter() - self._scheduledAt
+
+        # How long the event loop took to get to this update
+        self.updates += 1
+        self.totalUpdateLatency += latency
+        self.maxUpdateLatency = max(self.maxUpdateLatency, latency)
+
+        if busy == self.busy and text == self._appliedText:
+            return
+
+        now = time.perf_counter()
+        if busy and not self.busy:
+            self._busySince = now
+        elif self.busy and not busy:
+            duration = now - self._busySince
+            self.busyPeriods += 1
+            self.totalBusyTime += duration
+            self.maxBusyTime = max(self.maxBusyTime, duration)
+
+        busyChanged = busy != self.busy
+        self.busy = busy
+        self._appliedText = text
+
+        try:
+            self.onUpdate(busy, text)
+        except RuntimeError as e:
+            console.warning(f'Busy state update failed, owner deleted? {e}')
+
+        if busyChanged:
+            self.busyChanged.emit(busy) # type: ignore
+
+    def report(self) -> dict[str, float]:
+        '''Summarize busy time and UI update latency
+
+        Returns:
+            dict[str, float]: {busyPeriods, totalBusy, maxBusy, updates, meanLatency, maxLatency} (times in milliseconds)
+        '''
+
+        return {
+            'busyPeriods': self.busyPeriods,
+            'totalBusy': self.totalBusyTime * 1000,
+            'maxBusy': self.maxBusyTime * 1000,
+            'updates': self.updates,
+            'meanLatency': (self.totalUpdateLatency / self.updates * 1000) if self.updates else 0,
+            'maxLatency': self.maxUpdateLatency * 1000
+        }
+
+    def logReport(self, name: str|None=None) -> None:
+        '''Output busy time and UI update latency to the console'''
+
+        stats = self.report()
+        console.log(
+            f'{name or self.parent()}: busy {stats["busyPeriods"]} time(s), total {stats["totalBusy"]:.1f} ms, max {stats["maxBusy"]:.1f} ms. '
+            f'{stats["updates"]} UI update(s), mean latency {stats["meanLatency"]:.3f} ms, max {stats["maxLatency"]:.3f} ms'
+        )
\ No newline at end of file
@@ -10,19 +10,14 @@ import proxi.dev as dev
 import proxi.config as config
 import proxi.console as console
 import proxi.ui as ui
+import proxi.ui.windowManager as windowManager
+import proxi.ui.tickDispatcher as tickDispatcher
+import proxi.ui.styleCache as styleCache
 
 from . import debugSystemTime_ui as window
 from . import debugSystemTime_css as css
 
-dev.reloadModules([
-    # 'proxi.models', # must come first
-    ui, # must come before `window` and `css`
-    config,
-    window, 
-    css,
-    'proxi.ui.wrappers.windowBase', 
-    'proxi.ui.wrappers.mainWindow'
-])
+dev.reloadChanged()
 
 from proxi.ui.wrappers.mainWindow import QtMainWindowWrapper
 from PySide6 import (
@@ -33,6 +28,9 @@ from PySide6 import (
 
 
 class DebugSystemTime(QtMainWindowWrapper):
+
+    tickInterval = tickDispatcher.EVERY_FRAME # We're profiling ticks, need every single one
+
     def __init__(self, parent=None):
         '''Debug system time: Output (potential) differences between tick-based time calculations vs. system time'''
 
@@ -71,12 +69,12 @@ class DebugSystemTime(QtMainWindowWrapper):
         self.resetTimers()
 
     def _setStyleSheet(self):
-        '''Set stylesheet overrides'''
+        '''Set stylesheet overrides. The app-wide theme is applied (and cached) once by `proxi.ui`, only our own overrides go here'''
 
         dev.reloadModules([css])
 
-        # self.setStyleSheet(ui.UNREAL_APP.styleSheet() + css.STYLESHEET.format(**os.environ))
-        QtWidgets.QApplication.instance().processEvents()
+        if config.Style.applyTheme:
+            self.setStyleSheet(styleCache.formatOverrides([css.STYLESHEET]))
 
     def eventTick(self, delta_seconds, forceUpdate=False):
         '''Event tick from Unreal has been received'''
@@ -117,41 +115,15 @@ except NameError:
 
 
 def showWindow(forceNew=False):
-    '''Public access method: Show dialog, instanciate new instance if required'''
+    '''Public access method: Show window, reusing an open or warm (hidden) instance if possible'''
 
     # MUST keep global track of this instance because of the Unreal garbage collection. Or so it seems.
     global WINDOW_INSTANCE
 
-    # We might not be in sync, window could have been deleted even if `WINDOW_INSTANCE` reference claims otherwise.
-    # Activate window the brute-force way
-
-    if forceNew or dev.DEBUG_MODE or dev.DEV_MODE:
-        # clearCache()
-
-        # Allow multiple (unbound) window instances in `DEV_MODE`
-        if dev.DEV_MODE:
-            pass
-            # dev.reloadModules([ui])
-
-        # Force window delete for `forceNew` or `DEBUG_MODE`
-        elif WINDOW_INSTANCE:
-            try:
-                console.debug('Deleting existing window instance', timestamp=True)
-                del ui.OPEN_WINDOWS[WINDOW_INSTANCE]
-                WINDOW_INSTANCE._delete()
-            except Exception as e:
-                console.error(f'Error destroying old window instance: {e}')
-
-        WINDOW_INSTANCE = None # type: ignore
-
-    try:
-        WINDOW_INSTANCE.showAndActivate()
-        console.log('Activating existing window')
-    except Exception:
-        WINDOW_INSTANCE = DebugSystemTime()
-        WINDOW_INSTANCE.showAndActivate()
-        console.log('Created new window')
-
-    if not WINDOW_INSTANCE in ui.OPEN_WINDOWS:
-        ui.OPEN_WINDOWS[WINDOW_INSTANCE] = showWindow
-        console.log('Adding window instance to global tracker')
\ No newline at end of file
+    # Allow multiple (unbound) window instances in `DEV_MODE`, since the module may have been reloaded. Always rebuild in `DEBUG_MODE`
+    WINDOW_INSTANCE = windowManager.showWindow(
+        DebugSystemTime,
+        showCallback = showWindow,
+        forceNew = forceNew or dev.DEBUG_MODE,
+        allowMultiple = dev.DEV_MODE
+    )
\ No newline at end of file
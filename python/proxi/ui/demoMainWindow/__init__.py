@@ -6,6 +6,7 @@ import typing
 import proxi.dev as dev
 import proxi.config as config
 import proxi.ui as ui
+import proxi.ui.windowManager as windowManager
 import proxi.console as console
 import proxi.ui.wrappers.mainWindow as mainWindow
 from . import demoMainWindow_ui as window
@@ -16,6 +17,9 @@ from PySide6 import QtGui
 
 
 class DemoMainWindow(mainWindow.QtMainWindowWrapper, QtStyleTools):
+
+    lazyPages = True
+
     def __init__(self, parent=None):
         # scriptPath = os.path.realpath(__file__)
 
@@ -50,40 +54,15 @@ except NameError:
 
 
 def showWindow(forceNew=False):
-    '''Public access method: Show dialog, instanciate new instance if required'''
+    '''Public access method: Show window, reusing an open or warm (hidden) instance if possible'''
 
     # MUST keep global track of this instance because of the Unreal garbage collection. Or so it seems.
     global WINDOW_INSTANCE
 
-    # We might not be in sync, window could have been deleted even if `WINDOW_INSTANCE` reference claims otherwise.
-    # Activate window the brute-force way
-
-    if forceNew or dev.DEBUG_MODE or dev.DEV_MODE:
-
-        # Allow multiple (unbound) window instances in `DEV_MODE`
-        if dev.DEV_MODE:
-            pass
-            # dev.reloadModules([ui])
-
-        # Force window delete for `forceNew` or `DEBUG_MODE`
-        elif WINDOW_INSTANCE:
-            try:
-                console.debug('Deleting existing window instance', timestamp=True)
-                del ui.OPEN_WINDOWS[WINDOW_INSTANCE]
-                WINDOW_INSTANCE._delete()
-            except Exception as e:
-                console.error(f'Error destroying old window instance: {e}')
-
-        WINDOW_INSTANCE = None # type: ignore
-
-    try:
-        WINDOW_INSTANCE.showAndActivate()
-        console.log('Activating existing window')
-    except Exception:
-        WINDOW_INSTANCE = DemoMainWindow()
-        WINDOW_INSTANCE.showAndActivate()
-        console.log('Created new window')
-
-    if not WINDOW_INSTANCE in ui.OPEN_WINDOWS:
-        ui.OPEN_WINDOWS[WINDOW_INSTANCE] = showWindow
-        console.log('Adding window instance to global tracker')
\ No newline at end of file
+    # Allow multiple (unbound) window instances in `DEV_MODE`, since the module may have been reloaded. Always rebuild in `DEBUG_MODE`
+    WINDOW_INSTANCE = windowManager.showWindow(
+        DemoMainWindow,
+        showCallback = showWindow,
+        forceNew = forceNew or dev.DEBUG_MODE,
+        allowMultiple = dev.DEV_MODE
+    )
\ No newline at end of file
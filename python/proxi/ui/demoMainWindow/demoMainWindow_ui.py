@@ -30,7 +30,26 @@ from PySide6.QtWidgets import (QApplication, QCalendarWidget, QCheckBox, QComboB
     QTreeWidgetItem, QVBoxLayout, QWidget)
 
 class Ui_MainWindow(object):
-    def setupUi(self, MainWindow):
+    LAZY_PAGES = { # Container -> pages, built by `setupPage`
+        'tabWidget_2': ('tab', 'tab_2'),
+        'tabWidget_4': ('tab_11', 'tab_13'),
+        'tabWidget_3': ('tab_7', 'tab_17', 'tab_8'),
+        'stackedWidget': ('page_5',),
+        'tabWidget': ('tab_15', 'tab_16', 'tab_5', 'tab_6'),
+        'tabWidget_5': ('tab_20',),
+        'tabWidget_6': ('tab_22',),
+    }
+    LAZY_PAGE_PARENTS = { # Nested page -> page containing it, built first
+        'page_5': 'tab_7',
+        'tab_15': 'tab_7',
+        'tab_16': 'tab_7',
+        'tab_5': 'tab_7',
+        'tab_6': 'tab_7',
+        'tab_20': 'tab_6',
+        'tab_22': 'tab_20',
+    }
+
+    def setupUi(self, MainWindow, lazy=False):
         if not MainWindow.objectName():
             MainWindow.setObjectName(u"MainWindow")
         MainWindow.resize(1380, 928)
@@ -85,6 +104,272 @@ class Ui_MainWindow(object):
         self.tabWidget_2.setTabsClosable(True)
         self.tab = QWidget()
         self.tab.setObjectName(u"tab")
+
+        self.tabWidget_2.addTab(self.tab, "")
+        self.tab_2 = QWidget()
+        self.tab_2.setObjectName(u"tab_2")
+
+        self.tabWidget_2.addTab(self.tab_2, "")
+
+        self.gridLayout_17.addWidget(self.tabWidget_2, 0, 1, 1, 1)
+
+        self.tabWidget_4 = QTabWidget(self.centralwidget)
+        self.tabWidget_4.setObjectName(u"tabWidget_4")
+        self.tabWidget_4.setTabPosition(QTabWidget.West)
+        self.tab_11 = QWidget()
+        self.tab_11.setObjectName(u"tab_11")
+
+        self.tabWidget_4.addTab(self.tab_11, "")
+        self.tab_13 = QWidget()
+        self.tab_13.setObjectName(u"tab_13")
+
+        self.tabWidget_4.addTab(self.tab_13, "")
+        self.tab_12 = QWidget()
+        self.tab_12.setObjectName(u"tab_12")
+        self.tabWidget_4.addTab(self.tab_12, "")
+
+        self.gridLayout_17.addWidget(self.tabWidget_4, 0, 0, 1, 1)
+
+        self.tabWidget_3 = QTabWidget(self.centralwidget)
+        self.tabWidget_3.setObjectName(u"tabWidget_3")
+        self.tabWidget_3.setTabPosition(QTabWidget.South)
+        self.tabWidget_3.setDocumentMode(True)
+        self.tab_7 = QWidget()
+        self.tab_7.setObjectName(u"tab_7")
+
+        self.tabWidget_3.addTab(self.tab_7, "")
+        self.tab_17 = QWidget()
+        self.tab_17.setObjectName(u"tab_17")
+
+        self.tabWidget_3.addTab(self.tab_17, "")
+        self.tab_8 = QWidget()
+        self.tab_8.setObjectName(u"tab_8")
+
+        self.tabWidget_3.addTab(self.tab_8, "")
+        self.tab_9 = QWidget()
+        self.tab_9.setObjectName(u"tab_9")
+        self.tabWidget_3.addTab(self.tab_9, "")
+        self.tab_10 = QWidget()
+        self.tab_10.setObjectName(u"tab_10")
+        self.tabWidget_3.addTab(self.tab_10, "")
+
+        self.gridLayout_17.addWidget(self.tabWidget_3, 1, 0, 1, 2)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 1380, 22))
+        self.menumenu = QMenu(self.menubar)
+        self.menumenu.setObjectName(u"menumenu")
+        self.menuSubmenu = QMenu(self.menumenu)
+        self.menuSubmenu.setObjectName(u"menuSubmenu")
+        self.menumenu2 = QMenu(self.menubar)
+        self.menumenu2.setObjectName(u"menumenu2")
+        self.menumenu_disabled = QMenu(self.menubar)
+        self.menumenu_disabled.setObjectName(u"menumenu_disabled")
+        self.menumenu_disabled.setEnabled(False)
+        self.menuStyles = QMenu(self.menubar)
+        self.menuStyles.setObjectName(u"menuStyles")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.dockWidget_6 = QDockWidget(MainWindow)
+        self.dockWidget_6.setObjectName(u"dockWidget_6")
+        self.dockWidgetContents_5 = QWidget()
+        self.dockWidgetContents_5.setObjectName(u"dockWidgetContents_5")
+        self.gridLayout_20 = QGridLayout(self.dockWidgetContents_5)
+        self.gridLayout_20.setObjectName(u"gridLayout_20")
+        self.listWidget = QListWidget(self.dockWidgetContents_5)
+        __qlistwidgetitem = QListWidgetItem(self.listWidget)
+        __qlistwidgetitem.setCheckState(Qt.Checked);
+        __qlistwidgetitem.setFlags(Qt.ItemIsSelectable|Qt.ItemIsEditable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable|Qt.ItemIsEnabled);
+        __qlistwidgetitem1 = QListWidgetItem(self.listWidget)
+        __qlistwidgetitem1.setCheckState(Qt.Unchecked);
+        __qlistwidgetitem2 = QListWidgetItem(self.listWidget)
+        __qlistwidgetitem2.setCheckState(Qt.PartiallyChecked);
+        __qlistwidgetitem3 = QListWidgetItem(self.listWidget)
+        __qlistwidgetitem3.setCheckState(Qt.Checked);
+        __qlistwidgetitem3.setFlags(Qt.ItemIsSelectable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable);
+        __qlistwidgetitem4 = QListWidgetItem(self.listWidget)
+        __qlistwidgetitem4.setCheckState(Qt.Unchecked);
+        __qlistwidgetitem4.setFlags(Qt.ItemIsSelectable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable);
+        __qlistwidgetitem5 = QListWidgetItem(self.listWidget)
+        __qlistwidgetitem5.setCheckState(Qt.PartiallyChecked);
+        __qlistwidgetitem5.setFlags(Qt.ItemIsSelectable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable);
+        QListWidgetItem(self.listWidget)
+        __qlistwidgetitem6 = QListWidgetItem(self.listWidget)
+        __qlistwidgetitem6.setFlags(Qt.ItemIsSelectable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable);
+        self.listWidget.setObjectName(u"listWidget")
+
+        self.gridLayout_20.addWidget(self.listWidget, 0, 0, 1, 1)
+
+        self.dockWidget_6.setWidget(self.dockWidgetContents_5)
+        MainWindow.addDockWidget(Qt.RightDockWidgetArea, self.dockWidget_6)
+        self.toolBar = QToolBar(MainWindow)
+        self.toolBar.setObjectName(u"toolBar")
+        self.toolBar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        MainWindow.addToolBar(Qt.TopToolBarArea, self.toolBar)
+        self.toolBar_vertical = QToolBar(MainWindow)
+        self.toolBar_vertical.setObjectName(u"toolBar_vertical")
+        MainWindow.addToolBar(Qt.LeftToolBarArea, self.toolBar_vertical)
+        self.dockWidget = QDockWidget(MainWindow)
+        self.dockWidget.setObjectName(u"dockWidget")
+        self.dockWidgetContents = QWidget()
+        self.dockWidgetContents.setObjectName(u"dockWidgetContents")
+        self.gridLayout_26 = QGridLayout(self.dockWidgetContents)
+        self.gridLayout_26.setObjectName(u"gridLayout_26")
+        self.textEdit = QTextEdit(self.dockWidgetContents)
+        self.textEdit.setObjectName(u"textEdit")
+
+        self.gridLayout_26.addWidget(self.textEdit, 0, 0, 1, 1)
+
+        self.plainTextEdit = QPlainTextEdit(self.dockWidgetContents)
+        self.plainTextEdit.setObjectName(u"plainTextEdit")
+
+        self.gridLayout_26.addWidget(self.plainTextEdit, 1, 0, 1, 1)
+
+        self.dockWidget.setWidget(self.dockWidgetContents)
+        MainWindow.addDockWidget(Qt.RightDockWidgetArea, self.dockWidget)
+
+        self.menubar.addAction(self.menuStyles.menuAction())
+        self.menubar.addAction(self.menumenu.menuAction())
+        self.menubar.addAction(self.menumenu2.menuAction())
+        self.menubar.addAction(self.menumenu_disabled.menuAction())
+        self.menumenu.addAction(self.menuSubmenu.menuAction())
+        self.menumenu.addAction(self.actionSubmenu_2)
+        self.menumenu.addSeparator()
+        self.menumenu.addAction(self.actionSubmenu_3)
+        self.menumenu.addAction(self.actiondissabled)
+        self.menuSubmenu.addAction(self.actionSUBSUB)
+        self.menuSubmenu.addAction(self.actionSUBSUB_2)
+        self.menuSubmenu.addSeparator()
+        self.menuSubmenu.addAction(self.actionSUBSUB_3)
+        self.menumenu2.addAction(self.actionSubmenu)
+        self.menumenu2.addAction(self.actionSubmenu_4)
+        self.menumenu2.addAction(self.actionSubmenu_5)
+        self.toolBar.addAction(self.actionToolbar)
+        self.toolBar.addAction(self.actionSelected)
+        self.toolBar.addSeparator()
+        self.toolBar.addAction(self.actionaction)
+        self.toolBar.addAction(self.actionaction2)
+        self.toolBar.addAction(self.actionaction3)
+        self.toolBar_vertical.addAction(self.actionToolbar)
+        self.toolBar_vertical.addAction(self.actionSelected)
+        self.builtPages = set()
+        if not lazy:
+            for pages in self.LAZY_PAGES.values():
+                for page in pages:
+                    self.setupPage(MainWindow, page, retranslate=False)
+
+        self.retranslateUi(MainWindow)
+
+        self.tabWidget_2.setCurrentIndex(0)
+        self.tabWidget_4.setCurrentIndex(0)
+        self.tabWidget_3.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"Qt Material", None))
+        self.actionSubmenu_2.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
+        self.actionSubmenu_3.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
+        self.actionSUBSUB.setText(QCoreApplication.translate("MainWindow", u"SUBSUB", None))
+        self.actionSUBSUB_2.setText(QCoreApplication.translate("MainWindow", u"SUBSUB", None))
+        self.actionSUBSUB_3.setText(QCoreApplication.translate("MainWindow", u"SUBSUB", None))
+        self.actiondissabled.setText(QCoreApplication.translate("MainWindow", u"dissabled", None))
+        self.actionSubmenu.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
+        self.actionSubmenu_4.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
+        self.actionSubmenu_5.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
+        self.actionToolbar.setText(QCoreApplication.translate("MainWindow", u"Qt Material Theme", None))
+#if QT_CONFIG(tooltip)
+        self.actionToolbar.setToolTip(QCoreApplication.translate("MainWindow", u"Qt Material Theme", None))
+#endif // QT_CONFIG(tooltip)
+        self.actionSelected.setText(QCoreApplication.translate("MainWindow", u"Selected", None))
+        self.actionaction.setText(QCoreApplication.translate("MainWindow", u"action", None))
+        self.actionaction2.setText(QCoreApplication.translate("MainWindow", u"action2", None))
+        self.actionaction3.setText(QCoreApplication.translate("MainWindow", u"action3", None))
+        self.tabWidget_2.setTabText(self.tabWidget_2.indexOf(self.tab), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_2.setTabText(self.tabWidget_2.indexOf(self.tab_2), QCoreApplication.translate("MainWindow", u"Long Page Name", None))
+        self.tabWidget_4.setTabText(self.tabWidget_4.indexOf(self.tab_11), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_4.setTabText(self.tabWidget_4.indexOf(self.tab_13), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_4.setTabText(self.tabWidget_4.indexOf(self.tab_12), QCoreApplication.translate("MainWindow", u"Long Page Name", None))
+        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_7), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_17), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_8), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_9), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_10), QCoreApplication.translate("MainWindow", u"Long Page Name", None))
+        self.menumenu.setTitle(QCoreApplication.translate("MainWindow", u"Menu", None))
+        self.menuSubmenu.setTitle(QCoreApplication.translate("MainWindow", u"Submenu", None))
+        self.menumenu2.setTitle(QCoreApplication.translate("MainWindow", u"Menu2", None))
+        self.menumenu_disabled.setTitle(QCoreApplication.translate("MainWindow", u"Menu disabled", None))
+        self.menuStyles.setTitle(QCoreApplication.translate("MainWindow", u"Styles", None))
+        self.dockWidget_6.setWindowTitle(QCoreApplication.translate("MainWindow", u"Top Dock", None))
+
+        __sortingEnabled4 = self.listWidget.isSortingEnabled()
+        self.listWidget.setSortingEnabled(False)
+        ___qlistwidgetitem3 = self.listWidget.item(0)
+        ___qlistwidgetitem3.setText(QCoreApplication.translate("MainWindow", u"New Item (editable)", None));
+        ___qlistwidgetitem4 = self.listWidget.item(1)
+        ___qlistwidgetitem4.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        ___qlistwidgetitem5 = self.listWidget.item(2)
+        ___qlistwidgetitem5.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        ___qlistwidgetitem6 = self.listWidget.item(3)
+        ___qlistwidgetitem6.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        ___qlistwidgetitem7 = self.listWidget.item(4)
+        ___qlistwidgetitem7.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        ___qlistwidgetitem8 = self.listWidget.item(5)
+        ___qlistwidgetitem8.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        ___qlistwidgetitem9 = self.listWidget.item(6)
+        ___qlistwidgetitem9.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        ___qlistwidgetitem10 = self.listWidget.item(7)
+        ___qlistwidgetitem10.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        self.listWidget.setSortingEnabled(__sortingEnabled4)
+
+        self.toolBar.setWindowTitle(QCoreApplication.translate("MainWindow", u"toolBar", None))
+        self.toolBar_vertical.setWindowTitle(QCoreApplication.translate("MainWindow", u"toolBar_2", None))
+        self.dockWidget.setWindowTitle(QCoreApplication.translate("MainWindow", u"Right Doc", None))
+        self.textEdit.setMarkdown(QCoreApplication.translate("MainWindow", u"textEdit Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do\n"
+"eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim\n"
+"veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo\n"
+"consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse\n"
+"cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non\n"
+"proident, sunt in culpa qui officia deserunt mollit anim id est laborum.\n"
+"\n"
+"", None))
+        self.textEdit.setHtml(QCoreApplication.translate("MainWindow", u"<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><meta charset=\"utf-8\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"</style></head><body style=\" font-family:'Segoe UI'; font-size:9pt; font-weight:400; font-style:normal;\">\n"
+"<p style=\" margin-top:6px; margin-bottom:6px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">textEdit Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.</p></body></html>", None))
+        self.plainTextEdit.setPlainText(QCoreApplication.translate("MainWindow", u"plainTextEdit\n"
+"Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.", None))
+        for page in self.builtPages:
+            getattr(self, f'retranslatePage_{page}')(MainWindow)
+    # retranslateUi
+
+    def setupPage(self, MainWindow, page, retranslate=True):
+        if page in self.builtPages:
+            return False
+
+        parent = self.LAZY_PAGE_PARENTS.get(page)
+        if parent is not None:
+            self.setupPage(MainWindow, parent, retranslate)
+
+        self.builtPages.add(page)
+        getattr(self, f'setupPage_{page}')(MainWindow)
+        widget = getattr(self, page).parentWidget()
+        while widget is not None: # Hidden pages don't pass size hint changes on, their containers cached the empty page's
+            widget.updateGeometry()
+            widget = widget.parentWidget()
+        if retranslate:
+            getattr(self, f'retranslatePage_{page}')(MainWindow)
+        return True
+    # setupPage
+
+    def setupPage_tab(self, MainWindow):
         self.gridLayout_22 = QGridLayout(self.tab)
         self.gridLayout_22.setObjectName(u"gridLayout_22")
         self.toolBox = QToolBox(self.tab)
@@ -335,26 +620,97 @@ class Ui_MainWindow(object):
         self.toolBox.addItem(self.page_4, u"Inputs")
 
         self.gridLayout_22.addWidget(self.toolBox, 0, 0, 2, 2)
+        self.toolBox.setCurrentIndex(1)
+    # setupPage_tab
 
-        self.tabWidget_2.addTab(self.tab, "")
-        self.tab_2 = QWidget()
-        self.tab_2.setObjectName(u"tab_2")
-        self.gridLayout_23 = QGridLayout(self.tab_2)
-        self.gridLayout_23.setObjectName(u"gridLayout_23")
-        self.mdiArea = QMdiArea(self.tab_2)
-        self.mdiArea.setObjectName(u"mdiArea")
+    def retranslatePage_tab(self, MainWindow):
+        self.toolBox.setItemText(self.toolBox.indexOf(self.page_3), QCoreApplication.translate("MainWindow", u"Date controls", None))
+        self.label_3.setText(QCoreApplication.translate("MainWindow", u"Material theme", None))
+        self.label.setText(QCoreApplication.translate("MainWindow", u"Material theme", None))
+        self.comboBox_4.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_4.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_4.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_4.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_4.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item", None))
 
-        self.gridLayout_23.addWidget(self.mdiArea, 0, 0, 1, 1)
+        self.comboBox_3.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_3.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_3.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_3.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_3.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_3.setItemText(5, QCoreApplication.translate("MainWindow", u"New Item", None))
 
-        self.tabWidget_2.addTab(self.tab_2, "")
+        self.lineEdit_2.setText(QCoreApplication.translate("MainWindow", u"Lorem ipsum dolor sit amet", None))
+        self.lineEdit_3.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Placeholder text", None))
+        self.comboBox_6.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item1", None))
+        self.comboBox_6.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item2", None))
+        self.comboBox_6.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item3", None))
+        self.comboBox_6.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item4", None))
+        self.comboBox_6.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item5", None))
+        self.comboBox_6.setItemText(5, QCoreApplication.translate("MainWindow", u"New Item6", None))
+        self.comboBox_6.setItemText(6, QCoreApplication.translate("MainWindow", u"New Item7", None))
 
-        self.gridLayout_17.addWidget(self.tabWidget_2, 0, 1, 1, 1)
+        self.comboBox.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item", None))
 
-        self.tabWidget_4 = QTabWidget(self.centralwidget)
-        self.tabWidget_4.setObjectName(u"tabWidget_4")
-        self.tabWidget_4.setTabPosition(QTabWidget.West)
-        self.tab_11 = QWidget()
-        self.tab_11.setObjectName(u"tab_11")
+        self.comboBox.setCurrentText(QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.lineEdit.setText(QCoreApplication.translate("MainWindow", u"Lorem ipsum dolor sit amet", None))
+        self.comboBox_2.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item1", None))
+        self.comboBox_2.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item2", None))
+        self.comboBox_2.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item3", None))
+        self.comboBox_2.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item4", None))
+        self.comboBox_2.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item5", None))
+        self.comboBox_2.setItemText(5, QCoreApplication.translate("MainWindow", u"New Item6", None))
+        self.comboBox_2.setItemText(6, QCoreApplication.translate("MainWindow", u"New Item7", None))
+
+        self.comboBox_5.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item1", None))
+        self.comboBox_5.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item2", None))
+        self.comboBox_5.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item3", None))
+        self.comboBox_5.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item4", None))
+        self.comboBox_5.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item5", None))
+        self.comboBox_5.setItemText(5, QCoreApplication.translate("MainWindow", u"New Item6", None))
+        self.comboBox_5.setItemText(6, QCoreApplication.translate("MainWindow", u"New Item7", None))
+
+        self.lineEdit_4.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Placeholder text", None))
+        self.comboBox_7.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_7.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_7.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_7.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.comboBox_7.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item", None))
+
+        self.label_2.setText(QCoreApplication.translate("MainWindow", u"Material theme", None))
+        self.pushButton_18.setText(QCoreApplication.translate("MainWindow", u"Danger", None))
+        self.pushButton_18.setProperty("class", QCoreApplication.translate("MainWindow", u"danger", None))
+        self.pushButton_22.setText(QCoreApplication.translate("MainWindow", u"Success", None))
+        self.pushButton_22.setProperty("class", QCoreApplication.translate("MainWindow", u"success", None))
+        self.pushButton_19.setText(QCoreApplication.translate("MainWindow", u"Warning", None))
+        self.pushButton_19.setProperty("class", QCoreApplication.translate("MainWindow", u"warning", None))
+        self.pushButton_21.setText(QCoreApplication.translate("MainWindow", u"Warning", None))
+        self.pushButton_21.setProperty("class", QCoreApplication.translate("MainWindow", u"warning", None))
+        self.pushButton_20.setText(QCoreApplication.translate("MainWindow", u"Success", None))
+        self.pushButton_20.setProperty("class", QCoreApplication.translate("MainWindow", u"success", None))
+        self.pushButton_23.setText(QCoreApplication.translate("MainWindow", u"Danger", None))
+        self.pushButton_23.setProperty("class", QCoreApplication.translate("MainWindow", u"danger", None))
+        self.toolBox.setItemText(self.toolBox.indexOf(self.page_4), QCoreApplication.translate("MainWindow", u"Inputs", None))
+    # retranslatePage_tab
+
+    def setupPage_tab_2(self, MainWindow):
+        self.gridLayout_23 = QGridLayout(self.tab_2)
+        self.gridLayout_23.setObjectName(u"gridLayout_23")
+        self.mdiArea = QMdiArea(self.tab_2)
+        self.mdiArea.setObjectName(u"mdiArea")
+
+        self.gridLayout_23.addWidget(self.mdiArea, 0, 0, 1, 1)
+    # setupPage_tab_2
+
+    def retranslatePage_tab_2(self, MainWindow):
+        pass
+    # retranslatePage_tab_2
+
+    def setupPage_tab_11(self, MainWindow):
         self.gridLayout_11 = QGridLayout(self.tab_11)
         self.gridLayout_11.setObjectName(u"gridLayout_11")
         self.groupBox = QGroupBox(self.tab_11)
@@ -488,10 +844,33 @@ class Ui_MainWindow(object):
 
 
         self.gridLayout_11.addWidget(self.groupBox_3, 1, 1, 1, 1)
+    # setupPage_tab_11
 
-        self.tabWidget_4.addTab(self.tab_11, "")
-        self.tab_13 = QWidget()
-        self.tab_13.setObjectName(u"tab_13")
+    def retranslatePage_tab_11(self, MainWindow):
+        self.groupBox.setTitle(QCoreApplication.translate("MainWindow", u"Buttons", None))
+#if QT_CONFIG(tooltip)
+        self.pushButton.setToolTip(QCoreApplication.translate("MainWindow", u"Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.", None))
+#endif // QT_CONFIG(tooltip)
+        self.pushButton.setText(QCoreApplication.translate("MainWindow", u"PushButton", None))
+        self.pushButton_3.setText(QCoreApplication.translate("MainWindow", u"Checked", None))
+        self.pushButton_6.setText(QCoreApplication.translate("MainWindow", u"Disabled", None))
+        self.pushButton_7.setText(QCoreApplication.translate("MainWindow", u"Disable checked", None))
+        self.pushButton_11.setText(QCoreApplication.translate("MainWindow", u"Flat", None))
+        self.pushButton_5.setText(QCoreApplication.translate("MainWindow", u"Flat checkeable", None))
+        self.pushButton_4.setText(QCoreApplication.translate("MainWindow", u"Flat disabled", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("MainWindow", u"Radio", None))
+        self.radioButton_2.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
+        self.radioButton_3.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
+        self.radioButton.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
+        self.radioButton_4.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("MainWindow", u"Check", None))
+        self.checkBox_3.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
+        self.checkBox_2.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
+        self.checkBox_4.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
+        self.checkBox.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
+    # retranslatePage_tab_11
+
+    def setupPage_tab_13(self, MainWindow):
         self.gridLayout_24 = QGridLayout(self.tab_13)
         self.gridLayout_24.setObjectName(u"gridLayout_24")
         self.verticalLayout = QVBoxLayout()
@@ -627,20 +1006,27 @@ class Ui_MainWindow(object):
         self.verticalSpacer_6 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
 
         self.gridLayout_24.addItem(self.verticalSpacer_6, 3, 0, 1, 2)
+    # setupPage_tab_13
 
-        self.tabWidget_4.addTab(self.tab_13, "")
-        self.tab_12 = QWidget()
-        self.tab_12.setObjectName(u"tab_12")
-        self.tabWidget_4.addTab(self.tab_12, "")
-
-        self.gridLayout_17.addWidget(self.tabWidget_4, 0, 0, 1, 1)
+    def retranslatePage_tab_13(self, MainWindow):
+        self.radioButton_7.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
+        self.radioButton_5.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
+        self.radioButton_6.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
+        self.radioButton_8.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
+        self.pushButton_2.setText(QCoreApplication.translate("MainWindow", u"PushButton", None))
+        self.pushButton_12.setText(QCoreApplication.translate("MainWindow", u"Checked", None))
+        self.pushButton_17.setText(QCoreApplication.translate("MainWindow", u"Flat disabled", None))
+        self.pushButton_14.setText(QCoreApplication.translate("MainWindow", u"Disable checked", None))
+        self.pushButton_13.setText(QCoreApplication.translate("MainWindow", u"Disabled", None))
+        self.pushButton_16.setText(QCoreApplication.translate("MainWindow", u"Flat checkeable", None))
+        self.pushButton_15.setText(QCoreApplication.translate("MainWindow", u"Flat", None))
+        self.checkBox_5.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
+        self.checkBox_6.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
+        self.checkBox_7.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
+        self.checkBox_8.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
+    # retranslatePage_tab_13
 
-        self.tabWidget_3 = QTabWidget(self.centralwidget)
-        self.tabWidget_3.setObjectName(u"tabWidget_3")
-        self.tabWidget_3.setTabPosition(QTabWidget.South)
-        self.tabWidget_3.setDocumentMode(True)
-        self.tab_7 = QWidget()
-        self.tab_7.setObjectName(u"tab_7")
+    def setupPage_tab_7(self, MainWindow):
         self.gridLayout_16 = QGridLayout(self.tab_7)
         self.gridLayout_16.setObjectName(u"gridLayout_16")
         self.tabWidget = QTabWidget(self.tab_7)
@@ -717,33 +1103,6 @@ class Ui_MainWindow(object):
         self.stackedWidget.setObjectName(u"stackedWidget")
         self.page_5 = QWidget()
         self.page_5.setObjectName(u"page_5")
-        self.gridLayout_18 = QGridLayout(self.page_5)
-        self.gridLayout_18.setObjectName(u"gridLayout_18")
-        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
-
-        self.gridLayout_18.addItem(self.horizontalSpacer, 0, 0, 1, 1)
-
-        self.verticalScrollBar_2 = QScrollBar(self.page_5)
-        self.verticalScrollBar_2.setObjectName(u"verticalScrollBar_2")
-        self.verticalScrollBar_2.setValue(50)
-        self.verticalScrollBar_2.setOrientation(Qt.Vertical)
-
-        self.gridLayout_18.addWidget(self.verticalScrollBar_2, 0, 1, 1, 1)
-
-        self.horizontalSpacer_3 = QSpacerItem(8, 108, QSizePolicy.Expanding, QSizePolicy.Minimum)
-
-        self.gridLayout_18.addItem(self.horizontalSpacer_3, 0, 2, 1, 1)
-
-        self.verticalSlider_2 = QSlider(self.page_5)
-        self.verticalSlider_2.setObjectName(u"verticalSlider_2")
-        self.verticalSlider_2.setValue(50)
-        self.verticalSlider_2.setOrientation(Qt.Vertical)
-
-        self.gridLayout_18.addWidget(self.verticalSlider_2, 0, 3, 1, 1)
-
-        self.horizontalSpacer_2 = QSpacerItem(32, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
-
-        self.gridLayout_18.addItem(self.horizontalSpacer_2, 0, 4, 1, 1)
 
         self.stackedWidget.addWidget(self.page_5)
         self.page_6 = QWidget()
@@ -845,26 +1204,10 @@ class Ui_MainWindow(object):
         self.tabWidget.addTab(self.tab_3, "")
         self.tab_15 = QWidget()
         self.tab_15.setObjectName(u"tab_15")
-        self.gridLayout_29 = QGridLayout(self.tab_15)
-        self.gridLayout_29.setObjectName(u"gridLayout_29")
-        self.widget = QWidget(self.tab_15)
-        self.widget.setObjectName(u"widget")
-        self.gridLayout_34 = QGridLayout(self.widget)
-        self.gridLayout_34.setObjectName(u"gridLayout_34")
-
-        self.gridLayout_29.addWidget(self.widget, 0, 0, 1, 1)
 
         self.tabWidget.addTab(self.tab_15, "")
         self.tab_16 = QWidget()
         self.tab_16.setObjectName(u"tab_16")
-        self.gridLayout_30 = QGridLayout(self.tab_16)
-        self.gridLayout_30.setObjectName(u"gridLayout_30")
-        self.frame_6 = QFrame(self.tab_16)
-        self.frame_6.setObjectName(u"frame_6")
-        self.frame_6.setFrameShape(QFrame.StyledPanel)
-        self.frame_6.setFrameShadow(QFrame.Raised)
-
-        self.gridLayout_30.addWidget(self.frame_6, 0, 0, 1, 1)
 
         self.tabWidget.addTab(self.tab_16, "")
         self.tab_18 = QWidget()
@@ -931,102 +1274,137 @@ class Ui_MainWindow(object):
         self.tabWidget.addTab(self.tab_4, "")
         self.tab_5 = QWidget()
         self.tab_5.setObjectName(u"tab_5")
-        self.gridLayout_8 = QGridLayout(self.tab_5)
-        self.gridLayout_8.setObjectName(u"gridLayout_8")
         self.tabWidget.addTab(self.tab_5, "")
         self.tab_6 = QWidget()
         self.tab_6.setObjectName(u"tab_6")
-        self.gridLayout_10 = QGridLayout(self.tab_6)
-        self.gridLayout_10.setObjectName(u"gridLayout_10")
-        self.tabWidget_5 = QTabWidget(self.tab_6)
-        self.tabWidget_5.setObjectName(u"tabWidget_5")
-        self.tabWidget_5.setTabPosition(QTabWidget.East)
-        self.tab_20 = QWidget()
-        self.tab_20.setObjectName(u"tab_20")
-        self.gridLayout_25 = QGridLayout(self.tab_20)
-        self.gridLayout_25.setObjectName(u"gridLayout_25")
-        self.tabWidget_6 = QTabWidget(self.tab_20)
-        self.tabWidget_6.setObjectName(u"tabWidget_6")
-        self.tabWidget_6.setTabPosition(QTabWidget.South)
-        self.tab_22 = QWidget()
-        self.tab_22.setObjectName(u"tab_22")
-        self.gridLayout_28 = QGridLayout(self.tab_22)
-        self.gridLayout_28.setObjectName(u"gridLayout_28")
-        self.tabWidget_7 = QTabWidget(self.tab_22)
-        self.tabWidget_7.setObjectName(u"tabWidget_7")
-        self.tabWidget_7.setTabPosition(QTabWidget.West)
-        self.tab_24 = QWidget()
-        self.tab_24.setObjectName(u"tab_24")
-        self.tabWidget_7.addTab(self.tab_24, "")
-        self.tab_38 = QWidget()
-        self.tab_38.setObjectName(u"tab_38")
-        self.tabWidget_7.addTab(self.tab_38, "")
-        self.tab_39 = QWidget()
-        self.tab_39.setObjectName(u"tab_39")
-        self.tabWidget_7.addTab(self.tab_39, "")
-        self.tab_25 = QWidget()
-        self.tab_25.setObjectName(u"tab_25")
-        self.tabWidget_7.addTab(self.tab_25, "")
-
-        self.gridLayout_28.addWidget(self.tabWidget_7, 0, 0, 1, 1)
-
-        self.tabWidget_6.addTab(self.tab_22, "")
-        self.tab_23 = QWidget()
-        self.tab_23.setObjectName(u"tab_23")
-        self.tabWidget_6.addTab(self.tab_23, "")
-        self.tab_28 = QWidget()
-        self.tab_28.setObjectName(u"tab_28")
-        self.tabWidget_6.addTab(self.tab_28, "")
-        self.tab_29 = QWidget()
-        self.tab_29.setObjectName(u"tab_29")
-        self.tabWidget_6.addTab(self.tab_29, "")
-        self.tab_30 = QWidget()
-        self.tab_30.setObjectName(u"tab_30")
-        self.tabWidget_6.addTab(self.tab_30, "")
-        self.tab_31 = QWidget()
-        self.tab_31.setObjectName(u"tab_31")
-        self.tabWidget_6.addTab(self.tab_31, "")
-        self.tab_32 = QWidget()
-        self.tab_32.setObjectName(u"tab_32")
-        self.tabWidget_6.addTab(self.tab_32, "")
-        self.tab_33 = QWidget()
-        self.tab_33.setObjectName(u"tab_33")
-        self.tabWidget_6.addTab(self.tab_33, "")
-        self.tab_34 = QWidget()
-        self.tab_34.setObjectName(u"tab_34")
-        self.tabWidget_6.addTab(self.tab_34, "")
-        self.tab_35 = QWidget()
-        self.tab_35.setObjectName(u"tab_35")
-        self.tabWidget_6.addTab(self.tab_35, "")
-        self.tab_36 = QWidget()
-        self.tab_36.setObjectName(u"tab_36")
-        self.tabWidget_6.addTab(self.tab_36, "")
-        self.tab_37 = QWidget()
-        self.tab_37.setObjectName(u"tab_37")
-        self.tabWidget_6.addTab(self.tab_37, "")
-
-        self.gridLayout_25.addWidget(self.tabWidget_6, 0, 0, 1, 1)
-
-        self.tabWidget_5.addTab(self.tab_20, "")
-        self.tab_26 = QWidget()
-        self.tab_26.setObjectName(u"tab_26")
-        self.tabWidget_5.addTab(self.tab_26, "")
-        self.tab_21 = QWidget()
-        self.tab_21.setObjectName(u"tab_21")
-        self.tabWidget_5.addTab(self.tab_21, "")
-        self.tab_27 = QWidget()
-        self.tab_27.setObjectName(u"tab_27")
-        self.tabWidget_5.addTab(self.tab_27, "")
-
-        self.gridLayout_10.addWidget(self.tabWidget_5, 0, 0, 1, 1)
 
         self.tabWidget.addTab(self.tab_6, "")
 
         self.gridLayout_16.addWidget(self.tabWidget, 0, 0, 1, 1)
-
-        self.tabWidget_3.addTab(self.tab_7, "")
-        self.tab_17 = QWidget()
-        self.tab_17.setObjectName(u"tab_17")
+        self.tabWidget.setCurrentIndex(0)
+        self.stackedWidget.setCurrentIndex(0)
+    # setupPage_tab_7
+
+    def retranslatePage_tab_7(self, MainWindow):
+        __sortingEnabled = self.listWidget_2.isSortingEnabled()
+        self.listWidget_2.setSortingEnabled(False)
+        ___qlistwidgetitem = self.listWidget_2.item(0)
+        ___qlistwidgetitem.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        ___qlistwidgetitem1 = self.listWidget_2.item(1)
+        ___qlistwidgetitem1.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        ___qlistwidgetitem2 = self.listWidget_2.item(2)
+        ___qlistwidgetitem2.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
+        self.listWidget_2.setSortingEnabled(__sortingEnabled)
+
+        ___qtreewidgetitem = self.treeWidget.headerItem()
+        ___qtreewidgetitem.setText(0, QCoreApplication.translate("MainWindow", u"Material Tree", None));
+
+        __sortingEnabled1 = self.treeWidget.isSortingEnabled()
+        self.treeWidget.setSortingEnabled(False)
+        ___qtreewidgetitem1 = self.treeWidget.topLevelItem(0)
+        ___qtreewidgetitem1.setText(0, QCoreApplication.translate("MainWindow", u"Tree #1", None));
+        ___qtreewidgetitem2 = ___qtreewidgetitem1.child(0)
+        ___qtreewidgetitem2.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #1", None));
+        ___qtreewidgetitem3 = ___qtreewidgetitem1.child(1)
+        ___qtreewidgetitem3.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #2", None));
+        ___qtreewidgetitem4 = ___qtreewidgetitem3.child(0)
+        ___qtreewidgetitem4.setText(0, QCoreApplication.translate("MainWindow", u"New Subitem", None));
+        ___qtreewidgetitem5 = ___qtreewidgetitem3.child(1)
+        ___qtreewidgetitem5.setText(0, QCoreApplication.translate("MainWindow", u"New Item", None));
+        ___qtreewidgetitem6 = self.treeWidget.topLevelItem(1)
+        ___qtreewidgetitem6.setText(0, QCoreApplication.translate("MainWindow", u"Tree #2", None));
+        ___qtreewidgetitem7 = self.treeWidget.topLevelItem(2)
+        ___qtreewidgetitem7.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #4", None));
+        ___qtreewidgetitem8 = ___qtreewidgetitem7.child(0)
+        ___qtreewidgetitem8.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #41", None));
+        ___qtreewidgetitem9 = ___qtreewidgetitem7.child(1)
+        ___qtreewidgetitem9.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #42", None));
+        ___qtreewidgetitem10 = self.treeWidget.topLevelItem(3)
+        ___qtreewidgetitem10.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #5", None));
+        ___qtreewidgetitem11 = self.treeWidget.topLevelItem(4)
+        ___qtreewidgetitem11.setText(0, QCoreApplication.translate("MainWindow", u"Tree #3", None));
+        ___qtreewidgetitem12 = self.treeWidget.topLevelItem(5)
+        ___qtreewidgetitem12.setText(0, QCoreApplication.translate("MainWindow", u"Tree #4", None));
+        self.treeWidget.setSortingEnabled(__sortingEnabled1)
+
+        ___qtablewidgetitem = self.tableWidget.horizontalHeaderItem(0)
+        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"Duration", None));
+        ___qtablewidgetitem1 = self.tableWidget.horizontalHeaderItem(1)
+        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"Datetime", None));
+        ___qtablewidgetitem2 = self.tableWidget.horizontalHeaderItem(2)
+        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"Name", None));
+        ___qtablewidgetitem3 = self.tableWidget.verticalHeaderItem(0)
+        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"Row-1", None));
+        ___qtablewidgetitem4 = self.tableWidget.verticalHeaderItem(2)
+        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"Row-3", None));
+
+        __sortingEnabled2 = self.tableWidget.isSortingEnabled()
+        self.tableWidget.setSortingEnabled(False)
+        ___qtablewidgetitem5 = self.tableWidget.item(0, 0)
+        ___qtablewidgetitem5.setText(QCoreApplication.translate("MainWindow", u"00:05:02", None));
+        ___qtablewidgetitem6 = self.tableWidget.item(0, 1)
+        ___qtablewidgetitem6.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
+        ___qtablewidgetitem7 = self.tableWidget.item(0, 2)
+        ___qtablewidgetitem7.setText(QCoreApplication.translate("MainWindow", u"Unamed-1", None));
+        ___qtablewidgetitem8 = self.tableWidget.item(1, 0)
+        ___qtablewidgetitem8.setText(QCoreApplication.translate("MainWindow", u"00:01:02", None));
+        ___qtablewidgetitem9 = self.tableWidget.item(1, 1)
+        ___qtablewidgetitem9.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
+        ___qtablewidgetitem10 = self.tableWidget.item(1, 2)
+        ___qtablewidgetitem10.setText(QCoreApplication.translate("MainWindow", u"Unamed-2", None));
+        ___qtablewidgetitem11 = self.tableWidget.item(2, 0)
+        ___qtablewidgetitem11.setText(QCoreApplication.translate("MainWindow", u"00:07:02", None));
+        ___qtablewidgetitem12 = self.tableWidget.item(2, 1)
+        ___qtablewidgetitem12.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
+        ___qtablewidgetitem13 = self.tableWidget.item(2, 2)
+        ___qtablewidgetitem13.setText(QCoreApplication.translate("MainWindow", u"Unamed-3", None));
+        self.tableWidget.setSortingEnabled(__sortingEnabled2)
+
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_15), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_16), QCoreApplication.translate("MainWindow", u"Page", None))
+        ___qtablewidgetitem14 = self.tableWidget_2.horizontalHeaderItem(0)
+        ___qtablewidgetitem14.setText(QCoreApplication.translate("MainWindow", u"Duration", None));
+        ___qtablewidgetitem15 = self.tableWidget_2.horizontalHeaderItem(1)
+        ___qtablewidgetitem15.setText(QCoreApplication.translate("MainWindow", u"Datetime", None));
+        ___qtablewidgetitem16 = self.tableWidget_2.horizontalHeaderItem(2)
+        ___qtablewidgetitem16.setText(QCoreApplication.translate("MainWindow", u"Name", None));
+        ___qtablewidgetitem17 = self.tableWidget_2.verticalHeaderItem(0)
+        ___qtablewidgetitem17.setText(QCoreApplication.translate("MainWindow", u"Row-1", None));
+        ___qtablewidgetitem18 = self.tableWidget_2.verticalHeaderItem(2)
+        ___qtablewidgetitem18.setText(QCoreApplication.translate("MainWindow", u"Row-3", None));
+
+        __sortingEnabled3 = self.tableWidget_2.isSortingEnabled()
+        self.tableWidget_2.setSortingEnabled(False)
+        ___qtablewidgetitem19 = self.tableWidget_2.item(0, 0)
+        ___qtablewidgetitem19.setText(QCoreApplication.translate("MainWindow", u"00:05:02", None));
+        ___qtablewidgetitem20 = self.tableWidget_2.item(0, 1)
+        ___qtablewidgetitem20.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
+        ___qtablewidgetitem21 = self.tableWidget_2.item(0, 2)
+        ___qtablewidgetitem21.setText(QCoreApplication.translate("MainWindow", u"Unamed-1", None));
+        ___qtablewidgetitem22 = self.tableWidget_2.item(1, 0)
+        ___qtablewidgetitem22.setText(QCoreApplication.translate("MainWindow", u"00:01:02", None));
+        ___qtablewidgetitem23 = self.tableWidget_2.item(1, 1)
+        ___qtablewidgetitem23.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
+        ___qtablewidgetitem24 = self.tableWidget_2.item(1, 2)
+        ___qtablewidgetitem24.setText(QCoreApplication.translate("MainWindow", u"Unamed-2", None));
+        ___qtablewidgetitem25 = self.tableWidget_2.item(2, 0)
+        ___qtablewidgetitem25.setText(QCoreApplication.translate("MainWindow", u"00:07:02", None));
+        ___qtablewidgetitem26 = self.tableWidget_2.item(2, 1)
+        ___qtablewidgetitem26.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
+        ___qtablewidgetitem27 = self.tableWidget_2.item(2, 2)
+        ___qtablewidgetitem27.setText(QCoreApplication.translate("MainWindow", u"Unamed-3", None));
+        self.tableWidget_2.setSortingEnabled(__sortingEnabled3)
+
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_18), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_19), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_14), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_5), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_6), QCoreApplication.translate("MainWindow", u"Page", None))
+    # retranslatePage_tab_7
+
+    def setupPage_tab_17(self, MainWindow):
         self.gridLayout_31 = QGridLayout(self.tab_17)
         self.gridLayout_31.setObjectName(u"gridLayout_31")
         self.gridLayout_31.setContentsMargins(0, 0, 0, 0)
@@ -1092,10 +1470,13 @@ class Ui_MainWindow(object):
         self.gridLayout_33.setColumnStretch(1, 1)
 
         self.gridLayout_31.addWidget(self.frame_7, 0, 0, 1, 1)
+    # setupPage_tab_17
 
-        self.tabWidget_3.addTab(self.tab_17, "")
-        self.tab_8 = QWidget()
-        self.tab_8.setObjectName(u"tab_8")
+    def retranslatePage_tab_17(self, MainWindow):
+        pass
+    # retranslatePage_tab_17
+
+    def setupPage_tab_8(self, MainWindow):
         self.gridLayout_32 = QGridLayout(self.tab_8)
         self.gridLayout_32.setObjectName(u"gridLayout_32")
         self.gridLayout_32.setContentsMargins(0, 0, 0, 0)
@@ -1103,385 +1484,165 @@ class Ui_MainWindow(object):
         self.widget_2.setObjectName(u"widget_2")
 
         self.gridLayout_32.addWidget(self.widget_2, 0, 0, 1, 1)
+    # setupPage_tab_8
 
-        self.tabWidget_3.addTab(self.tab_8, "")
-        self.tab_9 = QWidget()
-        self.tab_9.setObjectName(u"tab_9")
-        self.tabWidget_3.addTab(self.tab_9, "")
-        self.tab_10 = QWidget()
-        self.tab_10.setObjectName(u"tab_10")
-        self.tabWidget_3.addTab(self.tab_10, "")
+    def retranslatePage_tab_8(self, MainWindow):
+        pass
+    # retranslatePage_tab_8
 
-        self.gridLayout_17.addWidget(self.tabWidget_3, 1, 0, 1, 2)
+    def setupPage_page_5(self, MainWindow):
+        self.gridLayout_18 = QGridLayout(self.page_5)
+        self.gridLayout_18.setObjectName(u"gridLayout_18")
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
 
-        MainWindow.setCentralWidget(self.centralwidget)
-        self.menubar = QMenuBar(MainWindow)
-        self.menubar.setObjectName(u"menubar")
-        self.menubar.setGeometry(QRect(0, 0, 1380, 22))
-        self.menumenu = QMenu(self.menubar)
-        self.menumenu.setObjectName(u"menumenu")
-        self.menuSubmenu = QMenu(self.menumenu)
-        self.menuSubmenu.setObjectName(u"menuSubmenu")
-        self.menumenu2 = QMenu(self.menubar)
-        self.menumenu2.setObjectName(u"menumenu2")
-        self.menumenu_disabled = QMenu(self.menubar)
-        self.menumenu_disabled.setObjectName(u"menumenu_disabled")
-        self.menumenu_disabled.setEnabled(False)
-        self.menuStyles = QMenu(self.menubar)
-        self.menuStyles.setObjectName(u"menuStyles")
-        MainWindow.setMenuBar(self.menubar)
-        self.statusbar = QStatusBar(MainWindow)
-        self.statusbar.setObjectName(u"statusbar")
-        MainWindow.setStatusBar(self.statusbar)
-        self.dockWidget_6 = QDockWidget(MainWindow)
-        self.dockWidget_6.setObjectName(u"dockWidget_6")
-        self.dockWidgetContents_5 = QWidget()
-        self.dockWidgetContents_5.setObjectName(u"dockWidgetContents_5")
-        self.gridLayout_20 = QGridLayout(self.dockWidgetContents_5)
-        self.gridLayout_20.setObjectName(u"gridLayout_20")
-        self.listWidget = QListWidget(self.dockWidgetContents_5)
-        __qlistwidgetitem = QListWidgetItem(self.listWidget)
-        __qlistwidgetitem.setCheckState(Qt.Checked);
-        __qlistwidgetitem.setFlags(Qt.ItemIsSelectable|Qt.ItemIsEditable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable|Qt.ItemIsEnabled);
-        __qlistwidgetitem1 = QListWidgetItem(self.listWidget)
-        __qlistwidgetitem1.setCheckState(Qt.Unchecked);
-        __qlistwidgetitem2 = QListWidgetItem(self.listWidget)
-        __qlistwidgetitem2.setCheckState(Qt.PartiallyChecked);
-        __qlistwidgetitem3 = QListWidgetItem(self.listWidget)
-        __qlistwidgetitem3.setCheckState(Qt.Checked);
-        __qlistwidgetitem3.setFlags(Qt.ItemIsSelectable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable);
-        __qlistwidgetitem4 = QListWidgetItem(self.listWidget)
-        __qlistwidgetitem4.setCheckState(Qt.Unchecked);
-        __qlistwidgetitem4.setFlags(Qt.ItemIsSelectable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable);
-        __qlistwidgetitem5 = QListWidgetItem(self.listWidget)
-        __qlistwidgetitem5.setCheckState(Qt.PartiallyChecked);
-        __qlistwidgetitem5.setFlags(Qt.ItemIsSelectable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable);
-        QListWidgetItem(self.listWidget)
-        __qlistwidgetitem6 = QListWidgetItem(self.listWidget)
-        __qlistwidgetitem6.setFlags(Qt.ItemIsSelectable|Qt.ItemIsDragEnabled|Qt.ItemIsUserCheckable);
-        self.listWidget.setObjectName(u"listWidget")
+        self.gridLayout_18.addItem(self.horizontalSpacer, 0, 0, 1, 1)
 
-        self.gridLayout_20.addWidget(self.listWidget, 0, 0, 1, 1)
+        self.verticalScrollBar_2 = QScrollBar(self.page_5)
+        self.verticalScrollBar_2.setObjectName(u"verticalScrollBar_2")
+        self.verticalScrollBar_2.setValue(50)
+        self.verticalScrollBar_2.setOrientation(Qt.Vertical)
 
-        self.dockWidget_6.setWidget(self.dockWidgetContents_5)
-        MainWindow.addDockWidget(Qt.RightDockWidgetArea, self.dockWidget_6)
-        self.toolBar = QToolBar(MainWindow)
-        self.toolBar.setObjectName(u"toolBar")
-        self.toolBar.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
-        MainWindow.addToolBar(Qt.TopToolBarArea, self.toolBar)
-        self.toolBar_vertical = QToolBar(MainWindow)
-        self.toolBar_vertical.setObjectName(u"toolBar_vertical")
-        MainWindow.addToolBar(Qt.LeftToolBarArea, self.toolBar_vertical)
-        self.dockWidget = QDockWidget(MainWindow)
-        self.dockWidget.setObjectName(u"dockWidget")
-        self.dockWidgetContents = QWidget()
-        self.dockWidgetContents.setObjectName(u"dockWidgetContents")
-        self.gridLayout_26 = QGridLayout(self.dockWidgetContents)
-        self.gridLayout_26.setObjectName(u"gridLayout_26")
-        self.textEdit = QTextEdit(self.dockWidgetContents)
-        self.textEdit.setObjectName(u"textEdit")
+        self.gridLayout_18.addWidget(self.verticalScrollBar_2, 0, 1, 1, 1)
 
-        self.gridLayout_26.addWidget(self.textEdit, 0, 0, 1, 1)
+        self.horizontalSpacer_3 = QSpacerItem(8, 108, QSizePolicy.Expanding, QSizePolicy.Minimum)
 
-        self.plainTextEdit = QPlainTextEdit(self.dockWidgetContents)
-        self.plainTextEdit.setObjectName(u"plainTextEdit")
+        self.gridLayout_18.addItem(self.horizontalSpacer_3, 0, 2, 1, 1)
 
-        self.gridLayout_26.addWidget(self.plainTextEdit, 1, 0, 1, 1)
+        self.verticalSlider_2 = QSlider(self.page_5)
+        self.verticalSlider_2.setObjectName(u"verticalSlider_2")
+        self.verticalSlider_2.setValue(50)
+        self.verticalSlider_2.setOrientation(Qt.Vertical)
 
-        self.dockWidget.setWidget(self.dockWidgetContents)
-        MainWindow.addDockWidget(Qt.RightDockWidgetArea, self.dockWidget)
+        self.gridLayout_18.addWidget(self.verticalSlider_2, 0, 3, 1, 1)
 
-        self.menubar.addAction(self.menuStyles.menuAction())
-        self.menubar.addAction(self.menumenu.menuAction())
-        self.menubar.addAction(self.menumenu2.menuAction())
-        self.menubar.addAction(self.menumenu_disabled.menuAction())
-        self.menumenu.addAction(self.menuSubmenu.menuAction())
-        self.menumenu.addAction(self.actionSubmenu_2)
-        self.menumenu.addSeparator()
-        self.menumenu.addAction(self.actionSubmenu_3)
-        self.menumenu.addAction(self.actiondissabled)
-        self.menuSubmenu.addAction(self.actionSUBSUB)
-        self.menuSubmenu.addAction(self.actionSUBSUB_2)
-        self.menuSubmenu.addSeparator()
-        self.menuSubmenu.addAction(self.actionSUBSUB_3)
-        self.menumenu2.addAction(self.actionSubmenu)
-        self.menumenu2.addAction(self.actionSubmenu_4)
-        self.menumenu2.addAction(self.actionSubmenu_5)
-        self.toolBar.addAction(self.actionToolbar)
-        self.toolBar.addAction(self.actionSelected)
-        self.toolBar.addSeparator()
-        self.toolBar.addAction(self.actionaction)
-        self.toolBar.addAction(self.actionaction2)
-        self.toolBar.addAction(self.actionaction3)
-        self.toolBar_vertical.addAction(self.actionToolbar)
-        self.toolBar_vertical.addAction(self.actionSelected)
+        self.horizontalSpacer_2 = QSpacerItem(32, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
 
-        self.retranslateUi(MainWindow)
+        self.gridLayout_18.addItem(self.horizontalSpacer_2, 0, 4, 1, 1)
+    # setupPage_page_5
 
-        self.tabWidget_2.setCurrentIndex(0)
-        self.toolBox.setCurrentIndex(1)
-        self.tabWidget_4.setCurrentIndex(0)
-        self.tabWidget_3.setCurrentIndex(0)
-        self.tabWidget.setCurrentIndex(0)
-        self.stackedWidget.setCurrentIndex(0)
-        self.tabWidget_5.setCurrentIndex(0)
-        self.tabWidget_6.setCurrentIndex(0)
+    def retranslatePage_page_5(self, MainWindow):
+        pass
+    # retranslatePage_page_5
 
+    def setupPage_tab_15(self, MainWindow):
+        self.gridLayout_29 = QGridLayout(self.tab_15)
+        self.gridLayout_29.setObjectName(u"gridLayout_29")
+        self.widget = QWidget(self.tab_15)
+        self.widget.setObjectName(u"widget")
+        self.gridLayout_34 = QGridLayout(self.widget)
+        self.gridLayout_34.setObjectName(u"gridLayout_34")
 
-        QMetaObject.connectSlotsByName(MainWindow)
-    # setupUi
-
-    def retranslateUi(self, MainWindow):
-        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"Qt Material", None))
-        self.actionSubmenu_2.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
-        self.actionSubmenu_3.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
-        self.actionSUBSUB.setText(QCoreApplication.translate("MainWindow", u"SUBSUB", None))
-        self.actionSUBSUB_2.setText(QCoreApplication.translate("MainWindow", u"SUBSUB", None))
-        self.actionSUBSUB_3.setText(QCoreApplication.translate("MainWindow", u"SUBSUB", None))
-        self.actiondissabled.setText(QCoreApplication.translate("MainWindow", u"dissabled", None))
-        self.actionSubmenu.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
-        self.actionSubmenu_4.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
-        self.actionSubmenu_5.setText(QCoreApplication.translate("MainWindow", u"Submenu", None))
-        self.actionToolbar.setText(QCoreApplication.translate("MainWindow", u"Qt Material Theme", None))
-#if QT_CONFIG(tooltip)
-        self.actionToolbar.setToolTip(QCoreApplication.translate("MainWindow", u"Qt Material Theme", None))
-#endif // QT_CONFIG(tooltip)
-        self.actionSelected.setText(QCoreApplication.translate("MainWindow", u"Selected", None))
-        self.actionaction.setText(QCoreApplication.translate("MainWindow", u"action", None))
-        self.actionaction2.setText(QCoreApplication.translate("MainWindow", u"action2", None))
-        self.actionaction3.setText(QCoreApplication.translate("MainWindow", u"action3", None))
-        self.toolBox.setItemText(self.toolBox.indexOf(self.page_3), QCoreApplication.translate("MainWindow", u"Date controls", None))
-        self.label_3.setText(QCoreApplication.translate("MainWindow", u"Material theme", None))
-        self.label.setText(QCoreApplication.translate("MainWindow", u"Material theme", None))
-        self.comboBox_4.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_4.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_4.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_4.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_4.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item", None))
-
-        self.comboBox_3.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_3.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_3.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_3.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_3.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_3.setItemText(5, QCoreApplication.translate("MainWindow", u"New Item", None))
+        self.gridLayout_29.addWidget(self.widget, 0, 0, 1, 1)
+    # setupPage_tab_15
 
-        self.lineEdit_2.setText(QCoreApplication.translate("MainWindow", u"Lorem ipsum dolor sit amet", None))
-        self.lineEdit_3.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Placeholder text", None))
-        self.comboBox_6.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item1", None))
-        self.comboBox_6.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item2", None))
-        self.comboBox_6.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item3", None))
-        self.comboBox_6.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item4", None))
-        self.comboBox_6.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item5", None))
-        self.comboBox_6.setItemText(5, QCoreApplication.translate("MainWindow", u"New Item6", None))
-        self.comboBox_6.setItemText(6, QCoreApplication.translate("MainWindow", u"New Item7", None))
+    def retranslatePage_tab_15(self, MainWindow):
+        pass
+    # retranslatePage_tab_15
 
-        self.comboBox.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item", None))
+    def setupPage_tab_16(self, MainWindow):
+        self.gridLayout_30 = QGridLayout(self.tab_16)
+        self.gridLayout_30.setObjectName(u"gridLayout_30")
+        self.frame_6 = QFrame(self.tab_16)
+        self.frame_6.setObjectName(u"frame_6")
+        self.frame_6.setFrameShape(QFrame.StyledPanel)
+        self.frame_6.setFrameShadow(QFrame.Raised)
 
-        self.comboBox.setCurrentText(QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.lineEdit.setText(QCoreApplication.translate("MainWindow", u"Lorem ipsum dolor sit amet", None))
-        self.comboBox_2.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item1", None))
-        self.comboBox_2.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item2", None))
-        self.comboBox_2.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item3", None))
-        self.comboBox_2.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item4", None))
-        self.comboBox_2.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item5", None))
-        self.comboBox_2.setItemText(5, QCoreApplication.translate("MainWindow", u"New Item6", None))
-        self.comboBox_2.setItemText(6, QCoreApplication.translate("MainWindow", u"New Item7", None))
+        self.gridLayout_30.addWidget(self.frame_6, 0, 0, 1, 1)
+    # setupPage_tab_16
 
-        self.comboBox_5.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item1", None))
-        self.comboBox_5.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item2", None))
-        self.comboBox_5.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item3", None))
-        self.comboBox_5.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item4", None))
-        self.comboBox_5.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item5", None))
-        self.comboBox_5.setItemText(5, QCoreApplication.translate("MainWindow", u"New Item6", None))
-        self.comboBox_5.setItemText(6, QCoreApplication.translate("MainWindow", u"New Item7", None))
+    def retranslatePage_tab_16(self, MainWindow):
+        pass
+    # retranslatePage_tab_16
 
-        self.lineEdit_4.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Placeholder text", None))
-        self.comboBox_7.setItemText(0, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_7.setItemText(1, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_7.setItemText(2, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_7.setItemText(3, QCoreApplication.translate("MainWindow", u"New Item", None))
-        self.comboBox_7.setItemText(4, QCoreApplication.translate("MainWindow", u"New Item", None))
+    def setupPage_tab_5(self, MainWindow):
+        self.gridLayout_8 = QGridLayout(self.tab_5)
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+    # setupPage_tab_5
 
-        self.label_2.setText(QCoreApplication.translate("MainWindow", u"Material theme", None))
-        self.pushButton_18.setText(QCoreApplication.translate("MainWindow", u"Danger", None))
-        self.pushButton_18.setProperty("class", QCoreApplication.translate("MainWindow", u"danger", None))
-        self.pushButton_22.setText(QCoreApplication.translate("MainWindow", u"Success", None))
-        self.pushButton_22.setProperty("class", QCoreApplication.translate("MainWindow", u"success", None))
-        self.pushButton_19.setText(QCoreApplication.translate("MainWindow", u"Warning", None))
-        self.pushButton_19.setProperty("class", QCoreApplication.translate("MainWindow", u"warning", None))
-        self.pushButton_21.setText(QCoreApplication.translate("MainWindow", u"Warning", None))
-        self.pushButton_21.setProperty("class", QCoreApplication.translate("MainWindow", u"warning", None))
-        self.pushButton_20.setText(QCoreApplication.translate("MainWindow", u"Success", None))
-        self.pushButton_20.setProperty("class", QCoreApplication.translate("MainWindow", u"success", None))
-        self.pushButton_23.setText(QCoreApplication.translate("MainWindow", u"Danger", None))
-        self.pushButton_23.setProperty("class", QCoreApplication.translate("MainWindow", u"danger", None))
-        self.toolBox.setItemText(self.toolBox.indexOf(self.page_4), QCoreApplication.translate("MainWindow", u"Inputs", None))
-        self.tabWidget_2.setTabText(self.tabWidget_2.indexOf(self.tab), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_2.setTabText(self.tabWidget_2.indexOf(self.tab_2), QCoreApplication.translate("MainWindow", u"Long Page Name", None))
-        self.groupBox.setTitle(QCoreApplication.translate("MainWindow", u"Buttons", None))
-#if QT_CONFIG(tooltip)
-        self.pushButton.setToolTip(QCoreApplication.translate("MainWindow", u"Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.", None))
-#endif // QT_CONFIG(tooltip)
-        self.pushButton.setText(QCoreApplication.translate("MainWindow", u"PushButton", None))
-        self.pushButton_3.setText(QCoreApplication.translate("MainWindow", u"Checked", None))
-        self.pushButton_6.setText(QCoreApplication.translate("MainWindow", u"Disabled", None))
-        self.pushButton_7.setText(QCoreApplication.translate("MainWindow", u"Disable checked", None))
-        self.pushButton_11.setText(QCoreApplication.translate("MainWindow", u"Flat", None))
-        self.pushButton_5.setText(QCoreApplication.translate("MainWindow", u"Flat checkeable", None))
-        self.pushButton_4.setText(QCoreApplication.translate("MainWindow", u"Flat disabled", None))
-        self.groupBox_2.setTitle(QCoreApplication.translate("MainWindow", u"Radio", None))
-        self.radioButton_2.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
-        self.radioButton_3.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
-        self.radioButton.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
-        self.radioButton_4.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
-        self.groupBox_3.setTitle(QCoreApplication.translate("MainWindow", u"Check", None))
-        self.checkBox_3.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
-        self.checkBox_2.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
-        self.checkBox_4.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
-        self.checkBox.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
-        self.tabWidget_4.setTabText(self.tabWidget_4.indexOf(self.tab_11), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.radioButton_7.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
-        self.radioButton_5.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
-        self.radioButton_6.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
-        self.radioButton_8.setText(QCoreApplication.translate("MainWindow", u"RadioButton", None))
-        self.pushButton_2.setText(QCoreApplication.translate("MainWindow", u"PushButton", None))
-        self.pushButton_12.setText(QCoreApplication.translate("MainWindow", u"Checked", None))
-        self.pushButton_17.setText(QCoreApplication.translate("MainWindow", u"Flat disabled", None))
-        self.pushButton_14.setText(QCoreApplication.translate("MainWindow", u"Disable checked", None))
-        self.pushButton_13.setText(QCoreApplication.translate("MainWindow", u"Disabled", None))
-        self.pushButton_16.setText(QCoreApplication.translate("MainWindow", u"Flat checkeable", None))
-        self.pushButton_15.setText(QCoreApplication.translate("MainWindow", u"Flat", None))
-        self.checkBox_5.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
-        self.checkBox_6.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
-        self.checkBox_7.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
-        self.checkBox_8.setText(QCoreApplication.translate("MainWindow", u"CheckBox", None))
-        self.tabWidget_4.setTabText(self.tabWidget_4.indexOf(self.tab_13), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_4.setTabText(self.tabWidget_4.indexOf(self.tab_12), QCoreApplication.translate("MainWindow", u"Long Page Name", None))
+    def retranslatePage_tab_5(self, MainWindow):
+        pass
+    # retranslatePage_tab_5
 
-        __sortingEnabled = self.listWidget_2.isSortingEnabled()
-        self.listWidget_2.setSortingEnabled(False)
-        ___qlistwidgetitem = self.listWidget_2.item(0)
-        ___qlistwidgetitem.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        ___qlistwidgetitem1 = self.listWidget_2.item(1)
-        ___qlistwidgetitem1.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        ___qlistwidgetitem2 = self.listWidget_2.item(2)
-        ___qlistwidgetitem2.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        self.listWidget_2.setSortingEnabled(__sortingEnabled)
+    def setupPage_tab_6(self, MainWindow):
+        self.gridLayout_10 = QGridLayout(self.tab_6)
+        self.gridLayout_10.setObjectName(u"gridLayout_10")
+        self.tabWidget_5 = QTabWidget(self.tab_6)
+        self.tabWidget_5.setObjectName(u"tabWidget_5")
+        self.tabWidget_5.setTabPosition(QTabWidget.East)
+        self.tab_20 = QWidget()
+        self.tab_20.setObjectName(u"tab_20")
 
-        ___qtreewidgetitem = self.treeWidget.headerItem()
-        ___qtreewidgetitem.setText(0, QCoreApplication.translate("MainWindow", u"Material Tree", None));
+        self.tabWidget_5.addTab(self.tab_20, "")
+        self.tab_26 = QWidget()
+        self.tab_26.setObjectName(u"tab_26")
+        self.tabWidget_5.addTab(self.tab_26, "")
+        self.tab_21 = QWidget()
+        self.tab_21.setObjectName(u"tab_21")
+        self.tabWidget_5.addTab(self.tab_21, "")
+        self.tab_27 = QWidget()
+        self.tab_27.setObjectName(u"tab_27")
+        self.tabWidget_5.addTab(self.tab_27, "")
 
-        __sortingEnabled1 = self.treeWidget.isSortingEnabled()
-        self.treeWidget.setSortingEnabled(False)
-        ___qtreewidgetitem1 = self.treeWidget.topLevelItem(0)
-        ___qtreewidgetitem1.setText(0, QCoreApplication.translate("MainWindow", u"Tree #1", None));
-        ___qtreewidgetitem2 = ___qtreewidgetitem1.child(0)
-        ___qtreewidgetitem2.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #1", None));
-        ___qtreewidgetitem3 = ___qtreewidgetitem1.child(1)
-        ___qtreewidgetitem3.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #2", None));
-        ___qtreewidgetitem4 = ___qtreewidgetitem3.child(0)
-        ___qtreewidgetitem4.setText(0, QCoreApplication.translate("MainWindow", u"New Subitem", None));
-        ___qtreewidgetitem5 = ___qtreewidgetitem3.child(1)
-        ___qtreewidgetitem5.setText(0, QCoreApplication.translate("MainWindow", u"New Item", None));
-        ___qtreewidgetitem6 = self.treeWidget.topLevelItem(1)
-        ___qtreewidgetitem6.setText(0, QCoreApplication.translate("MainWindow", u"Tree #2", None));
-        ___qtreewidgetitem7 = self.treeWidget.topLevelItem(2)
-        ___qtreewidgetitem7.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #4", None));
-        ___qtreewidgetitem8 = ___qtreewidgetitem7.child(0)
-        ___qtreewidgetitem8.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #41", None));
-        ___qtreewidgetitem9 = ___qtreewidgetitem7.child(1)
-        ___qtreewidgetitem9.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #42", None));
-        ___qtreewidgetitem10 = self.treeWidget.topLevelItem(3)
-        ___qtreewidgetitem10.setText(0, QCoreApplication.translate("MainWindow", u"Subitem #5", None));
-        ___qtreewidgetitem11 = self.treeWidget.topLevelItem(4)
-        ___qtreewidgetitem11.setText(0, QCoreApplication.translate("MainWindow", u"Tree #3", None));
-        ___qtreewidgetitem12 = self.treeWidget.topLevelItem(5)
-        ___qtreewidgetitem12.setText(0, QCoreApplication.translate("MainWindow", u"Tree #4", None));
-        self.treeWidget.setSortingEnabled(__sortingEnabled1)
+        self.gridLayout_10.addWidget(self.tabWidget_5, 0, 0, 1, 1)
+        self.tabWidget_5.setCurrentIndex(0)
+    # setupPage_tab_6
 
-        ___qtablewidgetitem = self.tableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"Duration", None));
-        ___qtablewidgetitem1 = self.tableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"Datetime", None));
-        ___qtablewidgetitem2 = self.tableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"Name", None));
-        ___qtablewidgetitem3 = self.tableWidget.verticalHeaderItem(0)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"Row-1", None));
-        ___qtablewidgetitem4 = self.tableWidget.verticalHeaderItem(2)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"Row-3", None));
+    def retranslatePage_tab_6(self, MainWindow):
+        self.tabWidget_5.setTabText(self.tabWidget_5.indexOf(self.tab_20), QCoreApplication.translate("MainWindow", u"Tab 1", None))
+        self.tabWidget_5.setTabText(self.tabWidget_5.indexOf(self.tab_26), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_5.setTabText(self.tabWidget_5.indexOf(self.tab_21), QCoreApplication.translate("MainWindow", u"Tab 2", None))
+        self.tabWidget_5.setTabText(self.tabWidget_5.indexOf(self.tab_27), QCoreApplication.translate("MainWindow", u"Page", None))
+    # retranslatePage_tab_6
 
-        __sortingEnabled2 = self.tableWidget.isSortingEnabled()
-        self.tableWidget.setSortingEnabled(False)
-        ___qtablewidgetitem5 = self.tableWidget.item(0, 0)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("MainWindow", u"00:05:02", None));
-        ___qtablewidgetitem6 = self.tableWidget.item(0, 1)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
-        ___qtablewidgetitem7 = self.tableWidget.item(0, 2)
-        ___qtablewidgetitem7.setText(QCoreApplication.translate("MainWindow", u"Unamed-1", None));
-        ___qtablewidgetitem8 = self.tableWidget.item(1, 0)
-        ___qtablewidgetitem8.setText(QCoreApplication.translate("MainWindow", u"00:01:02", None));
-        ___qtablewidgetitem9 = self.tableWidget.item(1, 1)
-        ___qtablewidgetitem9.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
-        ___qtablewidgetitem10 = self.tableWidget.item(1, 2)
-        ___qtablewidgetitem10.setText(QCoreApplication.translate("MainWindow", u"Unamed-2", None));
-        ___qtablewidgetitem11 = self.tableWidget.item(2, 0)
-        ___qtablewidgetitem11.setText(QCoreApplication.translate("MainWindow", u"00:07:02", None));
-        ___qtablewidgetitem12 = self.tableWidget.item(2, 1)
-        ___qtablewidgetitem12.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
-        ___qtablewidgetitem13 = self.tableWidget.item(2, 2)
-        ___qtablewidgetitem13.setText(QCoreApplication.translate("MainWindow", u"Unamed-3", None));
-        self.tableWidget.setSortingEnabled(__sortingEnabled2)
+    def setupPage_tab_20(self, MainWindow):
+        self.gridLayout_25 = QGridLayout(self.tab_20)
+        self.gridLayout_25.setObjectName(u"gridLayout_25")
+        self.tabWidget_6 = QTabWidget(self.tab_20)
+        self.tabWidget_6.setObjectName(u"tabWidget_6")
+        self.tabWidget_6.setTabPosition(QTabWidget.South)
+        self.tab_22 = QWidget()
+        self.tab_22.setObjectName(u"tab_22")
 
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_15), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_16), QCoreApplication.translate("MainWindow", u"Page", None))
-        ___qtablewidgetitem14 = self.tableWidget_2.horizontalHeaderItem(0)
-        ___qtablewidgetitem14.setText(QCoreApplication.translate("MainWindow", u"Duration", None));
-        ___qtablewidgetitem15 = self.tableWidget_2.horizontalHeaderItem(1)
-        ___qtablewidgetitem15.setText(QCoreApplication.translate("MainWindow", u"Datetime", None));
-        ___qtablewidgetitem16 = self.tableWidget_2.horizontalHeaderItem(2)
-        ___qtablewidgetitem16.setText(QCoreApplication.translate("MainWindow", u"Name", None));
-        ___qtablewidgetitem17 = self.tableWidget_2.verticalHeaderItem(0)
-        ___qtablewidgetitem17.setText(QCoreApplication.translate("MainWindow", u"Row-1", None));
-        ___qtablewidgetitem18 = self.tableWidget_2.verticalHeaderItem(2)
-        ___qtablewidgetitem18.setText(QCoreApplication.translate("MainWindow", u"Row-3", None));
+        self.tabWidget_6.addTab(self.tab_22, "")
+        self.tab_23 = QWidget()
+        self.tab_23.setObjectName(u"tab_23")
+        self.tabWidget_6.addTab(self.tab_23, "")
+        self.tab_28 = QWidget()
+        self.tab_28.setObjectName(u"tab_28")
+        self.tabWidget_6.addTab(self.tab_28, "")
+        self.tab_29 = QWidget()
+        self.tab_29.setObjectName(u"tab_29")
+        self.tabWidget_6.addTab(self.tab_29, "")
+        self.tab_30 = QWidget()
+        self.tab_30.setObjectName(u"tab_30")
+        self.tabWidget_6.addTab(self.tab_30, "")
+        self.tab_31 = QWidget()
+        self.tab_31.setObjectName(u"tab_31")
+        self.tabWidget_6.addTab(self.tab_31, "")
+        self.tab_32 = QWidget()
+        self.tab_32.setObjectName(u"tab_32")
+        self.tabWidget_6.addTab(self.tab_32, "")
+        self.tab_33 = QWidget()
+        self.tab_33.setObjectName(u"tab_33")
+        self.tabWidget_6.addTab(self.tab_33, "")
+        self.tab_34 = QWidget()
+        self.tab_34.setObjectName(u"tab_34")
+        self.tabWidget_6.addTab(self.tab_34, "")
+        self.tab_35 = QWidget()
+        self.tab_35.setObjectName(u"tab_35")
+        self.tabWidget_6.addTab(self.tab_35, "")
+        self.tab_36 = QWidget()
+        self.tab_36.setObjectName(u"tab_36")
+        self.tabWidget_6.addTab(self.tab_36, "")
+        self.tab_37 = QWidget()
+        self.tab_37.setObjectName(u"tab_37")
+        self.tabWidget_6.addTab(self.tab_37, "")
 
-        __sortingEnabled3 = self.tableWidget_2.isSortingEnabled()
-        self.tableWidget_2.setSortingEnabled(False)
-        ___qtablewidgetitem19 = self.tableWidget_2.item(0, 0)
-        ___qtablewidgetitem19.setText(QCoreApplication.translate("MainWindow", u"00:05:02", None));
-        ___qtablewidgetitem20 = self.tableWidget_2.item(0, 1)
-        ___qtablewidgetitem20.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
-        ___qtablewidgetitem21 = self.tableWidget_2.item(0, 2)
-        ___qtablewidgetitem21.setText(QCoreApplication.translate("MainWindow", u"Unamed-1", None));
-        ___qtablewidgetitem22 = self.tableWidget_2.item(1, 0)
-        ___qtablewidgetitem22.setText(QCoreApplication.translate("MainWindow", u"00:01:02", None));
-        ___qtablewidgetitem23 = self.tableWidget_2.item(1, 1)
-        ___qtablewidgetitem23.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
-        ___qtablewidgetitem24 = self.tableWidget_2.item(1, 2)
-        ___qtablewidgetitem24.setText(QCoreApplication.translate("MainWindow", u"Unamed-2", None));
-        ___qtablewidgetitem25 = self.tableWidget_2.item(2, 0)
-        ___qtablewidgetitem25.setText(QCoreApplication.translate("MainWindow", u"00:07:02", None));
-        ___qtablewidgetitem26 = self.tableWidget_2.item(2, 1)
-        ___qtablewidgetitem26.setText(QCoreApplication.translate("MainWindow", u"2020-04-27 17:31:34", None));
-        ___qtablewidgetitem27 = self.tableWidget_2.item(2, 2)
-        ___qtablewidgetitem27.setText(QCoreApplication.translate("MainWindow", u"Unamed-3", None));
-        self.tableWidget_2.setSortingEnabled(__sortingEnabled3)
+        self.gridLayout_25.addWidget(self.tabWidget_6, 0, 0, 1, 1)
+        self.tabWidget_6.setCurrentIndex(0)
+    # setupPage_tab_20
 
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_18), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_19), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_14), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_5), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_7.setTabText(self.tabWidget_7.indexOf(self.tab_24), QCoreApplication.translate("MainWindow", u"Tab 1", None))
-        self.tabWidget_7.setTabText(self.tabWidget_7.indexOf(self.tab_38), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_7.setTabText(self.tabWidget_7.indexOf(self.tab_39), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_7.setTabText(self.tabWidget_7.indexOf(self.tab_25), QCoreApplication.translate("MainWindow", u"Tab 2", None))
+    def retranslatePage_tab_20(self, MainWindow):
         self.tabWidget_6.setTabText(self.tabWidget_6.indexOf(self.tab_22), QCoreApplication.translate("MainWindow", u"Tab 1", None))
         self.tabWidget_6.setTabText(self.tabWidget_6.indexOf(self.tab_23), QCoreApplication.translate("MainWindow", u"Tab 2", None))
         self.tabWidget_6.setTabText(self.tabWidget_6.indexOf(self.tab_28), QCoreApplication.translate("MainWindow", u"Page", None))
@@ -1494,62 +1655,36 @@ class Ui_MainWindow(object):
         self.tabWidget_6.setTabText(self.tabWidget_6.indexOf(self.tab_35), QCoreApplication.translate("MainWindow", u"Page", None))
         self.tabWidget_6.setTabText(self.tabWidget_6.indexOf(self.tab_36), QCoreApplication.translate("MainWindow", u"Page", None))
         self.tabWidget_6.setTabText(self.tabWidget_6.indexOf(self.tab_37), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_5.setTabText(self.tabWidget_5.indexOf(self.tab_20), QCoreApplication.translate("MainWindow", u"Tab 1", None))
-        self.tabWidget_5.setTabText(self.tabWidget_5.indexOf(self.tab_26), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_5.setTabText(self.tabWidget_5.indexOf(self.tab_21), QCoreApplication.translate("MainWindow", u"Tab 2", None))
-        self.tabWidget_5.setTabText(self.tabWidget_5.indexOf(self.tab_27), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_6), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_7), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_17), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_8), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_9), QCoreApplication.translate("MainWindow", u"Page", None))
-        self.tabWidget_3.setTabText(self.tabWidget_3.indexOf(self.tab_10), QCoreApplication.translate("MainWindow", u"Long Page Name", None))
-        self.menumenu.setTitle(QCoreApplication.translate("MainWindow", u"Menu", None))
-        self.menuSubmenu.setTitle(QCoreApplication.translate("MainWindow", u"Submenu", None))
-        self.menumenu2.setTitle(QCoreApplication.translate("MainWindow", u"Menu2", None))
-        self.menumenu_disabled.setTitle(QCoreApplication.translate("MainWindow", u"Menu disabled", None))
-        self.menuStyles.setTitle(QCoreApplication.translate("MainWindow", u"Styles", None))
-        self.dockWidget_6.setWindowTitle(QCoreApplication.translate("MainWindow", u"Top Dock", None))
+    # retranslatePage_tab_20
 
-        __sortingEnabled4 = self.listWidget.isSortingEnabled()
-        self.listWidget.setSortingEnabled(False)
-        ___qlistwidgetitem3 = self.listWidget.item(0)
-        ___qlistwidgetitem3.setText(QCoreApplication.translate("MainWindow", u"New Item (editable)", None));
-        ___qlistwidgetitem4 = self.listWidget.item(1)
-        ___qlistwidgetitem4.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        ___qlistwidgetitem5 = self.listWidget.item(2)
-        ___qlistwidgetitem5.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        ___qlistwidgetitem6 = self.listWidget.item(3)
-        ___qlistwidgetitem6.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        ___qlistwidgetitem7 = self.listWidget.item(4)
-        ___qlistwidgetitem7.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        ___qlistwidgetitem8 = self.listWidget.item(5)
-        ___qlistwidgetitem8.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        ___qlistwidgetitem9 = self.listWidget.item(6)
-        ___qlistwidgetitem9.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        ___qlistwidgetitem10 = self.listWidget.item(7)
-        ___qlistwidgetitem10.setText(QCoreApplication.translate("MainWindow", u"New Item", None));
-        self.listWidget.setSortingEnabled(__sortingEnabled4)
+    def setupPage_tab_22(self, MainWindow):
+        self.gridLayout_28 = QGridLayout(self.tab_22)
+        self.gridLayout_28.setObjectName(u"gridLayout_28")
+        self.tabWidget_7 = QTabWidget(self.tab_22)
+        self.tabWidget_7.setObjectName(u"tabWidget_7")
+        self.tabWidget_7.setTabPosition(QTabWidget.West)
+        self.tab_24 = QWidget()
+        self.tab_24.setObjectName(u"tab_24")
+        self.tabWidget_7.addTab(self.tab_24, "")
+        self.tab_38 = QWidget()
+        self.tab_38.setObjectName(u"tab_38")
+        self.tabWidget_7.addTab(self.tab_38, "")
+        self.tab_39 = QWidget()
+        self.tab_39.setObjectName(u"tab_39")
+        self.tabWidget_7.addTab(self.tab_39, "")
+        self.tab_25 = QWidget()
+        self.tab_25.setObjectName(u"tab_25")
+        self.tabWidget_7.addTab(self.tab_25, "")
 
-        self.toolBar.setWindowTitle(QCoreApplication.translate("MainWindow", u"toolBar", None))
-        self.toolBar_vertical.setWindowTitle(QCoreApplication.translate("MainWindow", u"toolBar_2", None))
-        self.dockWidget.setWindowTitle(QCoreApplication.translate("MainWindow", u"Right Doc", None))
-        self.textEdit.setMarkdown(QCoreApplication.translate("MainWindow", u"textEdit Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do\n"
-"eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim\n"
-"veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo\n"
-"consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse\n"
-"cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non\n"
-"proident, sunt in culpa qui officia deserunt mollit anim id est laborum.\n"
-"\n"
-"", None))
-        self.textEdit.setHtml(QCoreApplication.translate("MainWindow", u"<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><meta charset=\"utf-8\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:'Segoe UI'; font-size:9pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:6px; margin-bottom:6px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">textEdit Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.</p></body></html>", None))
-        self.plainTextEdit.setPlainText(QCoreApplication.translate("MainWindow", u"plainTextEdit\n"
-"Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.", None))
-    # retranslateUi
+        self.gridLayout_28.addWidget(self.tabWidget_7, 0, 0, 1, 1)
+    # setupPage_tab_22
+
+    def retranslatePage_tab_22(self, MainWindow):
+        self.tabWidget_7.setTabText(self.tabWidget_7.indexOf(self.tab_24), QCoreApplication.translate("MainWindow", u"Tab 1", None))
+        self.tabWidget_7.setTabText(self.tabWidget_7.indexOf(self.tab_38), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_7.setTabText(self.tabWidget_7.indexOf(self.tab_39), QCoreApplication.translate("MainWindow", u"Page", None))
+        self.tabWidget_7.setTabText(self.tabWidget_7.indexOf(self.tab_25), QCoreApplication.translate("MainWindow", u"Tab 2", None))
+    # retranslatePage_tab_22
 
 
 
@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import proxi.config as config
 import proxi.console as console
-from typing import Callable
+import proxi.ui.notifications as notifications
+from typing import Callable, TypeVar
 from PySide6.QtWidgets import (
+    QApplication,
     QWidget,
     QMessageBox
 )
@@ -26,6 +29,28 @@ class StandardButton(QMessageBox.StandardButton):
     '''Standard buttons for dialogs'''
 
 
+def isHeadless() -> bool:
+    '''Should dialogs resolve to their defaults without showing anything? See `config.Dialogs.headless`'''
+
+    return config.Dialogs.headless or QApplication.instance() is None
+
+
+def setHeadless(headless: bool) -> None:
+    '''Toggle headless mode for the current session. Eg. around batch/automation runs'''
+
+    config.Dialogs.headless = headless
+
+
+ResultType = TypeVar('ResultType')
+
+
+def _headlessResult(title: str, message: str, result: ResultType) -> ResultType:
+    '''Log a dialog that was resolved without user interaction'''
+
+    console.log(f'[Headless] {title}: {message} -> {getattr(result, "name", result)}')
+    return result
+
+
 def messagebox(title: str, message: str, parent: QWidget=None, buttons=StandardButton.Ok, default=StandardButton.Ok, consolePrint: bool=False) -> StandardButton:
     '''Display a modal information-style pop up for the user
  
@@ -43,11 +68,14 @@ def messagebox(title: str, message: str, parent: QWidget=None, buttons=StandardB
     if consolePrint:
         console.log(message)
 
+    if isHeadless():
+        return _headlessResult(title, message, default) # type: ignore
+
     return QMessageBox.information(parent, title, message, buttons, default) # type: ignore
 
 
 def notify(title: str, message: str, parent: QWidget=None, consolePrint: bool=True):
-    '''Alias for `messagebox` with a single OK button
+    '''Non-modal toast notification (see `proxi.ui.notifications`), in place of a `messagebox` with a single OK button. Never blocks
 
     Args:
         title (string): Heading
@@ -56,10 +84,11 @@ def notify(title: str, message: str, parent: QWidget=None, consolePrint: bool=Tr
         consolePrint (bool, optional): Print message to console. Defaults to True
     
     Returns:
-        QtWidgets.QMessageBox.StandardButton: Result of interaction
+        QtWidgets.QMessageBox.StandardButton: Always `Ok`
     '''
 
-    return messagebox(title, message, parent=parent, buttons=StandardButton.Ok, default=StandardButton.Ok, consolePrint=consolePrint)
+    notifications.toast(title, message, parent=parent, consolePrint=consolePrint)
+    return StandardButton.Ok
 
 
 def warn(title: str, message: str, parent: QWidget=None, buttons=StandardButton.Ok, default=StandardButton.Ok) -> StandardButton:
@@ -77,6 +106,10 @@ def warn(title: str, message: str, parent: QWidget=None, buttons=StandardButton.
     '''
 
     console.warning(message)
+
+    if isHeadless():
+        return _headlessResult(title, message, default) # type: ignore
+
     return QMessageBox.warning(parent, title, message, buttons, default) # type: ignore
 
 
@@ -89,6 +122,7 @@ def error(title: str, message: str, parent: QWidget=None, buttons: StandardButto
         parent (QtWidget): Parent object, if any
         buttons (QtWidgets.QMessageBox.StandardButton|...): Collection of buttons to display, separated by a bitwise OR operator (|)
         default (QtWidgets.QMessageBox.StandardButton): Default button for various non-mouse interactions like pressing Enter key, etc. Must be present in the `buttons` collection
+        throw (bool, optional): Raise `RuntimeError` after the dialog is dismissed (or immediately, in headless mode). Defaults to True.
 
     Raises:
         RuntimeError
@@ -98,7 +132,11 @@ def error(title: str, message: str, parent: QWidget=None, buttons: StandardButto
     '''
 
     console.error(message)
-    result = QMessageBox.critical(parent, title, message, buttons, default) # type: ignore
+
+    if isHeadless():
+        result = _headlessResult(title, message, default)
+    else:
+        result = QMessageBox.critical(parent, title, message, buttons, default) # type: ignore
 
     if throw:
         raise RuntimeError(message)
@@ -121,6 +159,9 @@ def questionYesNo(title: str, message: str, parent: QWidget=None, dialogStyle: o
 
     console.log(f'{title}: {message}')
 
+    if isHeadless():
+        return _headlessResult(title, message, False) # type: ignore
+
     _dialogStyle: Callable = dialogStyle or DialogStyle.question # type: ignore
     reply = _dialogStyle(parent, title, message, StandardButton.Yes|StandardButton.No, StandardButton.No)
     if reply == StandardButton.Yes:
@@ -144,6 +185,9 @@ def questionOkCancel(title: str, message: str, parent: QWidget=None, dialogStyle
 
     console.log(f'{title}: {message}')
 
+    if isHeadless():
+        return _headlessResult(title, message, False) # type: ignore
+
     _dialogStyle: Callable = dialogStyle or DialogStyle.question # type: ignore
     reply = _dialogStyle(parent, title, message, StandardButton.Ok|StandardButton.Cancel, StandardButton.Cancel)
     if reply == StandardButton.Ok:
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+'''Live reload for `DEV_MODE`: watch `proxi` for changes, recompile changed .ui files, reload changed modules and re-show their windows'''
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import proxi.dev as dev
+import proxi.config as config
+import proxi.console as console
+import proxi.ui as ui
+import proxi.ui.windowManager as windowManager
+from PySide6 import QtCore
+from typing import Callable
+
+
+PROXI_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+class QtFileWatcher(QtCore.QObject):
+
+    changed = QtCore.Signal(list, float) # Changed files, `time.perf_counter` of the first change in the burst
+
+    def __init__(self, root: str, extensions: tuple[str, ...], parent: QtCore.QObject|None=None):
+        '''Watch a directory tree for changed files, emitting `changed` once per burst of changes
+
+        Uses native notifications (`QFileSystemWatcher`: inotify on Linux, change notifications on Windows), falling back
+        to polling where those are unavailable. Changes are debounced by `config.LiveReload.debounce`
+
+        Args:
+            root (str): Directory to watch, recursively
+            extensions (tuple[str, ...]): File extensions to report, eg. `('.py', '.ui')`
+            parent (QObject, optional): Parent object. Defaults to None.
+        '''
+
+        super().__init__(parent)
+
+        self.root = root
+        self.extensions = extensions
+        self.polling = False
+        self._watcher: QtCore.QFileSystemWatcher|None = None
+        self._snapshot: dict[str, tuple[int, int]] = {} # Path -> (mtime, size)
+        self._pending: set[str] = set()
+        self._firstChange = 0.0
+
+        self._debounceTimer = QtCore.QTimer(self)
+        self._debounceTimer.setSingleShot(True)
+        self._debounceTimer.timeout.connect(self._flush) # type: ignore
+
+        self._pollTimer = QtCore.QTimer(self)
+        self._pollTimer.timeout.connect(self._poll) # type: ignore
+
+    def start(self, polling: bool=False) -> None:
+        '''Start watching. Falls back to polling if native notifications can't be set up for every path'''
+
+        self.stop()
+        directories, self._snapshot = self._scan()
+
+        if not polling:
+            self._watcher = QtCore.QFileSystemWatcher(self)
+            failed = self._watcher.addPaths(directories + list(self._snapshot))
+            if failed:
+                console.warning(f'Could not watch {len(failed)} path(s) natively, polling for changes instead')
+                self._watcher.deleteLater()
+                self._watcher = None
+                polling = True
+            else:
+                self._watcher.fileChanged.connect(self._onFileChanged) # type: ignore
+                self._watcher.directoryChanged.connect(self._onDirectoryChanged) # type: ignore
+
+        self.polling = polling
+        if polling:
+            self._pollTimer.start(config.LiveReload.pollInterval)
+
+        console.debug(f'Watching {len(self._snapshot)} file(s) in {self.root} ({"polling" if polling else "native"})')
+
+    def stop(self) -> None:
+        self._pollTimer.stop()
+        self._debounceTimer.stop()
+        self._pending.clear()
+        if self._watcher is not None:
+            self._watcher.deleteLater()
+            self._watcher = None
+
+    def isActive(self) -> bool:
+        return self._watcher is not None or self._pollTimer.isActive()
+
+    def _isWatched(self, path: str) -> bool:
+        return path.endswith(self.extensions) and '__pycache__' not in path
+
+    def _stat(self, path: str) -> tuple[int, int]|None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def _scan(self) -> tuple[list[str], dict[str, tuple[int, int]]]:
+        '''Directories, and watched files with their (mtime, size)'''
+
+        directories: list[str] = []
+        snapshot: dict[str, tuple[int, int]] = {}
+        for root, dirs, files in os.walk(self.root):
+            dirs[:] = [x for x in dirs if x != '__pycache__']
+            directories.append(root)
+            for file in files:
+                path = os.path.join(root, file)
+                if self._isWatched(path):
+                    stamp = self._stat(path)
+                    if stamp is not None:
+                        snapshot[path] = stamp
+
+        return directories, snapshot
+
+    def _onFileChanged(self, path: str) -> None:
+        # Editors saving via write-and-rename drop the file from the watch list
+        if self._watcher is not None and os.path.exists(path) and path not in self._watcher.files():
+            self._watcher.addPath(path)
+
+        self._queue(path)
+
+    def _onDirectoryChanged(self, directory: str) -> None:
+        '''Files added, removed or renamed: compare the directory against the snapshot'''
+
+        try:
+            entries = [os.path.join(directory, x) for x in os.listdir(directory)]
+        except OSError:
+            entries = []
+
+        for path in entries:
+            if os.path.isdir(path):
+                if self._watcher is not None and os.path.basename(path) != '__pycache__' and path not in self._watcher.directories():
+                    self._watcher.addPath(path)
+                continue
+
+            if not self._isWatched(path):
+                continue
+
+            stamp = self._stat(path)
+            if stamp is not None and self._snapshot.get(path) != stamp:
+                if path not in self._snapshot and self._watcher is not None:
+                    self._watcher.addPath(path)
+                self._snapshot[path] = stamp
+                self._queue(path)
+
+        existing = set(entries)
+        for path in [x for x in self._snapshot if os.path.dirname(x) == directory and x not in existing]:
+            del self._snapshot[path]
+            self._queue(path)
+
+    def _poll(self) -> None:
+        _, snapshot = self._scan()
+        for path in snapshot.keys() | self._snapshot.keys():
+            if snapshot.get(path) != self._snapshot.get(path):
+                self._queue(path)
+
+        self._snapshot = snapshot
+
+    def _queue(self, path: str) -> None:
+        if not self._isWatched(path):
+            return
+
+        if not self._pending:
+            self._firstChange = time.perf_counter()
+
+        self._pending.add(path)
+        self._debounceTimer.start(config.LiveReload.debounce) # Restart: wait for the burst to end
+
+    def _flush(self) -> None:
+        paths = sorted(self._pending)
+        self._pending.clear()
+        if paths:
+            self.changed.emit(paths, self._firstChange) # type: ignore
+
+
+def _showCallback(instance: windowManager.ManagedWindow, callback: Callable) -> Callable:
+    '''The reloaded version of a window's show callback'''
+
+    module = sys.modules.get(getattr(callback, '__module__', None) or '')
+    name = getattr(callback, '__name__', '')
+    if module is not None and name.isidentifier():
+        return getattr(module, name, callback)
+
+    # Generic callback (eg. a lambda bound to the old class), show the reloaded class instead
+    windowClass = windowManager._resolveClass(windowManager.windowKey(type(instance)))
+    return lambda: windowManager.showWindow(windowClass)
+
+
+def reshowWindows(reloaded: list[str]) -> int:
+    '''Rebuild visible windows whose class, or any of its base classes, comes from a reloaded module
+
+    Returns:
+        int: Number of windows re-shown
+    '''
+
+    reloadedSet = set(reloaded)
+    count = 0
+    for instance, callback in list(ui.OPEN_WINDOWS.items()):
+        if not windowManager.isAlive(instance) or not instance.isVisible():
+            continue
+
+        if not any(x.__module__ in reloadedSet for x in type(instance).__mro__):
+            continue
+
+        try:
+            callback = _showCallback(instance, callback)
+            windowManager.discardAll(type(instance))
+            callback()
+            count += 1
+        except Exception as e:
+            console.error(f'Could not re-show window {instance}: {e}')
+
+    return count
+
+
+class LiveReload(QtCore.QObject):
+
+    def __init__(self, root: str=PROXI_DIR, parent: QtCore.QObject|None=None):
+        '''Reload changed modules when files below `root` change, see `apply`'''
+
+        super().__init__(parent)
+
+        self.watcher = QtFileWatcher(root, config.LiveReload.extensions, self)
+        self.watcher.changed.connect(self.apply) # type: ignore
+        self.latencies: list[float] = [] # Seconds from the first change to re-shown windows, per reload
+
+    def start(self) -> None:
+        self.watcher.start(polling=config.LiveReload.polling)
+
+    def stop(self) -> None:
+        self.watcher.stop()
+
+    def apply(self, paths: list[str], firstChange: float|None=None) -> list[str]:
+        '''Recompile changed .ui files, reload changed modules (and their importers) and re-show affected windows
+
+        Args:
+            paths (list[str]): Changed files
+            firstChange (float, optional): `time.perf_counter` of the first change, for latency logging. Defaults to None.
+
+        Returns:
+            list[str]: Reloaded modules
+        '''
+
+        start = time.perf_counter()
+
+        uiFiles = [x for x in paths if x.endswith('.ui') and os.path.isfile(x)]
+        if uiFiles:
+            ui.rebuildUiFiles(uiFiles)
+
+        try:
+            reloaded = dev.reloadChanged(onlyInDevMode=False)
+        except Exception as e:
+            console.error(f'Live reload failed: {e}')
+            return []
+
+        if not reloaded:
+            return []
+
+        windows = reshowWindows(reloaded)
+        end = time.perf_counter()
+        latency = end - (firstChange or start)
+        self.latencies.append(latency)
+        console.log(
+            f'Live reload: {len(paths)} changed file(s), {len(reloaded)} module(s) reloaded, {windows} window(s) re-shown '
+            f'in {(end - start) * 1000:.1f} ms ({latency * 1000:.1f} ms after the first change)',
+            timestamp=True
+        )
+
+        return reloaded
+
+
+# Keep the watcher while allowing for module reload without resetting
+try:
+    LIVE_RELOAD # type: ignore
+except NameError:
+    LIVE_RELOAD: LiveReload|None = None
+
+
+def start() -> LiveReload|None:
+    '''Start live reloading, in `DEV_MODE` only (and if `config.LiveReload.enabled`)
+
+    Returns:
+        LiveReload|None: The running instance, None if not enabled
+    '''
+
+    global LIVE_RELOAD
+
+    if not dev.DEV_MODE or not config.LiveReload.enabled:
+        return None
+
+    if LIVE_RELOAD is None:
+        LIVE_RELOAD = LiveReload()
+
+    if not LIVE_RELOAD.watcher.isActive():
+        LIVE_RELOAD.start()
+
+    return LIVE_RELOAD
+
+
+def stop() -> None:
+    if LIVE_RELOAD is not None:
+        LIVE_RELOAD.stop()
\ No newline at end of file
@@ -24,8 +24,8 @@ TOPLEVELMENUS = [
             MenuSection('Developer', 'Developer', [
                 MenuItem('Toggle developer mode', 'import proxi.debug as x; x.toggleDevMode()', 'Toggles developer mode on/off'),
                 MenuSeparator(),
-                MenuItem('Material UI demo window', 'import proxi.ui.demoMainWindow as x; {} x.showWindow()'.format(dev.insertReloadForDev('x')), 'Launch a demo window showcasing the Qt Material integration'),
-                MenuItem('Debug System Time', 'import proxi.ui.debugSystemTime as x; {} x.showWindow()'.format(dev.insertReloadForDev('x')), 'Launch a demo window showcasing the Qt Material integration')
+                MenuItem('Material UI demo window', 'import proxi.ui.demoMainWindow as x; {} x.showWindow()'.format(dev.insertReloadForDev()), 'Launch a demo window showcasing the Qt Material integration'),
+                MenuItem('Debug System Time', 'import proxi.ui.debugSystemTime as x; {} x.showWindow()'.format(dev.insertReloadForDev()), 'Launch a demo window showcasing the Qt Material integration')
             ])
         ]
     )    
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+'''Non-modal toast notifications, queued with rate limiting and de-duplication'''
+
+from __future__ import annotations
+
+import time
+import proxi.config as config
+import proxi.console as console
+from collections import deque
+from PySide6 import QtCore, QtWidgets
+
+
+class Level:
+    '''Toast levels, used as the `level` dynamic property for styling'''
+
+    info = 'info'
+    warning = 'warning'
+    error = 'error'
+
+
+STYLESHEET = """
+    QFrame#proxiToast {
+        background-color: rgba(40, 44, 52, 230);
+        border: 1px solid #5c6370;
+        border-radius: 4px;
+    }
+    QFrame#proxiToast[level="warning"] {
+        border-color: #e5c07b;
+    }
+    QFrame#proxiToast[level="error"] {
+        border-color: #e06c75;
+    }
+    QFrame#proxiToast QLabel {
+        color: #dcdfe4;
+        background: transparent;
+        border: none;
+    }
+"""
+
+
+class QtToast(QtWidgets.QFrame):
+
+    dismissed = QtCore.Signal(object)
+
+    def __init__(self, title: str, message: str, level: str=Level.info, duration: int=4000, parent: QtWidgets.QWidget|None=None):
+        '''Frameless notification that never takes focus and hides itself after `duration`. Click to dismiss
+
+        Args:
+            title (str): Heading
+            message (str): Body text
+            level (str, optional): One of `Level`. Defaults to `Level.info`.
+            duration (int, optional): Milliseconds on screen. Defaults to 4000.
+            parent (QWidget, optional): Window to show the toast on top of. Defaults to None (primary screen).
+        '''
+
+        super().__init__(parent, QtCore.Qt.Tool | QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.WindowDoesNotAcceptFocus)
+
+        self.key = (title, message, level)
+        self.count = 1
+        self.setAttribute(QtCore.Qt.WA_ShowWithoutActivating, True)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
+        self.setObjectName('proxiToast')
+        self.setProperty('level', level)
+        self.setStyleSheet(STYLESHEET)
+        self.setFixedWidth(320)
+
+        self.titleWidget = QtWidgets.QLabel(f'<b>{title}</b>')
+        self.messageWidget = QtWidgets.QLabel(message)
+        self.messageWidget.setWordWrap(True)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(12, 8, 12, 8)
+        layout.addWidget(self.titleWidget)
+        layout.addWidget(self.messageWidget)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(duration)
+        self._timer.timeout.connect(self.dismiss) # type: ignore
+
+    def popup(self) -> None:
+        self.adjustSize()
+        self.show()
+        self._timer.start()
+
+    def repeat(self) -> None:
+        '''Identical toast requested again: bump the counter and restart the timer instead of stacking another one'''
+
+        self.count += 1
+        self.titleWidget.setText(f'<b>{self.key[0]}</b> (x{self.count})')
+        self._timer.start()
+
+    def dismiss(self) -> None:
+        self._timer.stop()
+        self.dismissed.emit(self) # type: ignore
+        self.close()
+
+    def mousePressEvent(self, event):
+        self.dismiss()
+
+
+class ToastQueue(QtCore.QObject):
+
+    def __init__(self, parent: QtCore.QObject|None=None):
+        '''Shows toasts stacked in the bottom right corner of their window (or the primary screen)
+
+        At most `config.Dialogs.maxVisibleToasts` are visible, and new ones appear at most once every
+        `config.Dialogs.toastInterval`. Anything beyond that is queued. Repeats of a visible (or queued) toast are merged
+        into it, showing a counter and restarting its timer
+        '''
+
+        super().__init__(parent)
+
+        self.visible: list[QtToast] = []
+        self.pending: deque[tuple[str, str, str, QtWidgets.QWidget|None]] = deque()
+        self._lastShown = 0.0
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._showNext) # type: ignore
+
+    def push(self, title: str, message: str, level: str=Level.info, parent: QtWidgets.QWidget|None=None) -> None:
+        '''Queue a toast. Never blocks'''
+
+        key = (title, message, level)
+
+        # De-duplicate
+        for toast in self.visible:
+            if toast.key == key:
+                toast.repeat()
+                return
+
+        if any(x[:3] == key for x in self.pending):
+            return
+
+        self.pending.append((title, message, level, parent))
+        self._schedule()
+
+    def clear(self) -> None:
+        '''Drop queued toasts and dismiss visible ones'''
+
+        self.pending.clear()
+        for toast in list(self.visible):
+            toast.dismiss()
+
+    def _schedule(self) -> None:
+        if self._timer.isActive() or not self.pending or len(self.visible) >= config.Dialogs.maxVisibleToasts:
+            return
+
+        wait = config.Dialogs.toastInterval - (time.monotonic() - self._lastShown) * 1000
+        self._timer.start(max(0, int(wait)))
+
+    def _showNext(self) -> None:
+        if not self.pending or len(self.visible) >= config.Dialogs.maxVisibleToasts:
+            return
+
+        title, message, level, parent = self.pending.popleft()
+        try:
+            toast = QtToast(title, message, level=level, duration=config.Dialogs.toastDuration, parent=parent)
+        except RuntimeError:
+            toast = QtToast(title, message, level=level, duration=config.Dialogs.toastDuration) # Parent deleted in the meantime
+
+        toast.dismissed.connect(self._dismissed) # type: ignore
+        toast.destroyed.connect(lambda _=None, toast=toast: self._destroyed(toast)) # type: ignore -> Eg. deleted along with its window, without being dismissed
+        self.visible.append(toast)
+        self._lastShown = time.monotonic()
+        toast.popup()
+        self._layout()
+        self._schedule()
+
+    def _dismissed(self, toast: QtToast) -> None:
+        if toast in self.visible:
+            self.visible.remove(toast)
+            self._layout()
+
+        self._schedule()
+
+    def _destroyed(self, toast: QtToast) -> None:
+        if toast in self.visible:
+            self.visible.remove(toast)
+            QtCore.QTimer.singleShot(0, self._layout) # Siblings may be going down with the same window
+
+        self._schedule()
+
+    def _layout(self) -> None:
+        '''Stack visible toasts upwards from the bottom right corner'''
+
+        margin = 12
+        bottoms: dict[object, int] = {}
+        for toast in reversed(self.visible):
+            window = toast.parentWidget()
+            if window and window.isVisible():
+                area = window.frameGeometry()
+            else:
+                area = QtWidgets.QApplication.primaryScreen().availableGeometry()
+
+            bottom = bottoms.get(window, area.bottom() - margin)
+            toast.move(area.right() - margin - toast.width(), bottom - toast.height())
+            bottoms[window] = bottom - toast.height() - margin // 2
+
+
+try:
+    QUEUE # type: ignore
+except NameError:
+    QUEUE: ToastQueue|None = None
+
+
+def toast(title: str, message: str, level: str=Level.info, parent: QtWidgets.QWidget|None=None, consolePrint: bool=True) -> None:
+    '''Show a non-modal notification. Never blocks, and is only logged in headless mode (see `proxi.ui.dialogs.isHeadless`)
+
+    Args:
+        title (str): Heading
+        message (str): Body text
+        level (str, optional): One of `Level`. Defaults to `Level.info`.
+        parent (QWidget, optional): Window to show the toast on. Defaults to None (primary screen).
+        consolePrint (bool, optional): Also print to console. Defaults to True.
+    '''
+
+    global QUEUE
+
+    if consolePrint:
+        if level == Level.error:
+            console.error(f'{title}: {message}', stacktrace=False)
+        elif level == Level.warning:
+            console.warning(f'{title}: {message}')
+        else:
+            console.log(f'{title}: {message}')
+
+    if config.Dialogs.headless or QtWidgets.QApplication.instance() is None:
+        return
+
+    if QUEUE is None:
+        QUEUE = ToastQueue()
+
+    QUEUE.push(title, message, level=level, parent=parent)
\ No newline at end of file
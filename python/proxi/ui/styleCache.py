@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+'''Stylesheet cache: render the qt_material template plus PROXi overrides once per (theme, density, overrides), persist on disk'''
+
+from __future__ import annotations
+
+import os
+import hashlib
+import proxi.config as config
+import proxi.console as console
+from PySide6 import QtCore, QtGui, QtWidgets # Must be imported before `qt_material`
+import qt_material
+from qt_material.resources import RESOURCES_PATH
+from typing import cast
+
+
+QT_MATERIAL_DIR = os.path.dirname(cast(str, qt_material.__file__))
+
+
+# Keep rendered stylesheets while allowing for module reload without resetting
+try:
+    _MEMORY_CACHE # type: ignore
+except NameError:
+    _MEMORY_CACHE: dict[str, str] = {}
+
+try:
+    _APPLIED_KEY # type: ignore
+except NameError:
+    _APPLIED_KEY: str|None = None
+
+
+def _themePath(theme: str) -> str:
+    '''Resolve a qt_material theme name to its .xml file'''
+
+    if os.path.isfile(theme):
+        return theme
+
+    return os.path.join(QT_MATERIAL_DIR, 'themes', theme)
+
+
+def _fileHash(path: str) -> str:
+    '''Content hash of a file, empty string if missing'''
+
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return ''
+
+
+def formatOverrides(overrides: list[str]|tuple[str, ...]) -> str:
+    '''Join and format override stylesheets with `QTMATERIAL_*` environment variables (set by `qt_material.get_theme`)'''
+
+    return '\n'.join(x.format(**os.environ) for x in overrides)
+
+
+def cacheKey(theme: str, density: int, overrides: list[str]|tuple[str, ...], invertSecondary: bool=False) -> str:
+    '''Content hash for a given stylesheet configuration. Changes whenever the theme, template or overrides change'''
+
+    digest = hashlib.sha1()
+    for part in (
+        theme,
+        str(density),
+        str(invertSecondary),
+        _fileHash(_themePath(theme)),
+        _fileHash(qt_material.TEMPLATE_FILE),
+        *overrides
+    ):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def _iconsParent(key: str) -> str:
+    '''Icon folder (relative to qt_material's resource path) for a given cache key. Icons are colored per theme'''
+
+    return f'proxi_{key[:12]}'
+
+
+def _applyPalette(themeColors: dict) -> None:
+    '''Placeholder text color, as set by `qt_material.build_stylesheet` (stylesheets can't reach it)'''
+
+    color = QtGui.QColor(themeColors['primaryColor'])
+    color.setAlpha(92)
+    palette = QtGui.QGuiApplication.palette()
+    palette.setColor(QtGui.QPalette.ColorRole.PlaceholderText, color)
+    QtGui.QGuiApplication.setPalette(palette)
+
+
+def _ensureResources(themeColors: dict, key: str) -> None:
+    '''Fonts, icons and the palette are normally set up while rendering the template. Do the same for cache hits, reusing generated icons if possible'''
+
+    qt_material.add_fonts()
+    _applyPalette(themeColors)
+
+    iconsDir = os.path.join(RESOURCES_PATH, _iconsParent(key))
+    if not os.path.isdir(os.path.join(iconsDir, 'primary')):
+        qt_material.set_icons_theme(themeColors, parent=_iconsParent(key))
+        return
+
+    QtCore.QDir.addSearchPath('icon', iconsDir)
+    QtCore.QDir.addSearchPath('qt_material', os.path.join(QT_MATERIAL_DIR, 'resources'))
+
+
+def buildStylesheet(theme: str|None=None, density: int|None=None, overrides: list[str]|tuple[str, ...]=(), invertSecondary: bool|None=None) -> tuple[str, str]|None:
+    '''Get the combined (material + overrides) stylesheet, from memory, disk or a fresh render, in that order
+
+    Args:
+        theme (str, optional): qt_material theme. Defaults to None, which means `config.Style.theme`
+        density (int, optional): qt_material density scale. Defaults to None, which means `config.Style.density`
+        overrides (list[str], optional): PROXi stylesheets to append, formatted with `QTMATERIAL_*` environment variables. Defaults to ().
+        invertSecondary (bool, optional): Swap light/dark secondary colors. Defaults to None, which means `config.Style.invertSecondary`
+
+    Returns:
+        tuple[str, str]|None: (cache key, stylesheet), None if the theme could not be loaded
+    '''
+
+    theme = theme or config.Style.theme
+    density = config.Style.density if density is None else density
+    invertSecondary = config.Style.invertSecondary if invertSecondary is None else invertSecondary
+
+    # Cheap: parses the theme .xml and exports `QTMATERIAL_*` environment variables, which overrides (and tools) rely on
+    themeColors = qt_material.get_theme(theme, invertSecondary)
+    if themeColors is None:
+        console.error(f'Unable to load qt_material theme `{theme}`')
+        return None
+
+    key = cacheKey(theme, density, overrides, invertSecondary)
+    if key in _MEMORY_CACHE:
+        _applyPalette(themeColors) # Another theme may have been applied since
+        return key, _MEMORY_CACHE[key]
+
+    cacheFile = '{}/{}.qss'.format(config.Paths.styleCacheDir, key)
+    stylesheet = None
+
+    if os.path.isfile(cacheFile):
+        try:
+            with open(cacheFile, 'r', encoding='utf-8') as f:
+                stylesheet = f.read()
+
+            _ensureResources(themeColors, key)
+            console.debug(f'Loaded cached stylesheet {cacheFile}')
+        except Exception as e:
+            console.warning(f'Error reading cached stylesheet `{cacheFile}`, rendering a new one: {e}')
+            stylesheet = None
+
+    if stylesheet is None:
+        console.debug(f'Rendering stylesheet for theme `{theme}` (density {density})', timestamp=True)
+        material = qt_material.build_stylesheet(theme, invertSecondary, {'density_scale': str(density)}, parent=_iconsParent(key))
+        if material is None:
+            return None
+
+        stylesheet = material + formatOverrides(overrides)
+
+        try:
+            os.makedirs(config.Paths.styleCacheDir, exist_ok=True)
+            with open(cacheFile, 'w', encoding='utf-8') as f:
+                f.write(stylesheet)
+        except Exception as e:
+            console.warning(f'Error writing stylesheet cache `{cacheFile}`: {e}')
+
+    _MEMORY_CACHE[key] = stylesheet
+    return key, stylesheet
+
+
+def applyStylesheet(app: QtWidgets.QApplication|None=None, theme: str|None=None, density: int|None=None, overrides: list[str]|tuple[str, ...]=(), invertSecondary: bool|None=None, force: bool=False) -> bool:
+    '''Apply the combined stylesheet app-wide. No-op if the same stylesheet is already applied
+
+    Args:
+        app (QApplication, optional): Target application. Defaults to None, which means the current instance
+        theme, density, overrides, invertSecondary: See `buildStylesheet`
+        force (bool, optional): Re-apply even if unchanged. Defaults to False.
+
+    Returns:
+        bool: True if the stylesheet is applied, False on error
+    '''
+
+    global _APPLIED_KEY
+
+    result = buildStylesheet(theme, density, overrides, invertSecondary)
+    if result is None:
+        return False
+
+    key, stylesheet = result
+    if key == _APPLIED_KEY and not force:
+        return True
+
+    app = app or QtWidgets.QApplication.instance() # type: ignore
+    app.setStyleSheet(stylesheet) # type: ignore
+    _APPLIED_KEY = key
+    return True
+
+
+def clearCache(disk: bool=True) -> None:
+    '''Drop cached stylesheets from memory and (optionally) disk'''
+
+    global _APPLIED_KEY
+
+    _MEMORY_CACHE.clear()
+    _APPLIED_KEY = None
+
+    if not disk or not os.path.isdir(config.Paths.styleCacheDir):
+        return
+
+    for entry in os.scandir(config.Paths.styleCacheDir):
+        if entry.name.endswith('.qss'):
+            try:
+                os.remove(entry.path)
+            except OSError as e:
+                console.warning(f'Error deleting cached stylesheet `{entry.path}`: {e}')
\ No newline at end of file
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+'''Shared Slate tick dispatcher. One Unreal callback, fanned out to all subscribers at their own rate'''
+
+from __future__ import annotations
+
+import time
+import unreal
+import proxi.console as console
+from PySide6 import QtWidgets
+from typing import Callable
+
+
+EVERY_FRAME = 0.0 # Profilers and anything that needs every single tick
+LABELS = 0.1 # 10 Hz, plenty for text output
+
+
+class TickSubscriber:
+    '''Tick subscription, including rate limit and cost tracking'''
+
+    def __init__(self, callback: Callable[[float], None], interval: float=EVERY_FRAME, widget: QtWidgets.QWidget|None=None, name: str|None=None) -> None:
+        '''Tick subscription, including rate limit and cost tracking
+
+        Args:
+            callback (Callable[[float], None]): Receives the seconds elapsed since its previous call
+            interval (float, optional): Minimum seconds between calls. Defaults to `EVERY_FRAME`.
+            widget (QWidget, optional): Skip ticks while this widget is hidden or minimized, that time isn't passed on. Defaults to None.
+            name (str, optional): Display name for cost reports. Defaults to None, which means the callback's qualified name.
+        '''
+
+        self.callback = callback
+        self.interval = interval
+        self.widget = widget
+        self.name = name or getattr(callback, '__qualname__', f'{callback}')
+        self.elapsed: float = 0
+        self.calls: int = 0
+        self.totalTime: float = 0
+        self.maxTime: float = 0
+
+    def isActive(self) -> bool:
+        '''Should this subscriber receive ticks right now? False for hidden/minimized widgets'''
+
+        if self.widget is None:
+            return True
+
+        try:
+            return self.widget.isVisible() and not self.widget.isMinimized()
+        except RuntimeError:
+            # Underlying C++ object is gone
+            return False
+
+    def resetStats(self) -> None:
+        '''Reset cost tracking'''
+
+        self.calls = 0
+        self.totalTime = 0
+        self.maxTime = 0
+
+
+# Keep registration and subscribers while allowing for module reload without resetting
+try:
+    SUBSCRIBERS # type: ignore
+except NameError:
+    SUBSCRIBERS: list[TickSubscriber] = []
+
+try:
+    _TICK_HANDLE # type: ignore
+except NameError:
+    _TICK_HANDLE: object|None = None
+
+
+def _register() -> None:
+    '''Register the one and only tick callback with Unreal'''
+
+    global _TICK_HANDLE
+
+    if _TICK_HANDLE is None:
+        _TICK_HANDLE = unreal.register_slate_post_tick_callback(_tick)
+        console.debug('Registered shared Slate tick callback')
+
+
+def _unregister() -> None:
+    '''Unregister the tick callback with Unreal'''
+
+    global _TICK_HANDLE
+
+    if _TICK_HANDLE is not None:
+        unreal.unregister_slate_post_tick_callback(_TICK_HANDLE)
+        _TICK_HANDLE = None
+        console.debug('Unregistered shared Slate tick callback')
+
+
+def subscribe(callback: Callable[[float], None], interval: float=EVERY_FRAME, widget: QtWidgets.QWidget|None=None, name: str|None=None) -> TickSubscriber:
+    '''Subscribe to Slate ticks. Registers with Unreal on first subscription
+
+    Args:
+        callback (Callable[[float], None]): Receives the seconds elapsed since its previous call
+        interval (float, optional): Minimum seconds between calls. Defaults to `EVERY_FRAME`.
+        widget (QWidget, optional): Skip ticks while this widget is hidden or minimized, that time isn't passed on. Defaults to None.
+        name (str, optional): Display name for cost reports. Defaults to None.
+
+    Returns:
+        TickSubscriber: Subscription handle, for `unsubscribe`
+    '''
+
+    subscriber = TickSubscriber(callback, interval=interval, widget=widget, name=name)
+    SUBSCRIBERS.append(subscriber)
+    _register()
+    return subscriber
+
+
+def unsubscribe(subscriber: TickSubscriber) -> None:
+    '''Remove a subscription. Unregisters from Unreal when the last one is gone'''
+
+    if subscriber in SUBSCRIBERS:
+        SUBSCRIBERS.remove(subscriber)
+
+    if not SUBSCRIBERS:
+        _unregister()
+
+
+def _tick(deltaSeconds: float) -> None:
+    '''Unreal Slate post-tick callback'''
+
+    # Iterate over a copy, subscribers may unsubscribe during their own tick
+    for subscriber in list(SUBSCRIBERS):
+        subscriber.elapsed += deltaSeconds
+        if subscriber.elapsed < subscriber.interval:
+            continue
+
+        if not subscriber.isActive():
+            subscriber.elapsed = 0 # Time spent hidden doesn't count, or the first tick after showing would get all of it at once
+            continue
+
+        elapsed = subscriber.elapsed
+        subscriber.elapsed = 0
+        start = time.perf_counter()
+
+        try:
+            subscriber.callback(elapsed)
+        except Exception as e:
+            # Don't flood the log every frame -> drop the offending subscriber
+            console.error(f'Error in tick subscriber `{subscriber.name}`, unsubscribing: {e}')
+            unsubscribe(subscriber)
+
+        cost = time.perf_counter() - start
+        subscriber.calls += 1
+        subscriber.totalTime += cost
+        subscriber.maxTime = max(subscriber.maxTime, cost)
+
+
+def costReport() -> dict[str, dict[str, float]]:
+    '''Summarize per-subscriber tick cost
+
+    Returns:
+        dict[str, dict[str, float]]: Subscriber name -> {calls, interval, mean, max, total} (times in milliseconds)
+    '''
+
+    report: dict[str, dict[str, float]] = {}
+    for x in SUBSCRIBERS:
+        name = x.name
+        if name in report:
+            name = f'{name} [{len(report)}]'
+
+        report[name] = {
+            'calls': x.calls,
+            'interval': x.interval,
+            'mean': (x.totalTime / x.calls * 1000) if x.calls else 0,
+            'max': x.maxTime * 1000,
+            'total': x.totalTime * 1000
+        }
+
+    return report
+
+
+def logCostReport() -> None:
+    '''Output per-subscriber tick cost to the console'''
+
+    for name, stats in costReport().items():
+        console.log(f'{name}: {stats["calls"]} call(s) every {stats["interval"]:.3f}s, mean {stats["mean"]:.3f} ms, max {stats["max"]:.3f} ms, total {stats["total"]:.1f} ms')
\ No newline at end of file
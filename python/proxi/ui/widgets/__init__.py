@@ -1,8 +1,11 @@
 '''Qt widgets'''
 
 
+from .columnarModel import QtColumnarTableModel, QtColumnarListModel, QtVirtualTableView, QtVirtualListView
 from .flowLayout import QtFlowLayout
+from .gallery import QtTileGallery
 from .listWidgetItemCustom import QtListWidgetItemCustom
 from .spinner import QtSpinner
 from .tableWidgetItemCustom import QtTableWidgetItemCustom
-from .tile import QtTile
\ No newline at end of file
+from .thumbnails import PixmapCache, ThumbnailLoader
+from .tile import QtTile, QtTileFactory
\ No newline at end of file
@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+# pyright: reportIncompatibleMethodOverride=false
+'''Virtualized Qt item models backed by columnar Python data (replacements for `QTableWidget`/`QListWidget` + custom items)'''
+
+from __future__ import annotations
+
+import bisect
+import itertools
+from PySide6 import QtCore, QtWidgets
+from typing import Callable, Iterable, Type, TYPE_CHECKING
+
+
+MAX_REMOVE_SIGNALS = 64 # Above this many contiguous ranges, a removal is announced as a model reset
+
+
+def QtColumnarModelFactory(baseType: Type[QtCore.QAbstractTableModel|QtCore.QAbstractListModel]|None):
+    '''Generate a columnar model class inheriting from the supplied `baseType`'''
+
+    if TYPE_CHECKING or baseType is None:
+        _baseType = QtCore.QAbstractTableModel
+    else:
+        _baseType = baseType
+
+    class QtColumnarModelBase(_baseType):
+
+        def __init__(self, headers: list[str], columns: list[list]|None=None, formatters: dict[int, Callable[[object], str]]|None=None, roleProviders: dict[int, Callable[[int, int, object], object]]|None=None, batchSize: int=1000, parent: QtCore.QObject|None=None):
+            '''Item model backed by one Python list per column. Nothing is computed or allocated per cell until a view asks for it
+
+            Args:
+                headers (list[str]): Column headers
+                columns (list[list], optional): Column data, one list per header, all of equal length. Defaults to None (empty).
+                formatters (dict[int, Callable], optional): Column -> method turning a raw value into display text. Defaults to None, which means `str`
+                roleProviders (dict[int, Callable], optional): Extra item data role -> method receiving (sourceRow, column, value). Eg. `ToolTipRole`. Defaults to None.
+                batchSize (int, optional): Number of rows exposed per `fetchMore`. Defaults to 1000.
+                parent (QObject, optional): Parent object. Defaults to None.
+            '''
+
+            super().__init__(parent)
+
+            self.headers = list(headers)
+            self.formatters = formatters or {}
+            self.roleProviders = roleProviders or {}
+            self.batchSize = batchSize
+            self._columns: list[list] = [[] for _ in self.headers]
+            self._view: list[int]|None = None # View row -> source row. None means identity (no sort/filter)
+            self._loaded: int = 0
+            self._sortColumn: int = -1
+            self._sortOrder = QtCore.Qt.AscendingOrder
+            self._filter: Callable[[int], bool]|None = None
+
+            if columns:
+                self.setColumns(columns)
+
+        # Qt model interface
+
+        def rowCount(self, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> int:
+            return 0 if parent.isValid() else self._loaded
+
+        def columnCount(self, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self.headers)
+
+        def data(self, index: QtCore.QModelIndex, role: int=QtCore.Qt.DisplayRole) -> object:
+            if not index.isValid():
+                return None
+
+            column = index.column()
+            row = self.sourceRow(index.row())
+            value = self._columns[column][row]
+
+            if role == QtCore.Qt.DisplayRole:
+                formatter = self.formatters.get(column)
+                return formatter(value) if formatter else f'{value}'
+            elif role == QtCore.Qt.UserRole:
+                return value
+
+            provider = self.roleProviders.get(role)
+            if provider:
+                return provider(row, column, value)
+
+            return None
+
+        def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int=QtCore.Qt.DisplayRole) -> object:
+            if role != QtCore.Qt.DisplayRole:
+                return None
+
+            if orientation == QtCore.Qt.Horizontal:
+                return self.headers[section] if section < len(self.headers) else None
+
+            return section + 1
+
+        def canFetchMore(self, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> bool:
+            return not parent.isValid() and self._loaded < self.totalRowCount()
+
+        def fetchMore(self, parent: QtCore.QModelIndex=QtCore.QModelIndex()) -> None:
+            if parent.isValid():
+                return
+
+            remaining = self.totalRowCount() - self._loaded
+            count = min(self.batchSize, remaining)
+            if count <= 0:
+                return
+
+            self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + count - 1)
+            self._loaded += count
+            self.endInsertRows()
+
+        def sort(self, column: int, order: QtCore.Qt.SortOrder=QtCore.Qt.AscendingOrder) -> None:
+            '''Sort on raw column values. One Python `sorted` call, no per-comparison callbacks from C++'''
+
+            self._sortColumn = column
+            self._sortOrder = order
+            self.layoutAboutToBeChanged.emit()
+            persistent = [(x, self.sourceRow(x.row())) for x in self.persistentIndexList()]
+            self._rebuildView()
+            self._remapPersistentIndexes(persistent)
+            self.layoutChanged.emit()
+
+        # Data access
+
+        def totalRowCount(self) -> int:
+            '''Number of rows passing the filter, including rows not yet fetched'''
+
+            if self._view is not None:
+                return len(self._view)
+
+            return len(self._columns[0]) if self._columns else 0
+
+        def sourceRowCount(self) -> int:
+            '''Number of rows in the underlying data, ignoring filters'''
+
+            return len(self._columns[0]) if self._columns else 0
+
+        def sourceRow(self, row: int) -> int:
+            '''Map a view row to its row in the underlying columns'''
+
+            return self._view[row] if self._view is not None else row
+
+        def value(self, row: int, column: int) -> object:
+            '''Raw value for a given view row and column'''
+
+            return self._columns[column][self.sourceRow(row)]
+
+        def column(self, column: int) -> list:
+            '''Underlying data for a column (source order, unfiltered). Do not modify in place'''
+
+            return self._columns[column]
+
+        def setColumns(self, columns: list[list]) -> None:
+            '''Replace all data
+
+            Args:
+                columns (list[list]): One list per header, all of equal length
+            '''
+
+            if len(columns) != len(self.headers):
+                raise ValueError(f'Expected {len(self.headers)} columns, got {len(columns)}')
+
+            lengths = {len(x) for x in columns}
+            if len(lengths) > 1:
+                raise ValueError(f'All columns must be of equal length, got lengths {sorted(lengths)}')
+
+            self.beginResetModel()
+            self._columns = [list(x) for x in columns]
+            self._rebuildView()
+            self._loaded = min(self.batchSize, self.totalRowCount())
+            self.endResetModel()
+
+        def appendRows(self, columns: list[list]) -> None:
+            '''Append a batch of rows, emitting a single insert signal
+
+            Args:
+                columns (list[list]): One list per header, all of equal length
+            '''
+
+            if len(columns) != len(self.headers):
+                raise ValueError(f'Expected {len(self.headers)} columns, got {len(columns)}')
+
+            count = len(columns[0]) if columns else 0
+            if not count:
+                return
+
+            # Sorted/filtered: new rows can land anywhere
+            if self._view is not None:
+                self.beginResetModel()
+                for target, source in zip(self._columns, columns):
+                    target.extend(source)
+                self._rebuildView()
+                self._loaded = min(max(self._loaded, self.batchSize), self.totalRowCount())
+                self.endResetModel()
+                return
+
+            fullyLoaded = self._loaded == self.sourceRowCount()
+            for target, source in zip(self._columns, columns):
+                target.extend(source)
+
+            # Rows beyond `_loaded` are picked up by `fetchMore`, no need to announce them
+            if fullyLoaded:
+                self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + count - 1)
+                self._loaded += count
+                self.endInsertRows()
+
+        def removeSourceRows(self, rows: Iterable[int]) -> None:
+            '''Remove rows (given as source rows), emitting one remove signal per contiguous range of view rows.
+            Scattered removals (many ranges) are announced as a single model reset instead
+
+            Args:
+                rows (Iterable[int]): Source row indexes to remove
+            '''
+
+            removed = sorted(set(rows))
+            if not removed:
+                return
+
+            removedSet = set(removed)
+            if self._view is not None:
+                viewRows = [i for i, x in enumerate(self._view) if x in removedSet and i < self._loaded]
+            else:
+                viewRows = removed[:bisect.bisect_left(removed, self._loaded)]
+
+            ranges = _contiguousRanges(viewRows)
+            reset = len(ranges) > MAX_REMOVE_SIGNALS
+            if reset:
+                self.beginResetModel()
+            else:
+                # Announce visible rows, last range first so earlier indexes stay valid
+                for start, end in reversed(ranges):
+                    self.beginRemoveRows(QtCore.QModelIndex(), start, end)
+                    self._loaded -= end - start + 1
+                    if self._view is not None:
+                        del self._view[start:end + 1]
+                    self.endRemoveRows()
+
+            # Drop data in one pass per column; unannounced (not yet fetched or filtered out) rows go silently
+            keep = bytearray(b'\x01') * self.sourceRowCount()
+            for row in removed:
+                keep[row] = 0
+            self._columns = [list(itertools.compress(x, keep)) for x in self._columns]
+
+            if self._view is not None:
+                self._view = [x - bisect.bisect_left(removed, x) for x in self._view if x not in removedSet]
+
+            if reset:
+                self._loaded -= len(viewRows)
+                self.endResetModel()
+
+            self._loaded = min(self._loaded, self.totalRowCount())
+
+        def clear(self) -> None:
+            '''Remove all data'''
+
+            self.setColumns([[] for _ in self.headers])
+
+        # Filtering
+
+        def setFilterFunction(self, predicate: Callable[[int], bool]|None) -> None:
+            '''Filter rows with a predicate receiving the source row. None clears the filter'''
+
+            self.beginResetModel()
+            self._filter = predicate
+            self._rebuildView()
+            self._loaded = min(max(self._loaded, self.batchSize), self.totalRowCount())
+            self.endResetModel()
+
+        def setFilterText(self, text: str|None, column: int=-1, caseSensitive: bool=False) -> None:
+            '''Only show rows containing `text` in their display value, for one or all (-1) columns. Empty text clears the filter'''
+
+            if not text:
+                self.setFilterFunction(None)
+                return
+
+            needle = text if caseSensitive else text.lower()
+            columns = range(len(self.headers)) if column < 0 else [column]
+
+            # Format each column once up front, instead of once per row per call
+            haystacks: list[list[str]] = []
+            for c in columns:
+                formatter = self.formatters.get(c) or str
+                values = map(formatter, self._columns[c])
+                haystacks.append(list(values) if caseSensitive else [x.lower() for x in values])
+
+            self.setFilterFunction(lambda row: any(needle in x[row] for x in haystacks))
+
+        def _rebuildView(self) -> None:
+            '''Recompute the view row -> source row map from the current filter and sort'''
+
+            rowCount = self.sourceRowCount()
+            if self._filter is None and self._sortColumn < 0:
+                self._view = None
+                return
+
+            rows: list[int] = list(filter(self._filter, range(rowCount))) if self._filter else list(range(rowCount))
+
+            if 0 <= self._sortColumn < len(self._columns):
+                keys = self._columns[self._sortColumn]
+                try:
+                    rows.sort(key=keys.__getitem__, reverse=self._sortOrder == QtCore.Qt.DescendingOrder)
+                except TypeError:
+                    # Mixed types, fall back to text comparison
+                    rows.sort(key=lambda x: f'{keys[x]}', reverse=self._sortOrder == QtCore.Qt.DescendingOrder)
+
+            self._view = rows
+
+        def _remapPersistentIndexes(self, persistent: list[tuple[QtCore.QModelIndex, int]]) -> None:
+            '''Point persistent indexes (selection, current item) at the new view rows of their source rows'''
+
+            if not persistent:
+                return
+
+            lookup = {x: i for i, x in enumerate(self._view)} if self._view is not None else None
+            fromIndexes = []
+            toIndexes = []
+            for index, source in persistent:
+                row = lookup.get(source, -1) if lookup is not None else source
+                fromIndexes.append(index)
+                toIndexes.append(self.index(row, index.column()) if 0 <= row < self._loaded else QtCore.QModelIndex())
+
+            self.changePersistentIndexList(fromIndexes, toIndexes)
+
+    return QtColumnarModelBase
+
+
+def _contiguousRanges(rows: Iterable[int]) -> list[tuple[int, int]]:
+    '''Group sorted row indexes into inclusive (start, end) ranges'''
+
+    ranges: list[tuple[int, int]] = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+
+    return ranges
+
+
+baseTableClass = QtColumnarModelFactory(QtCore.QAbstractTableModel)
+class QtColumnarTableModel(baseTableClass):
+    '''Virtualized table model, see `QtColumnarModelBase`'''
+
+
+baseListClass = QtColumnarModelFactory(QtCore.QAbstractListModel)
+class QtColumnarListModel(baseListClass):
+
+    def __init__(self, values: list|None=None, formatter: Callable[[object], str]|None=None, roleProviders: dict[int, Callable[[int, int, object], object]]|None=None, batchSize: int=1000, parent: QtCore.QObject|None=None):
+        '''Virtualized list model, see `QtColumnarModelBase`
+
+        Args:
+            values (list, optional): List data. Defaults to None (empty).
+            formatter (Callable, optional): Method turning a raw value into display text. Defaults to None, which means `str`
+            roleProviders (dict[int, Callable], optional): Extra item data role -> method receiving (sourceRow, column, value). Defaults to None.
+            batchSize (int, optional): Number of rows exposed per `fetchMore`. Defaults to 1000.
+            parent (QObject, optional): Parent object. Defaults to None.
+        '''
+
+        super().__init__(
+            headers = [''],
+            columns = [values] if values else None,
+            formatters = {0: formatter} if formatter else None,
+            roleProviders = roleProviders,
+            batchSize = batchSize,
+            parent = parent
+        )
+
+    def setValues(self, values: list) -> None:
+        '''Replace all data'''
+
+        self.setColumns([values])
+
+    def appendValues(self, values: list) -> None:
+        '''Append a batch of values, emitting a single insert signal'''
+
+        self.appendRows([values])
+
+
+class QtVirtualTableView(QtWidgets.QTableView):
+
+    def __init__(self, model: QtColumnarTableModel|None=None, rowHeight: int=24, parent: QtWidgets.QWidget|None=None):
+        '''`QTableView` tuned for large `QtColumnarTableModel`s: fixed row heights, no word wrap, header click sorting
+
+        Args:
+            model (QtColumnarTableModel, optional): Model to display. Defaults to None.
+            rowHeight (int, optional): Fixed row height in pixels. Defaults to 24.
+            parent (QWidget, optional): Parent widget. Defaults to None.
+        '''
+
+        super().__init__(parent)
+
+        self.setWordWrap(False)
+        self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(rowHeight)
+        self.horizontalHeader().setStretchLastSection(True)
+
+        if model is not None:
+            self.setModel(model)
+
+        self.setSortingEnabled(True)
+
+
+class QtVirtualListView(QtWidgets.QListView):
+
+    def __init__(self, model: QtColumnarListModel|None=None, parent: QtWidgets.QWidget|None=None):
+        '''`QListView` tuned for large `QtColumnarListModel`s: uniform item sizes and batched layout
+
+        Args:
+            model (QtColumnarListModel, optional): Model to display. Defaults to None.
+            parent (QWidget, optional): Parent widget. Defaults to None.
+        '''
+
+        super().__init__(parent)
+
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QtWidgets.QListView.Batched)
+        self.setBatchSize(500)
+
+        if model is not None:
+            self.setModel(model)
\ No newline at end of file
@@ -3,14 +3,141 @@
 '''Qt flow (gallery) layout'''
 
 from __future__ import annotations
+
+import bisect
+from collections import OrderedDict
 from PySide6 import QtCore, QtWidgets
+from typing import Iterable
+
+
+class FlowGeometry:
+
+    def __init__(self, x: int, y: int, width: int, spacing: int):
+        '''Flow layout geometry (row breaks and item positions) for one available width. Appending items extends it incrementally
+
+        Uses the same wrapping rules as `QtFlowLayout._doLayout`
+
+        Args:
+            x (int): Left edge of the layout area
+            y (int): Top edge of the layout area
+            width (int): Available width
+            spacing (int): Horizontal and vertical item spacing
+        '''
+
+        self.left = x
+        self.top = y
+        self.width = width
+        self.spacing = spacing
+        self.itemRects: list[tuple[int, int, int, int]|None] = [] # (x, y, width, height) per item, None for hidden items
+        self.rowStarts: list[int] = [] # First item index per row
+        self.rowTops: list[int] = []
+        self.rowHeights: list[int] = []
+
+        # Cursor, for incremental appends
+        self._x = x
+        self._y = y
+        self._lineHeight = 0
+
+    def extend(self, sizes: Iterable[tuple[int, int]|None]) -> None:
+        '''Append items to the layout
+
+        Args:
+            sizes (Iterable[tuple[int, int]|None]): (width, height) per item, None for hidden items
+        '''
+
+        right = self.left + self.width - 1
+        spacing = self.spacing
+        x = self._x
+        y = self._y
+        lineHeight = self._lineHeight
+        rects = self.itemRects
+
+        for size in sizes:
+            if size is None:
+                rects.append(None)
+                continue
+
+            width, height = size
+            nextX = x + width + spacing
+            if nextX - spacing > right and lineHeight > 0:
+                x = self.left
+                y = y + lineHeight + spacing
+                nextX = x + width + spacing
+                lineHeight = 0
+
+            # First item of a new row
+            if lineHeight == 0 and (not self.rowTops or self.rowTops[-1] != y):
+                self.rowStarts.append(len(rects))
+                self.rowTops.append(y)
+                self.rowHeights.append(0)
+
+            rects.append((x, y, width, height))
+            x = nextX
+            lineHeight = max(lineHeight, height)
+            self.rowHeights[-1] = lineHeight
+
+        self._x = x
+        self._y = y
+        self._lineHeight = lineHeight
+
+    def truncate(self, index: int) -> None:
+        '''Drop the layout from the row containing item `index` onwards, so it can be re-extended from there. Earlier rows are unaffected by later items'''
+
+        row = bisect.bisect_right(self.rowStarts, index) - 1
+        if row < 0:
+            del self.itemRects[:]
+            del self.rowStarts[:]
+            del self.rowTops[:]
+            del self.rowHeights[:]
+            self._x = self.left
+            self._y = self.top
+            self._lineHeight = 0
+            return
+
+        # Rewind the cursor to the start of `row`, as if its first item had just wrapped
+        y = self.rowTops[row]
+        del self.itemRects[self.rowStarts[row]:]
+        del self.rowStarts[row:]
+        del self.rowTops[row:]
+        del self.rowHeights[row:]
+        self._x = self.left
+        self._y = y
+        self._lineHeight = 0
+
+    def height(self) -> int:
+        '''Total layout height, equivalent to `QtFlowLayout.heightForWidth`'''
+
+        return self._y + self._lineHeight - self.top
+
+    def itemsIntersecting(self, top: int, bottom: int) -> range:
+        '''Index range of items in rows intersecting the vertical span `top`..`bottom` (may include hidden items)'''
+
+        if not self.rowTops:
+            return range(0)
+
+        first = max(0, bisect.bisect_right(self.rowTops, top) - 1)
+        if self.rowTops[first] + self.rowHeights[first] < top:
+            first += 1
+
+        last = bisect.bisect_right(self.rowTops, bottom) - 1
+        if last < first:
+            return range(0)
+
+        start = self.rowStarts[first]
+        end = self.rowStarts[last + 1] if last + 1 < len(self.rowStarts) else len(self.itemRects)
+        return range(start, end)
 
 
 class QtFlowLayout(QtWidgets.QLayout):
 
+    maxCachedWidths = 8 # Number of layout widths to keep row breaks for
+
     def __init__(self, parent: QtWidgets.QWidget|None=None, margin: int=0, spacing: int=3):
         '''Qt flow (gallery) layout
 
+        Item size hints and row breaks (per width) are cached. Adding items extends cached layouts, removing or
+        resizing/hiding an item only relayouts from the row before it, once, on the next layout request
+
         Args:
             parent (QWidget, optional): Parent object. Usually set automatically by assigning this layout to an object. Defaults to None.
             margin (int, optional): Layout margin (pixels). Defaults to 0.
@@ -21,17 +148,32 @@ class QtFlowLayout(QtWidgets.QLayout):
         if parent is not None:
             self.setContentsMargins(margin, margin, margin, margin)
 
-        self.setSpacing(spacing)
-
         self.itemList: list[QtWidgets.QLayoutItem] = []
+        self._sizes: list[tuple[int, int]|None] = [] # Cached size hint per item, None for hidden items
+        self._sizesDirty = False
+        self._dirtyFrom: int|None = None # First item whose cached row breaks are stale, relayout is deferred to the next layout request
+        self._geometryCache: OrderedDict[tuple[int, int, int], FlowGeometry] = OrderedDict()
+        self._appliedRects: list[tuple[int, int, int, int]|None] = []
+        self._minimumSize: QtCore.QSize|None = None
+
+        self.setSpacing(spacing)
 
     def __del__(self):
-        item = self.takeAt(0)
-        while item:
-            item = self.takeAt(0)
+        self.itemList.clear()
+        self._sizes.clear()
+        self._appliedRects.clear()
+        self._geometryCache.clear()
 
     def addItem(self, item: QtWidgets.QLayoutItem):
         self.itemList.append(item)
+        size = self._itemSize(item)
+        self._sizes.append(size)
+        self._minimumSize = None
+
+        # With a pending relayout, the next layout request extends the cached layouts anyway
+        if self._dirtyFrom is None:
+            for geometry in self._geometryCache.values():
+                geometry.extend([size])
 
     def count(self) -> int:
         return len(self.itemList)
@@ -44,10 +186,25 @@ class QtFlowLayout(QtWidgets.QLayout):
 
     def takeAt(self, index) -> QtWidgets.QLayoutItem|None:
         if index >= 0 and index < len(self.itemList):
+            self._sizes.pop(index)
+            self._minimumSize = None
+            del self._appliedRects[index:]
+            self._markDirty(index)
             return self.itemList.pop(index)
 
         return None
 
+    def setSpacing(self, spacing: int):
+        super().setSpacing(spacing)
+        self._geometryCache.clear()
+
+    def invalidate(self):
+        '''Qt calls this when an item is shown/hidden or its size hint changes. Sizes are re-checked lazily, on the next layout request'''
+
+        self._sizesDirty = True
+        self._minimumSize = None
+        super().invalidate()
+
     def expandingDirections(self):
         return QtCore.Qt.Orientations(QtCore.Qt.Orientation(0)) # type: ignore -> Incomplete .pyi definition
 
@@ -66,6 +223,9 @@ class QtFlowLayout(QtWidgets.QLayout):
         return self.minimumSize()
 
     def minimumSize(self):
+        if self._minimumSize is not None:
+            return QtCore.QSize(self._minimumSize)
+
         size = QtCore.QSize()
 
         for item in self.itemList:
@@ -73,41 +233,84 @@ class QtFlowLayout(QtWidgets.QLayout):
 
         left , top , right, bottom = self.getContentsMargins()
         size += QtCore.QSize(left + right, top + bottom)
-        return size
+        self._minimumSize = size
+        return QtCore.QSize(size)
+
+    def _itemSize(self, item: QtWidgets.QLayoutItem) -> tuple[int, int]|None:
+        '''Size hint for an item, None if hidden'''
+
+        if item.isEmpty():
+            return None
+
+        hint = item.sizeHint()
+        return (hint.width(), hint.height())
+
+    def _refreshSizes(self) -> None:
+        '''Re-check size hints after `invalidate`, and relayout from the first item that actually changed'''
+
+        if not self._sizesDirty:
+            return
+
+        self._sizesDirty = False
+        sizes = [self._itemSize(x) for x in self.itemList]
+        changed = next((i for i, (old, new) in enumerate(zip(self._sizes, sizes)) if old != new), None)
+        self._sizes = sizes
+
+        if changed is not None:
+            self._markDirty(changed)
+
+    def _markDirty(self, index: int) -> None:
+        '''Cached row breaks are stale from item `index` onwards. Removing many items (or clearing the layout) relayouts once, on the next layout request'''
+
+        self._dirtyFrom = index if self._dirtyFrom is None else min(self._dirtyFrom, index)
+
+    def _relayoutDirty(self) -> None:
+        '''Drop cached row breaks from the row containing the first stale item and recompute the rest'''
+
+        if self._dirtyFrom is None:
+            return
+
+        index = self._dirtyFrom
+        self._dirtyFrom = None
+        for geometry in self._geometryCache.values():
+            geometry.truncate(max(0, index - 1)) # If `index` started a row, the previous one may now have room for it
+            geometry.extend(self._sizes[len(geometry.itemRects):])
+
+    def _geometry(self, rect: QtCore.QRect) -> FlowGeometry:
+        '''Row breaks for a given layout area, from cache if possible'''
+
+        self._refreshSizes()
+        self._relayoutDirty()
+
+        key = (rect.x(), rect.y(), rect.width())
+        geometry = self._geometryCache.get(key)
+        if geometry is not None:
+            self._geometryCache.move_to_end(key)
+            return geometry
+
+        geometry = FlowGeometry(rect.x(), rect.y(), rect.width(), self.spacing())
+        geometry.extend(self._sizes)
+        self._geometryCache[key] = geometry
+
+        while len(self._geometryCache) > self.maxCachedWidths:
+            self._geometryCache.popitem(last=False)
+
+        return geometry
 
     def _doLayout(self, rect, testOnly):
-        x = rect.x()
-        y = rect.y()
-        lineHeight = 0
+        geometry = self._geometry(rect)
 
-        for item in self.itemList:
-            # wid = item.widget()
-            if not item.widget().isVisible():
-                continue
-            # spaceX = self.spacing() + wid.style().layoutSpacing(
-            #     QtWidgets.QSizePolicy.PushButton,
-            #     QtWidgets.QSizePolicy.PushButton,
-            #     QtCore.Qt.Horizontal)
-
-            # spaceY = self.spacing() + wid.style().layoutSpacing(
-            #     QtWidgets.QSizePolicy.PushButton, 
-            #     QtWidgets.QSizePolicy.PushButton, 
-            #     QtCore.Qt.Vertical)
-            spaceX = self.spacing()
-            spaceY = self.spacing()
-
-            nextX = x + item.sizeHint().width() + spaceX
-            if nextX - spaceX > rect.right() and lineHeight > 0:
-                x = rect.x()
-                y = y + lineHeight + spaceY
-                nextX = x + item.sizeHint().width() + spaceX
-                lineHeight = 0
+        if not testOnly:
+            # Only touch items that actually moved
+            applied = self._appliedRects
+            if len(applied) < len(self.itemList):
+                applied.extend([None] * (len(self.itemList) - len(applied)))
 
-            if not testOnly:
-                item.setGeometry(
-                    QtCore.QRect(QtCore.QPoint(x, y), item.sizeHint()))
+            for i, (item, itemRect) in enumerate(zip(self.itemList, geometry.itemRects)):
+                if itemRect is None or applied[i] == itemRect:
+                    continue
 
-            x = nextX
-            lineHeight = max(lineHeight, item.sizeHint().height())
+                item.setGeometry(QtCore.QRect(*itemRect))
+                applied[i] = itemRect
 
-        return y + lineHeight - rect.y()
\ No newline at end of file
+        return geometry.height()
\ No newline at end of file
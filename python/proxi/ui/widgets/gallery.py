@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+'''Virtualized tile gallery: only tiles intersecting the viewport exist as widgets'''
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from PySide6 import QtCore, QtGui, QtWidgets
+from typing import Iterable
+from .flowLayout import FlowGeometry
+from .tile import QtTile, QtTileFactory
+
+
+class QtTileGallery(QtWidgets.QAbstractScrollArea):
+
+    tileClicked = QtCore.Signal(int)
+    tileToggled = QtCore.Signal(int, bool)
+
+    maxCachedWidths = 8 # Number of viewport widths to keep row breaks for
+
+    def __init__(self, margin: int=0, spacing: int=3, parent: QtWidgets.QWidget|None=None):
+        '''Scrollable tile gallery with the same wrapping rules as `QtFlowLayout`, for thousands of tiles
+
+        Tiles are plain data until they scroll into view. A small pool of `QtTile` widgets is recycled between them,
+        and row breaks are cached per width (appends extend the cached layout instead of recomputing it)
+
+        Args:
+            margin (int, optional): Gallery margin (pixels). Defaults to 0.
+            spacing (int, optional): Tile spacing (pixels). Defaults to 3.
+            parent (QWidget, optional): Parent widget. Defaults to None.
+        '''
+
+        super().__init__(parent)
+
+        self.margin = margin
+        self.spacing = spacing
+
+        # Tile data, one entry per tile
+        self._labels: list[str] = []
+        self._sizes: list[tuple[int, int]] = []
+        self._properties: list[dict[str, object]|None] = []
+        self._checked: list[bool] = []
+        self._visible: list[bool] = []
+
+        self._geometryCache: OrderedDict[int, FlowGeometry] = OrderedDict()
+        self._assigned: dict[int, QtTile] = {} # Tile index -> widget currently displaying it
+        self._pool: list[QtTile] = [] # Idle widgets
+        self.tileFactory = QtTileFactory(self.viewport()) # Shared tile stylesheets and thumbnails
+
+        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(20)
+
+    # Tile API
+
+    def addTile(self, label: str, width: int, height: int, properties: dict[str, object]|None=None) -> int:
+        '''Add a tile, see `QtTile` for arguments
+
+        A `thumbnailPath` property (and optionally `assetId`, the thumbnail cache key) shows a thumbnail, loaded in the background
+
+        Returns:
+            int: Tile index
+        '''
+
+        self.addTiles([(label, width, height, properties)])
+        return len(self._labels) - 1
+
+    def addTiles(self, tiles: Iterable[tuple[str, int, int, dict[str, object]|None]]) -> None:
+        '''Add a batch of tiles
+
+        Args:
+            tiles (Iterable[tuple]): (label, width, height, properties) per tile
+        '''
+
+        start = len(self._labels)
+        for label, width, height, properties in tiles:
+            self._labels.append(label)
+            self._sizes.append((width, height))
+            self._properties.append(properties)
+            self._checked.append(False)
+            self._visible.append(True)
+
+        # Extend cached layouts instead of recomputing them
+        newSizes = self._sizes[start:]
+        for geometry in self._geometryCache.values():
+            geometry.extend(newSizes)
+
+        self._refresh()
+
+    def clear(self) -> None:
+        '''Remove all tiles'''
+
+        for tile in self._assigned.values():
+            tile.hide()
+            self._pool.append(tile)
+
+        self._assigned.clear()
+        self._labels.clear()
+        self._sizes.clear()
+        self._properties.clear()
+        self._checked.clear()
+        self._visible.clear()
+        self._geometryCache.clear()
+        self._refresh()
+
+    def count(self) -> int:
+        return len(self._labels)
+
+    def tileLabel(self, index: int) -> str:
+        return self._labels[index]
+
+    def tileProperties(self, index: int) -> dict[str, object]:
+        return self._properties[index] or {}
+
+    def isTileChecked(self, index: int) -> bool:
+        return self._checked[index]
+
+    def setTileChecked(self, index: int, checked: bool) -> None:
+        self._checked[index] = checked
+        tile = self._assigned.get(index)
+        if tile is not None:
+            tile.setChecked(checked)
+
+    def checkedTiles(self) -> list[int]:
+        '''Indexes of all checked tiles'''
+
+        return [i for i, x in enumerate(self._checked) if x]
+
+    def setTileVisible(self, index: int, visible: bool) -> None:
+        self.setTilesVisible({index: visible})
+
+    def setTilesVisible(self, visibility: dict[int, bool]) -> None:
+        '''Show/hide a batch of tiles. Hidden tiles take up no space, like hidden widgets in `QtFlowLayout`'''
+
+        changed = False
+        for index, visible in visibility.items():
+            if self._visible[index] != visible:
+                self._visible[index] = visible
+                changed = True
+
+        if changed:
+            self._geometryCache.clear()
+            self._refresh()
+
+    def tileWidget(self, index: int) -> QtTile|None:
+        '''Widget currently displaying a tile, None if the tile is scrolled out of view. Do not hold on to it, widgets are recycled'''
+
+        return self._assigned.get(index)
+
+    def scrollToTile(self, index: int) -> None:
+        rect = self._geometry().itemRects[index]
+        if rect is not None:
+            self.verticalScrollBar().setValue(rect[1] - self.margin)
+
+    # Layout
+
+    def _geometry(self) -> FlowGeometry:
+        '''Row breaks for the current viewport width, from cache if possible'''
+
+        width = self.viewport().width()
+        geometry = self._geometryCache.get(width)
+        if geometry is not None:
+            self._geometryCache.move_to_end(width)
+            return geometry
+
+        geometry = FlowGeometry(self.margin, self.margin, max(0, width - self.margin * 2), self.spacing)
+        geometry.extend(x if visible else None for x, visible in zip(self._sizes, self._visible))
+        self._geometryCache[width] = geometry
+
+        while len(self._geometryCache) > self.maxCachedWidths:
+            self._geometryCache.popitem(last=False)
+
+        return geometry
+
+    def _refresh(self) -> None:
+        '''Update scroll range and (re)assign tile widgets to the tiles intersecting the viewport'''
+
+        geometry = self._geometry()
+        viewportHeight = self.viewport().height()
+        scrollBar = self.verticalScrollBar()
+        scrollBar.setPageStep(viewportHeight)
+        scrollBar.setRange(0, max(0, geometry.height() + self.margin * 2 - viewportHeight))
+
+        offset = scrollBar.value()
+        wanted = [
+            i for i in geometry.itemsIntersecting(offset, offset + viewportHeight)
+            if geometry.itemRects[i] is not None
+        ]
+        wantedSet = set(wanted)
+
+        # Release widgets that scrolled out of view
+        for index in [x for x in self._assigned if x not in wantedSet]:
+            tile = self._assigned.pop(index)
+            tile.hide()
+            self._pool.append(tile)
+
+        for index in wanted:
+            x, y, width, height = geometry.itemRects[index] # type: ignore
+            tile = self._assigned.get(index)
+            if tile is None:
+                tile = self._acquire(index)
+
+            tile.setGeometry(x, y - offset, width, height)
+            tile.show()
+
+    def _acquire(self, index: int) -> QtTile:
+        '''Get an idle (or new) widget and set it up to display a given tile'''
+
+        width, height = self._sizes[index]
+        if self._pool:
+            tile = self._pool.pop()
+            self.tileFactory.setTileSize(tile, width, height)
+            tile.setLabel(self._labels[index])
+
+            # Drop properties of the previous tile
+            for name in tile.dynamicPropertyNames():
+                name = name.data().decode()
+                if name != 'tileClass':
+                    tile.setProperty(name, None)
+        else:
+            tile = self.tileFactory.create(self._labels[index], width, height)
+            tile.toggled.connect(lambda checked, tile=tile: self._tileToggled(tile, checked))
+            tile.clicked.connect(lambda _=False, tile=tile: self.tileClicked.emit(tile.property('galleryIndex')))
+
+        properties = self._properties[index] or {}
+        tile.setProperties(properties)
+        tile.setProperty('galleryIndex', index)
+
+        thumbnailPath = properties.get('thumbnailPath')
+        if thumbnailPath or tile.thumbnailWidget is not None:
+            self.tileFactory.setThumbnail(tile, properties.get('assetId', thumbnailPath), thumbnailPath) # type: ignore
+        tile.blockSignals(True)
+        tile.setChecked(self._checked[index])
+        tile.blockSignals(False)
+        self._assigned[index] = tile
+        return tile
+
+    def _tileToggled(self, tile: QtTile, checked: bool) -> None:
+        index = tile.property('galleryIndex')
+        if index is None or self._assigned.get(index) is not tile:
+            return
+
+        self._checked[index] = checked
+        self.tileToggled.emit(index, checked)
+
+    # Events
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._refresh()
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        self._refresh()
+
+    def sizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(400, 300)
\ No newline at end of file
@@ -7,6 +7,14 @@ import math
 from PySide6 import QtGui, QtCore, QtWidgets
 
 
+MAX_CACHED_ATLASES = 8
+
+try:
+    FRAME_CACHE # type: ignore
+except NameError:
+    FRAME_CACHE: dict[tuple, list[QtGui.QPixmap]] = {} # Frame key -> one pixmap per counter step
+
+
 class QtSpinner(QtWidgets.QWidget):
 
     def __init__(self, parent, centerOnParent=True, disableParentWhenSpinning=False, modality=QtCore.Qt.NonModal):
@@ -46,15 +54,57 @@ class QtSpinner(QtWidgets.QWidget):
 
     def paintEvent(self, event):
         self.updatePosition()
-        # self.updateSize()
-        painter = QtGui.QPainter(self)
-        painter.fillRect(self.rect(), QtCore.Qt.transparent)
-        # painter.fillRect(self.rect(), QtCore.Qt.lightGray)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
 
         if self._currentCounter >= self._numberOfLines:
             self._currentCounter = 0
 
+        # Single blit per tick, frames are pre-rendered once per appearance
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self.frames()[self._currentCounter])
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._isSpinning and not self._timer.isActive():
+            self._timer.start()
+
+    def hideEvent(self, event):
+        # Also received when the parent window is hidden or minimized. No point in ticking while nothing is drawn
+        super().hideEvent(event)
+        self._timer.stop()
+
+    def frameKey(self) -> tuple:
+        '''Everything that affects the rendered frames'''
+
+        return (
+            self._color.rgba(), self._roundness, self._minimumTrailOpacity, self._trailFadePercentage,
+            self._numberOfLines, self._lineLength, self._lineWidth, self._innerRadius, self.devicePixelRatioF()
+        )
+
+    def frames(self) -> list[QtGui.QPixmap]:
+        '''Pre-rendered frame atlas (one pixmap per counter step), shared between spinners with the same appearance'''
+
+        key = self.frameKey()
+        frames = FRAME_CACHE.get(key)
+        if frames is None:
+            frames = [self.renderFrame(x) for x in range(self._numberOfLines)]
+            FRAME_CACHE[key] = frames
+
+            while len(FRAME_CACHE) > MAX_CACHED_ATLASES:
+                del FRAME_CACHE[next(iter(FRAME_CACHE))]
+
+        return frames
+
+    def renderFrame(self, counter: int) -> QtGui.QPixmap:
+        '''Render all lines for a given counter step'''
+
+        size = (self._innerRadius + self._lineLength) * 2
+        ratio = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(math.ceil(size * ratio), math.ceil(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
         painter.setPen(QtCore.Qt.NoPen)
         for i in range(0, self._numberOfLines):
             painter.save()
@@ -62,7 +112,7 @@ class QtSpinner(QtWidgets.QWidget):
             rotateAngle = float(360 * i) / float(self._numberOfLines)
             painter.rotate(rotateAngle)
             painter.translate(self._innerRadius, 0)
-            distance = self.lineCountDistanceFromPrimary(i, self._currentCounter, self._numberOfLines)
+            distance = self.lineCountDistanceFromPrimary(i, counter, self._numberOfLines)
             color = self.currentLineColor(distance, self._numberOfLines, self._trailFadePercentage,
                                           self._minimumTrailOpacity, self._color)
             painter.setBrush(color)
@@ -70,6 +120,9 @@ class QtSpinner(QtWidgets.QWidget):
                                     self._roundness, QtCore.Qt.RelativeSize)
             painter.restore()
 
+        painter.end()
+        return pixmap
+
     def start(self):
         self.updatePosition()
         self._isSpinning = True
@@ -79,8 +132,9 @@ class QtSpinner(QtWidgets.QWidget):
             self.parentWidget().setEnabled(False)
 
         if not self._timer.isActive():
-            self._timer.start()
             self._currentCounter = 0
+            if self.isVisible():
+                self._timer.start() # Otherwise started by `showEvent`, once the parent is shown
 
     def stop(self):
         self._isSpinning = False
@@ -157,6 +211,10 @@ class QtSpinner(QtWidgets.QWidget):
         self._minimumTrailOpacity = minimumTrailOpacity
 
     def rotate(self):
+        if not self.isVisible():
+            self._timer.stop()
+            return
+
         self._currentCounter += 1
         if self._currentCounter >= self._numberOfLines:
             self._currentCounter = 0
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+'''Thumbnail pixmap cache and asynchronous thumbnail loading'''
+
+from __future__ import annotations
+
+import proxi.console as console
+from collections import OrderedDict
+from PySide6 import QtCore, QtGui
+
+
+class PixmapCache:
+
+    def __init__(self, limitKb: int=32 * 1024):
+        '''Bounded LRU pixmap cache keyed on asset id and size, similar to `QPixmapCache` but not shared with Qt internals
+
+        Args:
+            limitKb (int, optional): Cache limit in kilobytes (approximate, based on pixmap dimensions and depth). Defaults to 32MB.
+        '''
+
+        self.limitKb = limitKb
+        self._cache: OrderedDict[tuple[str, int, int], QtGui.QPixmap] = OrderedDict()
+        self._costs: dict[tuple[str, int, int], int] = {}
+        self._totalKb = 0
+
+    @staticmethod
+    def cost(pixmap: QtGui.QPixmap) -> int:
+        '''Approximate memory cost of a pixmap, in kilobytes'''
+
+        return max(1, pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8 // 1024)
+
+    def find(self, assetId: str, width: int, height: int) -> QtGui.QPixmap|None:
+        '''Get a cached pixmap, None if not cached. Marks the entry as recently used'''
+
+        key = (assetId, width, height)
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self._cache.move_to_end(key)
+
+        return pixmap
+
+    def insert(self, assetId: str, width: int, height: int, pixmap: QtGui.QPixmap) -> None:
+        '''Add (or replace) a pixmap, evicting the least recently used entries beyond `limitKb`'''
+
+        key = (assetId, width, height)
+        self._discard(key)
+
+        cost = self.cost(pixmap)
+        if cost > self.limitKb:
+            return
+
+        self._cache[key] = pixmap
+        self._costs[key] = cost
+        self._totalKb += cost
+
+        while self._totalKb > self.limitKb:
+            self._discard(next(iter(self._cache)))
+
+    def remove(self, assetId: str) -> None:
+        '''Remove all sizes of an asset, e.g. after its thumbnail changed on disk'''
+
+        for key in [x for x in self._cache if x[0] == assetId]:
+            self._discard(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._costs.clear()
+        self._totalKb = 0
+
+    def totalKb(self) -> int:
+        return self._totalKb
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _discard(self, key: tuple[str, int, int]) -> None:
+        if key in self._cache:
+            del self._cache[key]
+            self._totalKb -= self._costs.pop(key)
+
+
+class _ThumbnailTask(QtCore.QRunnable):
+
+    def __init__(self, loader: ThumbnailLoader, assetId: str, path: str, width: int, height: int):
+        '''Decode and scale one thumbnail on a pool thread. Only `QImage` is used here, pixmaps must be created on the GUI thread'''
+
+        super().__init__()
+        self.loader = loader
+        self.assetId = assetId
+        self.path = path
+        self.width = width
+        self.height = height
+
+    def run(self):
+        reader = QtGui.QImageReader(self.path)
+        size = reader.size()
+        if size.isValid():
+            # Decode straight to the target size where the format supports it
+            reader.setScaledSize(size.scaled(self.width, self.height, QtCore.Qt.KeepAspectRatio))
+
+        image = reader.read()
+        if image.isNull():
+            console.warning(f'Could not load thumbnail `{self.path}`: {reader.errorString()}')
+
+        self.loader._imageReady.emit(self.assetId, self.width, self.height, image) # type: ignore
+
+
+class ThumbnailLoader(QtCore.QObject):
+
+    loaded = QtCore.Signal(str, int, int) # assetId, width, height. Pixmap is available from `cache` when emitted
+    failed = QtCore.Signal(str, int, int) # assetId, width, height. Not retried until `clearFailed`
+    _imageReady = QtCore.Signal(str, int, int, QtGui.QImage)
+
+    def __init__(self, cache: PixmapCache|None=None, maxThreads: int=2, parent: QtCore.QObject|None=None):
+        '''Loads thumbnails from disk on a thread pool, into a `PixmapCache`
+
+        Args:
+            cache (PixmapCache, optional): Target cache. Defaults to the shared `PIXMAP_CACHE`.
+            maxThreads (int, optional): Max number of decoder threads. Defaults to 2.
+            parent (QObject, optional): Parent object. Defaults to None.
+        '''
+
+        super().__init__(parent)
+
+        self.cache = cache if cache is not None else PIXMAP_CACHE
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(maxThreads)
+        self._pending: set[tuple[str, int, int]] = set()
+        self._failed: set[tuple[str, int, int]] = set() # Missing or broken images
+        self._imageReady.connect(self._onImageReady) # type: ignore -> Queued, runs on the GUI thread
+
+    def request(self, assetId: str, path: str, width: int, height: int) -> QtGui.QPixmap|None:
+        '''Get a thumbnail. Returns the pixmap right away if cached, otherwise queues a load and emits `loaded` (or `failed`) when done. Failed loads are not retried
+
+        Args:
+            assetId (str): Cache key, e.g. the asset object path
+            path (str): Image file on disk
+            width (int): Max thumbnail width
+            height (int): Max thumbnail height
+
+        Returns:
+            QPixmap|None: Cached pixmap, or None if loading (or failed)
+        '''
+
+        pixmap = self.cache.find(assetId, width, height)
+        if pixmap is not None:
+            return pixmap
+
+        key = (assetId, width, height)
+        if key not in self._pending and key not in self._failed:
+            self._pending.add(key)
+            self._pool.start(_ThumbnailTask(self, assetId, path, width, height))
+
+        return None
+
+    def isPending(self, assetId: str, width: int, height: int) -> bool:
+        return (assetId, width, height) in self._pending
+
+    def hasFailed(self, assetId: str, width: int, height: int) -> bool:
+        return (assetId, width, height) in self._failed
+
+    def clearFailed(self, assetId: str|None=None) -> None:
+        '''Allow failed loads of an asset (or of all assets) to be retried, e.g. after its thumbnail was written to disk'''
+
+        if assetId is None:
+            self._failed.clear()
+        else:
+            self._failed = {x for x in self._failed if x[0] != assetId}
+
+    def waitForDone(self, msecs: int=-1) -> bool:
+        '''Block until all queued loads have been decoded (their `loaded` and `failed` signals are still delivered by the event loop)'''
+
+        return self._pool.waitForDone(msecs)
+
+    def _onImageReady(self, assetId: str, width: int, height: int, image: QtGui.QImage) -> None:
+        key = (assetId, width, height)
+        self._pending.discard(key)
+        if image.isNull():
+            self._failed.add(key)
+            self.failed.emit(assetId, width, height) # type: ignore
+            return
+
+        self.cache.insert(assetId, width, height, QtGui.QPixmap.fromImage(image))
+        self.loaded.emit(assetId, width, height) # type: ignore
+
+
+try:
+    PIXMAP_CACHE # type: ignore
+except NameError:
+    PIXMAP_CACHE = PixmapCache()
\ No newline at end of file
@@ -2,8 +2,10 @@
 '''Tile widget (QPushButton)'''
 
 from __future__ import annotations
+import functools
 import proxi.common.strings as strings
 from PySide6 import QtCore, QtWidgets, QtGui
+from .thumbnails import PixmapCache, ThumbnailLoader
 
 
 STYLESHEET = """
@@ -18,10 +20,35 @@ STYLESHEET = """
     }}
 """
 
+SHARED_STYLESHEET = """
+    QPushButton[tileClass="{sizeClass}"] {{
+        font-weight: normal;
+        height: {height}px;
+        max-height: {height}px;
+        min-height: {height}px;
+        width: {width}px;
+        max-width: {width}px;
+        min-width: {width}px;
+    }}
+"""
+
+
+def sizeClass(width: int, height: int) -> str:
+    '''Tile size class name, used as the `tileClass` property for shared stylesheets'''
+
+    return f'{width}x{height}'
+
+
+@functools.lru_cache(maxsize=4096)
+def wrapLabel(label: str) -> str:
+    '''Insert zero-width whitespace after each underscore and hyphen, to let long text wrap more easily'''
+
+    return label.replace('_', f'_{strings.Unicode.hairSpace}').replace('-', f'-{strings.Unicode.hairSpace}')
+
 
 class QtTile(QtWidgets.QPushButton):
 
-    def __init__(self, label: str, width: int, height: int, properties: dict[str, object]=None, parent=None):
+    def __init__(self, label: str, width: int, height: int, properties: dict[str, object]|None=None, parent=None, sharedStyle: QtTileFactory|None=None):
         '''Qt tile widget (QPushButton), primarily for use with `qtFlowLayout`
 
         Args:
@@ -30,28 +57,173 @@ class QtTile(QtWidgets.QPushButton):
             height (int): Tile height in pixels
             properties (dict[str, object], optional): A collection of key->object pairings to add to the button via QObject.setProperty(). Defaults to None.
             parent (object, optional): [description]. Parent object to associate this widget with. Defaults to None.
+            sharedStyle (QtTileFactory, optional): Use the factory's shared stylesheet instead of a per-tile stylesheet. Defaults to None.
         '''
 
         super().__init__(parent)
 
-        # Set properties
+        # Button props
+        self.setCheckable(True)
+
+        # Use a child layout and label for button text, to allow wrapping
+        self.labelWidget = QtWidgets.QLabel()
+        self.labelWidget.setWordWrap(True)
+        self.labelWidget.setAlignment(QtCore.Qt.AlignCenter)
+        self._layout = QtWidgets.QVBoxLayout()
+        self._layout.addWidget(self.labelWidget)
+        self.setLayout(self._layout)
+
+        self.thumbnailWidget: QtWidgets.QLabel|None = None
+        self.tileSize: tuple[int, int]|None = None
+        self.setProperties(properties)
+        if sharedStyle is not None:
+            sharedStyle.registerSize(width, height)
+        self.setTileSize(width, height, shared=sharedStyle is not None)
+        self.setLabel(label)
+
+    def setProperties(self, properties: dict[str, object]|None) -> None:
+        '''Add a collection of key->object pairings to the button via QObject.setProperty()'''
+
         if isinstance(properties, dict):
             for key, prop in properties.items():
                 self.setProperty(key, prop) # type: ignore
 
-        # Set size and other stylesheet properties
-        self.setStyleSheet(STYLESHEET.format(width=width, height=height))
+    def setTileSize(self, width: int, height: int, shared: bool=False) -> None:
+        '''Set size and other stylesheet properties. No-op if unchanged
 
-        # Button props
-        self.setCheckable(True)
+        Args:
+            width (int): Tile width in pixels
+            height (int): Tile height in pixels
+            shared (bool, optional): Only set the `tileClass` property and rely on a shared stylesheet on an ancestor (see `QtTileFactory`), instead of a per-tile stylesheet. Defaults to False.
+        '''
 
-        # Insert zero-width whitespace after each underscore and hyphen, to let long text wrap more easily
-        label = f'{label}'.replace('_', f'_{strings.Unicode.hairSpace}').replace('-', f'-{strings.Unicode.hairSpace}')
+        if self.tileSize == (width, height) and (self.property('tileClass') is not None) == shared:
+            return
 
-        # Use a child layout and label for button text, to allow wrapping
-        labelWidget = QtWidgets.QLabel('{}'.format(label))
-        labelWidget.setWordWrap(True)
-        labelWidget.setAlignment(QtCore.Qt.AlignCenter)
-        layout = QtWidgets.QVBoxLayout()
-        layout.addWidget(labelWidget)
-        self.setLayout(layout)
\ No newline at end of file
+        self.tileSize = (width, height)
+        if shared:
+            if self.styleSheet():
+                self.setStyleSheet('')
+
+            self.setProperty('tileClass', sizeClass(width, height))
+
+            # Dynamic property selectors are only evaluated on polish
+            style = self.style()
+            style.unpolish(self)
+            style.polish(self)
+        else:
+            self.setProperty('tileClass', None)
+            self.setStyleSheet(STYLESHEET.format(width=width, height=height))
+
+    def setLabel(self, label: str) -> None:
+        '''Set text to display on tile'''
+
+        self.labelWidget.setText(wrapLabel(f'{label}'))
+
+    def setThumbnail(self, pixmap: QtGui.QPixmap|None) -> None:
+        '''Show a thumbnail above the label. None removes it'''
+
+        if pixmap is None:
+            if self.thumbnailWidget is not None:
+                self.thumbnailWidget.hide()
+            return
+
+        if self.thumbnailWidget is None:
+            self.thumbnailWidget = QtWidgets.QLabel()
+            self.thumbnailWidget.setAlignment(QtCore.Qt.AlignCenter)
+            self._layout.insertWidget(0, self.thumbnailWidget)
+
+        self.thumbnailWidget.setPixmap(pixmap)
+        self.thumbnailWidget.show()
+
+
+class QtTileFactory(QtCore.QObject):
+
+    def __init__(self, host: QtWidgets.QWidget, loader: ThumbnailLoader|None=None):
+        '''Creates (and recycles) `QtTile` widgets sharing one stylesheet per tile size, with asynchronously loaded thumbnails
+
+        Instead of a private stylesheet per tile, each size class gets one rule on `host`, selected via the `tileClass`
+        dynamic property. Tiles must be children (or descendants) of `host`, and `host` should not have a stylesheet of its own
+
+        Args:
+            host (QWidget): Common ancestor of all tiles, e.g. a gallery viewport. Holds the shared stylesheet
+            loader (ThumbnailLoader, optional): Thumbnail loader. Defaults to a new loader using the shared `PIXMAP_CACHE`.
+        '''
+
+        super().__init__(host)
+
+        self.host = host
+        self.loader = loader if loader is not None else ThumbnailLoader(parent=self)
+        self.loader.loaded.connect(self._thumbnailLoaded) # type: ignore
+        self.loader.failed.connect(self._thumbnailFailed) # type: ignore
+        self._sizeClasses: dict[tuple[int, int], str] = {}
+        self._awaitingThumbnail: dict[tuple[str, int, int], list[QtTile]] = {}
+
+    @property
+    def cache(self) -> PixmapCache:
+        return self.loader.cache
+
+    def create(self, label: str, width: int, height: int, properties: dict[str, object]|None=None, parent: QtWidgets.QWidget|None=None) -> QtTile:
+        '''Create a tile using the shared stylesheet, see `QtTile` for arguments. `parent` defaults to `host`'''
+
+        tile = QtTile(label, width, height, properties, parent=parent if parent is not None else self.host, sharedStyle=self)
+        return tile
+
+    def setTileSize(self, tile: QtTile, width: int, height: int) -> None:
+        '''Resize a (recycled) tile using the shared stylesheet'''
+
+        self.registerSize(width, height)
+        tile.setTileSize(width, height, shared=True)
+
+    def registerSize(self, width: int, height: int) -> None:
+        '''Add the stylesheet rule for a tile size to `host`. Restyles `host` once per new size'''
+
+        if (width, height) in self._sizeClasses:
+            return
+
+        self._sizeClasses[(width, height)] = SHARED_STYLESHEET.format(sizeClass=sizeClass(width, height), width=width, height=height)
+        self.host.setStyleSheet(''.join(self._sizeClasses.values()))
+
+    def setThumbnail(self, tile: QtTile, assetId: str|None, path: str|None=None) -> None:
+        '''Show an asset thumbnail on a tile. Cached pixmaps are applied right away, others are loaded in the background
+
+        Args:
+            tile (QtTile): Target tile
+            assetId (str|None): Asset id (cache key). None clears the thumbnail
+            path (str, optional): Image file to load the thumbnail from, if not cached. Defaults to None.
+        '''
+
+        tile.setProperty('thumbnailAssetId', assetId)
+        if assetId is None or tile.tileSize is None:
+            tile.setThumbnail(None)
+            return
+
+        width, height = self.thumbnailSize(*tile.tileSize)
+        pixmap = self.cache.find(assetId, width, height) if path is None else self.loader.request(assetId, path, width, height)
+        tile.setThumbnail(pixmap)
+
+        if pixmap is None and path is not None and self.loader.isPending(assetId, width, height):
+            self._awaitingThumbnail.setdefault((assetId, width, height), []).append(tile)
+
+    @staticmethod
+    def thumbnailSize(width: int, height: int) -> tuple[int, int]:
+        '''Thumbnail size for a tile size, leaving room for the label'''
+
+        return (max(1, width - 8), max(1, height * 2 // 3))
+
+    def _thumbnailLoaded(self, assetId: str, width: int, height: int) -> None:
+        tiles = self._awaitingThumbnail.pop((assetId, width, height), None)
+        if not tiles:
+            return
+
+        pixmap = self.cache.find(assetId, width, height)
+        for tile in tiles:
+            # Tiles may have been recycled for another asset in the meantime
+            try:
+                if tile.property('thumbnailAssetId') == assetId:
+                    tile.setThumbnail(pixmap)
+            except RuntimeError:
+                pass # Deleted
+
+    def _thumbnailFailed(self, assetId: str, width: int, height: int) -> None:
+        self._awaitingThumbnail.pop((assetId, width, height), None)
\ No newline at end of file
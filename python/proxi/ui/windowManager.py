@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+'''Window lifecycle: reuse open windows, keep closed ones warm (hidden), prebuild in idle time and track open latency'''
+
+from __future__ import annotations
+
+import time
+import importlib
+import shiboken6
+import proxi.config as config
+import proxi.console as console
+import proxi.ui as ui
+from collections import OrderedDict
+from PySide6 import QtCore
+from typing import Callable, Protocol, Type, TypeVar, cast
+
+
+class ManagedWindow(Protocol):
+    '''What the window manager needs from a window. `QtWindowBase` comes from a factory, so it can't be used in annotations'''
+
+    def setKeepWarm(self, keepWarm: bool) -> None: ...
+    def showAndActivate(self) -> None: ...
+    def _delete(self) -> None: ...
+    def isVisible(self) -> bool: ...
+
+
+WindowType = TypeVar('WindowType', bound=ManagedWindow)
+
+
+# Keep warm instances and latency stats while allowing for module reload without resetting
+try:
+    WARM_WINDOWS # type: ignore
+except NameError:
+    WARM_WINDOWS: OrderedDict[str, ManagedWindow] = OrderedDict() # Least recently used first
+
+try:
+    OPEN_LATENCY # type: ignore
+except NameError:
+    OPEN_LATENCY: dict[str, list[tuple[float, bool]]] = {} # windowKey -> [(seconds, wasWarm), ...]
+
+
+def windowKey(windowClass: type) -> str:
+    '''Get the pool key for a window class. Eg. `proxi.ui.debugSystemTime.DebugSystemTime`'''
+
+    return f'{windowClass.__module__}.{windowClass.__qualname__}'
+
+
+def isAlive(instance: object) -> bool:
+    '''Is the underlying C++ object of this window still around?'''
+
+    try:
+        return instance is not None and shiboken6.isValid(instance)
+    except Exception:
+        return False
+
+
+def _findOpenInstance(windowClass: type) -> ManagedWindow|None:
+    '''Find a tracked, visible instance of `windowClass`'''
+
+    for instance in list(ui.OPEN_WINDOWS.keys()):
+        if not isAlive(instance):
+            del ui.OPEN_WINDOWS[instance]
+        elif type(instance) is windowClass:
+            return instance
+
+    return None
+
+
+def _takeWarmInstance(windowClass: type) -> ManagedWindow|None:
+    '''Take the warm instance of `windowClass` out of the pool, if any. Stale instances (eg. from a reloaded module) are deleted'''
+
+    instance = WARM_WINDOWS.pop(windowKey(windowClass), None)
+    if instance is None or not isAlive(instance):
+        return None
+
+    if type(instance) is not windowClass:
+        console.debug(f'Discarding stale warm instance {instance}')
+        instance._delete()
+        return None
+
+    return instance
+
+
+def showWindow(windowClass: Type[WindowType], showCallback: Callable|None=None, forceNew: bool=False, allowMultiple: bool=False) -> WindowType:
+    '''Show a window, reusing an open or warm instance when possible
+
+    Args:
+        windowClass (Type[QtWindowBase]): Window class to show
+        showCallback (Callable, optional): Public `showWindow` method of the tool, stored in `ui.OPEN_WINDOWS`. Defaults to None.
+        forceNew (bool, optional): Delete any existing instance and build a new one. Defaults to False.
+        allowMultiple (bool, optional): Always build a new instance, leaving existing ones alone. Defaults to False.
+
+    Returns:
+        QtWindowBase: The displayed window instance
+    '''
+
+    start = time.perf_counter()
+    key = windowKey(windowClass)
+    instance: WindowType|None = None
+
+    if forceNew:
+        discardAll(windowClass)
+    elif not allowMultiple:
+        instance = cast('WindowType|None', _findOpenInstance(windowClass) or _takeWarmInstance(windowClass)) # Both match the exact class
+
+    warm = instance is not None
+    if instance is None:
+        instance = windowClass()
+
+    instance.setKeepWarm(config.Windows.keepWarm and not allowMultiple)
+    instance.showAndActivate()
+    ui.OPEN_WINDOWS[instance] = showCallback or (lambda: showWindow(windowClass))
+
+    elapsed = time.perf_counter() - start
+    OPEN_LATENCY.setdefault(key, []).append((elapsed, warm))
+    console.debug(f'Opened {key} in {elapsed * 1000:.1f} ms ({"warm" if warm else "cold"})', timestamp=True)
+
+    return instance
+
+
+def release(instance: ManagedWindow) -> None:
+    '''Window has been closed: park it in the warm pool, evicting the least recently used instances if required'''
+
+    key = windowKey(type(instance))
+    previous = WARM_WINDOWS.pop(key, None)
+    if previous is not None and previous is not instance and isAlive(previous):
+        previous._delete()
+
+    WARM_WINDOWS[key] = instance
+
+    while len(WARM_WINDOWS) > max(0, config.Windows.maxWarmInstances):
+        evictedKey, evicted = WARM_WINDOWS.popitem(last=False)
+        console.debug(f'Evicting warm window instance {evictedKey}')
+        if isAlive(evicted):
+            evicted._delete()
+
+
+def discard(instance: ManagedWindow) -> None:
+    '''Remove an instance from the warm pool (without deleting it). Called when a window is being destroyed'''
+
+    for key, warm in list(WARM_WINDOWS.items()):
+        if warm is instance:
+            del WARM_WINDOWS[key]
+
+
+def discardAll(windowClass: type|None=None) -> None:
+    '''Delete open and warm instances of `windowClass`, or of every window class if None'''
+
+    for key, instance in list(WARM_WINDOWS.items()):
+        if windowClass is None or key == windowKey(windowClass):
+            del WARM_WINDOWS[key]
+            if isAlive(instance):
+                instance._delete()
+
+    for instance in list(ui.OPEN_WINDOWS.keys()):
+        if windowClass is None or type(instance) is windowClass:
+            try:
+                instance._delete()
+            except Exception as e:
+                console.error(f'Error destroying old window instance: {e}')
+
+            ui.OPEN_WINDOWS.pop(instance, None)
+
+
+def _resolveClass(path: str) -> type:
+    '''Import and return a window class from a dotted path. Eg. `proxi.ui.debugSystemTime.DebugSystemTime`'''
+
+    moduleName, className = path.rsplit('.', 1)
+    return getattr(importlib.import_module(moduleName), className)
+
+
+def prebuild(windowClass: Type[ManagedWindow]) -> None:
+    '''Build a window without showing it, and park it in the warm pool'''
+
+    key = windowKey(windowClass)
+    if key in WARM_WINDOWS or _findOpenInstance(windowClass):
+        return
+
+    start = time.perf_counter()
+    instance = windowClass()
+    instance.setKeepWarm(True)
+    release(instance)
+    console.debug(f'Prebuilt {key} in {(time.perf_counter() - start) * 1000:.1f} ms', timestamp=True)
+
+
+def schedulePrebuild(paths: list[str]|None=None, delay: int|None=None) -> None:
+    '''Prebuild windows in idle time, one per event loop turn so the editor stays responsive
+
+    Args:
+        paths (list[str], optional): Dotted window class paths. Defaults to None, which means `config.Windows.prebuild`
+        delay (int, optional): Milliseconds to wait before starting. Defaults to None, which means `config.Windows.prebuildDelay`
+    '''
+
+    pending = list(paths if paths is not None else config.Windows.prebuild)
+
+    def buildNext():
+        if not pending:
+            return
+
+        path = pending.pop(0)
+        try:
+            prebuild(_resolveClass(path))
+        except Exception as e:
+            console.error(f'Error prebuilding window `{path}`: {e}')
+
+        QtCore.QTimer.singleShot(0, buildNext)
+
+    if pending:
+        QtCore.QTimer.singleShot(config.Windows.prebuildDelay if delay is None else delay, buildNext)
+
+
+def latencyReport() -> dict[str, dict[str, float]]:
+    '''Summarize window open latency per tool
+
+    Returns:
+        dict[str, dict[str, float]]: windowKey -> {count, warm, cold, mean, min, max} (times in milliseconds)
+    '''
+
+    report: dict[str, dict[str, float]] = {}
+    for key, samples in OPEN_LATENCY.items():
+        times = [x[0] * 1000 for x in samples]
+        report[key] = {
+            'count': len(samples),
+            'warm': sum(1 for x in samples if x[1]),
+            'cold': sum(1 for x in samples if not x[1]),
+            'mean': sum(times) / len(times),
+            'min': min(times),
+            'max': max(times)
+        }
+
+    return report
+
+
+def logLatencyReport() -> None:
+    '''Output window open latency per tool to the console'''
+
+    for key, stats in latencyReport().items():
+        console.log(f'{key}: {stats["count"]} open(s) ({stats["warm"]} warm, {stats["cold"]} cold), mean {stats["mean"]:.1f} ms, min {stats["min"]:.1f} ms, max {stats["max"]:.1f} ms')
\ No newline at end of file
@@ -4,13 +4,17 @@
 from __future__ import annotations
 
 # import unreal
+import time
 import proxi.dev as dev
 import proxi.config as config
 #import proxi.ui.tools as uiTools
 import proxi.console as console
-#import proxi.io.userprefs as userprefs
+import proxi.io.userprefs as userprefs
 import proxi.common.threads as threads
 import proxi.ui as ui
+import proxi.ui.busyState as busyState
+import proxi.ui.windowManager as windowManager
+import proxi.ui.tickDispatcher as tickDispatcher
 #import proxi.ui.dialogs as dialogs
 #import proxi.ui.widgets.spinner as spinner
 from PySide6 import QtGui, QtCore, QtWidgets
@@ -51,6 +55,9 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
 
     class QtWindowBase(_baseType):
 
+        tickInterval: float|None = None # Seconds between `eventTick` calls, see `tickDispatcher`. None means no ticks
+        lazyPages = False # Build only the current tab/stack pages in `setupUi`, the others on activation or in idle time. Needs a .ui compiled with `LAZY_PAGES`, see `.build/ui.py`. Use `ensurePage` before touching widgets of other pages
+
         def __init__(self, uiClass: object, prefsPath: str, overrideTitle: str=None, windowSize: QtCore.QSize=None, flushCacheHook: Callable|None=None, parent: QtWidgets.QWidget=None):
             '''Base class for all window wrappers, containing basic scaffolding for Proxi pipeline and Unreal integration
 
@@ -63,13 +70,15 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
                 parent (QtWidgets.QWidget, optional): [description]. Defaults to None.
             '''
 
+            openStart = time.perf_counter()
             super().__init__(parent)
 
             self.hasBeenDisplayed = False
             self.prefsPath = prefsPath
             self.prefs: dict[str, Any] = {}
             self.busy = False
-            self.busyCallers = 0
+            self.busyState = busyState.BusyState(self._applyBusyState, parent=self)
+            self._busyTokens: dict[threads.EmittingThread, int] = {}
             self.spinner = None
             self._needInitUi = True
             self._needSlateParent = True
@@ -77,18 +86,29 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
             self._closing = False
             self._activeThreads: list[threads.EmittingThread] = []
             self._userDefinedThreadShutdownHooks: list = []
-            self.tickHandle = None
+            self.tickHandle: tickDispatcher.TickSubscriber|None = None
             self.pyShutdownHandle = None
             self.flushCacheHook = flushCacheHook
+            self.keepWarm = False
             # self.persistentPrefsMapping: list[PersistentPrefsMap] = []
             self.persistentPrefsMapping = []
+            self.timeToFirstPaint: float|None = None # Seconds from construction to the first painted frame
+            self._openStart = openStart
+            self._firstPaintPending = False
+            self._pendingPages: list[str] = [] # Lazy pages not built yet
+            self._lazyPageNames: dict[QtWidgets.QWidget, str] = {} # Page widget -> page name
+            self._lazyContainers: set[str] = set() # Lazy page containers whose `currentChanged` we watch
 
             # Fetch ShotGrid project ID (if any)
             # self.defaultProject = config.getShotgridProjectId()
 
             # Setup UI
             self.ui = uiClass() # type: ignore
-            self.ui.setupUi(self) # type: ignore
+            if self.lazyPages and getattr(self.ui, 'LAZY_PAGES', None):
+                self.ui.setupUi(self, lazy=True) # type: ignore
+                self._initLazyPages()
+            else:
+                self.ui.setupUi(self) # type: ignore
 
             self.defaultWindowSize = windowSize or self.size()
             self.detaultWindowPos = QtCore.QPoint(100, 100)
@@ -113,6 +133,89 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
             # self.setAttribute(QtCore.Qt.WA_DeleteOnClose, False)
             # self._setup() # Call from child class!
 
+        def _initLazyPages(self) -> None:
+            '''Build the current page of each lazy page container now, the others once they become current (or in idle time, see `config.Windows.lazyPageIdleBuild`)'''
+
+            self._pendingPages = [page for pages in self.ui.LAZY_PAGES.values() for page in pages] # type: ignore
+            self._watchLazyContainers()
+
+        def _watchLazyContainers(self) -> None:
+            '''Watch the lazy page containers built by now (nested ones come with the page containing them), and build their current page'''
+
+            for containerName, pages in self.ui.LAZY_PAGES.items(): # type: ignore
+                container = getattr(self.ui, containerName, None)
+                if container is None or containerName in self._lazyContainers:
+                    continue
+
+                self._lazyContainers.add(containerName)
+                for page in pages:
+                    self._lazyPageNames[getattr(self.ui, page)] = page
+
+                container.currentChanged.connect(lambda index, container=container: self._lazyPageActivated(container, index))
+                self._lazyPageActivated(container, container.currentIndex())
+
+        def _lazyPageActivated(self, container: QtWidgets.QWidget, index: int) -> None:
+            '''Lazy page container `currentChanged` callback: build the new current page'''
+
+            page = self._lazyPageNames.get(container.widget(index)) # type: ignore
+            if page is not None:
+                self.ensurePage(page)
+
+        def ensurePage(self, page: str) -> bool:
+            '''Build a lazy page now (and the pages containing it), if it hasn't been built yet. See `lazyPages`
+
+            Args:
+                page (str): Page name, as in the .ui file. Eg. `tab_2`
+
+            Returns:
+                bool: True if the page was built by this call
+            '''
+
+            if page not in self._pendingPages:
+                return False
+
+            start = time.perf_counter()
+            self.ui.setupPage(self, page) # type: ignore
+            built = [x for x in self._pendingPages if x in self.ui.builtPages] # type: ignore
+            self._pendingPages = [x for x in self._pendingPages if x not in built]
+            self._watchLazyContainers()
+
+            # Widgets added to an already visible parent stay hidden until shown explicitly
+            for name in built:
+                widget: QtWidgets.QWidget = getattr(self.ui, name)
+                if widget.isVisible():
+                    for child in widget.children():
+                        if isinstance(child, QtWidgets.QWidget) and not child.testAttribute(QtCore.Qt.WA_WState_ExplicitShowHide):
+                            child.show()
+
+            console.debug(f'Built lazy page(s) {", ".join(built)} in {(time.perf_counter() - start) * 1000:.1f} ms', timestamp=True)
+            return True
+
+        def ensureAllPages(self) -> None:
+            '''Build all lazy pages that haven't been built yet'''
+
+            for page in list(self._pendingPages):
+                self.ensurePage(page)
+
+        def _buildIdlePage(self) -> None:
+            '''Build the next pending lazy page, then yield to the event loop before building another one'''
+
+            if self._destroying or not self._pendingPages:
+                return
+
+            self.ensurePage(self._pendingPages[0])
+            if self._pendingPages:
+                QtCore.QTimer.singleShot(0, self._buildIdlePage)
+
+        def _firstPainted(self) -> None:
+            '''The first frame has been painted: log the time to first paint, and build the remaining lazy pages in idle time'''
+
+            self.timeToFirstPaint = time.perf_counter() - self._openStart
+            console.debug(f'{type(self).__name__} first paint after {self.timeToFirstPaint * 1000:.1f} ms, {len(self._pendingPages)} lazy page(s) pending', timestamp=True)
+
+            if self._pendingPages and config.Windows.lazyPageIdleBuild:
+                QtCore.QTimer.singleShot(config.Windows.lazyPageIdleDelay, self._buildIdlePage)
+
         def _threadTaskCallbackHelper(self, result: threads.ThreadResultWrapper) -> None:
             '''Simple helper method to indicate UI is no longer busy after thread complete'''
 
@@ -127,11 +230,11 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
                 self._activeThreads.remove(result.sourceThread)
 
             # Reset busy state
-            if result.resetBusyState:
-                self.busyCallers =- 1
-
-            if result.resetBusyState and self.busyCallers < 1:
-                self.setBusy(False)
+            token = self._busyTokens.pop(result.sourceThread, None)
+            if token is not None:
+                self.busyState.release(token)
+            elif result.resetBusyState and not self._busyTokens:
+                self.setBusy(False) # Task didn't hold a token, but resets busy state once nothing else is in flight
 
             # Deal with errors captured by thread(s)
             if result.error:
@@ -149,15 +252,18 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
         def _registerTickCallback(self) -> None:
             '''Register tick callback with Unreal'''
 
-            # if not self.tickHandle:
-            #     self.tickHandle = unreal.register_slate_post_tick_callback(self.eventTick)
+            if self.tickInterval is None:
+                return
+
+            if not self.tickHandle:
+                self.tickHandle = tickDispatcher.subscribe(self.eventTick, interval=self.tickInterval, widget=self, name=type(self).__name__)
 
         def _unregisterTickCallback(self) -> None:
             '''Unregister tick callback with Unreal'''
 
-            # if self.tickHandle:
-            #     unreal.unregister_slate_post_tick_callback(self.tickHandle)
-            #     self.tickHandle = None
+            if self.tickHandle:
+                tickDispatcher.unsubscribe(self.tickHandle)
+                self.tickHandle = None
 
         def _registerPythonShutdownCallback(self) -> None:
             '''Register Python shutdown callback with Unreal'''
@@ -183,6 +289,7 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
             self._unregisterPythonShutdownCallback()
             self._unregisterTickCallback()
             self._removeWindowInstanceFromTracker()
+            windowManager.discard(self)
             self._flushCache()
             self._destroying = True
             self._closing = True
@@ -280,6 +387,11 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
                     self.statusBarMessage(event.tip()) # type: ignore
                     return True
 
+            # Children paint after the window, in the same pass: measure once the whole frame is done
+            if event.type() == event.Type.Paint and self.timeToFirstPaint is None and not self._firstPaintPending:
+                self._firstPaintPending = True
+                QtCore.QTimer.singleShot(0, self._firstPainted)
+
             return super().event(event)
 
         def eventTick(self, delta_seconds: float) -> None:
@@ -313,6 +425,10 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
             event.accept()
             self._needSlateParent = True
 
+            # Hidden, not deleted: hand over to the warm pool for a fast reopen
+            if self.keepWarm:
+                windowManager.release(self)
+
         def showEvent(self, event: QtGui.QShowEvent) -> None:
             '''Dialog is opening'''
 
@@ -342,6 +458,12 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
                 # unreal.parent_external_window_to_slate(self.winId())
                 self._needSlateParent = False
 
+        def setKeepWarm(self, keepWarm: bool) -> None:
+            '''Hide this window on close instead of deleting it, see `proxi.ui.windowManager`'''
+
+            self.keepWarm = keepWarm
+            self.setAttribute(QtCore.Qt.WA_DeleteOnClose, not keepWarm)
+
         def addThreadTerminationHook(self, hook: Callable) -> None:
             '''Add a user defined thread termination hook to the global `shutdownThreads` callback'''
 
@@ -366,6 +488,10 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
                 console.log(f'Requesting termination for `EmittingThread`: {thread}')
                 thread.kill()
 
+            # Killed threads never report back
+            self._busyTokens.clear()
+            self.busyState.reset()
+
             for hook in self._userDefinedThreadShutdownHooks:
                 console.log(f'Executing user defined thread shutdown hook: {hook}')
 
@@ -374,22 +500,32 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
                 except Exception as e:
                     console.error(f'Error executing hook: {e}')
 
+        @property
+        def busyCallers(self) -> int:
+            '''Number of busy tasks in flight, see `busyState`'''
+
+            return self.busyState.count()
+
         def setBusy(self, busy: bool, busyText: str=None) -> None:
-            '''Toggle busy state (and spinner)'''
+            '''Toggle busy state (and spinner). `setBusy(False)` also drops all in-flight tasks. Applied on the next event loop turn'''
 
-            if busy:
-                if not self.spinner._isSpinning:
-                    self.spinner.start()
-                if busyText:
-                    console.log(busyText)
-                    self.statusBarMessage(busyText)
-            else:
-                self.busyCallers = 0
-                self.spinner.stop()
-                self.statusBarMessage(None)
+            if busyText:
+                console.log(busyText)
+
+            self.busyState.setManual(busy, busyText)
+
+        def _applyBusyState(self, busy: bool, busyText: str|None) -> None:
+            '''`busyState` callback: update spinner and status bar'''
 
             self.busy = busy
-            QtWidgets.QApplication.instance().processEvents()
+
+            if self.spinner is not None:
+                if busy and not self.spinner.isSpinning():
+                    self.spinner.start()
+                elif not busy and self.spinner.isSpinning():
+                    self.spinner.stop()
+
+            self.statusBarMessage(busyText if busy else None)
 
         def opacitySliderChanged(self, value: int) -> None:
             '''Opacity slider `valueChanged` callback: set window opacity'''
@@ -446,11 +582,13 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
             Callback method must be capable of accepting an `*args, **kwargs` payload
             '''
 
-            if setBusyState:
-                self.setBusy(True, busyText)
-
-            if resetBusyState:
-                self.busyCallers += 1
+            token = None
+            if setBusyState and resetBusyState:
+                if busyText:
+                    console.log(busyText)
+                token = self.busyState.acquire(busyText)
+            elif setBusyState:
+                self.setBusy(True, busyText) # Stays busy until `setBusy(False)`
 
             thread = threads.EmittingThread(
                 target=workerMethod,
@@ -460,6 +598,8 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
                 parent=self
             )
             thread.finished.connect(self._threadTaskCallbackHelper) # type: ignore
+            if token is not None:
+                self._busyTokens[thread] = token
             thread.start()
             self._activeThreads.append(thread)
 
@@ -532,7 +672,7 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
 
             # `userprefs.load` can return None to indicate error/missing file. We don't care,
             # and need to maintain `self.prefs` as a `dict`
-            # self.prefs = userprefs.load(self.prefsPath) or {}
+            self.prefs = userprefs.load(self.prefsPath) or {}
 
             # Parse `windowGeo` from components to a QRect
             if 'windowGeo' in self.prefs:
@@ -587,7 +727,7 @@ def QtWindowBaseFactory(baseType: Type[QtWidgets.QMainWindow|QtWidgets.QDialog]|
                 'height': geo.height()
             }
 
-            # return userprefs.save(self.prefs, self.prefsPath)
+            return userprefs.save(self.prefs, self.prefsPath)
 
         def savingPrefs(self) -> bool:
             '''Placeholder: Prefs are about to be saved. Make any required adjustments to self.prefs, which will be dumped as JSON on disk